@@ -0,0 +1,306 @@
+"""
+evaluation.compare_evidence
+===========================
+Golden-set comparison of the fast pipeline's two tool-evidence formats.
+
+``SENTISENSE_EVIDENCE_FORMAT=compact`` drops empty tool sections and
+renders hits as ``tag:term→gloss`` tokens, so each headline costs far
+fewer prompt tokens and a batch call can carry about twice as many
+headlines.  This script checks that the saving does not cost accuracy:
+
+1. Load the golden dataset (same CSV as ``evaluation.evaluate``).
+2. Measure the evidence token cost of both formats (no LLM needed).
+3. Score every headline with ``score_headlines_batch`` twice — full
+   evidence at ``--batch-size`` headlines per call, compact evidence at
+   ``--compact-batch-size`` (default: twice as many).
+4. Compute MAE / Within-1/2 / Pearson r per category for each run, plus
+   the agreement between the two runs, and save everything to
+   ``results/evidence_format_comparison.json``.
+
+Usage
+-----
+::
+
+    # Token cost only — no LLM calls
+    python -m evaluation.compare_evidence --tokens-only
+
+    # Full comparison against the configured backend
+    python -m evaluation.compare_evidence --batch-size 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Ensure the project root is on sys.path when run as a script
+# ---------------------------------------------------------------------------
+_HERE = Path(__file__).resolve().parent          # evaluation/
+_ENGINE_ROOT = _HERE.parent                      # project root
+if str(_ENGINE_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ENGINE_ROOT))
+
+from evaluation.metrics import (                 # noqa: E402
+    CATEGORY_COLUMNS,
+    CATEGORY_NAMES,
+    compute_all_metrics,
+)
+
+FORMATS = ("full", "compact")
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Golden dataset
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def load_golden_rows(path: Path) -> list[dict[str, Any]]:
+    """
+    Load and validate the golden CSV (headline + 6 integer gold scores).
+
+    Kept separate from ``evaluation.evaluate.load_golden_dataset`` because
+    that module imports the full LangGraph engine at import time.
+    """
+    rows: list[dict[str, Any]] = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for i, row in enumerate(csv.DictReader(f), start=2):  # row 1 = header
+            missing = [c for c in ["headline"] + CATEGORY_COLUMNS if c not in row]
+            if missing:
+                raise ValueError(f"Row {i}: missing required columns: {missing}")
+            for col in CATEGORY_COLUMNS:
+                try:
+                    row[col] = int(row[col])
+                except (ValueError, TypeError) as exc:
+                    raise ValueError(
+                        f"Row {i}, column '{col}': expected integer, got {row[col]!r}"
+                    ) from exc
+            rows.append(row)
+    if not rows:
+        raise ValueError(f"Golden dataset is empty: {path}")
+    return rows
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Token cost
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def evidence_token_stats(headlines: list[str]) -> dict[str, dict[str, float]]:
+    """
+    Per-headline evidence tokens for each format.
+
+    Returns ``{format: {"mean", "median", "max", "total"}}`` plus a
+    ``"ratio"`` entry (full mean / compact mean).
+    """
+    from processing_engine.fast_pipeline import precompute_tool_evidence_many
+    from processing_engine.tokens import token_counter
+
+    counter = token_counter()
+    stats: dict[str, dict[str, float]] = {}
+    for fmt in FORMATS:
+        counts = counter.count_many(precompute_tool_evidence_many(headlines, fmt))
+        stats[fmt] = {
+            "mean": statistics.fmean(counts),
+            "median": statistics.median(counts),
+            "max": max(counts),
+            "total": sum(counts),
+        }
+    stats["ratio"] = {
+        "mean": stats["full"]["mean"] / max(stats["compact"]["mean"], 1e-9),
+    }
+    return stats
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Scoring runs
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def _scores(results: list[dict[str, Any]]) -> dict[str, list[float]]:
+    """Category slug → predicted scores, in input order."""
+    return {
+        col: [float(r.get(f"relevance_category_{i}", 0)) for r in results]
+        for i, col in enumerate(CATEGORY_COLUMNS, start=1)
+    }
+
+
+def format_agreement(
+    full: list[dict[str, Any]], compact: list[dict[str, Any]],
+) -> dict[str, float]:
+    """
+    How closely the compact run reproduces the full run.
+
+    ``relevance_within1`` is the share of (headline, category) pairs whose
+    scores differ by at most 1; ``sentiment_mae`` compares
+    ``global_sentiment``, which the golden set does not label.
+    """
+    a, b = _scores(full), _scores(compact)
+    pairs = [(x, y) for col in CATEGORY_COLUMNS for x, y in zip(a[col], b[col])]
+    sentiments = [
+        (float(f.get("global_sentiment", 0)), float(c.get("global_sentiment", 0)))
+        for f, c in zip(full, compact)
+    ]
+    return {
+        "relevance_within1": sum(abs(x - y) <= 1 for x, y in pairs) / max(len(pairs), 1),
+        "sentiment_mae": (
+            sum(abs(x - y) for x, y in sentiments) / max(len(sentiments), 1)
+        ),
+    }
+
+
+async def run_format(
+    rows: list[dict[str, Any]], evidence_format: str, batch_size: int, concurrency: int,
+) -> tuple[list[dict[str, Any]], float]:
+    """Score the golden headlines with one evidence format; returns (results, seconds)."""
+    from processing_engine.fast_pipeline import score_headlines_batch
+
+    observations = [
+        {
+            "headline": r["headline"],
+            "date": r.get("date") or "2025-01-01",
+            "source": r.get("source") or "golden",
+            "hour": r.get("hour") or "12:00",
+            "popularity": r.get("popularity") or "normal",
+        }
+        for r in rows
+    ]
+    t0 = time.time()
+    results = await score_headlines_batch(
+        observations,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        evidence_format=evidence_format,
+    )
+    return results, time.time() - t0
+
+
+def print_comparison(report: dict[str, Any]) -> None:
+    """Print token cost and (when present) per-format metrics to stdout."""
+    tokens = report["evidence_tokens"]
+    print(f"\n{'═' * 72}")
+    print("  EVIDENCE FORMAT COMPARISON")
+    print(f"{'═' * 72}")
+    print(f"  {'Format':<10} {'mean tok':>9} {'median':>8} {'max':>6} {'total':>9}")
+    for fmt in FORMATS:
+        t = tokens[fmt]
+        print(
+            f"  {fmt:<10} {t['mean']:>9.1f} {t['median']:>8.0f} "
+            f"{t['max']:>6.0f} {t['total']:>9.0f}"
+        )
+    print(f"  full / compact (mean): {tokens['ratio']['mean']:.1f}×")
+
+    if "runs" in report:
+        print(f"\n  {'Category':<24} {'full W-1':>9} {'compact W-1':>12} {'Δ MAE':>7}")
+        print(f"  {'-' * 56}")
+        full_m = report["runs"]["full"]["metrics"]
+        comp_m = report["runs"]["compact"]["metrics"]
+        for col, name in zip(CATEGORY_COLUMNS + ["average"], CATEGORY_NAMES + ["AVERAGE"]):
+            print(
+                f"  {name:<24} {full_m[col]['within1']:>9.1%} "
+                f"{comp_m[col]['within1']:>12.1%} "
+                f"{comp_m[col]['mae'] - full_m[col]['mae']:>+7.2f}"
+            )
+        for fmt in FORMATS:
+            run = report["runs"][fmt]
+            print(
+                f"\n  {fmt}: {run['batch_size']} headlines/call, "
+                f"{run['seconds']:.1f}s, {run['failed']} failed"
+            )
+        agree = report["agreement"]
+        print(
+            f"\n  Agreement: relevance within-1 {agree['relevance_within1']:.1%}, "
+            f"sentiment MAE {agree['sentiment_mae']:.2f}"
+        )
+    print(f"{'═' * 72}\n")
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# CLI entrypoint
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare full vs compact tool evidence on the golden dataset: "
+            "prompt tokens per headline, and fast-batch accuracy with compact "
+            "evidence packed at twice the headlines per call."
+        ),
+    )
+    parser.add_argument(
+        "--golden", type=Path, default=Path("evaluation/golden_dataset.csv"),
+        help="Path to the golden dataset CSV file.",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=Path("evaluation/results"),
+        help="Directory for evidence_format_comparison.json.",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=15,
+        help="Headlines per LLM call with full evidence (default: 15).",
+    )
+    parser.add_argument(
+        "--compact-batch-size", type=int, default=0,
+        help="Headlines per LLM call with compact evidence (default: 2 × --batch-size).",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4,
+        help="Concurrent LLM calls per run (default: 4).",
+    )
+    parser.add_argument(
+        "--tokens-only", action="store_true",
+        help="Only measure evidence tokens; do not call the LLM.",
+    )
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    rows = load_golden_rows(args.golden)
+    print(f"Loaded {len(rows)} headlines from {args.golden}")
+
+    report: dict[str, Any] = {
+        "golden": str(args.golden),
+        "headlines": len(rows),
+        "evidence_tokens": evidence_token_stats([r["headline"] for r in rows]),
+    }
+
+    if not args.tokens_only:
+        gold = {col: [float(r[col]) for r in rows] for col in CATEGORY_COLUMNS}
+        sizes = {
+            "full": args.batch_size,
+            "compact": args.compact_batch_size or 2 * args.batch_size,
+        }
+        results: dict[str, list[dict[str, Any]]] = {}
+        report["runs"] = {}
+        for fmt in FORMATS:
+            results[fmt], seconds = await run_format(
+                rows, fmt, sizes[fmt], args.concurrency,
+            )
+            report["runs"][fmt] = {
+                "batch_size": sizes[fmt],
+                "seconds": seconds,
+                "failed": sum(not r.get("validation_passed") for r in results[fmt]),
+                "metrics": compute_all_metrics(_scores(results[fmt]), gold),
+            }
+        report["agreement"] = format_agreement(results["full"], results["compact"])
+
+    print_comparison(report)
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    path = args.output / "evidence_format_comparison.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Comparison saved to {path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
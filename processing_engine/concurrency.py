@@ -0,0 +1,306 @@
+"""
+processing_engine.concurrency
+=============================
+Adaptive concurrency limit for LLM calls.
+
+A fixed ``--concurrency`` is either too timid (the server has headroom)
+or too aggressive (requests queue server-side until they time out, or
+the provider answers 429).  :class:`AdaptiveLimiter` replaces the fixed
+semaphore with an AIMD controller fed by every call it admits:
+
+* **additive increase** — each successful call while the limiter is
+  saturated adds ``1/limit``, i.e. +1 slot per round of successful calls;
+* **multiplicative decrease** — a 429 / 5xx / timeout multiplies the
+  limit by ``backoff``, at most once per round-trip so one overload
+  burst is not punished once per failed call;
+* **latency gradient** — when the short-term latency per token exceeds
+  ``tolerance`` × the long-term no-load baseline, the server is queueing:
+  the limit shrinks in proportion to the gradient before errors appear.
+
+The limit is bounded by ``[min_limit, max_limit]``; ``min_limit ==
+max_limit`` is a plain fixed semaphore.  Per-call latency, token
+throughput and error classes are kept in :meth:`AdaptiveLimiter.snapshot`.
+
+Users: ``fast_pipeline`` (``--concurrency`` is the starting limit),
+``nodes`` (``AGENT_CONCURRENCY``) and ``scripts/llm_worker.py`` (threads
+around the local Ollama server).  This module depends on the stdlib and
+loguru only, so the worker — which runs in the root ``sentisense``
+environment without the LangChain stack — loads it by path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+
+from loguru import logger
+
+# Outcomes that mean "the server is overloaded" → back off.
+_BACKOFF_OUTCOMES = frozenset({"overload", "timeout"})
+
+_OVERLOAD_MARKERS = (
+    "rate limit", "rate_limit", "too many requests", "overloaded",
+    "service unavailable", "bad gateway", "gateway timeout", "error code: 429",
+    "error code: 5",
+)
+
+
+def classify_error(exc: BaseException) -> str:
+    """Map an LLM-call exception to an outcome class.
+
+    ``"timeout"`` and ``"overload"`` (429 / 5xx) shrink the limit;
+    ``"client"`` (other 4xx, e.g. context overflow) and ``"error"``
+    (parse failures, bugs) are counted but say nothing about load.
+    """
+    name = type(exc).__name__.lower()
+    text = str(exc).lower()
+    if isinstance(exc, TimeoutError) or "timeout" in name or "timed out" in text:
+        return "timeout"
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is None:
+        status = getattr(exc, "code", None)   # urllib.error.HTTPError
+    if isinstance(status, int) and 400 <= status < 600:
+        return "overload" if status == 429 or status >= 500 else "client"
+    if any(m in text for m in _OVERLOAD_MARKERS):
+        return "overload"
+    return "error"
+
+
+class _Call:
+    """Handle yielded by a slot; set ``tokens`` once the real count is known."""
+
+    __slots__ = ("tokens",)
+
+    def __init__(self, tokens: int) -> None:
+        self.tokens = tokens
+
+
+class AdaptiveLimiter:
+    """AIMD + latency-gradient concurrency limit, usable from asyncio or threads.
+
+    Parameters
+    ----------
+    initial : int
+        Starting limit (the old fixed concurrency).
+    min_limit, max_limit : int
+        Bounds for the limit; equal bounds make it a fixed semaphore.
+    backoff : float
+        Multiplicative decrease on 429 / 5xx / timeout.
+    tolerance : float
+        Short-term / baseline latency ratio above which the limit shrinks.
+    name : str
+        Label for log lines.
+
+    Use one instance either from a single event loop (:meth:`slot`) or
+    from threads (:meth:`slot_sync`), not both at once.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 0,
+        backoff: float = 0.7,
+        tolerance: float = 2.0,
+        name: str = "llm",
+    ) -> None:
+        max_limit = max_limit or initial
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError(
+                f"need 1 <= min_limit <= initial <= max_limit "
+                f"(got {min_limit}, {initial}, {max_limit})"
+            )
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.name = name
+
+        self._limit = float(initial)
+        self._inflight = 0
+        self._lock = threading.Lock()
+        self._sync_cond = threading.Condition(self._lock)
+        self._waiters: list[asyncio.Future] = []
+
+        self._short: float | None = None      # EWMA of seconds per token
+        self._baseline: float | None = None   # slowly-rising minimum of the same
+        self._rtt: float = 0.0                # EWMA of call latency (seconds)
+        self._last_decrease = 0.0
+        self._started = time.monotonic()
+        self._tokens = 0
+        self._latency_total = 0.0
+        self.outcomes: Counter[str] = Counter()
+
+    @classmethod
+    def configured(
+        cls,
+        initial: int,
+        *,
+        adaptive: bool = True,
+        floor: int = 1,
+        ceiling: int = 0,
+        tolerance: float = 2.0,
+        name: str = "llm",
+    ) -> AdaptiveLimiter:
+        """Build from the config knobs: ``ceiling=0`` means twice ``initial``."""
+        if not adaptive:
+            return cls(initial, min_limit=initial, max_limit=initial, name=name)
+        return cls(
+            initial,
+            min_limit=min(max(floor, 1), initial),
+            max_limit=max(ceiling or 2 * initial, initial),
+            tolerance=tolerance,
+            name=name,
+        )
+
+    # ── state ──────────────────────────────────────────────────────────
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    def _take_locked(self) -> bool:
+        if self._inflight < int(self._limit):
+            self._inflight += 1
+            return True
+        return False
+
+    def _take(self) -> bool:
+        with self._lock:
+            return self._take_locked()
+
+    def record(
+        self, latency: float, outcome: str = "ok", tokens: int = 0, saturated: bool = True,
+    ) -> None:
+        """Feed one finished call into the controller."""
+        with self._lock:
+            self._record_locked(latency, outcome, tokens, saturated)
+
+    def _record_locked(self, latency: float, outcome: str, tokens: int, saturated: bool) -> None:
+        self.outcomes[outcome] += 1
+        if outcome == "cancelled":
+            return
+        self._latency_total += latency
+        self._rtt = latency if not self._rtt else 0.8 * self._rtt + 0.2 * latency
+        before = int(self._limit)
+        now = time.monotonic()
+
+        if outcome in _BACKOFF_OUTCOMES:
+            if now - self._last_decrease >= self._rtt:
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+                self._last_decrease = now
+        elif outcome == "ok":
+            self._tokens += tokens
+            cost = latency / tokens if tokens > 0 else latency
+            self._short = cost if self._short is None else 0.7 * self._short + 0.3 * cost
+            if self._baseline is None or cost < self._baseline:
+                self._baseline = cost
+            else:
+                self._baseline += (cost - self._baseline) * 0.01
+            gradient = self.tolerance * self._baseline / self._short if self._short > 0 else 1.0
+            if gradient < 1.0:
+                if now - self._last_decrease >= self._rtt:
+                    self._limit = max(self.min_limit, self._limit * max(gradient, self.backoff))
+                    self._last_decrease = now
+            elif saturated:
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+
+        after = int(self._limit)
+        if after < before:
+            logger.info("[{}] concurrency {} → {} ({})", self.name, before, after, outcome)
+        elif after > before:
+            logger.debug("[{}] concurrency {} → {}", self.name, before, after)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Limit, in-flight calls, latency/throughput and outcome counts."""
+        with self._lock:
+            calls = sum(n for o, n in self.outcomes.items() if o != "cancelled")
+            elapsed = max(time.monotonic() - self._started, 1e-9)
+            return {
+                "limit": int(self._limit),
+                "inflight": self._inflight,
+                "calls": calls,
+                "mean_latency_s": round(self._latency_total / calls, 3) if calls else 0.0,
+                "tokens_per_s": round(self._tokens / elapsed, 1),
+                "outcomes": dict(self.outcomes),
+            }
+
+    def summary(self) -> str:
+        s = self.snapshot()
+        outcomes = ", ".join(f"{k}={v}" for k, v in sorted(s["outcomes"].items())) or "none"
+        return (
+            f"limit={s['limit']} (range {self.min_limit}-{self.max_limit}), "
+            f"calls={s['calls']}, mean latency={s['mean_latency_s']}s, "
+            f"~{s['tokens_per_s']} tok/s, outcomes: {outcomes}"
+        )
+
+    # ── asyncio gate ───────────────────────────────────────────────────
+
+    def _wake(self) -> None:
+        for fut in self._waiters:
+            if not fut.done():
+                fut.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[_Call]:
+        """Hold one call slot for the body; its latency and outcome feed the limit."""
+        loop = asyncio.get_running_loop()
+        while not self._take():
+            fut = loop.create_future()
+            self._waiters.append(fut)
+            try:
+                await fut
+            finally:
+                self._waiters.remove(fut)
+        saturated = self._inflight >= int(self._limit)
+        call = _Call(tokens)
+        outcome = "ok"
+        t0 = time.perf_counter()
+        try:
+            yield call
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception as exc:
+            outcome = classify_error(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight -= 1
+                self._record_locked(time.perf_counter() - t0, outcome, call.tokens, saturated)
+            self._wake()
+
+    # ── thread gate ────────────────────────────────────────────────────
+
+    @contextmanager
+    def slot_sync(self, tokens: int = 0) -> Iterator[_Call]:
+        """Blocking counterpart of :meth:`slot` for worker threads."""
+        with self._sync_cond:
+            self._sync_cond.wait_for(self._take_locked)
+            saturated = self._inflight >= int(self._limit)
+        call = _Call(tokens)
+        outcome = "ok"
+        t0 = time.perf_counter()
+        try:
+            yield call
+        except Exception as exc:
+            outcome = classify_error(exc)
+            raise
+        finally:
+            with self._sync_cond:
+                self._inflight -= 1
+                self._record_locked(time.perf_counter() - t0, outcome, call.tokens, saturated)
+                self._sync_cond.notify_all()
@@ -108,6 +108,17 @@ AGENT_CONCURRENCY: int = int(_env("AGENT_CONCURRENCY", "7"))
 # Only relevant for OpenAI-compatible backends; Ollama has no rate limits.
 RATE_LIMIT_RPM: int = int(_env("RATE_LIMIT_RPM", "0"))
 
+# Adaptive LLM concurrency (processing_engine.concurrency).  --concurrency and
+# AGENT_CONCURRENCY become the *starting* limit; an AIMD controller then grows it
+# while latency holds and backs off on 429 / 5xx / timeouts or queueing latency.
+# Set ADAPTIVE_CONCURRENCY=false for the old fixed semaphore.
+ADAPTIVE_CONCURRENCY: bool = _env("ADAPTIVE_CONCURRENCY", "true").lower() in ("true", "1", "yes")
+LLM_CONCURRENCY_MIN: int = int(_env("LLM_CONCURRENCY_MIN", "1"))
+# Upper bound for the adaptive limit; 0 = twice the starting limit.
+LLM_CONCURRENCY_MAX: int = int(_env("LLM_CONCURRENCY_MAX", "0"))
+# Short-term / no-load latency-per-token ratio above which the limit shrinks.
+LLM_LATENCY_TOLERANCE: float = float(_env("LLM_LATENCY_TOLERANCE", "2.0"))
+
 # Force the text-based ManualToolAgent for ALL models, regardless of name.
 # Required when the inference server (e.g. vLLM on RunAI) does not support
 # native tool/function calling (--enable-auto-tool-choice not set).
@@ -141,6 +152,34 @@ COMPLETIONS_MAX_TOKENS: int = int(_env("COMPLETIONS_MAX_TOKENS", "16384"))
 # 8192 for Ollama qwen2.5:14b.
 CONTEXT_WINDOW: int = int(_env("CONTEXT_WINDOW", "131072"))
 
+# Exact prompt token counts (processing_engine.tokens).  Path to the served
+# model's tokenizer.json (or its directory), loaded locally with the optional
+# ``tokenizers`` package; empty = estimate from characters.  With exact counts,
+# fast-batch prompts are packed to BATCH_FILL_RATIO of CONTEXT_WINDOW instead of
+# the estimate's 75% safety margin.  TOKEN_CACHE_SIZE bounds the per-text LRU.
+TOKENIZER_PATH: str = _env("TOKENIZER_PATH", "")
+TOKEN_CACHE_SIZE: int = int(_env("TOKEN_CACHE_SIZE", "65536"))
+BATCH_FILL_RATIO: float = float(_env("BATCH_FILL_RATIO", "0.9"))
+
+# Bulk tool-evidence pre-computation (fast_pipeline.precompute_tool_evidence_many).
+# Lists with at least EVIDENCE_POOL_THRESHOLD headlines are split across a
+# process pool of EVIDENCE_WORKERS processes (0 = os.cpu_count()); smaller
+# lists, or EVIDENCE_WORKERS=1, run inline in the calling thread.
+EVIDENCE_POOL_THRESHOLD: int = int(_env("EVIDENCE_POOL_THRESHOLD", "4000"))
+EVIDENCE_WORKERS: int = int(_env("EVIDENCE_WORKERS", "0"))
+
+# Tool-evidence rendering for the fast pipeline: "full" (every tool's text,
+# including "No … detected" lines) or "compact" (only hits, as tag:term→gloss
+# tokens; ~20x fewer evidence tokens, so about twice the headlines per call).
+# Compare score quality with ``python -m evaluation.compare_evidence``.
+EVIDENCE_FORMAT: str = _env("EVIDENCE_FORMAT", "full")
+
+# Near-duplicate collapsing (processing_engine.near_dup, --dedup-threshold):
+# a headline may reuse the score of a representative at most this many days
+# apart — a flash re-run across midnight still collapses, a recurring
+# template headline weeks later does not.
+DEDUP_WINDOW_DAYS: int = int(_env("DEDUP_WINDOW_DAYS", "1"))
+
 
 # ---------------------------------------------------------------------------
 # Retry / resilience settings
@@ -39,22 +39,41 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
 import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from loguru import logger
 
+from .concurrency import AdaptiveLimiter
 from .config import (
+    ADAPTIVE_CONCURRENCY,
+    BATCH_FILL_RATIO,
     CATEGORY_DISPLAY_NAMES,
     CONTEXT_WINDOW,
+    EVIDENCE_FORMAT,
+    EVIDENCE_POOL_THRESHOLD,
+    EVIDENCE_WORKERS,
+    LLM_CONCURRENCY_MAX,
+    LLM_CONCURRENCY_MIN,
+    LLM_LATENCY_TOLERANCE,
     RELEVANCY_CATEGORIES,
     RELEVANCY_MAX,
     RELEVANCY_MIN,
     SENTIMENT_MAX,
     SENTIMENT_MIN,
 )
+from .lexicon import COMPACT_TAGS, LEXICON, render_compact, render_tool
 from .models import BatchHeadlineScores, HeadlineScoreEntry, HeadlineScores
 from .prompts import build_llm
+from .tokens import token_counter
 from .tools import (
     SHARED_TOOLS,
     SENTIMENT_TOOLS,
@@ -62,6 +81,18 @@ from .tools import (
 )
 
 
+def make_llm_limiter(concurrency: int, name: str = "llm") -> AdaptiveLimiter:
+    """Adaptive LLM call limit starting at ``concurrency`` (bounds from config)."""
+    return AdaptiveLimiter.configured(
+        concurrency,
+        adaptive=ADAPTIVE_CONCURRENCY,
+        floor=LLM_CONCURRENCY_MIN,
+        ceiling=LLM_CONCURRENCY_MAX,
+        tolerance=LLM_LATENCY_TOLERANCE,
+        name=name,
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Tool pre-computation
 # ═══════════════════════════════════════════════════════════════════════
@@ -79,29 +110,57 @@ def _run_tool(tool_fn, text: str) -> str:
             return f"(tool error: {exc})"
 
 
-def precompute_tool_evidence(headline: str) -> str:
+EVIDENCE_FORMATS = ("full", "compact")
+
+
+def _check_evidence_format(evidence_format: str) -> str:
+    if evidence_format not in EVIDENCE_FORMATS:
+        raise ValueError(
+            f"evidence_format must be one of {EVIDENCE_FORMATS} (got {evidence_format!r})"
+        )
+    return evidence_format
+
+
+def precompute_tool_evidence(headline: str, evidence_format: str = "full") -> str:
     """
     Run ALL tools locally on a headline and format results.
 
-    Returns a formatted text block with evidence from every tool
-    (shared + all 6 categories + sentiment tools).  Tools that find
-    nothing return "No ... detected" which is still useful signal.
+    With ``evidence_format="full"`` (default) returns a formatted text block
+    with evidence from every tool (shared + all 6 categories + sentiment
+    tools).  Tools that find nothing return "No ... detected" which is still
+    useful signal.
+
+    ``evidence_format="compact"`` renders the same scan as
+    :func:`processing_engine.lexicon.render_compact`: empty sections are
+    dropped, hits become ``tag:term→gloss`` tokens and a term found by
+    several tools is listed once — a small fraction of the tokens.  The
+    prompts then carry :data:`_COMPACT_EVIDENCE_LEGEND`.
+
+    Every keyword dictionary is matched in ONE compiled scan
+    (:data:`processing_engine.lexicon.LEXICON`) and rendered without going
+    through ``tool.invoke``; the full text is identical to invoking each tool.
     """
+    hits = LEXICON.scan(headline)
+    if _check_evidence_format(evidence_format) == "compact":
+        return render_compact(headline, hits)
+
+    def _evidence(tool_fn) -> str:
+        result = render_tool(tool_fn, headline, hits)
+        return _run_tool(tool_fn, headline) if result is None else result
+
     sections: list[str] = []
 
     # Shared tools
     sections.append("### General Text Analysis")
     for tool_fn in SHARED_TOOLS:
-        result = _run_tool(tool_fn, headline)
-        sections.append(f"**{tool_fn.name}:** {result}")
+        sections.append(f"**{tool_fn.name}:** {_evidence(tool_fn)}")
 
     # Category-specific tools
     for cat in RELEVANCY_CATEGORIES:
         display = CATEGORY_DISPLAY_NAMES[cat]
         sections.append(f"\n### {display} Scan")
         for tool_fn in TOOLS_BY_CATEGORY[cat]:
-            result = _run_tool(tool_fn, headline)
-            sections.append(f"**{tool_fn.name}:** {result}")
+            sections.append(f"**{tool_fn.name}:** {_evidence(tool_fn)}")
 
     # Sentiment tools
     sections.append("\n### Sentiment / Tone Signals")
@@ -109,12 +168,72 @@ def precompute_tool_evidence(headline: str) -> str:
         # Skip duplicates already covered in category scans
         if tool_fn.name in ("scan_financial_entities", "detect_economic_indicators"):
             continue
-        result = _run_tool(tool_fn, headline)
-        sections.append(f"**{tool_fn.name}:** {result}")
+        sections.append(f"**{tool_fn.name}:** {_evidence(tool_fn)}")
 
     return "\n".join(sections)
 
 
+def _precompute_chunk(texts: list[str], evidence_format: str = "full") -> list[str]:
+    """Evidence for a contiguous slice of headlines (one process-pool task)."""
+    return [precompute_tool_evidence(t, evidence_format) for t in texts]
+
+
+_evidence_pool: ProcessPoolExecutor | None = None
+_evidence_pool_lock = threading.Lock()
+
+
+def _get_evidence_pool(workers: int) -> ProcessPoolExecutor:
+    """Lazily start the shared evidence pool (spawned: callers are threaded).
+
+    Created once under a lock, so concurrent callers share one pool; it is
+    shut down at interpreter exit.
+    """
+    global _evidence_pool
+    if _evidence_pool is None:
+        with _evidence_pool_lock:
+            if _evidence_pool is None:
+                _evidence_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                atexit.register(_evidence_pool.shutdown, cancel_futures=True)
+                logger.info("Evidence process pool started ({} workers)", workers)
+    return _evidence_pool
+
+
+def precompute_tool_evidence_many(
+    texts: Iterable[str], evidence_format: str = "full",
+) -> list[str]:
+    """
+    Pre-compute tool evidence for a whole list of headlines in one call.
+
+    Identical headline strings (the same wire story carried by several
+    outlets) are rendered once.  When at least ``EVIDENCE_POOL_THRESHOLD``
+    distinct headlines remain, they are split into one contiguous slice per
+    worker and rendered on a process pool; smaller lists run inline in the
+    calling thread, sharing the compiled lexicon.
+
+    Returns one evidence block per input text (in ``evidence_format``, see
+    :func:`precompute_tool_evidence`), in input order.
+    """
+    _check_evidence_format(evidence_format)
+    texts = list(texts)
+    unique = list(dict.fromkeys(texts))
+    workers = EVIDENCE_WORKERS or os.cpu_count() or 1
+
+    if workers <= 1 or len(unique) < EVIDENCE_POOL_THRESHOLD:
+        rendered = _precompute_chunk(unique, evidence_format)
+    else:
+        step = -(-len(unique) // workers)
+        slices = [unique[i : i + step] for i in range(0, len(unique), step)]
+        pool = _get_evidence_pool(workers)
+        chunk = partial(_precompute_chunk, evidence_format=evidence_format)
+        rendered = [ev for part in pool.map(chunk, slices) for ev in part]
+
+    by_text = dict(zip(unique, rendered))
+    return [by_text[t] for t in texts]
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Single-prompt system prompt
 # ═══════════════════════════════════════════════════════════════════════
@@ -179,6 +298,29 @@ headline on 7 dimensions in a single assessment.
 """
 
 
+_COMPACT_EVIDENCE_LEGEND = f"""
+
+## Tool Evidence Format (compact)
+Each headline's tool analysis lists ONLY what the local scanners found:
+- `words:N | nums:… | figures:… | quote:…` — word count, extracted numbers, quotes
+- `tag:term→gloss` — a keyword hit (Hebrew term → English gloss; tags are \
+comma-joined when one term hits several scanners). Tags: \
+{", ".join(dict.fromkeys(COMPACT_TAGS.values()))} \
+(pol/eco/sec/health/sci/tech = the 6 relevancy categories; bull/bear = market \
+signals; georisk/geostab = geopolitics; mag = magnitude words)
+- `threat:LEVEL(term)`, `balance:±N` (bullish − bearish hits), `impact:SIZE (x%)`
+`(no signals)` = no scanner matched. A category with no tagged line had NO keyword hits — evidence of low relevance, \
+not missing data.\
+"""
+
+
+def _with_legend(system_prompt: str, evidence_format: str) -> str:
+    """System prompt for ``evidence_format`` (compact adds the format legend)."""
+    if _check_evidence_format(evidence_format) == "compact":
+        return system_prompt + _COMPACT_EVIDENCE_LEGEND
+    return system_prompt
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Core scoring functions
 # ═══════════════════════════════════════════════════════════════════════
@@ -189,6 +331,7 @@ async def _score_headline_with_evidence(
     evidence: str,
     *,
     structured_llm,
+    evidence_format: str = "full",
 ) -> HeadlineScores:
     """Invoke the structured LLM with a pre-computed evidence block.
 
@@ -200,7 +343,7 @@ async def _score_headline_with_evidence(
         f"## Pre-computed Tool Analysis\n{evidence}"
     )
     return await structured_llm.ainvoke([
-        {"role": "system", "content": _FAST_SYSTEM_PROMPT},
+        {"role": "system", "content": _with_legend(_FAST_SYSTEM_PROMPT, evidence_format)},
         {"role": "user", "content": user_message},
     ])
 
@@ -231,9 +374,9 @@ async def score_headline(
         _structured_llm = llm.with_structured_output(HeadlineScores)
 
     # Pre-compute all tool evidence locally (instant, CPU-bound).
-    # Public single-headline path stays synchronous — the hot path in
-    # score_headlines_concurrent() wraps precompute_tool_evidence in
-    # asyncio.to_thread directly to avoid blocking the event loop.
+    # Public single-headline path stays synchronous — the hot paths in
+    # score_headlines_concurrent()/score_headlines_batch() build evidence for
+    # the whole list via precompute_tool_evidence_many in asyncio.to_thread.
     evidence = precompute_tool_evidence(headline)
     return await _score_headline_with_evidence(
         headline, evidence, structured_llm=_structured_llm,
@@ -245,6 +388,8 @@ async def score_headlines_concurrent(
     llm=None,
     *,
     concurrency: int = 4,
+    limiter: AdaptiveLimiter | None = None,
+    evidence_format: str | None = None,
 ) -> list[dict[str, Any]]:
     """
     Score multiple headlines concurrently using the fast pipeline.
@@ -256,7 +401,13 @@ async def score_headlines_concurrent(
     llm : BaseChatModel, optional
         Override the default LLM instance.
     concurrency : int
-        Max simultaneous LLM calls (default: 4).
+        Starting number of simultaneous LLM calls (default: 4); the
+        adaptive limiter moves it within the configured bounds.
+    limiter : AdaptiveLimiter, optional
+        Share one limit across calls (default: a new one from ``concurrency``).
+    evidence_format : str, optional
+        ``"full"`` or ``"compact"`` tool evidence (default:
+        ``SENTISENSE_EVIDENCE_FORMAT``).
 
     Returns
     -------
@@ -265,21 +416,28 @@ async def score_headlines_concurrent(
     """
     llm = llm or build_llm()
     structured_llm = llm.with_structured_output(HeadlineScores)
-    semaphore = asyncio.Semaphore(concurrency)
+    limiter = limiter or make_llm_limiter(concurrency)
+    evidence_format = _check_evidence_format(evidence_format or EVIDENCE_FORMAT)
+
+    # Build every headline's evidence in ONE off-loop call (CPU-bound), instead
+    # of one thread hop per headline.
+    all_evidences = await asyncio.to_thread(
+        precompute_tool_evidence_many,
+        [obs.get("headline", "") for obs in headlines],
+        evidence_format,
+    )
 
-    async def _process_one(obs: dict[str, Any]) -> dict[str, Any]:
+    async def _process_one(obs: dict[str, Any], evidence: str) -> dict[str, Any]:
         headline = obs.get("headline", "")
         t0 = time.perf_counter()
 
         try:
-            async with semaphore:
-                # Run CPU-bound tool scanning off the event loop so other
-                # coroutines (already past the semaphore) can progress.
-                evidence = await asyncio.to_thread(
-                    precompute_tool_evidence, headline,
-                )
+            async with limiter.slot(
+                tokens=_estimate_input_tokens(headline, evidence) + _PER_HEADLINE_OUTPUT_TOKENS,
+            ):
                 scores = await _score_headline_with_evidence(
                     headline, evidence, structured_llm=structured_llm,
+                    evidence_format=evidence_format,
                 )
             elapsed = time.perf_counter() - t0
 
@@ -321,7 +479,7 @@ async def score_headlines_concurrent(
                 "processing_time_seconds": round(elapsed, 3),
             }
 
-    tasks = [_process_one(obs) for obs in headlines]
+    tasks = [_process_one(obs, ev) for obs, ev in zip(headlines, all_evidences)]
     return await asyncio.gather(*tasks)
 
 
@@ -342,13 +500,27 @@ async def score_headlines_concurrent(
 _CONTEXT_WINDOW = CONTEXT_WINDOW
 _SYSTEM_PROMPT_TOKENS = 800       # measured ~750, padded
 _PER_HEADLINE_INPUT_TOKENS = 650  # evidence + headline text + formatting
+_PER_HEADLINE_INPUT_TOKENS_COMPACT = 250  # compact evidence: ~90 typical, ~320 worst seen
 _PER_HEADLINE_OUTPUT_TOKENS = 250  # scores + chain_of_thought
 _SAFETY_FACTOR = 0.75             # 25% safety margin
 
-MAX_BATCH_SIZE = int(
-    (_CONTEXT_WINDOW * _SAFETY_FACTOR - _SYSTEM_PROMPT_TOKENS)
-    / (_PER_HEADLINE_INPUT_TOKENS + _PER_HEADLINE_OUTPUT_TOKENS)
-)  # ≈ 109 on 128K context, ≈ 26 on 32K context
+
+def max_batch_size(evidence_format: str = "full") -> int:
+    """Headlines-per-call ceiling for ``evidence_format`` on this context window."""
+    per_input = (
+        _PER_HEADLINE_INPUT_TOKENS_COMPACT
+        if _check_evidence_format(evidence_format) == "compact"
+        else _PER_HEADLINE_INPUT_TOKENS
+    )
+    return int(
+        (_CONTEXT_WINDOW * _SAFETY_FACTOR - _SYSTEM_PROMPT_TOKENS)
+        / (per_input + _PER_HEADLINE_OUTPUT_TOKENS)
+    )
+
+
+# ≈ 109 on 128K context, ≈ 26 on 32K context with full evidence;
+# ≈ 195 / ≈ 47 with SENTISENSE_EVIDENCE_FORMAT=compact.
+MAX_BATCH_SIZE = max_batch_size(EVIDENCE_FORMAT)
 
 # Token-aware batching. ``batch_size`` (operator's --headlines-per-call) bounds the
 # COUNT; this budget bounds the actual prompt SIZE so a handful of long Hebrew
@@ -356,8 +528,10 @@ MAX_BATCH_SIZE = int(
 # (the 400 "maximum context length is N tokens" failure).  Conservative chars→tokens
 # ratio for Hebrew (SentencePiece fragments it finely, so this OVER-estimates → smaller,
 # safer batches); the adaptive bisection in _process_batch is the exact safety net.
+# With SENTISENSE_TOKENIZER_PATH set, counts come from the model's tokenizer
+# (processing_engine.tokens) and the budget becomes BATCH_FILL_RATIO of the window
+# (see _input_token_budget).
 _CHARS_PER_TOKEN = 1.5
-_INPUT_TOKEN_BUDGET = int(_CONTEXT_WINDOW * _SAFETY_FACTOR) - _SYSTEM_PROMPT_TOKENS
 _CTX_OVERFLOW_MARKERS = (
     "maximum context length", "input_tokens", "context_length", "max_model_len",
 )
@@ -369,44 +543,128 @@ def _is_context_overflow(exc: Exception) -> bool:
     return any(m in s for m in _CTX_OVERFLOW_MARKERS)
 
 
+# Per-entry wrapper of _build_batch_user_message (two-digit index, separator).
+_ENTRY_WRAPPER = "---\n## Headline [00]\n\n\n### Tool Analysis [00]\n\n\n"
+
+
+@dataclass
+class PackingStats:
+    """Fast-batch packing counters for the run.
+
+    ``mean_fill`` is the average share of the context window a packed prompt
+    was planned to use (system + input + output reserve); ``bisections`` and
+    ``truncations`` count requests the server still rejected for length —
+    each one is a wasted LLM call that exact token counts should remove.
+    """
+
+    batches: int = 0
+    headlines: int = 0
+    fill_sum: float = 0.0
+    bisections: int = 0
+    truncations: int = 0
+
+    @property
+    def mean_fill(self) -> float:
+        return self.fill_sum / self.batches if self.batches else 0.0
+
+    def summary(self) -> str:
+        mode = "exact" if token_counter().exact else "estimated"
+        return (
+            f"{self.batches:,} batches, {self.headlines / max(self.batches, 1):.1f} headlines/batch, "
+            f"mean fill {self.mean_fill:.0%} of context ({mode} tokens), "
+            f"{self.bisections:,} overflow bisections, {self.truncations:,} truncations"
+        )
+
+
+PACKING_STATS = PackingStats()
+
+
 def _estimate_message_tokens(text: str) -> int:
-    """Conservative token count for a prompt string (over-estimates for safety)."""
-    return int(len(text) / _CHARS_PER_TOKEN)
+    """Token count for a prompt string (exact with a tokenizer, else over-estimated)."""
+    return token_counter().count(text, cache=False)
 
 
 def _estimate_input_tokens(headline: str, evidence: str) -> int:
-    """Estimate input tokens for one (headline + evidence) entry incl. wrapper."""
-    return int((len(headline) + len(evidence) + 60) / _CHARS_PER_TOKEN)
+    """Input tokens for one (headline + evidence) entry incl. wrapper."""
+    return _estimate_entries_tokens([headline], [evidence])[0]
+
+
+def _estimate_entries_tokens(headlines: list[str], evidences: list[str]) -> list[int]:
+    """Input tokens per (headline + evidence) entry incl. wrapper.
+
+    Exact counts go through the counter's LRU, so evidence re-packed after a
+    bisection (or shared by duplicate headlines) is tokenised once.
+    """
+    counter = token_counter()
+    if not counter.exact:
+        return [
+            int((len(h) + len(e) + 60) / _CHARS_PER_TOKEN)
+            for h, e in zip(headlines, evidences)
+        ]
+    wrapper = counter.count(_ENTRY_WRAPPER)
+    h_tok = counter.count_many(_sanitize_for_batch_delimiter(h) for h in headlines)
+    e_tok = counter.count_many(evidences)
+    return [wrapper + h + e for h, e in zip(h_tok, e_tok)]
+
+
+def _system_prompt_tokens(evidence_format: str = "full") -> int:
+    counter = token_counter()
+    if counter.exact:
+        return counter.count(_with_legend(_BATCH_SYSTEM_PROMPT, evidence_format))
+    if evidence_format == "compact":
+        return _SYSTEM_PROMPT_TOKENS + counter.count(_COMPACT_EVIDENCE_LEGEND)
+    return _SYSTEM_PROMPT_TOKENS
+
+
+def _input_token_budget(evidence_format: str = "full") -> int:
+    """Prompt budget per batch: ``BATCH_FILL_RATIO`` of the window with exact counts,
+    the estimate's ``_SAFETY_FACTOR`` otherwise (both less the system prompt)."""
+    if not token_counter().exact:
+        return int(_CONTEXT_WINDOW * _SAFETY_FACTOR) - _system_prompt_tokens(evidence_format)
+    return int(_CONTEXT_WINDOW * BATCH_FILL_RATIO) - _system_prompt_tokens(evidence_format)
 
 
 def _pack_batches(
     headlines: list[dict[str, Any]],
     evidences: list[str],
     batch_size: int,
+    evidence_format: str = "full",
 ) -> list[tuple[list[dict[str, Any]], list[str]]]:
     """Greedily pack headlines into batches bounded by COUNT and CONTEXT budget.
 
     Each batch holds at most ``batch_size`` headlines AND keeps
     ``system + sum(input) + per-headline output reserve`` within
-    ``_CONTEXT_WINDOW * _SAFETY_FACTOR``.  An entry whose estimate alone exceeds
-    the budget becomes its own singleton batch (handled by adaptive truncation).
+    :func:`_input_token_budget`.  An entry whose count alone exceeds the budget
+    becomes its own singleton batch (handled by adaptive truncation).  The
+    planned fill of each batch is added to :data:`PACKING_STATS`.
     """
+    budget = _input_token_budget(evidence_format)
+    system = _system_prompt_tokens(evidence_format)
+    ests = _estimate_entries_tokens([obs.get("headline", "") for obs in headlines], evidences)
     packed: list[tuple[list[dict[str, Any]], list[str]]] = []
     cur_obs: list[dict[str, Any]] = []
     cur_ev: list[str] = []
     cur_in = 0
-    for obs, ev in zip(headlines, evidences):
-        est = _estimate_input_tokens(obs.get("headline", ""), ev)
+
+    def close() -> None:
+        packed.append((cur_obs, cur_ev))
+        PACKING_STATS.batches += 1
+        PACKING_STATS.headlines += len(cur_obs)
+        PACKING_STATS.fill_sum += (
+            system + cur_in + len(cur_obs) * _PER_HEADLINE_OUTPUT_TOKENS
+        ) / _CONTEXT_WINDOW
+
+    for obs, ev, est in zip(headlines, evidences, ests):
         out_reserve = (len(cur_obs) + 1) * _PER_HEADLINE_OUTPUT_TOKENS
-        too_big = (cur_in + est + out_reserve) > _INPUT_TOKEN_BUDGET
+        too_big = (cur_in + est + out_reserve) > budget
         if cur_obs and (len(cur_obs) >= batch_size or too_big):
-            packed.append((cur_obs, cur_ev))
+            close()
             cur_obs, cur_ev, cur_in = [], [], 0
         cur_obs.append(obs)
         cur_ev.append(ev)
         cur_in += est
     if cur_obs:
-        packed.append((cur_obs, cur_ev))
+        close()
     return packed
 
 
@@ -533,13 +791,16 @@ async def score_headlines_batch(
     *,
     batch_size: int = 15,
     concurrency: int = 4,
+    limiter: AdaptiveLimiter | None = None,
+    evidence_format: str | None = None,
 ) -> list[dict[str, Any]]:
     """
     Score multiple headlines by batching them into fewer LLM calls.
 
     Instead of 1 LLM call per headline, this packs up to ``batch_size``
     headlines + their pre-computed tool evidence into a single prompt.
-    Multiple batches run concurrently (controlled by ``concurrency``).
+    Multiple batches run concurrently under an :class:`AdaptiveLimiter`
+    that starts at ``concurrency``.
 
     Parameters
     ----------
@@ -550,17 +811,27 @@ async def score_headlines_batch(
     batch_size : int
         Max headlines per LLM call (default: 15, max: MAX_BATCH_SIZE).
     concurrency : int
-        Max simultaneous batch LLM calls (default: 4).
+        Starting number of simultaneous batch LLM calls (default: 4).
+    limiter : AdaptiveLimiter, optional
+        Share one limit across calls (the pipelined runner passes one to
+        every batch); default: a new one from ``concurrency``.
+    evidence_format : str, optional
+        ``"full"`` or ``"compact"`` tool evidence (default:
+        ``SENTISENSE_EVIDENCE_FORMAT``).  Compact evidence raises the
+        headlines-per-call ceiling (:func:`max_batch_size`) and lets the
+        packer fit more headlines per prompt.
 
     Returns
     -------
     list[dict]
         One result dict per headline with all 7 scores + metadata.
     """
-    batch_size = min(batch_size, MAX_BATCH_SIZE)
+    evidence_format = _check_evidence_format(evidence_format or EVIDENCE_FORMAT)
+    batch_size = min(batch_size, max_batch_size(evidence_format))
+    system_prompt = _with_legend(_BATCH_SYSTEM_PROMPT, evidence_format)
     llm = llm or build_llm()
     structured_llm = llm.with_structured_output(BatchHeadlineScores)
-    semaphore = asyncio.Semaphore(concurrency)
+    limiter = limiter or make_llm_limiter(concurrency)
 
     async def _score_single_truncated(
         obs: dict[str, Any], evidence: str,
@@ -571,15 +842,20 @@ async def score_headlines_batch(
         once, so one pathological row (e.g. a pasted article body) doesn't fail.
         """
         headline = obs.get("headline", "")
-        char_budget = max(int(_INPUT_TOKEN_BUDGET * _CHARS_PER_TOKEN), 500)
-        keep_headline = headline[: char_budget // 2]
-        keep_evidence = evidence[: max(0, char_budget - len(keep_headline))]
+        counter = token_counter()
+        budget = max(_input_token_budget(evidence_format), int(500 / _CHARS_PER_TOKEN))
+        keep_headline = counter.truncate(headline, budget // 2)
+        keep_evidence = counter.truncate(
+            evidence, budget - counter.count(keep_headline, cache=False),
+        )
         message = _build_batch_user_message([keep_headline], [keep_evidence])
         t0 = time.perf_counter()
         try:
-            async with semaphore:
+            async with limiter.slot(
+                tokens=_estimate_message_tokens(message) + _PER_HEADLINE_OUTPUT_TOKENS,
+            ):
                 res = await structured_llm.ainvoke([
-                    {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": message},
                 ])
             elapsed = time.perf_counter() - t0
@@ -605,9 +881,12 @@ async def score_headlines_batch(
         user_message = _build_batch_user_message(headline_texts, batch_evidences)
 
         try:
-            async with semaphore:
+            async with limiter.slot(
+                tokens=_estimate_message_tokens(user_message)
+                + len(batch_obs) * _PER_HEADLINE_OUTPUT_TOKENS,
+            ):
                 batch_result = await structured_llm.ainvoke([
-                    {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_message},
                 ])
             elapsed = time.perf_counter() - t0
@@ -646,9 +925,10 @@ async def score_headlines_batch(
             # Adaptive recovery: a context-length 400 means this batch's prompt
             # exceeded the model window. Bisect and retry each half (down to a
             # single headline) so a few long headlines don't fail their
-            # neighbours. The semaphore is already released (we left the
+            # neighbours. The limiter slot is already released (we left the
             # `async with` block), so the recursive halves can acquire it.
             if _is_context_overflow(exc) and len(batch_obs) > 1:
+                PACKING_STATS.bisections += 1
                 mid = len(batch_obs) // 2
                 logger.warning(
                     "Context overflow on {} headlines (~{} input tok) — bisecting.",
@@ -660,6 +940,7 @@ async def score_headlines_batch(
                 )
                 return left + right
             if _is_context_overflow(exc) and len(batch_obs) == 1:
+                PACKING_STATS.truncations += 1
                 return [await _score_single_truncated(batch_obs[0], batch_evidences[0])]
             elapsed = time.perf_counter() - t0
             logger.error(
@@ -671,19 +952,20 @@ async def score_headlines_batch(
                 for obs in batch_obs
             ]
 
-    # Pre-compute tool evidence for every headline ONCE on worker threads (stateless
-    # regex/dict lookups), reused across any adaptive re-split so a bisected retry
-    # never recomputes. Then pack into context-budget-bounded batches.
+    # Pre-compute tool evidence for every headline ONCE, in a single off-loop call
+    # (process pool for large lists), reused across any adaptive re-split so a
+    # bisected retry never recomputes. Then pack into context-budget-bounded batches.
     all_texts = [obs.get("headline", "") for obs in headlines]
-    all_evidences = list(await asyncio.gather(
-        *[asyncio.to_thread(precompute_tool_evidence, h) for h in all_texts]
-    ))
-    packed = _pack_batches(headlines, all_evidences, batch_size)
+    all_evidences = await asyncio.to_thread(
+        precompute_tool_evidence_many, all_texts, evidence_format,
+    )
+    packed = _pack_batches(headlines, all_evidences, batch_size, evidence_format)
 
     logger.info(
         "Batch mode: {} headlines → {} batches (≤{} headlines, ≤{} input tok/batch), "
-        "concurrency={}",
-        len(headlines), len(packed), batch_size, _INPUT_TOKEN_BUDGET, concurrency,
+        "concurrency={} (adaptive {}-{})",
+        len(headlines), len(packed), batch_size, _input_token_budget(evidence_format),
+        limiter.limit, limiter.min_limit, limiter.max_limit,
     )
 
     batch_results = await asyncio.gather(
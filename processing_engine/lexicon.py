@@ -0,0 +1,310 @@
+"""
+processing_engine.lexicon
+=========================
+Compiled multi-pattern matcher over every keyword dictionary in ``tools``.
+
+The LangChain tools each run ``heb in text`` over their own dictionary, so
+pre-computing evidence for one headline costs ~25 ``tool.invoke`` round-trips
+and a few hundred separate substring scans.  This module merges every
+dictionary into ONE compiled (trie-factored) alternation regex, scans a
+headline once, and returns the hits tagged by lexicon category.  :func:`render_tool` then
+produces exactly the text the corresponding ``@tool`` would have returned
+(the tools and this module share the renderers in ``tools``).
+
+Matching semantics are identical to ``heb in text``: every term that occurs
+anywhere in the text is a hit, including terms that overlap or nest inside
+longer terms (``שר`` inside ``סגן שר``, ``הסכם`` inside ``הסכם שלום``).
+
+Usage::
+
+    from processing_engine.lexicon import LEXICON, render_tool
+    from processing_engine.tools import scan_political_entities
+
+    hits = LEXICON.scan(headline)              # {"political_entities": [...], ...}
+    text = render_tool(scan_political_entities, headline, hits)
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from . import tools as T
+
+Hits = dict[str, list[tuple[str, str]]]
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Lexicon registry — category → (hebrew, english) entries in tool order
+# ═══════════════════════════════════════════════════════════════════════
+
+LEXICONS: dict[str, list[tuple[str, str]]] = {
+    "urgency": T._URGENCY_PATTERNS,
+    "political_entities": list(T._POLITICAL_ENTITIES.items()),
+    "legislative": T._LEGISLATIVE_KEYWORDS,
+    "financial_entities": list(T._FINANCIAL_ENTITIES.items()),
+    "economic_indicators": T._ECONOMIC_INDICATORS,
+    "military_entities": list(T._MILITARY_ENTITIES.items()),
+    "conflict": T._CONFLICT_KEYWORDS,
+    "threat": T._THREAT_KEYWORDS,
+    "health_entities": list(T._HEALTH_ENTITIES.items()),
+    "medical": T._MEDICAL_KEYWORDS,
+    "scientific": T._SCIENTIFIC_KEYWORDS,
+    "climate": T._CLIMATE_KEYWORDS,
+    "tech_keywords": T._TECH_KEYWORDS,
+    "tech_companies": list(T._TECH_COMPANIES.items()),
+    "bullish": T._BULLISH_SIGNALS,
+    "bearish": T._BEARISH_SIGNALS,
+    "geo_instability": T._GEO_INSTABILITY,
+    "geo_stability": T._GEO_STABILITY,
+    "dovish": T._DOVISH_SIGNALS,
+    "hawkish": T._HAWKISH_SIGNALS,
+    "magnitude": list(T._MAGNITUDE_WORDS.items()),
+}
+
+
+def _trie_regex(terms: Iterable[str]) -> str:
+    """Alternation of ``terms`` factored into a character trie.
+
+    Sibling branches start with distinct characters, so ``re`` rejects a
+    non-matching branch on its first character instead of trying every term
+    at every position.  Greedy optional groups make the match at a position
+    the LONGEST term starting there.
+    """
+    trie: dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-term marker
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class CompiledLexicon:
+    """All lexicons merged into a single compiled pattern.
+
+    The pattern is a zero-width lookahead over a trie of every distinct
+    term, so ``finditer`` reports the longest term starting at each
+    position.  Any shorter term matching at the same position is
+    necessarily a prefix of it; those are precomputed per term, which makes
+    the scan exact without an overlapping-match engine.
+    """
+
+    __slots__ = ("_entries", "_occurrences", "_prefixes", "_pattern")
+
+    def __init__(self, lexicons: dict[str, Iterable[tuple[str, str]]]) -> None:
+        self._entries: dict[str, list[tuple[str, str]]] = {
+            cat: list(entries) for cat, entries in lexicons.items()
+        }
+        # term → every (category, position) it occupies; one term can live in
+        # several dictionaries (e.g. פיגוע is urgency, conflict and threat).
+        self._occurrences: dict[str, list[tuple[str, int]]] = {}
+        for cat, entries in self._entries.items():
+            for i, (term, _) in enumerate(entries):
+                self._occurrences.setdefault(term, []).append((cat, i))
+
+        terms = list(self._occurrences)
+        self._prefixes: dict[str, tuple[str, ...]] = {
+            t: tuple(p for p in terms if t.startswith(p)) for t in terms
+        }
+        self._pattern = re.compile("(?=(" + _trie_regex(terms) + "))")
+
+    def terms_in(self, text: str) -> set[str]:
+        """Return every lexicon term that occurs as a substring of ``text``."""
+        found: set[str] = set()
+        for m in self._pattern.finditer(text):
+            found.update(self._prefixes[m.group(1)])
+        return found
+
+    def scan(self, text: str) -> Hits:
+        """Scan ``text`` once; return category → hits in dictionary order.
+
+        Categories without a hit are absent from the result.
+        """
+        positions: dict[str, list[int]] = {}
+        for term in self.terms_in(text):
+            for cat, i in self._occurrences[term]:
+                positions.setdefault(cat, []).append(i)
+        return {
+            cat: [self._entries[cat][i] for i in sorted(idx)]
+            for cat, idx in positions.items()
+        }
+
+
+LEXICON = CompiledLexicon(LEXICONS)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Tool renderers — tool name → (text, hits) → the tool's exact output
+# ═══════════════════════════════════════════════════════════════════════
+
+Renderer = Callable[[str, Hits], str]
+
+
+def _text_only(tool_fn: Any) -> Renderer:
+    """Tools that are not dictionary scans: call the plain function directly."""
+    fn = tool_fn.func
+    return lambda text, hits: fn(text)
+
+
+def _single(category: str, label: str, empty: str) -> Renderer:
+    return lambda text, hits: T._render_matches(hits.get(category, []), label, empty)
+
+
+_RENDERERS: dict[str, Renderer] = {
+    # Shared
+    "clean_hebrew_text": _text_only(T.clean_hebrew_text),
+    "transliterate_hebrew": _text_only(T.transliterate_hebrew),
+    "count_headline_words": _text_only(T.count_headline_words),
+    "detect_urgency_markers": _single(
+        "urgency", "Urgency markers found", "No urgency markers detected."),
+    "extract_quoted_text": _text_only(T.extract_quoted_text),
+    "extract_numbers_and_percentages": _text_only(T.extract_numbers_and_percentages),
+    # Politics & Government
+    "scan_political_entities": _single(
+        "political_entities", "Political entities", "No political entities detected."),
+    "detect_legislative_activity": _single(
+        "legislative", "Legislative keywords", "No legislative activity keywords detected."),
+    # Economy & Finance
+    "scan_financial_entities": _single(
+        "financial_entities", "Financial entities", "No financial entities detected."),
+    "detect_economic_indicators": _single(
+        "economic_indicators", "Economic indicators", "No economic indicator keywords detected."),
+    "extract_economic_figures": _text_only(T.extract_economic_figures),
+    # Security & Military
+    "scan_military_entities": _single(
+        "military_entities", "Military entities", "No military entities detected."),
+    "detect_conflict_signals": _single(
+        "conflict", "Conflict signals", "No conflict-related keywords detected."),
+    "assess_threat_level": lambda text, hits: T._render_threat_level(hits.get("threat", [])),
+    # Health & Medicine
+    "scan_health_entities": _single(
+        "health_entities", "Health entities", "No health entities detected."),
+    "detect_medical_terms": _single(
+        "medical", "Medical terms", "No medical terminology detected."),
+    # Science & Climate
+    "detect_scientific_terms": _single(
+        "scientific", "Scientific terms", "No scientific keywords detected."),
+    "detect_climate_indicators": _single(
+        "climate", "Climate indicators", "No climate/environment keywords detected."),
+    # Technology
+    "detect_tech_keywords": _single(
+        "tech_keywords", "Technology terms", "No technology keywords detected."),
+    "scan_tech_companies": _single(
+        "tech_companies", "Tech companies", "No technology companies detected."),
+    # Sentiment / market signals
+    "detect_market_sentiment_signals": lambda text, hits: T._render_market_sentiment(
+        hits.get("bullish", []), hits.get("bearish", [])),
+    "assess_geopolitical_risk": lambda text, hits: T._render_geopolitical_risk(
+        hits.get("geo_instability", []), hits.get("geo_stability", [])),
+    "detect_monetary_policy_signals": lambda text, hits: T._render_monetary_policy(
+        hits.get("dovish", []), hits.get("hawkish", [])),
+    "extract_impact_magnitude": lambda text, hits: T._render_impact_magnitude(
+        text, hits.get("magnitude", [])),
+}
+
+
+def render_tool(tool_fn: Any, text: str, hits: Hits) -> str | None:
+    """Render ``tool_fn``'s output for ``text`` from pre-scanned ``hits``.
+
+    Returns ``None`` for a tool this module does not know, so callers can
+    fall back to ``tool_fn.invoke``.
+    """
+    renderer = _RENDERERS.get(tool_fn.name)
+    if renderer is None:
+        return None
+    return renderer(text, hits)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Compact evidence — terse ``tag:term→gloss`` tokens, empty sections dropped
+# ═══════════════════════════════════════════════════════════════════════
+
+# Lexicon category → compact tag.  Dictionaries that feed the same relevancy
+# category share a tag, so a term found by two of its tools is listed once.
+COMPACT_TAGS: dict[str, str] = {
+    "urgency": "urgent",
+    "political_entities": "pol",
+    "legislative": "pol",
+    "financial_entities": "eco",
+    "economic_indicators": "eco",
+    "military_entities": "sec",
+    "conflict": "sec",
+    "health_entities": "health",
+    "medical": "health",
+    "scientific": "sci",
+    "climate": "sci",
+    "tech_keywords": "tech",
+    "tech_companies": "tech",
+    "bullish": "bull",
+    "bearish": "bear",
+    "geo_instability": "georisk",
+    "geo_stability": "geostab",
+    "dovish": "dovish",
+    "hawkish": "hawkish",
+    "magnitude": "mag",
+}
+
+
+def _squash(rendered: str) -> str | None:
+    """One-line form of a multi-line tool output; ``None`` for a "No …" result."""
+    if rendered.startswith("No "):
+        return None
+    lines = [line.strip(" -") for line in rendered.splitlines()]
+    if len(lines) > 1 and lines[0].endswith(":"):
+        lines = lines[1:]
+    return "; ".join(line for line in lines if line)
+
+
+def render_compact(text: str, hits: Hits) -> str:
+    """Compact evidence block for ``text`` from pre-scanned ``hits``.
+
+    One ``tags:term→gloss`` line per distinct lexicon term (tags joined by
+    ``,`` when several dictionaries matched it), plus one-line numeric,
+    quote, threat-tier and signal-balance facts.  Nothing is emitted for a
+    tool that found nothing; a headline with no signal at all renders as
+    ``(no signals)``.
+    """
+    lines: list[str] = []
+    words = len(text.split())
+    facts = [f"words:{words}"]
+    for label, fn in (
+        ("nums", T.extract_numbers_and_percentages.func),
+        ("figures", T.extract_economic_figures.func),
+        ("quote", T.extract_quoted_text.func),
+    ):
+        squashed = _squash(fn(text))
+        if squashed:
+            facts.append(f"{label}:{squashed}")
+    lines.append(" | ".join(facts))
+
+    terms: dict[str, tuple[list[str], str]] = {}
+    for cat, tag in COMPACT_TAGS.items():
+        for term, gloss in hits.get(cat, ()):
+            tags, _ = terms.setdefault(term, ([], gloss))
+            if tag not in tags:
+                tags.append(tag)
+    lines.extend(f"{','.join(tags)}:{term}→{gloss}" for term, (tags, gloss) in terms.items())
+
+    if hits.get("threat"):
+        kw, level = hits["threat"][0]
+        lines.append(f"threat:{level}({kw})")
+    bull, bear = len(hits.get("bullish", ())), len(hits.get("bearish", ()))
+    if bull or bear:
+        lines.append(f"balance:{bull - bear:+d}")
+    impact = _squash(T._render_impact_magnitude(text, []))
+    if impact:
+        lines.append(f"impact:{impact.removeprefix('Percentage magnitude: ')}")
+
+    if len(lines) == 1:
+        lines.append("(no signals)")
+    return "\n".join(lines)
@@ -0,0 +1,144 @@
+"""
+processing_engine.near_dup
+==========================
+Near-duplicate headline collapsing (MinHash + LSH) ahead of LLM scoring.
+
+The exact-text score cache (:mod:`processing_engine.score_cache`) misses the
+small rewrites outlets apply to the same flash — ``צה״ל`` vs ``צה"ל``, an
+extra word, a trailing source tag.  Here each headline is reduced to the set
+of character shingles of its cleaned text, summarised by a MinHash signature,
+and bucketed by LSH bands; only headlines sharing a bucket are compared, and
+a candidate joins a cluster only if the EXACT shingle Jaccard similarity to
+the cluster representative reaches the threshold (LSH is only the candidate
+filter, so the threshold is honoured exactly).
+
+Clusters are representative-centred rather than transitive: every member is
+within the threshold of the headline whose score it receives, so a chain of
+small rewrites can never drift into a different story.
+
+Usage::
+
+    from processing_engine.near_dup import near_duplicate_representatives
+
+    reps = near_duplicate_representatives(texts, dates, threshold=0.8)
+    # reps[i] == i  → headline i is scored
+    # reps[i] == j  → headline i reuses headline j's score (j < i)
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import zlib
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import Any
+
+from .tools import normalize_hebrew_text
+
+SHINGLE_SIZE: int = 3
+NUM_PERM: int = 64
+
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(0x5E471)  # fixed: signatures must be stable across runs
+_PERMS: list[tuple[int, int]] = [
+    (_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)
+]
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> frozenset[str]:
+    """Character ``k``-shingles of the cleaned text (niqqud and punctuation dropped).
+
+    Punctuation is removed before shingling so quote/geresh variants
+    (``צה״ל`` / ``צה"ל`` / ``צה'ל``) produce the same shingles.
+    """
+    cleaned = re.sub(r"[^\w\s]", "", normalize_hebrew_text(text))
+    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    if len(cleaned) <= k:
+        return frozenset([cleaned])
+    return frozenset(cleaned[i : i + k] for i in range(len(cleaned) - k + 1))
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def minhash(sh: frozenset[str]) -> tuple[int, ...]:
+    """``NUM_PERM``-slot MinHash signature (crc32 shingle hashes, universal permutations)."""
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in sh]
+    return tuple(min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMS)
+
+
+def lsh_params(threshold: float, num_perm: int = NUM_PERM) -> tuple[int, int]:
+    """``(bands, rows)`` whose S-curve midpoint ``(1/b)^(1/r)`` sits just below ``threshold``.
+
+    The midpoint is placed ~0.1 under the threshold so pairs AT the threshold
+    become candidates with high probability (≈95% at 0.8); false candidates
+    only cost an exact Jaccard check.
+    """
+    target = max(threshold - 0.1, 0.0)
+    best = (num_perm, 1)
+    for r in range(1, num_perm + 1):
+        b = num_perm // r
+        if (1 / b) ** (1 / r) <= target:
+            best = (b, r)
+    return best
+
+
+def _as_date(value: Any) -> date | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def near_duplicate_representatives(
+    texts: Sequence[str],
+    dates: Sequence[Any] | None = None,
+    *,
+    threshold: float = 0.8,
+    window_days: int = 1,
+) -> list[int]:
+    """Map every headline to the index of its cluster representative.
+
+    Headlines are visited in input order; each joins the most similar earlier
+    representative whose shingle Jaccard similarity is ``>= threshold`` and
+    whose date is within ``window_days`` (when ``dates`` is given), otherwise
+    it becomes a representative itself.
+    """
+    n = len(texts)
+    if n == 0:
+        return []
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+    days = [_as_date(d) for d in dates] if dates is not None else [None] * n
+    bands, rows = lsh_params(threshold)
+
+    reps = list(range(n))
+    sets: list[frozenset[str]] = []
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    for i, text in enumerate(texts):
+        sh = shingles(text)
+        sets.append(sh)
+        sig = minhash(sh)
+        keys = [(b, sig[b * rows : (b + 1) * rows]) for b in range(bands)]
+
+        candidates = {c for key in keys for c in buckets.get(key, ())}
+        best, best_sim = i, threshold
+        for c in sorted(candidates):
+            if days[i] is not None and days[c] is not None \
+                    and abs((days[i] - days[c]).days) > window_days:
+                continue
+            sim = jaccard(sh, sets[c])
+            if sim > best_sim or (sim == best_sim and best == i):
+                best, best_sim = c, sim
+        reps[i] = best
+        if reps[i] == i:
+            for key in keys:
+                buckets.setdefault(key, []).append(i)
+    return reps
@@ -33,8 +33,13 @@ from tenacity import (
     wait_exponential,
 )
 
+from .concurrency import AdaptiveLimiter
 from .config import (
+    ADAPTIVE_CONCURRENCY,
     AGENT_CONCURRENCY,
+    LLM_CONCURRENCY_MAX,
+    LLM_CONCURRENCY_MIN,
+    LLM_LATENCY_TOLERANCE,
     RATE_LIMIT_RPM,
     RELEVANCY_CATEGORIES,
     RELEVANCY_MAX,
@@ -51,16 +56,28 @@ from .models import (
 
 _retry_cfg = RetryConfig()
 
-# Semaphore that caps simultaneous Ollama calls across all agent nodes.
-# Concurrency=7 → all agents run in parallel (default, fastest).
-# Concurrency=1 → agents run one at a time (sequential, low-RAM safe).
-_agent_semaphore = asyncio.Semaphore(AGENT_CONCURRENCY)
+# Adaptive limit on simultaneous Ollama calls across all agent nodes, starting
+# at AGENT_CONCURRENCY and moved by latency / 429 / 5xx / timeout feedback.
+# Concurrency=7 → all agents start in parallel (default, fastest).
+# Concurrency=1 → agents start one at a time (sequential, low-RAM safe); with
+# SENTISENSE_ADAPTIVE_CONCURRENCY=false the limit never moves.
+_agent_limiter = AdaptiveLimiter.configured(
+    AGENT_CONCURRENCY,
+    adaptive=ADAPTIVE_CONCURRENCY,
+    floor=LLM_CONCURRENCY_MIN,
+    ceiling=LLM_CONCURRENCY_MAX,
+    tolerance=LLM_LATENCY_TOLERANCE,
+    name="agents",
+)
 
 _mode = "parallel" if AGENT_CONCURRENCY > 1 else "sequential"
 logger.info(
-    "Agent concurrency: {} ({} mode) — set SENTISENSE_AGENT_CONCURRENCY=1 to force sequential",
+    "Agent concurrency: {} ({} mode, adaptive {}-{}) — set SENTISENSE_AGENT_CONCURRENCY=1 "
+    "and SENTISENSE_ADAPTIVE_CONCURRENCY=false to force sequential",
     AGENT_CONCURRENCY,
     _mode,
+    _agent_limiter.min_limit,
+    _agent_limiter.max_limit,
 )
 
 
@@ -164,12 +181,19 @@ def make_agent_node(agent, state_key: str, display_name: str):
     """
 
     async def _invoke_agent(headline: str):
-        """Invoke the ReAct agent and return the structured response."""
-        result = await agent.ainvoke({
-            "messages": [
-                HumanMessage(content=f"Analyze this Hebrew news headline:\n\n{headline}")
-            ],
-        })
+        """Invoke the ReAct agent and return the structured response.
+
+        One attempt: the RPM throttle is waited out *before* taking a
+        concurrency slot, and retry backoff happens between attempts, so
+        the adaptive limiter only times the call itself.
+        """
+        await _rate_limiter.acquire()
+        async with _agent_limiter.slot():
+            result = await agent.ainvoke({
+                "messages": [
+                    HumanMessage(content=f"Analyze this Hebrew news headline:\n\n{headline}")
+                ],
+            })
         structured = result.get("structured_response")
         if structured is None:
             raise ValueError(
@@ -193,9 +217,7 @@ def make_agent_node(agent, state_key: str, display_name: str):
         logger.info("[{}] Starting ReAct agent for: {}…", display_name, headline[:50])
 
         try:
-            async with _agent_semaphore:
-                await _rate_limiter.acquire()
-                structured = await _invoke_with_retry(headline)
+            structured = await _invoke_with_retry(headline)
             logger.info("[{}] score={}", display_name, structured.score)
             return {
                 state_key: AgentResult(
@@ -42,20 +42,26 @@ from .config import (
     OllamaConfig,
     OpenAIConfig,
 )
+from .tokens import token_counter
 
 # Headroom clamp for the completions endpoint. vLLM rejects any request where
 # prompt_tokens + max_tokens > max_model_len. We clamp the requested output to
 # the residual window so a large COMPLETIONS_MAX_TOKENS (or one equal to the
 # context, as in some production envs) can't guarantee a 400 on every call.
-# Conservative chars→tokens (over-estimates the prompt → leaves MORE headroom).
-_CHARS_PER_TOKEN = 1.5
+# Prompt tokens come from processing_engine.tokens: exact with a local tokenizer,
+# else a conservative chars→tokens estimate (over-estimates → leaves MORE headroom).
 _OUTPUT_HEADROOM_MARGIN = 256   # reserve for prompt-estimate error + special tokens
 _MIN_OUTPUT_TOKENS = 256        # never request a non-positive output budget
 
 
 def _clamp_output_tokens(prompt: str, requested: int) -> int:
-    """Cap output max_tokens so prompt + output stays within the context window."""
-    prompt_tokens = int(len(prompt) / _CHARS_PER_TOKEN)
+    """Cap output max_tokens so prompt + output stays within the context window.
+
+    The prompt is counted with the model's tokenizer when
+    ``SENTISENSE_TOKENIZER_PATH`` is set (see :mod:`processing_engine.tokens`),
+    otherwise estimated from its length.
+    """
+    prompt_tokens = token_counter().count(prompt, cache=False)
     residual = CONTEXT_WINDOW - prompt_tokens - _OUTPUT_HEADROOM_MARGIN
     return max(_MIN_OUTPUT_TOKENS, min(requested, residual))
 
@@ -0,0 +1,159 @@
+"""
+processing_engine.score_cache
+=============================
+Content-addressed score cache keyed by normalised headline text + model.
+
+The same wire story is carried by many outlets on mivzakim.net, and
+``raw_headlines`` only dedups on ``(date, source, hour, headline_hash)``, so
+identical text from different sources used to be scored by the LLM again and
+again.  The cache key is the md5 of :func:`~processing_engine.tools.normalize_hebrew_text`
+(NFC, niqqud stripped, whitespace collapsed); rows live in the
+``headline_score_cache`` table (migration 010) and are read/written through
+any DB-API connection (psycopg v3 or psycopg2).
+
+Only validated scores are cached.  Results served from the cache use the
+same result-dict shape as :mod:`processing_engine.fast_pipeline`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .tools import normalize_hebrew_text
+
+# Result-dict keys (fast_pipeline) in DB column order (headline_score_cache / nlp_vectors).
+_RESULT_KEYS: tuple[str, ...] = (
+    "relevance_category_1",
+    "relevance_category_2",
+    "relevance_category_3",
+    "relevance_category_4",
+    "relevance_category_5",
+    "relevance_category_6",
+    "global_sentiment",
+)
+
+_LOOKUP_SQL = """
+    SELECT text_hash,
+           relevance_politics, relevance_economy, relevance_security,
+           relevance_health, relevance_science, relevance_technology,
+           global_sentiment, source_headline_id
+    FROM headline_score_cache
+    WHERE model_name = %s AND text_hash = ANY(%s)
+"""
+
+_STORE_SQL = """
+    INSERT INTO headline_score_cache (
+        text_hash, model_name,
+        relevance_politics, relevance_economy, relevance_security,
+        relevance_health, relevance_science, relevance_technology,
+        global_sentiment, source_headline_id
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (text_hash, model_name) DO NOTHING
+"""
+
+
+_WARM_SQL = """
+    SELECT rh.id, rh.headline,
+           nv.relevance_politics, nv.relevance_economy, nv.relevance_security,
+           nv.relevance_health, nv.relevance_science, nv.relevance_technology,
+           nv.global_sentiment
+    FROM raw_headlines rh
+    JOIN nlp_vectors nv ON nv.headline_id = rh.id
+    WHERE nv.model_name = %s AND nv.validation_passed = TRUE
+      AND nv.scored_from_headline_id IS NULL AND rh.id > %s
+    ORDER BY rh.id
+    LIMIT %s
+"""
+
+
+def headline_cache_key(headline: str) -> str:
+    """md5 hex digest of the normalised headline text."""
+    return hashlib.md5(normalize_hebrew_text(headline).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Per-run counters: how many headlines skipped their own LLM call."""
+
+    lookups: int = 0      # headlines checked against the cache
+    hits: int = 0         # served from headline_score_cache
+    duplicates: int = 0   # same key as another headline scored in the same chunk
+
+    @property
+    def saved(self) -> int:
+        return self.hits + self.duplicates
+
+    @property
+    def hit_rate(self) -> float:
+        return self.saved / self.lookups if self.lookups else 0.0
+
+
+class ScoreCache:
+    """Read/write access to ``headline_score_cache`` for one model."""
+
+    def __init__(self, conn: Any, model_name: str) -> None:
+        self.conn = conn
+        self.model_name = model_name
+        self.stats = CacheStats()
+
+    def lookup(self, keys: Iterable[str]) -> dict[str, tuple[dict[str, Any], int | None]]:
+        """Return ``key → (result dict, source_headline_id)`` for every cached key."""
+        keys = list(set(keys))
+        if not keys:
+            return {}
+        cursor = self.conn.cursor()
+        cursor.execute(_LOOKUP_SQL, (self.model_name, keys))
+        rows = cursor.fetchall()
+        cursor.close()
+        found: dict[str, tuple[dict[str, Any], int | None]] = {}
+        for row in rows:
+            result = dict(zip(_RESULT_KEYS, row[1:8]))
+            result.update(validation_passed=True, errors=[], processing_time_seconds=0.0)
+            found[row[0]] = (result, row[8])
+        return found
+
+    def store(self, key: str, result: dict[str, Any], source_headline_id: int) -> None:
+        """Cache a validated result (no-op for failed results or an existing key)."""
+        self.store_many([(key, result, source_headline_id)])
+
+    def store_many(self, entries: Iterable[tuple[str, dict[str, Any], int]]) -> int:
+        """Cache several ``(key, result, source_headline_id)``; returns rows offered."""
+        params = [
+            (key, self.model_name, *(result.get(k, 0) for k in _RESULT_KEYS), source_id)
+            for key, result, source_id in entries
+            if result.get("validation_passed", False)
+        ]
+        if params:
+            cursor = self.conn.cursor()
+            cursor.executemany(_STORE_SQL, params)
+            cursor.close()
+        return len(params)
+
+    def warm_from_nlp_vectors(self, page: int = 10_000) -> int:
+        """Seed the cache from validated ``nlp_vectors`` rows of this model.
+
+        Keyset-paginated over ``raw_headlines.id`` and committed per page.
+        Rows that are themselves cache copies are skipped.  Returns the number
+        of rows offered (existing keys are left untouched).
+        """
+        last_id, offered = 0, 0
+        while True:
+            cursor = self.conn.cursor()
+            cursor.execute(_WARM_SQL, (self.model_name, last_id, page))
+            rows = cursor.fetchall()
+            cursor.close()
+            if not rows:
+                return offered
+            offered += self.store_many(
+                (
+                    headline_cache_key(row[1]),
+                    {**dict(zip(_RESULT_KEYS, row[2:9])), "validation_passed": True},
+                    row[0],
+                )
+                for row in rows
+            )
+            self.conn.commit()
+            last_id = rows[-1][0]
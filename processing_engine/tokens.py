@@ -0,0 +1,143 @@
+"""
+processing_engine.tokens
+========================
+Prompt token counting for batch packing and output-budget clamping.
+
+By default tokens are *estimated* from the character count (1.5 chars per
+token — deliberately pessimistic for Hebrew, which SentencePiece splits
+finely).  That wastes context on short headlines, and when it
+under-estimates, ``fast_pipeline`` only finds out from a 400 "maximum
+context length" reply and bisects the batch: one failed request plus two
+half-size retries.
+
+Point ``SENTISENSE_TOKENIZER_PATH`` at the served model's
+``tokenizer.json`` (or the directory holding it — e.g. the HF snapshot
+already in the local cache) and counts become exact.  The file is loaded
+locally, never downloaded.  Needs the optional ``tokenizers`` package
+(``uv sync --extra tokenizer``); when it or the file is missing, the
+estimate is used and a warning logged once.
+
+Counts are memoised in an LRU keyed by text, so each headline's tool
+evidence is tokenised once per process even though a bisected or
+re-packed batch asks for it again.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+
+from loguru import logger
+
+from .config import TOKEN_CACHE_SIZE, TOKENIZER_PATH
+
+_CHARS_PER_TOKEN = 1.5
+
+
+def _load_tokenizer(path: str):
+    """``tokenizers.Tokenizer`` from a local file, or ``None`` (→ estimate)."""
+    file = Path(path).expanduser()
+    if file.is_dir():
+        file = file / "tokenizer.json"
+    if not file.is_file():
+        logger.warning("Tokenizer file {} not found — using the chars/token estimate", file)
+        return None
+    try:
+        from tokenizers import Tokenizer
+    except ImportError:
+        logger.warning(
+            "SENTISENSE_TOKENIZER_PATH is set but the 'tokenizers' package is not installed "
+            "(uv sync --extra tokenizer) — using the chars/token estimate",
+        )
+        return None
+    tokenizer = Tokenizer.from_file(str(file))
+    logger.info("Exact token counts from {}", file)
+    return tokenizer
+
+
+class TokenCounter:
+    """Count prompt tokens, exactly (local tokenizer) or by estimate.
+
+    Parameters
+    ----------
+    tokenizer_path : str
+        ``tokenizer.json`` (or its directory); empty → estimate only.
+    cache_size : int
+        Entries in the per-text LRU (0 disables caching).
+    """
+
+    def __init__(self, tokenizer_path: str = "", cache_size: int = 65536) -> None:
+        self._tokenizer = _load_tokenizer(tokenizer_path) if tokenizer_path else None
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def exact(self) -> bool:
+        """True when counts come from the model's tokenizer."""
+        return self._tokenizer is not None
+
+    def _encode_many(self, texts: list[str]) -> list[int]:
+        if self._tokenizer is None:
+            return [int(len(t) / _CHARS_PER_TOKEN) for t in texts]
+        encodings = self._tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [len(e.ids) for e in encodings]
+
+    def count(self, text: str, *, cache: bool = True) -> int:
+        """Token count of ``text``; ``cache=False`` for one-off strings (whole prompts)."""
+        if not cache or not self.cache_size:
+            return self._encode_many([text])[0]
+        return self.count_many([text])[0]
+
+    def count_many(self, texts: Iterable[str]) -> list[int]:
+        """Token counts for ``texts``; cache misses are tokenised in one batch call."""
+        texts = list(texts)
+        counts: list[int | None] = [None] * len(texts)
+        missing: dict[str, list[int]] = {}
+        with self._lock:
+            for i, text in enumerate(texts):
+                n = self._cache.get(text)
+                if n is None:
+                    missing.setdefault(text, []).append(i)
+                else:
+                    self._cache.move_to_end(text)
+                    counts[i] = n
+            self.hits += len(texts) - sum(len(v) for v in missing.values())
+            self.misses += len(missing)
+        if missing:
+            fresh = self._encode_many(list(missing))
+            with self._lock:
+                for (text, slots), n in zip(missing.items(), fresh):
+                    for i in slots:
+                        counts[i] = n
+                    if self.cache_size:
+                        self._cache[text] = n
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return counts  # type: ignore[return-value]
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of ``text`` within ``max_tokens`` (cut at a token boundary)."""
+        if max_tokens <= 0:
+            return ""
+        if self._tokenizer is None:
+            return text[: int(max_tokens * _CHARS_PER_TOKEN)]
+        encoding = self._tokenizer.encode_batch([text], add_special_tokens=False)[0]
+        if len(encoding.ids) <= max_tokens:
+            return text
+        return text[: encoding.offsets[max_tokens - 1][1]]
+
+
+_counter: TokenCounter | None = None
+
+
+def token_counter() -> TokenCounter:
+    """Process-wide counter built from ``SENTISENSE_TOKENIZER_PATH``."""
+    global _counter
+    if _counter is None:
+        _counter = TokenCounter(TOKENIZER_PATH, TOKEN_CACHE_SIZE)
+    return _counter
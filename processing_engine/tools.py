@@ -25,11 +25,37 @@ import regex  # enhanced Unicode support
 from langchain_core.tools import tool
 
 
+# Renderers are split from the matching so that processing_engine.lexicon
+# (one compiled scan over every dictionary) produces byte-identical text.
+# Each ``found`` argument is the list of (hebrew, english) hits in the order
+# of the source dictionary.
+
+
+def _render_matches(found: list[tuple[str, str]], label: str, empty: str) -> str:
+    """Render a single-dictionary scan: header with hit count + one line per hit."""
+    if not found:
+        return empty
+    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
+    return f"{label} ({len(found)}):\n" + "\n".join(lines)
+
+
 # ╔═══════════════════════════════════════════════════════════════════════╗
 # ║  SHARED TOOLS  — bound to every agent                               ║
 # ╚═══════════════════════════════════════════════════════════════════════╝
 
 
+def normalize_hebrew_text(text: str) -> str:
+    """NFC-normalise, strip niqqud (U+0591–U+05C7) and collapse whitespace.
+
+    Plain-function form of :func:`clean_hebrew_text` for non-agent callers
+    (e.g. the score cache key in ``processing_engine.score_cache``).
+    """
+    text = unicodedata.normalize("NFC", text)
+    text = re.sub(r"[\u0591-\u05C7]", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text
+
+
 @tool
 def clean_hebrew_text(text: str) -> str:
     """Clean and normalise a Hebrew text string for analysis.
@@ -38,10 +64,7 @@ def clean_hebrew_text(text: str) -> str:
     diacritics U+0591–U+05C7), and collapses whitespace.  Use this
     before analysing a headline to reduce noise.
     """
-    text = unicodedata.normalize("NFC", text)
-    text = re.sub(r"[\u0591-\u05C7]", "", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return normalize_hebrew_text(text)
 
 
 _HEBREW_TO_LATIN: dict[str, str] = {
@@ -106,10 +129,7 @@ def detect_urgency_markers(text: str) -> str:
     translations, or "none" if no urgency markers found.
     """
     found = [(heb, eng) for heb, eng in _URGENCY_PATTERNS if heb in text]
-    if not found:
-        return "No urgency markers detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Urgency markers found ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Urgency markers found", "No urgency markers detected.")
 
 
 @tool
@@ -249,10 +269,7 @@ def scan_political_entities(text: str) -> str:
     Returns each matched entity with its English translation.
     """
     found = [(heb, eng) for heb, eng in _POLITICAL_ENTITIES.items() if heb in text]
-    if not found:
-        return "No political entities detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Political entities ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Political entities", "No political entities detected.")
 
 
 @tool
@@ -263,10 +280,7 @@ def detect_legislative_activity(text: str) -> str:
     קואליציה (coalition), בחירות (elections), etc.
     """
     found = [(heb, eng) for heb, eng in _LEGISLATIVE_KEYWORDS if heb in text]
-    if not found:
-        return "No legislative activity keywords detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Legislative keywords ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Legislative keywords", "No legislative activity keywords detected.")
 
 
 # ╔═══════════════════════════════════════════════════════════════════════╗
@@ -334,10 +348,7 @@ def scan_financial_entities(text: str) -> str:
     the TA-125/TA-35 indices, regulatory bodies, etc.
     """
     found = [(heb, eng) for heb, eng in _FINANCIAL_ENTITIES.items() if heb in text]
-    if not found:
-        return "No financial entities detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Financial entities ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Financial entities", "No financial entities detected.")
 
 
 @tool
@@ -348,10 +359,7 @@ def detect_economic_indicators(text: str) -> str:
     צמיחה (growth), מיתון (recession), מניות (stocks), etc.
     """
     found = [(heb, eng) for heb, eng in _ECONOMIC_INDICATORS if heb in text]
-    if not found:
-        return "No economic indicator keywords detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Economic indicators ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Economic indicators", "No economic indicator keywords detected.")
 
 
 @tool
@@ -456,10 +464,7 @@ def scan_military_entities(text: str) -> str:
     (Hamas, Hezbollah, etc.), and defence systems (Iron Dome).
     """
     found = [(heb, eng) for heb, eng in _MILITARY_ENTITIES.items() if heb in text]
-    if not found:
-        return "No military entities detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Military entities ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Military entities", "No military entities detected.")
 
 
 @tool
@@ -470,10 +475,31 @@ def detect_conflict_signals(text: str) -> str:
     (escalation), הפסקת אש (ceasefire), נפגעים (casualties), etc.
     """
     found = [(heb, eng) for heb, eng in _CONFLICT_KEYWORDS if heb in text]
+    return _render_matches(found, "Conflict signals", "No conflict-related keywords detected.")
+
+
+# Tuples, not sets: the reported keyword must not depend on the per-process
+# string-hash seed, or the same headline renders different evidence in
+# different worker processes.
+_THREAT_TIERS: list[tuple[str, tuple[str, ...]]] = [
+    ("CRITICAL", ("פיגוע", "חללים", "הפצצה", "טבח", "פלישה")),
+    ("HIGH", ("רקטות", "טילים", "הסלמה", "תקיפה", "ירי", "חדירה", "יירוט")),
+    ("MODERATE", ("מבצע", "כוננות", "גיוס", "גבול", "רחפנים", "מנהרה")),
+    ("LOW", ("תקציב ביטחון", "ותיקי צבא", "תרגיל", "אימון")),
+]
+
+# Flattened (keyword, level) in tier order — the first hit decides the level.
+_THREAT_KEYWORDS: list[tuple[str, str]] = [
+    (kw, level) for level, tier in _THREAT_TIERS for kw in tier
+]
+
+
+def _render_threat_level(found: list[tuple[str, str]]) -> str:
+    """Render the highest-tier hit from (keyword, level) pairs in tier order."""
     if not found:
-        return "No conflict-related keywords detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Conflict signals ({len(found)}):\n" + "\n".join(lines)
+        return "Threat level: NONE — no security-related keywords detected."
+    kw, level = found[0]
+    return f"Threat level: {level} (matched: '{kw}')"
 
 
 @tool
@@ -488,26 +514,10 @@ def assess_threat_level(text: str) -> str:
       LOW      — policy discussions, veteran affairs, defence budget
       NONE     — no security relevance detected
     """
-    critical = {"פיגוע", "חללים", "הפצצה", "טבח", "פלישה"}
-    high = {"רקטות", "טילים", "הסלמה", "תקיפה", "ירי", "חדירה", "יירוט"}
-    moderate = {"מבצע", "כוננות", "גיוס", "גבול", "רחפנים", "מנהרה"}
-    low = {"תקציב ביטחון", "ותיקי צבא", "תרגיל", "אימון"}
-
     # Keyword matching uses substring search (``kw in text``) to handle
     # Hebrew morphology — prefix/suffix attached to the keyword root.
-    for kw in critical:
-        if kw in text:
-            return f"Threat level: CRITICAL (matched: '{kw}')"
-    for kw in high:
-        if kw in text:
-            return f"Threat level: HIGH (matched: '{kw}')"
-    for kw in moderate:
-        if kw in text:
-            return f"Threat level: MODERATE (matched: '{kw}')"
-    for kw in low:
-        if kw in text:
-            return f"Threat level: LOW (matched: '{kw}')"
-    return "Threat level: NONE — no security-related keywords detected."
+    found = [(kw, level) for kw, level in _THREAT_KEYWORDS if kw in text]
+    return _render_threat_level(found)
 
 
 # ╔═══════════════════════════════════════════════════════════════════════╗
@@ -568,10 +578,7 @@ def scan_health_entities(text: str) -> str:
     Hadassah, Sheba, etc.), HMOs (Clalit, Maccabi), and WHO.
     """
     found = [(heb, eng) for heb, eng in _HEALTH_ENTITIES.items() if heb in text]
-    if not found:
-        return "No health entities detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Health entities ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Health entities", "No health entities detected.")
 
 
 @tool
@@ -582,10 +589,7 @@ def detect_medical_terms(text: str) -> str:
     (cancer), ניסוי קליני (clinical trial), etc.
     """
     found = [(heb, eng) for heb, eng in _MEDICAL_KEYWORDS if heb in text]
-    if not found:
-        return "No medical terminology detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Medical terms ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Medical terms", "No medical terminology detected.")
 
 
 # ╔═══════════════════════════════════════════════════════════════════════╗
@@ -648,10 +652,7 @@ def detect_scientific_terms(text: str) -> str:
     (discovery), אוניברסיטה (university), etc.
     """
     found = [(heb, eng) for heb, eng in _SCIENTIFIC_KEYWORDS if heb in text]
-    if not found:
-        return "No scientific keywords detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Scientific terms ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Scientific terms", "No scientific keywords detected.")
 
 
 @tool
@@ -662,10 +663,7 @@ def detect_climate_indicators(text: str) -> str:
     מתחדשת (renewable energy), קיימות (sustainability), etc.
     """
     found = [(heb, eng) for heb, eng in _CLIMATE_KEYWORDS if heb in text]
-    if not found:
-        return "No climate/environment keywords detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Climate indicators ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Climate indicators", "No climate/environment keywords detected.")
 
 
 # ╔═══════════════════════════════════════════════════════════════════════╗
@@ -731,10 +729,7 @@ def detect_tech_keywords(text: str) -> str:
     (startup), בלוקצ'יין (blockchain), שבב (chip), etc.
     """
     found = [(heb, eng) for heb, eng in _TECH_KEYWORDS if heb in text]
-    if not found:
-        return "No technology keywords detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Technology terms ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Technology terms", "No technology keywords detected.")
 
 
 @tool
@@ -746,10 +741,7 @@ def scan_tech_companies(text: str) -> str:
     Wix, monday.com, etc.).
     """
     found = [(heb, eng) for heb, eng in _TECH_COMPANIES.items() if heb in text]
-    if not found:
-        return "No technology companies detected."
-    lines = [f"  - '{heb}' → {eng}" for heb, eng in found]
-    return f"Tech companies ({len(found)}):\n" + "\n".join(lines)
+    return _render_matches(found, "Tech companies", "No technology companies detected.")
 
 
 # ╔═══════════════════════════════════════════════════════════════════════╗
@@ -797,17 +789,10 @@ _BEARISH_SIGNALS: list[tuple[str, str]] = [
 ]
 
 
-@tool
-def detect_market_sentiment_signals(text: str) -> str:
-    """Detect bullish and bearish market signal keywords.
-
-    Classifies found keywords into BULLISH (positive market impact)
-    and BEARISH (negative market impact) categories, and computes a
-    raw signal balance.
-    """
-    bullish = [(heb, eng) for heb, eng in _BULLISH_SIGNALS if heb in text]
-    bearish = [(heb, eng) for heb, eng in _BEARISH_SIGNALS if heb in text]
-
+def _render_market_sentiment(
+    bullish: list[tuple[str, str]], bearish: list[tuple[str, str]],
+) -> str:
+    """Render bullish/bearish hits plus the raw signal balance."""
     if not bullish and not bearish:
         return "No market sentiment signals detected — headline appears market-neutral."
 
@@ -826,29 +811,37 @@ def detect_market_sentiment_signals(text: str) -> str:
 
 
 @tool
-def assess_geopolitical_risk(text: str) -> str:
-    """Assess geopolitical risk level from the headline.
+def detect_market_sentiment_signals(text: str) -> str:
+    """Detect bullish and bearish market signal keywords.
 
-    Evaluates whether the headline signals geopolitical instability
-    (which is typically bearish for the TA-125) or stability/diplomacy
-    (which is neutral-to-bullish).
+    Classifies found keywords into BULLISH (positive market impact)
+    and BEARISH (negative market impact) categories, and computes a
+    raw signal balance.
     """
-    instability = [
-        ("מלחמה", "war"), ("הסלמה", "escalation"), ("טרור", "terrorism"),
-        ("פיגוע", "attack"), ("סנקציות", "sanctions"), ("עימות", "confrontation"),
-        ("גרעין", "nuclear"), ("טילים", "missiles"), ("רקטות", "rockets"),
-        ("איום", "threat"), ("משבר", "crisis"), ("התנגשות", "clash"),
-    ]
-    stability = [
-        ("הסכם שלום", "peace agreement"), ("שלום", "peace"),
-        ("דיפלומטיה", "diplomacy"), ("משא ומתן", "negotiations"),
-        ("הפסקת אש", "ceasefire"), ("נורמליזציה", "normalisation"),
-        ("הסכם", "agreement"), ("שיתוף פעולה", "cooperation"),
-    ]
+    bullish = [(heb, eng) for heb, eng in _BULLISH_SIGNALS if heb in text]
+    bearish = [(heb, eng) for heb, eng in _BEARISH_SIGNALS if heb in text]
+    return _render_market_sentiment(bullish, bearish)
 
-    risk = [(heb, eng) for heb, eng in instability if heb in text]
-    stab = [(heb, eng) for heb, eng in stability if heb in text]
 
+_GEO_INSTABILITY: list[tuple[str, str]] = [
+    ("מלחמה", "war"), ("הסלמה", "escalation"), ("טרור", "terrorism"),
+    ("פיגוע", "attack"), ("סנקציות", "sanctions"), ("עימות", "confrontation"),
+    ("גרעין", "nuclear"), ("טילים", "missiles"), ("רקטות", "rockets"),
+    ("איום", "threat"), ("משבר", "crisis"), ("התנגשות", "clash"),
+]
+
+_GEO_STABILITY: list[tuple[str, str]] = [
+    ("הסכם שלום", "peace agreement"), ("שלום", "peace"),
+    ("דיפלומטיה", "diplomacy"), ("משא ומתן", "negotiations"),
+    ("הפסקת אש", "ceasefire"), ("נורמליזציה", "normalisation"),
+    ("הסכם", "agreement"), ("שיתוף פעולה", "cooperation"),
+]
+
+
+def _render_geopolitical_risk(
+    risk: list[tuple[str, str]], stab: list[tuple[str, str]],
+) -> str:
+    """Render instability/stability hits plus the overall assessment."""
     if not risk and not stab:
         return "No geopolitical signals detected."
 
@@ -870,30 +863,38 @@ def assess_geopolitical_risk(text: str) -> str:
 
 
 @tool
-def detect_monetary_policy_signals(text: str) -> str:
-    """Detect central bank and monetary policy signals.
+def assess_geopolitical_risk(text: str) -> str:
+    """Assess geopolitical risk level from the headline.
 
-    Identifies rate decisions, quantitative easing/tightening, and
-    other monetary policy actions that directly impact market
-    expectations.
+    Evaluates whether the headline signals geopolitical instability
+    (which is typically bearish for the TA-125) or stability/diplomacy
+    (which is neutral-to-bullish).
     """
-    dovish = [
-        ("הורדת ריבית", "rate cut"),
-        ("הקלה כמותית", "quantitative easing"),
-        ("הרחבה מוניטרית", "monetary expansion"),
-        ("הפחתה", "reduction"),
-        ("הזרמה", "injection/liquidity"),
-    ]
-    hawkish = [
-        ("העלאת ריבית", "rate hike"),
-        ("הידוק מוניטרי", "monetary tightening"),
-        ("צמצום", "contraction"),
-        ("ריסון", "restraint"),
-    ]
+    risk = [(heb, eng) for heb, eng in _GEO_INSTABILITY if heb in text]
+    stab = [(heb, eng) for heb, eng in _GEO_STABILITY if heb in text]
+    return _render_geopolitical_risk(risk, stab)
+
+
+_DOVISH_SIGNALS: list[tuple[str, str]] = [
+    ("הורדת ריבית", "rate cut"),
+    ("הקלה כמותית", "quantitative easing"),
+    ("הרחבה מוניטרית", "monetary expansion"),
+    ("הפחתה", "reduction"),
+    ("הזרמה", "injection/liquidity"),
+]
+
+_HAWKISH_SIGNALS: list[tuple[str, str]] = [
+    ("העלאת ריבית", "rate hike"),
+    ("הידוק מוניטרי", "monetary tightening"),
+    ("צמצום", "contraction"),
+    ("ריסון", "restraint"),
+]
 
-    d_found = [(heb, eng) for heb, eng in dovish if heb in text]
-    h_found = [(heb, eng) for heb, eng in hawkish if heb in text]
 
+def _render_monetary_policy(
+    d_found: list[tuple[str, str]], h_found: list[tuple[str, str]],
+) -> str:
+    """Render dovish/hawkish monetary-policy hits."""
     if not d_found and not h_found:
         return "No monetary policy signals detected."
 
@@ -908,13 +909,33 @@ def detect_monetary_policy_signals(text: str) -> str:
 
 
 @tool
-def extract_impact_magnitude(text: str) -> str:
-    """Estimate the magnitude of market impact from numeric data.
+def detect_monetary_policy_signals(text: str) -> str:
+    """Detect central bank and monetary policy signals.
 
-    Combines numeric extraction with directional keywords to assess
-    whether the headline describes a small, moderate, or large market
-    event.
+    Identifies rate decisions, quantitative easing/tightening, and
+    other monetary policy actions that directly impact market
+    expectations.
     """
+    d_found = [(heb, eng) for heb, eng in _DOVISH_SIGNALS if heb in text]
+    h_found = [(heb, eng) for heb, eng in _HAWKISH_SIGNALS if heb in text]
+    return _render_monetary_policy(d_found, h_found)
+
+
+_MAGNITUDE_WORDS: dict[str, str] = {
+    "חד": "sharp",
+    "דרמטי": "dramatic",
+    "היסטורי": "historic",
+    "חריג": "unusual",
+    "מפתיע": "surprising",
+    "משמעותי": "significant",
+    "קל": "slight",
+    "מתון": "moderate",
+    "שולי": "marginal",
+}
+
+
+def _render_impact_magnitude(text: str, found_mag: list[tuple[str, str]]) -> str:
+    """Render percentage magnitude (parsed from ``text``) + descriptor hits."""
     # Find percentages
     pcts = regex.findall(r"([\d,.]+)\s*%", text)
     pct_vals = []
@@ -924,20 +945,6 @@ def extract_impact_magnitude(text: str) -> str:
         except ValueError:
             pass
 
-    # Find magnitude words
-    magnitude_words = {
-        "חד": "sharp",
-        "דרמטי": "dramatic",
-        "היסטורי": "historic",
-        "חריג": "unusual",
-        "מפתיע": "surprising",
-        "משמעותי": "significant",
-        "קל": "slight",
-        "מתון": "moderate",
-        "שולי": "marginal",
-    }
-    found_mag = [(heb, eng) for heb, eng in magnitude_words.items() if heb in text]
-
     lines: list[str] = []
     if pct_vals:
         max_pct = max(pct_vals)
@@ -958,6 +965,18 @@ def extract_impact_magnitude(text: str) -> str:
     return "Impact magnitude analysis:\n" + "\n".join(f"  - {l}" for l in lines)
 
 
+@tool
+def extract_impact_magnitude(text: str) -> str:
+    """Estimate the magnitude of market impact from numeric data.
+
+    Combines numeric extraction with directional keywords to assess
+    whether the headline describes a small, moderate, or large market
+    event.
+    """
+    found_mag = [(heb, eng) for heb, eng in _MAGNITUDE_WORDS.items() if heb in text]
+    return _render_impact_magnitude(text, found_mag)
+
+
 # ╔═══════════════════════════════════════════════════════════════════════╗
 # ║  TOOL REGISTRIES  — used by agents.py to bind tools per agent        ║
 # ╚═══════════════════════════════════════════════════════════════════════╝
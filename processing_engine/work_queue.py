@@ -0,0 +1,199 @@
+"""
+processing_engine.work_queue
+============================
+Claim-based work queue over ``scoring_jobs`` (migration 011).
+
+The backlog of unscored headlines is split into one job per headline
+*day*.  Seeding is constant-time (``min``/``max`` of the indexed
+``raw_headlines.date`` plus ``generate_series``), so a worker starts
+scoring immediately instead of materialising millions of unscored rows.
+Workers claim days with ``FOR UPDATE SKIP LOCKED``, newest day first (the
+order ``process_headlines.py`` has always used), so any number of
+``process_headlines.py --pipeline --work-queue`` processes, on any number
+of machines, pull disjoint days.
+
+A claim is a lease: :meth:`WorkQueue.heartbeat` refreshes it, and a day
+whose lease expired (worker killed mid-day) is handed out again — rows that
+worker already wrote are skipped by the unscored filter, so at most its
+in-flight batches are redone.
+
+A done day can gain headlines later.  Seeding also reopens done days of
+the last ``REOPEN_RECENT_DAYS`` days (today after the morning scrape) that
+still have unscored headlines — an anti-join over a couple of days' rows,
+so startup stays cheap.  Older back-fills need the full sweep,
+:meth:`WorkQueue.reopen`, which anti-joins ``raw_headlines`` with
+``nlp_vectors`` over the whole date window, so its cost grows with the
+corpus.  It only runs on request (``process_headlines.py --reopen``);
+narrow it with ``--date-from``/``--date-to``.
+
+Every method commits, so it can share a connection with the writer as long
+as calls are not interleaved (the pipelined runner serialises all DB work
+on one thread).
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import uuid
+from datetime import date, timedelta
+from typing import Any
+
+_SEED_SQL = """
+    INSERT INTO scoring_jobs (model_name, scope, day)
+    SELECT %s, %s, d::date
+    FROM (
+        SELECT min(date) AS lo, max(date) AS hi
+        FROM raw_headlines
+        WHERE date >= COALESCE(%s::date, '-infinity'::date)
+          AND date <= COALESCE(%s::date, 'infinity'::date)
+    ) bounds,
+    generate_series(bounds.lo, bounds.hi, interval '1 day') AS d
+    ON CONFLICT (model_name, scope, day) DO NOTHING
+"""
+
+# A finished day that still has headlines the scope counts as unscored (scraped
+# late, back-filled, or written after the day was marked done) goes back in the
+# queue. {scored} is the unscored filter's condition for the scope.
+_REOPEN_SQL = """
+    UPDATE scoring_jobs sj
+    SET status = 'pending', done_at = NULL
+    FROM (
+        SELECT DISTINCT rh.date
+        FROM raw_headlines rh
+        WHERE rh.date >= COALESCE(%s::date, '-infinity'::date)
+          AND rh.date <= COALESCE(%s::date, 'infinity'::date)
+          AND NOT EXISTS (
+              SELECT 1 FROM nlp_vectors nv
+              WHERE nv.headline_id = rh.id AND {scored}
+          )
+    ) gap
+    WHERE sj.model_name = %s AND sj.scope = %s AND sj.status = 'done'
+      AND sj.day = gap.date
+"""
+# Days (counting today) whose done jobs every seed() re-checks for late headlines.
+REOPEN_RECENT_DAYS = 2
+
+_SCORED = {"model": "nv.model_name = %s", "any_model": "nv.validation_passed = TRUE"}
+
+_CLAIM_SQL = """
+    UPDATE scoring_jobs
+    SET status = 'claimed', claimed_by = %s, claimed_at = NOW()
+    WHERE (model_name, scope, day) = (
+        SELECT model_name, scope, day
+        FROM scoring_jobs
+        WHERE model_name = %s AND scope = %s
+          AND day >= COALESCE(%s::date, '-infinity'::date)
+          AND day <= COALESCE(%s::date, 'infinity'::date)
+          AND (status = 'pending'
+               OR (status = 'claimed' AND claimed_at < NOW() - %s * interval '1 minute'))
+        ORDER BY day DESC
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING day
+"""
+
+
+class WorkQueue:
+    """Day-granular scoring jobs for one ``(model_name, scope)``."""
+
+    def __init__(
+        self,
+        conn: Any,
+        model_name: str,
+        *,
+        any_model: bool = False,
+        date_from: str = "",
+        date_to: str = "",
+        worker_id: str = "",
+        lease_minutes: int = 15,
+    ) -> None:
+        self.conn = conn
+        self.model_name = model_name
+        self.scope = "any_model" if any_model else "model"
+        self.date_from = date_from or None
+        self.date_to = date_to or None
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lease_minutes = lease_minutes
+
+    def _execute(self, sql: str, params: tuple) -> tuple[list[tuple], int]:
+        """Run one statement in its own transaction → ``(rows, rowcount)``."""
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        rows = cursor.fetchall() if cursor.description else []
+        rowcount = cursor.rowcount
+        cursor.close()
+        self.conn.commit()
+        return rows, rowcount
+
+    def seed(self) -> int:
+        """Create missing day jobs in the date window; reopen recent done days with unscored rows.
+
+        Only the last ``REOPEN_RECENT_DAYS`` days are re-checked (see
+        :meth:`reopen` for the whole window).  Returns the number of jobs
+        added or reopened.
+        """
+        _, added = self._execute(
+            _SEED_SQL, (self.model_name, self.scope, self.date_from, self.date_to),
+        )
+        recent = (date.today() - timedelta(days=REOPEN_RECENT_DAYS - 1)).isoformat()
+        return added + self._reopen(max(self.date_from or recent, recent), self.date_to)
+
+    def reopen(self) -> int:
+        """Put done days that still have unscored headlines back in the queue.
+
+        Scans every headline in the date window, so it is far slower than
+        :meth:`seed`.  Returns the number of days reopened.
+        """
+        return self._reopen(self.date_from, self.date_to)
+
+    def _reopen(self, date_from: str | None, date_to: str | None) -> int:
+        scope_params = (self.model_name,) if self.scope == "model" else ()
+        _, reopened = self._execute(
+            _REOPEN_SQL.format(scored=_SCORED[self.scope]),
+            (date_from, date_to, *scope_params, self.model_name, self.scope),
+        )
+        return reopened
+
+    def claim(self) -> date | None:
+        """Lease the newest claimable day, or ``None`` when the queue is drained."""
+        rows, _ = self._execute(_CLAIM_SQL, (
+            self.worker_id, self.model_name, self.scope,
+            self.date_from, self.date_to, self.lease_minutes,
+        ))
+        return rows[0][0] if rows else None
+
+    def heartbeat(self) -> None:
+        """Refresh the lease on every day this worker holds."""
+        self._execute(
+            "UPDATE scoring_jobs SET claimed_at = NOW() "
+            "WHERE claimed_by = %s AND status = 'claimed'",
+            (self.worker_id,),
+        )
+
+    def complete(self, day: date, scored: int) -> None:
+        """Mark a claimed day done (no-op if the lease was lost to another worker)."""
+        self._execute(
+            "UPDATE scoring_jobs SET status = 'done', done_at = NOW(), scored = scored + %s "
+            "WHERE model_name = %s AND scope = %s AND day = %s AND claimed_by = %s",
+            (scored, self.model_name, self.scope, day, self.worker_id),
+        )
+
+    def release(self, day: date) -> None:
+        """Hand an unfinished day back to the queue (e.g. ``--limit`` reached)."""
+        self._execute(
+            "UPDATE scoring_jobs SET status = 'pending', claimed_by = NULL, claimed_at = NULL "
+            "WHERE model_name = %s AND scope = %s AND day = %s AND claimed_by = %s "
+            "AND status = 'claimed'",
+            (self.model_name, self.scope, day, self.worker_id),
+        )
+
+    def counts(self) -> dict[str, int]:
+        """Job count per status for this model/scope."""
+        rows, _ = self._execute(
+            "SELECT status, COUNT(*) FROM scoring_jobs "
+            "WHERE model_name = %s AND scope = %s GROUP BY status",
+            (self.model_name, self.scope),
+        )
+        return {status: n for status, n in rows}
@@ -1,10 +1,14 @@
 """Build the leak-safe derived embedding features (PCA + cluster distances) into Postgres.
 
-Pulls the daily e5 centroid (streamed, OOM-safe), fits a StandardScaler→PCA→KMeans basis on a
-TRAIN window only, applies it to every date, and upserts the result into
-``daily_embedding_derived``. The dataset builders then join ``embpca_*``/``embclus_dist_*`` as
+Pulls the daily e5 centroid (the incrementally-refreshed ``daily_embedding_centroid`` table),
+fits a StandardScaler→PCA→KMeans basis on a TRAIN window only, applies it to every date, and
+upserts the result into ``daily_embedding_derived``. The dataset builders then join ``embpca_*``/``embclus_dist_*`` as
 extra features automatically.
 
+The basis is stored in ``embedding_pca_basis`` (a new version only when the fit changed) and
+every embedded headline is projected through it into ``headline_pca`` — in full for a new
+version, otherwise just the headlines embedded since the last run — for the UI day view.
+
 Leakage boundary: the basis is fit on dates ≤ ``--fit-cutoff``. The default is the
 ``EMBED_DERIVED_TRAIN_FRAC`` (0.85) quantile date of the ≤ CUTOFF modeling corpus, which
 precedes both the CUT and FULL last-15% out-of-sample windows, so no OOS row ever influences
@@ -31,8 +35,14 @@ from sentisense.config import (
 )
 from sentisense.constants import CUTOFF_DATE
 from sentisense.db import get_engine
-from sentisense.embed import daily_embedding_centroid
-from sentisense.embed.derived import fit_transform_derived, persist_basis, persist_derived
+from sentisense.embed import stored_daily_centroid
+from sentisense.embed.derived import (
+    BASIS_KINDS,
+    fit_transform_derived,
+    persist_basis,
+    persist_derived,
+)
+from sentisense.embed.projection import fill_headline_pca
 
 _FAR_FUTURE = dt.date(2100, 1, 1)
 
@@ -61,7 +71,7 @@ def main() -> None:
     args = ap.parse_args()
 
     engine = get_engine()
-    cen = daily_embedding_centroid(engine, cutoff=args.coverage_cutoff)
+    cen = stored_daily_centroid(engine, cutoff=args.coverage_cutoff)
     if cen.empty:
         raise SystemExit("No embeddings cached — run the embed stage first.")
     centroid = cen[[c for c in cen.columns if c.startswith("embc_")]]
@@ -83,6 +93,8 @@ def main() -> None:
     n = persist_derived(derived, fit_cutoff=fit_cutoff,
                         n_pca=args.n_pca, n_clusters=args.n_clusters, engine=engine)
     persist_basis(basis, engine=engine)   # UI day-view projects headlines through this basis
+    for kind in BASIS_KINDS:              # new headlines → headline_pca, per stored basis
+        fill_headline_pca(engine, kind=kind)
     logger.info("Done — {} derived rows in daily_embedding_derived.", n)
 
 
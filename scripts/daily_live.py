@@ -49,12 +49,15 @@ def _score_stage() -> tuple:
 
     The remote vLLM (openai backend) handles 50-headline batch calls at high concurrency;
     local Ollama models (gemma4) fail batch-JSON parsing, so they score one headline per
-    call at low concurrency (tune with SENTISENSE_SCORE_CONCURRENCY). Both use
+    call at low concurrency. ``--concurrency`` is only the starting point (tune with
+    SENTISENSE_SCORE_CONCURRENCY): the scorer's adaptive limiter then moves it within
+    SENTISENSE_LLM_CONCURRENCY_MIN/MAX on latency and 429/5xx/timeout feedback. Both use
     ``--unscored-any-model`` so a backend/model switch never re-scores the history another
     model already covered.
     """
     if os.environ.get("SENTISENSE_LLM_BACKEND", "ollama").lower() == "openai":
-        extra = ["--headlines-per-call", "50", "--concurrency", "50"]
+        extra = ["--headlines-per-call", "50",
+                 "--concurrency", os.environ.get("SENTISENSE_SCORE_CONCURRENCY", "50")]
     else:
         extra = ["--concurrency", os.environ.get("SENTISENSE_SCORE_CONCURRENCY", "4")]
     return ("score", ["uv", "run", "python", "../scripts/process_headlines.py", "--fast",
@@ -64,6 +67,7 @@ def _score_stage() -> tuple:
 _STAGES = [
     ("scrape", ["uv", "run", "python", "../scripts/daily_scrape_to_db.py", "--days", "2"], _PE),
     _score_stage(),
+    ("aggregate", ["uv", "run", "python", "-m", "sentisense.features.source_scores"], "."),
     ("embed", ["uv", "run", "--extra", "embed", "python", "-m", "sentisense.embed.embeddings",
                "--scope", "all"], "."),
     ("derived", ["uv", "run", "--extra", "ml", "python", "scripts/build_embedding_derived.py"], "."),
@@ -5,19 +5,30 @@ project already uses, creates ``headline_vectors`` (one row per embedded headlin
 ``vector(dim)`` column + HNSW cosine index), and copies every cached embedding from
 ``headline_embeddings`` (BYTEA float32) joined to ``raw_headlines`` for date/source/text.
 
-Idempotent + resumable (keyset pagination + ON CONFLICT DO NOTHING). Embeddings are
+Idempotent + resumable (keyset pagination over rows not yet in the table). Embeddings are
 L2-normalised, so cosine distance is the right metric.
 
+Rows are streamed with psycopg3 binary ``COPY``: the BYTEA float32 blobs are byte-swapped
+into pgvector's binary ``vector`` wire format (int16 dim, int16 unused, big-endian float4s)
+in one numpy call per page, so nothing is formatted to — or parsed back from — decimal
+text. ``--loader insert`` keeps the old text-literal INSERT path (e.g. to debug a page).
+COPY has no ON CONFLICT: the page query only returns ids absent from the table, so re-runs
+resume safely, but do not run two loaders for the same model at once.
+
 Run (server-side; SENTISENSE_DATABASE_URL points at the native PG):
     uv run python scripts/deploy_vectordb.py --dry-run
-    uv run python scripts/deploy_vectordb.py --batch 2000
+    uv run python scripts/deploy_vectordb.py --batch 10000
     uv run python scripts/deploy_vectordb.py --query 12345 --k 5     # demo: nearest headlines
+
+Batched / filtered queries for callers live in ``sentisense.embed.similarity``.
 """
 
 from __future__ import annotations
 
 import argparse
+import datetime as dt
 import re
+import struct
 
 import numpy as np
 from loguru import logger
@@ -25,6 +36,7 @@ from sqlalchemy import text
 
 from sentisense.config import EMBED_MODEL
 from sentisense.db import get_engine
+from sentisense.embed.similarity import similar
 
 _EXT_HINT = (
     "pgvector extension unavailable in this Postgres. Install it for YOUR PG major (drop\n"
@@ -152,6 +164,46 @@ _INSERT = text(
     """)
 
 
+_COPY = ("COPY headline_vectors (headline_id, embed_model, date, source, headline, embedding) "
+         "FROM STDIN WITH (FORMAT BINARY)")
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)   # signature, flags, ext
+_PGCOPY_TRAILER = struct.pack("!h", -1)
+_PG_EPOCH = dt.date(2000, 1, 1).toordinal()                          # binary DATE = days since
+
+
+def _field(data: bytes | None) -> bytes:
+    """One binary-COPY field: int32 length + bytes (length -1 = NULL)."""
+    return struct.pack("!i", -1) if data is None else struct.pack("!i", len(data)) + data
+
+
+def _vector_binary(blobs: list[bytes], dim: int) -> list[bytes]:
+    """BYTEA float32 blobs → pgvector binary ``vector`` values (one numpy byte-swap per page)."""
+    for b in blobs:
+        if len(b) != 4 * dim:
+            raise ValueError(f"embedding length {len(b) // 4} != dim {dim}")
+    body = np.frombuffer(b"".join(blobs), dtype="<f4").astype(">f4").reshape(len(blobs), dim)
+    head = struct.pack("!hh", dim, 0)
+    return [head + row.tobytes() for row in body]
+
+
+def _copy_payload(rows, model: str, dim: int) -> bytes:
+    """A complete binary COPY stream (header, tuples, trailer) for one page of ``_PAGE`` rows."""
+    model_b = model.encode("utf-8")
+    out = [_PGCOPY_HEADER]
+    for r, vec in zip(rows, _vector_binary([bytes(r.embedding) for r in rows], dim)):
+        out.append(b"".join((
+            struct.pack("!h", 6),
+            _field(struct.pack("!q", int(r.headline_id))),
+            _field(model_b),
+            _field(None if r.date is None else struct.pack("!i", r.date.toordinal() - _PG_EPOCH)),
+            _field(None if r.source is None else r.source.encode("utf-8")),
+            _field(None if r.headline is None else r.headline.encode("utf-8")),
+            _field(vec),
+        )))
+    out.append(_PGCOPY_TRAILER)
+    return b"".join(out)
+
+
 def _count_source(engine, model: str) -> int:
     """How many cached embeddings exist for ``model`` (upper bound on what a fill would load)."""
     with engine.connect() as conn:
@@ -159,8 +211,11 @@ def _count_source(engine, model: str) -> int:
             text("SELECT COUNT(*) FROM headline_embeddings WHERE embed_model=:m"), {"m": model}).scalar())
 
 
-def fill(engine, model: str, dim: int, *, batch: int = 2000) -> int:
-    """Copy not-yet-loaded embeddings into headline_vectors (keyset paginated). Returns count."""
+def fill(engine, model: str, dim: int, *, batch: int = 10_000, loader: str = "copy") -> int:
+    """Copy not-yet-loaded embeddings into headline_vectors (keyset paginated). Returns count.
+
+    ``loader``: 'copy' (binary COPY, default) or 'insert' (text-literal INSERT … ON CONFLICT).
+    """
     last, written = -1, 0
     while True:
         with engine.connect() as conn:
@@ -168,40 +223,32 @@ def fill(engine, model: str, dim: int, *, batch: int = 2000) -> int:
         if not rows:
             break
         last = int(rows[-1].headline_id)
-        payload = [{"headline_id": int(r.headline_id), "embed_model": model, "date": r.date,
-                    "source": r.source, "headline": r.headline,
-                    "embedding": _vec_literal(r.embedding, dim)} for r in rows]
         with engine.begin() as conn:
-            conn.execute(_INSERT, payload)
+            if loader == "copy":
+                payload = _copy_payload(rows, model, dim)
+                with conn.connection.driver_connection.cursor() as cur, cur.copy(_COPY) as copy:
+                    copy.write(payload)
+            else:
+                conn.execute(_INSERT, [
+                    {"headline_id": int(r.headline_id), "embed_model": model, "date": r.date,
+                     "source": r.source, "headline": r.headline,
+                     "embedding": _vec_literal(r.embedding, dim)} for r in rows])
         written += len(rows)
-        logger.info("upserted {:,} (through headline_id {})", written, last)
+        logger.info("loaded {:,} (through headline_id {})", written, last)
     return written
 
 
-def similar(engine, headline_id: int, model: str, k: int = 5) -> list[dict]:
-    """Top-k nearest headlines to ``headline_id`` by cosine distance (HNSW)."""
-    q = text(
-        """
-        SELECT hv.headline_id, hv.date, hv.source, hv.headline,
-               hv.embedding <=> (SELECT embedding FROM headline_vectors
-                                 WHERE headline_id = :id AND embed_model = :m) AS distance
-        FROM headline_vectors hv
-        WHERE hv.embed_model = :m AND hv.headline_id <> :id
-        ORDER BY distance ASC
-        LIMIT :k
-        """)
-    with engine.connect() as conn:
-        return [dict(r._mapping) for r in conn.execute(q, {"id": headline_id, "m": model, "k": k})]
-
-
 def main() -> None:
     p = argparse.ArgumentParser(description="Deploy + fill the pgvector embedding store.")
     p.add_argument("--model", default=EMBED_MODEL, help="Embedding model name (default: active EMBED_MODEL).")
-    p.add_argument("--batch", type=int, default=2000)
+    p.add_argument("--batch", type=int, default=10_000)
+    p.add_argument("--loader", choices=["copy", "insert"], default="copy",
+                   help="Binary COPY (default) or the text-literal INSERT path.")
     p.add_argument("--rebuild", action="store_true", help="Drop + recreate headline_vectors first.")
     p.add_argument("--dry-run", action="store_true", help="Report how many would load; write nothing.")
     p.add_argument("--query", type=int, default=0, help="Demo: print k nearest headlines to this headline_id.")
     p.add_argument("--k", type=int, default=5)
+    p.add_argument("--ef-search", type=int, default=None, help="hnsw.ef_search for --query.")
     p.add_argument("--index", choices=["hnsw", "ivfflat", "none"], default="hnsw",
                    help="ANN index to build after the load (ivfflat is lighter than hnsw).")
     p.add_argument("--index-mem", default="2GB", help="maintenance_work_mem for the index build.")
@@ -214,7 +261,7 @@ def main() -> None:
     logger.info("Embedding model {} — dim {}", args.model, dim)
 
     if args.query:
-        for r in similar(engine, args.query, args.model, args.k):
+        for r in similar(engine, args.query, k=args.k, ef_search=args.ef_search, model=args.model):
             logger.info("  {:.4f}  [{}] {} — {}", r["distance"], r["date"], r["source"], r["headline"][:80])
         return
 
@@ -229,7 +276,7 @@ def main() -> None:
 
     ensure_extension(engine)
     ensure_table(engine, dim, rebuild=args.rebuild)
-    n = fill(engine, args.model, dim, batch=args.batch)
+    n = fill(engine, args.model, dim, batch=args.batch, loader=args.loader)
     logger.info("Loaded {:,} vectors into headline_vectors.", n)
     build_index(engine, method=args.index, mem=args.index_mem)   # after the bulk load
 
@@ -15,6 +15,12 @@ Request kinds:
     cannot run on this box (its Zep dependency needs Docker). The agent graph is built
     deterministically from per-source stats; only the report text comes from the LLM.
 
+Requests are answered on a small thread pool.  How many Ollama calls run at once is
+decided by the adaptive limiter shared with the scoring pipeline
+(``processing_engine/concurrency.py``): it starts at one, grows while Ollama's
+latency per token holds, and backs off on timeouts, 5xx and queueing latency, up to
+``SENTISENSE_LLM_WORKER_PARALLEL`` (default 2; match the server's OLLAMA_NUM_PARALLEL).
+
 Run (GPU box, needs SENTISENSE_DATABASE_URL + Ollama on localhost):
     uv run python scripts/llm_worker.py                 # poll loop (2s)
     uv run python scripts/llm_worker.py --once          # drain queue and exit
@@ -24,12 +30,14 @@ Run (GPU box, needs SENTISENSE_DATABASE_URL + Ollama on localhost):
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
 import os
 import re
 import sys
 import time
 import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from loguru import logger
@@ -43,6 +51,24 @@ _OLLAMA = os.environ.get("SENTISENSE_OLLAMA_URL", "http://localhost:11434")
 _MIGRATION = REPO_ROOT / "sentisense" / "db" / "migrations" / "008_llm_requests.sql"
 _MAX_HEADLINES = 40
 _POLL_SECONDS = 2.0
+_MAX_PARALLEL = max(1, int(os.environ.get("SENTISENSE_LLM_WORKER_PARALLEL", "2")))
+
+
+def _load_limiter():
+    """The processing engine's AdaptiveLimiter, loaded by path.
+
+    ``processing_engine/__init__`` imports the LangChain stack, which this (root
+    ``sentisense``) environment does not install; ``concurrency.py`` itself needs only
+    the stdlib and loguru.
+    """
+    path = REPO_ROOT / "processing_engine" / "concurrency.py"
+    spec = importlib.util.spec_from_file_location("processing_engine_concurrency", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.AdaptiveLimiter(1, min_limit=1, max_limit=_MAX_PARALLEL, name="llm-worker")
+
+
+_LIMITER = _load_limiter()
 
 _CLAIM = text(
     """
@@ -123,12 +149,23 @@ def _build_prompt(kind: str, day, question: str | None, context: str) -> str:
     )
 
 
+def _claim(engine):
+    """Mark the oldest pending request as working and return it (None when empty)."""
+    with engine.begin() as conn:
+        return conn.execute(_CLAIM).first()
+
+
 def handle_one(engine) -> bool:
     """Claim and answer one pending request. Returns False when the queue is empty."""
-    with engine.begin() as conn:
-        row = conn.execute(_CLAIM).first()
+    row = _claim(engine)
     if not row:
         return False
+    _answer(engine, row)
+    return True
+
+
+def _answer(engine, row) -> None:
+    """Answer one claimed request and write the answer (or the error) back."""
     rid, kind, day, question = int(row[0]), row[1], row[2], row[3]
     logger.info("Request {}: kind={} date={} q={}", rid, kind, day, (question or "")[:60])
     try:
@@ -137,7 +174,9 @@ def handle_one(engine) -> bool:
             answer = simulate_day(engine, day)
         else:
             context = _day_context(engine, day) if day else ""
-            answer = _ollama_generate(_build_prompt(kind, day, question, context))
+            prompt = _build_prompt(kind, day, question, context)
+            with _LIMITER.slot_sync(tokens=len(prompt) // 3):
+                answer = _ollama_generate(prompt)
         status = "done"
     except Exception as exc:  # noqa: BLE001 — record the failure; never crash the loop
         answer, status = f"worker error: {str(exc)[:300]}", "error"
@@ -145,7 +184,6 @@ def handle_one(engine) -> bool:
     with engine.begin() as conn:
         conn.execute(_FINISH, {"s": status, "a": answer, "i": rid})
     logger.info("Request {} -> {} ({} chars)", rid, status, len(answer))
-    return True
 
 
 def main() -> int:
@@ -158,14 +196,22 @@ def main() -> int:
     ensure_table(engine)
     with engine.begin() as conn:   # reclaim rows orphaned by a previous crash
         conn.execute(text("UPDATE llm_requests SET status = 'pending' WHERE status = 'working'"))
-    logger.info("LLM worker up — model={} ollama={} poll={}s", _MODEL, _OLLAMA, _POLL_SECONDS)
-    while True:
-        worked = True
-        while worked:
-            worked = handle_one(engine)
-        if args.once:
-            return 0
-        time.sleep(_POLL_SECONDS)
+    logger.info("LLM worker up — model={} ollama={} poll={}s parallel<={}",
+                _MODEL, _OLLAMA, _POLL_SECONDS, _MAX_PARALLEL)
+    busy: set = set()
+    with ThreadPoolExecutor(max_workers=_MAX_PARALLEL, thread_name_prefix="llm") as pool:
+        while True:
+            # Claim only as many requests as the limiter would let run, so nothing
+            # sits in 'working' while waiting for a slot.
+            while len(busy) < _LIMITER.limit and (row := _claim(engine)):
+                busy.add(pool.submit(_answer, engine, row))
+            if not busy:
+                if args.once:
+                    logger.info("Queue drained — {}", _LIMITER.summary())
+                    return 0
+                time.sleep(_POLL_SECONDS)
+                continue
+            _, busy = wait(busy, timeout=_POLL_SECONDS, return_when=FIRST_COMPLETED)
 
 
 if __name__ == "__main__":
@@ -23,6 +23,14 @@ Usage
     cd processing_engine && uv run python ../scripts/process_headlines.py \\
         --fast --headlines-per-call 20 --concurrency 8
 
+    # Full-history backfill — streaming reader → LLM workers → bulk writer
+    cd processing_engine && uv run python ../scripts/process_headlines.py \\
+        --fast --headlines-per-call 50 --concurrency 50 --pipeline --batch-size 2000
+
+    # Same, shared by several workers/machines (claims headline days from scoring_jobs)
+    cd processing_engine && uv run python ../scripts/process_headlines.py \\
+        --fast --headlines-per-call 50 --concurrency 50 --pipeline --work-queue
+
     # Fast mode — 4 headlines concurrently, 1 LLM call each
     cd processing_engine && uv run python ../scripts/process_headlines.py --fast --limit 100
 
@@ -38,8 +46,12 @@ from __future__ import annotations
 import argparse
 import asyncio
 import os
+import re
 import sys
 import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -56,6 +68,9 @@ DEFAULT_DB_URL = os.environ.get(
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 LOG_DIR = PROJECT_ROOT / "logs"
+MIGRATIONS_DIR = PROJECT_ROOT / "sentisense" / "db" / "migrations"
+SCORE_CACHE_MIGRATION = MIGRATIONS_DIR / "010_headline_score_cache.sql"
+WORK_QUEUE_MIGRATION = MIGRATIONS_DIR / "011_scoring_jobs.sql"
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -119,22 +134,10 @@ def get_active_model_name() -> str:
     return OllamaConfig().model
 
 
-def get_unprocessed_headlines(
-    conn: Any,
-    model_name: str,
-    limit: int = 0,
-    date_from: str = "",
-    date_to: str = "",
-    any_model: bool = False,
-) -> list[dict[str, Any]]:
-    """
-    Query raw_headlines lacking a score.
-
-    By default: no nlp_vectors row for ``model_name`` (re-scores under a new model).
-    With ``any_model=True``: no *validated* row from ANY model — i.e. truly-unscored
-    headlines only. Use this to fill gaps (e.g. score freshly-backfilled olds locally)
-    WITHOUT re-scoring headlines another model already covered.
-    """
+def _unprocessed_query(
+    model_name: str, date_from: str, date_to: str, any_model: bool,
+) -> tuple[str, list[Any]]:
+    """SELECT … FROM raw_headlines for rows lacking a score (no ORDER BY / LIMIT)."""
     if any_model:
         query = """
             SELECT rh.id, rh.date, rh.source, rh.hour, rh.popularity, rh.headline
@@ -163,6 +166,26 @@ def get_unprocessed_headlines(
         query += " AND rh.date <= %s"
         params.append(date_to)
 
+    return query, params
+
+
+def get_unprocessed_headlines(
+    conn: Any,
+    model_name: str,
+    limit: int = 0,
+    date_from: str = "",
+    date_to: str = "",
+    any_model: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Query raw_headlines lacking a score.
+
+    By default: no nlp_vectors row for ``model_name`` (re-scores under a new model).
+    With ``any_model=True``: no *validated* row from ANY model — i.e. truly-unscored
+    headlines only. Use this to fill gaps (e.g. score freshly-backfilled olds locally)
+    WITHOUT re-scoring headlines another model already covered.
+    """
+    query, params = _unprocessed_query(model_name, date_from, date_to, any_model)
     query += " ORDER BY rh.date DESC, rh.id"
 
     if limit > 0:
@@ -177,6 +200,37 @@ def get_unprocessed_headlines(
     return rows
 
 
+def fetch_unprocessed_page(
+    conn: Any,
+    model_name: str,
+    after: tuple[Any, int] | None,
+    page_size: int,
+    date_from: str = "",
+    date_to: str = "",
+    any_model: bool = False,
+) -> list[dict[str, Any]]:
+    """One keyset page of :func:`get_unprocessed_headlines` (same scope and order).
+
+    ``after`` is the ``(date, id)`` of the last row of the previous page
+    (``None`` for the first page).  Each page costs one bounded query, so
+    memory stays flat however many headlines are unscored.  Rows scored
+    since the previous page are naturally excluded by the anti-join.
+    """
+    query, params = _unprocessed_query(model_name, date_from, date_to, any_model)
+    if after is not None:
+        query += " AND (rh.date < %s OR (rh.date = %s AND rh.id > %s))"
+        params.extend([after[0], after[0], after[1]])
+    query += " ORDER BY rh.date DESC, rh.id LIMIT %s"
+    params.append(page_size)
+
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    columns = [desc[0] for desc in cursor.description]
+    rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    cursor.close()
+    return rows
+
+
 INSERT_NLP_SQL = """
     INSERT INTO nlp_vectors (
         headline_id, model_name,
@@ -188,13 +242,45 @@ INSERT_NLP_SQL = """
 """
 
 
-def insert_nlp_vector(cursor: Any, headline_id: int, model_name: str, result: dict[str, Any]) -> None:
-    """Insert a single processing result into nlp_vectors."""
+# Same row, plus the headline whose LLM call produced the scores (score cache copies).
+INSERT_NLP_COPY_SQL = """
+    INSERT INTO nlp_vectors (
+        headline_id, model_name,
+        relevance_politics, relevance_economy, relevance_security,
+        relevance_health, relevance_science, relevance_technology,
+        global_sentiment, validation_passed, processing_time_seconds, errors,
+        scored_from_headline_id
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (headline_id, model_name) DO NOTHING
+"""
+
+
+def insert_nlp_vector(
+    cursor: Any,
+    headline_id: int,
+    model_name: str,
+    result: dict[str, Any],
+    scored_from: int | None = None,
+) -> None:
+    """Insert a single processing result into nlp_vectors.
+
+    ``scored_from`` is the headline whose LLM call produced ``result`` when it
+    is reused for another headline (score cache); ``None`` for an own call.
+    """
+    params = _nlp_params(headline_id, model_name, result)
+    if scored_from is None:
+        cursor.execute(INSERT_NLP_SQL, params)
+    else:
+        cursor.execute(INSERT_NLP_COPY_SQL, (*params, scored_from))
+
+
+def _nlp_params(headline_id: int, model_name: str, result: dict[str, Any]) -> tuple:
+    """The 12 INSERT_NLP_SQL values for one result dict."""
     errors_list = result.get("errors", [])
     # Convert Python list to PostgreSQL text array literal
     errors_pg = errors_list if errors_list else None
 
-    cursor.execute(INSERT_NLP_SQL, (
+    return (
         headline_id,
         model_name,
         result.get("relevance_category_1", 0),
@@ -207,7 +293,220 @@ def insert_nlp_vector(cursor: Any, headline_id: int, model_name: str, result: di
         result.get("validation_passed", False),
         result.get("processing_time_seconds"),
         errors_pg,
-    ))
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Bulk nlp_vectors writer (COPY → temp stage → one INSERT … SELECT)
+# ─────────────────────────────────────────────────────────────────────
+
+_NLP_COLUMNS = (
+    "headline_id, model_name, "
+    "relevance_politics, relevance_economy, relevance_security, "
+    "relevance_health, relevance_science, relevance_technology, "
+    "global_sentiment, validation_passed, processing_time_seconds, errors, "
+    "scored_from_headline_id"
+)
+
+# Session-local; ON COMMIT DELETE ROWS empties it with every chunk commit.
+_CREATE_STAGE_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS nlp_vectors_stage (
+        headline_id             BIGINT,
+        model_name              VARCHAR(100),
+        relevance_politics      SMALLINT,
+        relevance_economy       SMALLINT,
+        relevance_security      SMALLINT,
+        relevance_health        SMALLINT,
+        relevance_science       SMALLINT,
+        relevance_technology    SMALLINT,
+        global_sentiment        SMALLINT,
+        validation_passed       BOOLEAN,
+        processing_time_seconds REAL,
+        errors                  TEXT[],
+        scored_from_headline_id BIGINT
+    ) ON COMMIT DELETE ROWS
+"""
+
+
+class NlpVectorWriter:
+    """Write a chunk of results to ``nlp_vectors`` in three round-trips.
+
+    Rows are streamed into a temp stage table with ``COPY … FROM STDIN``
+    (psycopg v3; psycopg2 falls back to ``executemany`` into the stage) and
+    moved with a single ``INSERT … SELECT … ON CONFLICT DO NOTHING
+    RETURNING``, which tells inserted rows from conflicting ones.  The
+    caller commits, exactly as with :func:`insert_nlp_vector`.
+
+    If the bulk statement fails (e.g. a CHECK violation on one row), the
+    chunk is rolled back to a savepoint taken just before it — other work
+    pending on the shared connection (the score cache's ``store_many``)
+    survives — and re-written row by row under savepoints so only the
+    offending rows are lost.  Shared by every fast runner, and through
+    them by ``retry_failed_headlines.py`` and ``standardize_to_latest_model.py``.
+    """
+
+    def __init__(self, conn: Any, model_name: str) -> None:
+        self.conn = conn
+        self.model_name = model_name
+        self.inserted = 0
+        self.conflicted = 0
+        self._stage_ready = False
+
+    def write(
+        self, scored: list[tuple[int, dict[str, Any], int | None]],
+    ) -> tuple[int, int, list[int]]:
+        """Write ``(headline_id, result, scored_from)`` rows.
+
+        Returns ``(inserted, conflicted, errored_ids)`` for this chunk.
+        """
+        if not scored:
+            return 0, 0, []
+        rows = [(*_nlp_params(hid, self.model_name, res), src) for hid, res, src in scored]
+        # Only name the provenance column when some row needs it, so databases
+        # without migration 010 keep working for plain runs.
+        with_source = any(row[-1] is not None for row in rows)
+        self._execute("SAVEPOINT nlp_bulk")
+        try:
+            inserted_ids = self._write_bulk(rows, with_source)
+        except Exception as exc:
+            logger.warning("Bulk nlp_vectors write failed ({}); retrying row by row", exc)
+            self._execute("ROLLBACK TO SAVEPOINT nlp_bulk")
+            self._execute("RELEASE SAVEPOINT nlp_bulk")
+            self._stage_ready = False  # the rollback may have undone CREATE TEMP TABLE
+            return self._write_rows(scored)
+        self._execute("RELEASE SAVEPOINT nlp_bulk")
+        inserted = len(inserted_ids)
+        conflicted = len(rows) - inserted
+        self.inserted += inserted
+        self.conflicted += conflicted
+        return inserted, conflicted, []
+
+    def _execute(self, sql: str) -> None:
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(sql)
+        finally:
+            cursor.close()
+
+    def _write_bulk(self, rows: list[tuple], with_source: bool) -> list[Any]:
+        cursor = self.conn.cursor()
+        try:
+            if not self._stage_ready:
+                cursor.execute(_CREATE_STAGE_SQL)
+                self._stage_ready = True
+            else:
+                cursor.execute("DELETE FROM nlp_vectors_stage")
+            if hasattr(cursor, "copy"):  # psycopg v3
+                with cursor.copy(f"COPY nlp_vectors_stage ({_NLP_COLUMNS}) FROM STDIN") as copy:
+                    for row in rows:
+                        copy.write_row(row)
+            else:
+                cursor.executemany(
+                    f"INSERT INTO nlp_vectors_stage ({_NLP_COLUMNS}) "
+                    f"VALUES ({', '.join(['%s'] * 13)})",
+                    rows,
+                )
+            columns = _NLP_COLUMNS if with_source else _NLP_COLUMNS.rsplit(",", 1)[0]
+            cursor.execute(
+                f"INSERT INTO nlp_vectors ({columns}) "
+                f"SELECT {columns} FROM nlp_vectors_stage "
+                "ON CONFLICT (headline_id, model_name) DO NOTHING "
+                "RETURNING headline_id"
+            )
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def _write_rows(
+        self, scored: list[tuple[int, dict[str, Any], int | None]],
+    ) -> tuple[int, int, list[int]]:
+        inserted, conflicted, errored = 0, 0, []
+        cursor = self.conn.cursor()
+        for headline_id, result, scored_from in scored:
+            cursor.execute("SAVEPOINT nlp_row")
+            try:
+                insert_nlp_vector(cursor, headline_id, self.model_name, result, scored_from)
+            except Exception as exc:
+                logger.error("DB insert failed id={}: {}", headline_id, exc)
+                cursor.execute("ROLLBACK TO SAVEPOINT nlp_row")
+                errored.append(headline_id)
+                continue
+            if cursor.rowcount == 1:
+                inserted += 1
+            else:
+                conflicted += 1
+            cursor.execute("RELEASE SAVEPOINT nlp_row")
+        cursor.close()
+        self.inserted += inserted
+        self.conflicted += conflicted
+        return inserted, conflicted, errored
+
+
+def ensure_score_cache(conn: Any) -> None:
+    """Apply migration 010 (headline_score_cache + nlp_vectors provenance; idempotent).
+
+    Skipped when both objects already exist: even a no-op ``ALTER TABLE … IF
+    NOT EXISTS`` takes an ACCESS EXCLUSIVE lock and would queue behind any
+    long-running reader of ``nlp_vectors``.
+    """
+    _apply_migration(conn, SCORE_CACHE_MIGRATION, """
+        SELECT to_regclass('headline_score_cache') IS NOT NULL
+           AND EXISTS (SELECT 1 FROM information_schema.columns
+                       WHERE table_name = 'nlp_vectors'
+                         AND column_name = 'scored_from_headline_id')
+    """)
+
+
+def _apply_migration(conn: Any, path: Path, probe_sql: str) -> None:
+    """Run the statements of migration ``path`` unless ``probe_sql`` returns TRUE."""
+    cursor = conn.cursor()
+    cursor.execute(probe_sql)
+    if not cursor.fetchone()[0]:
+        ddl = re.sub(r"--[^\n]*", "", path.read_text(encoding="utf-8"))
+        for stmt in [s.strip() for s in ddl.split(";") if s.strip()]:
+            cursor.execute(stmt)
+    conn.commit()
+    cursor.close()
+
+
+def make_score_cache(conn: Any, model_name: str) -> Any:
+    """Ensure the cache table exists and return a ScoreCache for ``model_name``."""
+    from processing_engine.score_cache import ScoreCache
+
+    ensure_score_cache(conn)
+    return ScoreCache(conn, model_name)
+
+
+def make_work_queue(
+    conn: Any, model_name: str, *, any_model: bool, date_from: str, date_to: str,
+    reopen: bool = False,
+) -> Any:
+    """Apply migration 011 if needed, seed the day jobs and return a WorkQueue.
+
+    Seeding re-checks recent done days for late headlines; with ``reopen``
+    also sweep every done day in the window — a full scan, so only on request.
+    """
+    from processing_engine.work_queue import WorkQueue
+
+    _apply_migration(conn, WORK_QUEUE_MIGRATION, "SELECT to_regclass('scoring_jobs') IS NOT NULL")
+    queue = WorkQueue(
+        conn, model_name, any_model=any_model, date_from=date_from, date_to=date_to,
+    )
+    seeded = queue.seed()
+    if reopen:
+        reopened = queue.reopen()
+        logger.info("Work queue: reopened {:,} done day(s) with unscored headlines", reopened)
+    logger.info(
+        "Work queue ({} / {}): {:,} day job(s) added or reopened — {} — worker {}",
+        model_name, queue.scope, seeded, queue.counts(), queue.worker_id,
+    )
+    return queue
+
+
+def warm_score_cache(conn: Any, model_name: str) -> int:
+    """Seed headline_score_cache from this model's existing nlp_vectors rows."""
+    cache = make_score_cache(conn, model_name)
+    return cache.warm_from_nlp_vectors()
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -233,12 +532,155 @@ def _make_obs(headline_row: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+class _ChunkPlan:
+    """How one chunk of rows gets its scores (see :func:`_plan_chunk`)."""
+
+    __slots__ = ("to_score", "ready", "followers", "keys")
+
+    def __init__(self, to_score: list[dict[str, Any]]) -> None:
+        self.to_score = to_score      # rows that need an LLM call
+        self.ready: list[tuple[int, dict[str, Any], int | None]] = []   # cache hits
+        self.followers: dict[int, list[dict[str, Any]]] = {}   # scored id → copies
+        self.keys: dict[int, str] = {}   # to_score id → cache key
+
+
+def _plan_chunk(rows: list[dict[str, Any]], cache: Any = None) -> _ChunkPlan:
+    """Split a chunk into cache hits, LLM work and rows that copy a result.
+
+    Without a cache every row is LLM work.  With a
+    :class:`~processing_engine.score_cache.ScoreCache`, rows whose normalised
+    text is already cached are ``ready``; the remaining rows are grouped by
+    cache key and only the first row per key is scored — the others follow it.
+    """
+    if cache is None:
+        return _ChunkPlan(to_score=list(rows))
+
+    from processing_engine.score_cache import headline_cache_key
+
+    keys = [headline_cache_key(str(row.get("headline", ""))) for row in rows]
+    cached = cache.lookup(keys)
+    plan = _ChunkPlan(to_score=[])
+    leaders: dict[str, int] = {}
+    for row, key in zip(rows, keys):
+        cache.stats.lookups += 1
+        if key in cached:
+            res, src = cached[key]
+            cache.stats.hits += 1
+            plan.ready.append((row["id"], res, src))
+        elif key in leaders:
+            cache.stats.duplicates += 1
+            plan.followers.setdefault(leaders[key], []).append(row)
+        else:
+            leaders[key] = row["id"]
+            plan.keys[row["id"]] = key
+            plan.to_score.append(row)
+    return plan
+
+
+def _finish_chunk(
+    plan: _ChunkPlan,
+    scored: list[tuple[int, dict[str, Any], int | None]],
+) -> tuple[list[tuple[int, dict[str, Any], int | None]], list[tuple[str, dict[str, Any], int]]]:
+    """Fan LLM results out to their followers; return ``(rows, cache entries)``.
+
+    ``scored`` may be any subset of ``plan.to_score`` (the pipelined runner
+    finishes a plan one LLM batch at a time).  The cache entries are the
+    ``(key, result, source_headline_id)`` to offer to ``ScoreCache.store_many``.
+    """
+    entries = [(plan.keys[hid], res, hid) for hid, res, _ in scored if hid in plan.keys]
+    return _fan_out(scored, plan.followers), entries
+
+
+async def _score_chunk(
+    rows: list[dict[str, Any]],
+    score_fn: Callable[[list[dict[str, Any]]], Awaitable[list[dict[str, Any]]]],
+    cache: Any = None,
+) -> list[tuple[int, dict[str, Any], int | None]]:
+    """Score a chunk of DB rows → ``(headline_id, result, scored_from)`` in row order.
+
+    Cache hits and exact duplicates are resolved by :func:`_plan_chunk`; only
+    the remaining rows go to ``score_fn``.  Validated results are written back
+    to the cache.  ``scored_from`` is the headline whose LLM call produced a
+    copied result (``None`` for a row's own call).
+    """
+    plan = _plan_chunk(rows, cache)
+    results = await score_fn([_make_obs(row) for row in plan.to_score]) if plan.to_score else []
+    scored, entries = _finish_chunk(
+        plan, [(row["id"], res, None) for row, res in zip(plan.to_score, results)],
+    )
+    if cache is not None:
+        cache.store_many(entries)
+    position = {row["id"]: i for i, row in enumerate(rows)}
+    return sorted(plan.ready + scored, key=lambda item: position[item[0]])
+
+
+def _collapse_near_duplicates(
+    headlines: list[dict[str, Any]], threshold: float,
+) -> tuple[list[dict[str, Any]], dict[int, list[dict[str, Any]]]]:
+    """Split rows into cluster representatives and ``rep id → member rows``.
+
+    ``threshold`` is the shingle Jaccard similarity a member must reach
+    against its representative (see :mod:`processing_engine.near_dup`);
+    ``0`` disables collapsing.  Only representatives go to the LLM.
+    """
+    if threshold <= 0 or len(headlines) < 2:
+        return headlines, {}
+    from processing_engine.config import DEDUP_WINDOW_DAYS
+    from processing_engine.near_dup import near_duplicate_representatives
+
+    reps = near_duplicate_representatives(
+        [str(row.get("headline", "")) for row in headlines],
+        [row.get("date") for row in headlines],
+        threshold=threshold,
+        window_days=DEDUP_WINDOW_DAYS,
+    )
+    representatives: list[dict[str, Any]] = []
+    members: dict[int, list[dict[str, Any]]] = {}
+    for row, rep in zip(headlines, reps):
+        if headlines[rep] is row:
+            representatives.append(row)
+        else:
+            members.setdefault(headlines[rep]["id"], []).append(row)
+    logger.info(
+        "Near-dup collapse (Jaccard ≥ {:.2f}): {:,} headlines → {:,} to score ({:,} collapsed)",
+        threshold, len(headlines), len(representatives),
+        len(headlines) - len(representatives),
+    )
+    return representatives, members
+
+
+def _fan_out(
+    scored: list[tuple[int, dict[str, Any], int | None]],
+    members: dict[int, list[dict[str, Any]]],
+) -> list[tuple[int, dict[str, Any], int | None]]:
+    """Append each representative's near-duplicate members to ``scored``.
+
+    Members reuse the representative's result; ``scored_from`` is the
+    headline whose LLM call produced it (the representative itself, or the
+    representative's own source when it was a cache copy).
+    """
+    if not members:
+        return scored
+    out = list(scored)
+    for headline_id, result, scored_from in scored:
+        source = scored_from if scored_from is not None else headline_id
+        for row in members.get(headline_id, ()):
+            out.append((row["id"], {**result, "processing_time_seconds": 0.0}, source))
+    return out
+
+
 def _log_progress(
     processed: int, total: int, succeeded: int, failed: int, t_start: float,
 ) -> None:
-    """Log a progress line with ETA."""
+    """Log a progress line with ETA (``total=0``: unknown, streaming runner)."""
     elapsed = time.perf_counter() - t_start
     rate = processed / elapsed if elapsed > 0 else 0
+    if total <= 0:
+        logger.info(
+            "Progress: {:,} | OK: {:,} | Failed: {:,} | {:.1f}s elapsed | {:.1f} headlines/min",
+            processed, succeeded, failed, elapsed, rate * 60,
+        )
+        return
     eta = (total - processed) / rate if rate > 0 else 0
     logger.info(
         "Progress: {:,}/{:,} ({:.0f}%) | OK: {:,} | Failed: {:,} | "
@@ -251,8 +693,12 @@ def _log_progress(
 def _log_summary(
     model_name: str, mode: str, total: int, succeeded: int,
     failed: int, failed_ids: list[int], t_start: float,
+    cache: Any = None,
+    writer: NlpVectorWriter | None = None,
+    limiter: Any = None,
+    packing: Any = None,
 ) -> None:
-    """Log the final batch summary."""
+    """Log the final batch summary (plus cache, DB-write, LLM-call and packing counters)."""
     elapsed = time.perf_counter() - t_start
     rate = total / elapsed * 60 if elapsed > 0 else 0
     logger.info("─" * 60)
@@ -264,6 +710,22 @@ def _log_summary(
     logger.info("  Failed:      {:,}", failed)
     logger.info("  Elapsed:     {:.1f}s ({:.1f} min)", elapsed, elapsed / 60)
     logger.info("  Throughput:  {:.1f} headlines/min", rate)
+    if cache is not None:
+        st = cache.stats
+        logger.info(
+            "  Score cache: {:.1%} hit rate — {:,} cached + {:,} in-run duplicates "
+            "of {:,} (LLM-scored {:,})",
+            st.hit_rate, st.hits, st.duplicates, st.lookups, st.lookups - st.saved,
+        )
+    if writer is not None:
+        logger.info(
+            "  DB writes:   {:,} inserted, {:,} conflicted (row already present)",
+            writer.inserted, writer.conflicted,
+        )
+    if limiter is not None:
+        logger.info("  LLM calls:   {}", limiter.summary())
+    if packing is not None:
+        logger.info("  Packing:     {}", packing.summary())
     if failed_ids:
         logger.info("  Failed IDs:  {}", failed_ids[:20])
         if len(failed_ids) > 20:
@@ -345,17 +807,28 @@ async def run_batch_fast(
     model_name: str,
     batch_size: int,
     concurrency: int,
+    *,
+    score_cache: bool = True,
+    dedup_threshold: float = 0.0,
 ) -> None:
     """
     Process headlines using the fast single-prompt pipeline.
 
     Each headline = 1 LLM call (instead of ~21).  Multiple headlines
-    are processed concurrently (default: 4 at a time).
+    are processed concurrently: ``concurrency`` is the starting point of
+    one adaptive limit shared by every chunk of the run.  With
+    ``score_cache`` on, headlines whose normalised text was already scored
+    by this model are copied from ``headline_score_cache`` instead, and with
+    ``dedup_threshold > 0`` near-duplicate rewrites reuse one representative's
+    score (:func:`_collapse_near_duplicates`).
     """
-    from processing_engine.fast_pipeline import score_headlines_concurrent
+    from processing_engine.fast_pipeline import make_llm_limiter, score_headlines_concurrent
     from processing_engine.prompts import build_llm
 
     llm = build_llm()
+    limiter = make_llm_limiter(concurrency)
+    cache = make_score_cache(conn, model_name) if score_cache else None
+    writer = NlpVectorWriter(conn, model_name)
     total = len(headlines)
     t_start = time.perf_counter()
     processed = 0
@@ -368,36 +841,33 @@ async def run_batch_fast(
         concurrency,
     )
 
-    for batch_start in range(0, total, batch_size):
-        batch = headlines[batch_start : batch_start + batch_size]
-        obs_list = [_make_obs(row) for row in batch]
-        ids = [row["id"] for row in batch]
+    to_score, members = _collapse_near_duplicates(headlines, dedup_threshold)
+    for batch_start in range(0, len(to_score), batch_size):
+        batch = to_score[batch_start : batch_start + batch_size]
 
-        # Process the whole batch concurrently
-        results = await score_headlines_concurrent(
-            obs_list, llm=llm, concurrency=concurrency,
+        # Process the whole batch concurrently (cache misses only)
+        scored = await _score_chunk(
+            batch,
+            lambda obs: score_headlines_concurrent(obs, llm=llm, limiter=limiter),
+            cache,
         )
+        scored = _fan_out(scored, members)
 
-        cursor = conn.cursor()
-        for headline_id, result in zip(ids, results):
-            try:
-                insert_nlp_vector(cursor, headline_id, model_name, result)
-                if result.get("validation_passed", False):
-                    succeeded += 1
-                else:
-                    failed += 1
-                    failed_ids.append(headline_id)
-            except Exception as exc:
-                logger.error("DB insert failed id={}: {}", headline_id, exc)
+        _, _, errored = writer.write(scored)
+        conn.commit()
+        for headline_id, result, _ in scored:
+            if result.get("validation_passed", False) and headline_id not in errored:
+                succeeded += 1
+            else:
                 failed += 1
                 failed_ids.append(headline_id)
             processed += 1
-
-        conn.commit()
-        cursor.close()
         _log_progress(processed, total, succeeded, failed, t_start)
 
-    _log_summary(model_name, f"fast (concurrency={concurrency})", total, succeeded, failed, failed_ids, t_start)
+    _log_summary(
+        model_name, f"fast (concurrency={concurrency})",
+        total, succeeded, failed, failed_ids, t_start, cache, writer, limiter,
+    )
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -412,18 +882,32 @@ async def run_batch_fast_batched(
     commit_size: int,
     headlines_per_call: int,
     concurrency: int,
+    *,
+    score_cache: bool = True,
+    dedup_threshold: float = 0.0,
 ) -> None:
     """
     Process headlines using batched single-prompt pipeline.
 
     Multiple headlines are packed into each LLM call (``headlines_per_call``),
-    and multiple batches run concurrently.  This is the fastest mode:
-    N headlines ÷ headlines_per_call = total LLM calls needed.
+    and multiple batches run concurrently under one adaptive limit that
+    starts at ``concurrency`` and carries over between commit chunks.  This
+    is the fastest mode:
+    N headlines ÷ headlines_per_call = total LLM calls needed.  Score-cache
+    hits and near-duplicates (see :func:`run_batch_fast`) are removed before
+    packing.
     """
-    from processing_engine.fast_pipeline import score_headlines_batch
+    from processing_engine.fast_pipeline import (
+        PACKING_STATS,
+        make_llm_limiter,
+        score_headlines_batch,
+    )
     from processing_engine.prompts import build_llm
 
     llm = build_llm()
+    limiter = make_llm_limiter(concurrency)
+    cache = make_score_cache(conn, model_name) if score_cache else None
+    writer = NlpVectorWriter(conn, model_name)
     total = len(headlines)
     t_start = time.perf_counter()
     processed = 0
@@ -431,47 +915,286 @@ async def run_batch_fast_batched(
     failed = 0
     failed_ids: list[int] = []
 
-    total_calls = (total + headlines_per_call - 1) // headlines_per_call
+    to_score, members = _collapse_near_duplicates(headlines, dedup_threshold)
+    total_calls = (len(to_score) + headlines_per_call - 1) // headlines_per_call
     logger.info(
         "Fast-batch mode: {} headlines/call, {} concurrent batches → ~{} LLM calls total",
         headlines_per_call, concurrency, total_calls,
     )
 
-    for commit_start in range(0, total, commit_size):
-        commit_chunk = headlines[commit_start : commit_start + commit_size]
-        obs_list = [_make_obs(row) for row in commit_chunk]
-        ids = [row["id"] for row in commit_chunk]
-
-        results = await score_headlines_batch(
-            obs_list,
-            llm=llm,
-            batch_size=headlines_per_call,
-            concurrency=concurrency,
+    for commit_start in range(0, len(to_score), commit_size):
+        commit_chunk = to_score[commit_start : commit_start + commit_size]
+
+        scored = await _score_chunk(
+            commit_chunk,
+            lambda obs: score_headlines_batch(
+                obs,
+                llm=llm,
+                batch_size=headlines_per_call,
+                limiter=limiter,
+            ),
+            cache,
         )
+        scored = _fan_out(scored, members)
 
-        cursor = conn.cursor()
-        for headline_id, result in zip(ids, results):
-            try:
-                insert_nlp_vector(cursor, headline_id, model_name, result)
-                if result.get("validation_passed", False):
-                    succeeded += 1
-                else:
-                    failed += 1
-                    failed_ids.append(headline_id)
-            except Exception as exc:
-                logger.error("DB insert failed id={}: {}", headline_id, exc)
+        _, _, errored = writer.write(scored)
+        conn.commit()
+        for headline_id, result, _ in scored:
+            if result.get("validation_passed", False) and headline_id not in errored:
+                succeeded += 1
+            else:
                 failed += 1
                 failed_ids.append(headline_id)
             processed += 1
-
-        conn.commit()
-        cursor.close()
         _log_progress(processed, total, succeeded, failed, t_start)
 
     _log_summary(
         model_name,
         f"fast-batch ({headlines_per_call}/call, concurrency={concurrency})",
-        total, succeeded, failed, failed_ids, t_start,
+        total, succeeded, failed, failed_ids, t_start, cache, writer, limiter,
+        PACKING_STATS,
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Pipelined fast-batch runner — read, score and write concurrently
+# ─────────────────────────────────────────────────────────────────────
+
+PIPELINE_PAGE_SIZE = 5000
+
+
+async def run_batch_pipelined(
+    conn: Any,
+    model_name: str,
+    flush_size: int,
+    headlines_per_call: int,
+    concurrency: int,
+    *,
+    limit: int = 0,
+    date_from: str = "",
+    date_to: str = "",
+    any_model: bool = False,
+    score_cache: bool = True,
+    dedup_threshold: float = 0.0,
+    page_size: int = PIPELINE_PAGE_SIZE,
+    work_queue: bool = False,
+    reopen: bool = False,
+) -> None:
+    """
+    Streaming producer/consumer version of :func:`run_batch_fast_batched`.
+
+    Three stages joined by bounded asyncio queues:
+
+    - **reader** — keyset pages of unscored rows (:func:`fetch_unprocessed_page`),
+      near-dup collapse and score-cache planning per page, then LLM batches
+      of ``headlines_per_call`` onto the work queue;
+    - **workers** — one task per slot of the adaptive limit's ceiling, each
+      with at most one LLM batch call in flight; the shared
+      :class:`~processing_engine.concurrency.AdaptiveLimiter` (starting at
+      ``concurrency``) decides how many of them are calling at once, so the
+      server sees a steady load instead of draining down to the slowest
+      batch of every chunk;
+    - **writer** — flushes finished rows through :class:`NlpVectorWriter`
+      (and the score cache) whenever ``flush_size`` rows are pending or the
+      workers have nothing more for it yet.
+
+    All DB work runs on one dedicated thread, so the single connection is
+    never used concurrently.  Memory is bounded by one page plus the queue
+    sizes, not by ``limit``.
+
+    With ``work_queue`` the reader claims one headline day at a time from
+    ``scoring_jobs`` (:mod:`processing_engine.work_queue`) instead of paging
+    the whole backlog, so several workers — on any number of machines — can
+    share it.  A day is marked done once its last row is written; a day left
+    unfinished (``limit`` reached, or an error) is released on exit.
+    ``reopen`` re-queues done days that gained unscored headlines since.
+    """
+    from processing_engine.fast_pipeline import (
+        PACKING_STATS,
+        make_llm_limiter,
+        score_headlines_batch,
+    )
+    from processing_engine.prompts import build_llm
+
+    llm = build_llm()
+    limiter = make_llm_limiter(concurrency)
+    n_workers = limiter.max_limit
+    loop = asyncio.get_running_loop()
+    db_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline-db")
+
+    async def on_db(fn: Callable[..., Any], *args: Any) -> Any:
+        return await loop.run_in_executor(db_thread, fn, *args)
+
+    cache = await on_db(make_score_cache, conn, model_name) if score_cache else None
+    queue = None
+    if work_queue:
+        queue = await on_db(partial(
+            make_work_queue, conn, model_name,
+            any_model=any_model, date_from=date_from, date_to=date_to, reopen=reopen,
+        ))
+    writer = NlpVectorWriter(conn, model_name)
+    work: asyncio.Queue = asyncio.Queue(maxsize=2 * n_workers)
+    done: asyncio.Queue = asyncio.Queue(maxsize=4 * n_workers)
+
+    t_start = time.perf_counter()
+    processed = 0
+    succeeded = 0
+    failed = 0
+    failed_ids: list[int] = []
+
+    logger.info(
+        "Pipelined fast-batch mode: {} headlines/call, {} LLM calls in flight "
+        "(adaptive {}-{}), pages of {:,}, flush every {:,} rows",
+        headlines_per_call, concurrency, limiter.min_limit, limiter.max_limit,
+        page_size, flush_size,
+    )
+
+    # Work-queue bookkeeping (event-loop thread only): rows read but not yet
+    # flushed per claimed day, rows written per day, which days are fully read,
+    # days with a failed write, and row → day.
+    outstanding: dict[Any, int] = {}
+    written: dict[Any, int] = {}
+    fully_read: set[Any] = set()
+    errored_days: set[Any] = set()
+    day_of: dict[int, Any] = {}
+
+    async def complete_if_finished(day: Any) -> None:
+        if day in fully_read and outstanding.get(day) == 0:
+            fully_read.discard(day)
+            del outstanding[day]
+            if day in errored_days:
+                # Keep the lease until the run ends (released then), so the
+                # failed rows are retried by the next run, not in a hot loop.
+                written.pop(day, None)
+            else:
+                await on_db(queue.complete, day, written.pop(day, 0))
+
+    async def read_pages(lo: str, hi: str, budget: int, day: Any = None) -> int:
+        after: tuple[Any, int] | None = None
+        read = 0
+        while not budget or read < budget:
+            n = page_size if not budget else min(page_size, budget - read)
+            page = await on_db(
+                fetch_unprocessed_page,
+                conn, model_name, after, n, lo, hi, any_model,
+            )
+            if not page:
+                break
+            read += len(page)
+            after = (page[-1]["date"], page[-1]["id"])
+            if day is not None:
+                outstanding[day] = outstanding.get(day, 0) + len(page)
+                day_of.update((row["id"], day) for row in page)
+            reps, members = await asyncio.to_thread(
+                _collapse_near_duplicates, page, dedup_threshold,
+            )
+            plan = await on_db(_plan_chunk, reps, cache)
+            if plan.ready:
+                await done.put((_fan_out(plan.ready, members), []))
+            for i in range(0, len(plan.to_score), headlines_per_call):
+                await work.put((plan, members, plan.to_score[i : i + headlines_per_call]))
+        return read
+
+    async def reader() -> None:
+        if queue is None:
+            await read_pages(date_from, date_to, limit)
+        else:
+            read = 0
+            while not limit or read < limit:
+                day = await on_db(queue.claim)
+                if day is None:
+                    break
+                outstanding.setdefault(day, 0)
+                budget = limit - read if limit else 0
+                n = await read_pages(str(day), str(day), budget, day)
+                read += n
+                if budget and n >= budget:
+                    break  # day may have more rows; released on exit
+                fully_read.add(day)
+                await complete_if_finished(day)
+        for _ in range(n_workers):
+            await work.put(None)
+
+    async def worker() -> None:
+        while (item := await work.get()) is not None:
+            plan, members, batch = item
+            results = await score_headlines_batch(
+                [_make_obs(row) for row in batch],
+                llm=llm,
+                batch_size=headlines_per_call,
+                limiter=limiter,
+            )
+            scored, entries = _finish_chunk(
+                plan, [(row["id"], res, None) for row, res in zip(batch, results)],
+            )
+            await done.put((_fan_out(scored, members), entries))
+
+    def flush(rows: list[tuple[int, dict[str, Any], int | None]], entries: list) -> list[int]:
+        _, _, errored = writer.write(rows)
+        if cache is not None:
+            cache.store_many(entries)
+        conn.commit()
+        return errored
+
+    async def sink() -> None:
+        nonlocal processed, succeeded, failed
+        rows: list[tuple[int, dict[str, Any], int | None]] = []
+        entries: list[tuple[str, dict[str, Any], int]] = []
+        while True:
+            item = await done.get()
+            if item is not None:
+                rows.extend(item[0])
+                entries.extend(item[1])
+            # Flush when enough is pending, or when nothing else is ready yet.
+            if rows and (item is None or len(rows) >= flush_size or done.empty()):
+                errored = set(await on_db(flush, rows, entries))
+                for headline_id, result, _ in rows:
+                    if result.get("validation_passed", False) and headline_id not in errored:
+                        succeeded += 1
+                    else:
+                        failed += 1
+                        failed_ids.append(headline_id)
+                processed += len(rows)
+                if queue is not None:
+                    days = set()
+                    for headline_id, _, _ in rows:
+                        day = day_of.pop(headline_id)
+                        outstanding[day] -= 1
+                        if headline_id in errored:
+                            errored_days.add(day)
+                        else:
+                            written[day] = written.get(day, 0) + 1
+                        days.add(day)
+                    await on_db(queue.heartbeat)
+                    for day in days:
+                        await complete_if_finished(day)
+                rows, entries = [], []
+                _log_progress(processed, limit, succeeded, failed, t_start)
+            if item is None:
+                return
+
+    async def produce() -> None:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(reader())
+            for _ in range(n_workers):
+                tg.create_task(worker())
+        await done.put(None)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            tg.create_task(sink())
+    finally:
+        if queue is not None:
+            for day in [*outstanding, *(errored_days - outstanding.keys())]:
+                await on_db(queue.release, day)
+        db_thread.shutdown(wait=True)
+
+    _log_summary(
+        model_name,
+        f"pipelined fast-batch ({headlines_per_call}/call, concurrency={concurrency})",
+        processed, succeeded, failed, failed_ids, t_start, cache, writer, limiter,
+        PACKING_STATS,
     )
 
 
@@ -493,9 +1216,30 @@ async def run_batch(
     concurrency: int = 4,
     headlines_per_call: int = 0,
     any_model: bool = False,
+    score_cache: bool = True,
+    warm_cache: bool = False,
+    dedup_threshold: float = 0.0,
+    pipeline: bool = False,
+    work_queue: bool = False,
+    reopen: bool = False,
 ) -> None:
-    """Main entry point — dispatches to standard, fast, or fast-batch runner."""
+    """Main entry point — dispatches to standard, fast, fast-batch or pipelined runner."""
     conn = get_connection(db_url)
+    if warm_cache and not dry_run:
+        offered = warm_score_cache(conn, model_name)
+        logger.info("Score cache warmed from {:,} existing nlp_vectors rows", offered)
+
+    if pipeline and not dry_run:
+        # Streams keyset pages — no up-front fetch of the whole backlog.
+        await run_batch_pipelined(
+            conn, model_name, batch_size, headlines_per_call, concurrency,
+            limit=limit, date_from=date_from, date_to=date_to, any_model=any_model,
+            score_cache=score_cache, dedup_threshold=dedup_threshold,
+            work_queue=work_queue, reopen=reopen,
+        )
+        conn.close()
+        return
+
     headlines = get_unprocessed_headlines(
         conn, model_name, limit=limit, date_from=date_from, date_to=date_to,
         any_model=any_model,
@@ -523,9 +1267,13 @@ async def run_batch(
         await run_batch_fast_batched(
             conn, headlines, model_name, batch_size,
             headlines_per_call, concurrency,
+            score_cache=score_cache, dedup_threshold=dedup_threshold,
         )
     elif fast:
-        await run_batch_fast(conn, headlines, model_name, batch_size, concurrency)
+        await run_batch_fast(
+            conn, headlines, model_name, batch_size, concurrency,
+            score_cache=score_cache, dedup_threshold=dedup_threshold,
+        )
     else:
         await run_batch_standard(conn, headlines, model_name, batch_size)
 
@@ -597,7 +1345,9 @@ def main() -> None:
         "--concurrency",
         type=int,
         default=4,
-        help="Number of headlines to process simultaneously in fast mode (default: 4).",
+        help="Starting number of simultaneous LLM calls in fast mode (default: 4); "
+             "adapted within SENTISENSE_LLM_CONCURRENCY_MIN/MAX on latency and "
+             "429/5xx/timeouts unless SENTISENSE_ADAPTIVE_CONCURRENCY=false.",
     )
     parser.add_argument(
         "--headlines-per-call",
@@ -611,6 +1361,48 @@ def main() -> None:
             "(fast_pipeline.MAX_BATCH_SIZE). Exceeding the bound is clamped."
         ),
     )
+    parser.add_argument(
+        "--no-score-cache",
+        action="store_true",
+        help="Fast modes: send every headline to the LLM instead of reusing scores of "
+             "identical (normalised) text from headline_score_cache.",
+    )
+    parser.add_argument(
+        "--warm-score-cache",
+        action="store_true",
+        help="Seed headline_score_cache from this model's existing nlp_vectors rows "
+             "before processing (one-off after migration 010).",
+    )
+    parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        default=0.0,
+        help="Fast modes: collapse near-duplicate headlines (character-shingle Jaccard "
+             ">= this, MinHash-LSH, within SENTISENSE_DEDUP_WINDOW_DAYS) and score one "
+             "representative per cluster. 0=disabled (default); 0.8 is a good start.",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Fast-batch only: stream keyset pages through a reader → LLM workers → "
+             "writer pipeline that keeps the LLM busy at the adaptive concurrency limit; "
+             "--batch-size becomes the write-flush size. Best for full backfills.",
+    )
+    parser.add_argument(
+        "--work-queue",
+        action="store_true",
+        help="With --pipeline: claim headline days from the scoring_jobs table "
+             "(FOR UPDATE SKIP LOCKED leases) so several workers, on any number of "
+             "machines, can share one backlog without duplicate LLM work.",
+    )
+    parser.add_argument(
+        "--reopen",
+        action="store_true",
+        help="With --work-queue: put every finished day that gained unscored headlines "
+             "(back-fills) back in the queue; the last 2 days are re-checked on every "
+             "start anyway. Scans every headline in the date window, so run it "
+             "occasionally, ideally with --date-from.",
+    )
     args = parser.parse_args()
 
     # Safety bounds — prevent accidental resource exhaustion.
@@ -629,12 +1421,24 @@ def main() -> None:
             f"--headlines-per-call must be between 0 and "
             f"{_MAX_HEADLINES_PER_CALL} (got {args.headlines_per_call})."
         )
+    if args.pipeline and not (args.fast and args.headlines_per_call > 1):
+        parser.error("--pipeline requires --fast and --headlines-per-call > 1.")
+    if args.work_queue and not args.pipeline:
+        parser.error("--work-queue requires --pipeline.")
+    if args.reopen and not args.work_queue:
+        parser.error("--reopen requires --work-queue.")
+    if not 0.0 <= args.dedup_threshold <= 1.0:
+        parser.error(f"--dedup-threshold must be between 0 and 1 (got {args.dedup_threshold}).")
+    if args.dedup_threshold > 0 and not args.fast:
+        parser.error("--dedup-threshold requires --fast.")
 
     setup_logging()
 
     model_name = args.model_name or get_active_model_name()
     hpc = args.headlines_per_call
-    if hpc > 1 and args.fast:
+    if args.pipeline:
+        mode = f"pipelined fast-batch ({hpc}/call)"
+    elif hpc > 1 and args.fast:
         mode = f"fast-batch ({hpc}/call)"
     elif args.fast:
         mode = "fast"
@@ -652,6 +1456,10 @@ def main() -> None:
         logger.info("  Concurrency: {}", args.concurrency)
     if hpc > 1:
         logger.info("  Headlines/call: {}", hpc)
+    if args.fast:
+        logger.info("  Score cache: {}", "off" if args.no_score_cache else "on")
+        if args.dedup_threshold > 0:
+            logger.info("  Near-dup:    Jaccard ≥ {:.2f}", args.dedup_threshold)
 
     asyncio.run(run_batch(
         db_url=args.db_url,
@@ -665,6 +1473,12 @@ def main() -> None:
         concurrency=args.concurrency,
         headlines_per_call=hpc,
         any_model=args.unscored_any_model,
+        score_cache=not args.no_score_cache,
+        warm_cache=args.warm_score_cache,
+        dedup_threshold=args.dedup_threshold,
+        pipeline=args.pipeline,
+        work_queue=args.work_queue,
+        reopen=args.reopen,
     ))
 
 
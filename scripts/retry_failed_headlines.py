@@ -24,7 +24,10 @@ Workflow
 2. ``DELETE`` those rows.
 3. Re-run the associated raw_headlines through ``run_batch_fast_batched``
    (or ``run_batch_fast`` / ``run_batch_standard``).
-4. New rows are inserted with correct scores.
+4. New rows are inserted with correct scores by the shared bulk writer
+   (``process_headlines.NlpVectorWriter``); the run summary reports
+   inserted vs conflicted rows — conflicts mean a row reappeared between
+   the DELETE and the re-insert (e.g. a concurrent ``process_headlines``).
 
 Usage
 -----
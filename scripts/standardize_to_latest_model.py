@@ -27,7 +27,8 @@ Workflow
      (use that flag if you want to preserve the multi-model history).
 
 4. Re-run the headlines through the same fast / fast-batched / standard
-   pipeline as ``process_headlines.py``.
+   pipeline as ``process_headlines.py``.  The fast runners write through
+   its bulk ``NlpVectorWriter`` and report inserted vs conflicted rows.
 
 Safety
 ------
@@ -409,14 +410,17 @@ async def standardize(
             )
 
         # Step 2: re-run through the identical process_headlines pipeline.
+        # A forced re-score must reach the LLM, so it bypasses the score cache.
         if fast and headlines_per_call > 1:
             await run_batch_fast_batched(
                 conn, headlines, latest_model, batch_size,
                 headlines_per_call, concurrency,
+                score_cache=not rescore_legacy,
             )
         elif fast:
             await run_batch_fast(
                 conn, headlines, latest_model, batch_size, concurrency,
+                score_cache=not rescore_legacy,
             )
         else:
             await run_batch_standard(
@@ -10,124 +10,376 @@ Output (indexed by date):
     (high = one narrative dominates the day; low = fragmented news).
   * ``cluster_entropy`` — Shannon entropy of the day's cluster distribution (normalised).
   * ``narrative_n_headlines`` — embedded headlines that day (context for the ratio).
+
+Persistence (migration 013): the per-day rows go to ``daily_narrative_features`` and every
+refit's centres to ``narrative_cluster_snapshot``. Because day T's row depends only on
+embeddings dated ≤ T, a run resumes at the first day whose stored headline count is missing or
+changed: it loads the latest snapshot fit before that day, assigns only the new days and refits
+when ``refit_every`` comes due — a daily run is O(new days), not a replay of the whole history.
+Each refit samples with an rng seeded by ``(SEED, n_fit)``, so a resumed run reproduces a full
+rebuild exactly — and lets the refits run in parallel: the refit days depend only on the
+cadence and the past row counts, so they are planned up front, fit on a process pool, and each
+model's days are then assigned in one vectorised block.
+
+Run (server-side):
+    uv run python -m sentisense.cluster.narrative            # resume / catch up
+    uv run python -m sentisense.cluster.narrative --rebuild  # drop this series, recompute all
+    uv run python -m sentisense.cluster.narrative --rebuild --workers 8   # refits in parallel
 """
 
 from __future__ import annotations
 
+import argparse
+import datetime as dt
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import get_all_start_methods, get_context
+
 import numpy as np
 import pandas as pd
 from loguru import logger
+from sqlalchemy import text
 
-from sentisense.config import CLUSTER_K, CLUSTER_REFIT_EVERY, EMBED_MODEL, SEED
+from sentisense.config import CLUSTER_K, CLUSTER_REFIT_EVERY, CLUSTER_WORKERS, EMBED_MODEL, SEED
 from sentisense.constants import CUTOFF_DATE, REPO_ROOT
+from sentisense.db import get_engine
 from sentisense.embed import load_embeddings
+from sentisense.embed.derived import _split_sql
 
 # Cap the per-refit fit sample. MiniBatchKMeans converges fine on a sample, so we never
 # materialise/scan the full (multi-GB, growing) past-embedding matrix on each of the
 # ~thousands of refits — that recopying was the hours-long bottleneck.
 _FIT_SAMPLE_CAP = 50_000
 _PROGRESS_EVERY = 500
-_CACHE_DIR = REPO_ROOT / "sentisense_cache"
+_MIGRATION = REPO_ROOT / "sentisense" / "db" / "migrations" / "013_narrative_clusters.sql"
+_FEATURE_COLS = ["dominant_cluster_ratio", "cluster_entropy", "narrative_n_headlines"]
+
+_SERIES = "embed_model = :model AND k = :k AND refit_every = :refit_every"
+_STORED_SQL = text(
+    f"SELECT date, dominant_cluster_ratio, cluster_entropy, narrative_n_headlines "
+    f"FROM daily_narrative_features WHERE {_SERIES} AND date <= :cutoff ORDER BY date"
+)
+_SNAPSHOT_SQL = text(
+    f"SELECT fit_date, dim, centers FROM narrative_cluster_snapshot "
+    f"WHERE {_SERIES} AND fit_date < :before ORDER BY fit_date DESC LIMIT 1"
+)
+_DELETE_FEATURES_SQL = text(f"DELETE FROM daily_narrative_features WHERE {_SERIES} AND date >= :since")
+_DELETE_SNAPSHOTS_SQL = text(
+    f"DELETE FROM narrative_cluster_snapshot WHERE {_SERIES} AND fit_date >= :since"
+)
+_INSERT_SNAPSHOT_SQL = text(
+    """
+    INSERT INTO narrative_cluster_snapshot (embed_model, k, refit_every, fit_date, n_fit, dim, centers)
+    VALUES (:model, :k, :refit_every, :fit_date, :n_fit, :dim, :centers)
+    ON CONFLICT (embed_model, k, refit_every, fit_date) DO UPDATE
+        SET n_fit = EXCLUDED.n_fit, dim = EXCLUDED.dim, centers = EXCLUDED.centers,
+            created_at = NOW()
+    """
+)
+_INSERT_FEATURES_SQL = text(
+    """
+    INSERT INTO daily_narrative_features (date, embed_model, k, refit_every, dominant_cluster_ratio,
+                                          cluster_entropy, narrative_n_headlines, fit_date)
+    VALUES (:date, :model, :k, :refit_every, :dominant_cluster_ratio, :cluster_entropy,
+            :narrative_n_headlines, :fit_date)
+    ON CONFLICT (date, embed_model, k, refit_every) DO UPDATE
+        SET dominant_cluster_ratio = EXCLUDED.dominant_cluster_ratio,
+            cluster_entropy = EXCLUDED.cluster_entropy,
+            narrative_n_headlines = EXCLUDED.narrative_n_headlines,
+            fit_date = EXCLUDED.fit_date, updated_at = NOW()
+    """
+)
+_FAR_PAST = dt.date(1900, 1, 1)
+
+
+def ensure_narrative_tables(engine=None) -> None:
+    """Apply the narrative-clustering migration (idempotent CREATE TABLE IF NOT EXISTS)."""
+    engine = engine or get_engine()
+    with engine.begin() as conn:
+        for stmt in _split_sql(_MIGRATION.read_text(encoding="utf-8")):
+            conn.execute(text(stmt))
+
+
+def _assign(centers: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Nearest-centre labels (what ``MiniBatchKMeans.predict`` computes), from bare centres."""
+    dist = (centers * centers).sum(axis=1) - 2.0 * (x @ centers.T)
+    return dist.argmin(axis=1)
+
+
+def _resume_index(days: pd.DatetimeIndex, counts: np.ndarray, stored: pd.Series) -> int:
+    """First position in ``days`` whose stored row is missing or stale (``len(days)`` if none).
+
+    ``stored`` maps date → persisted ``narrative_n_headlines``. A count mismatch means the day's
+    embeddings changed (or, for a stored date no longer present, vanished); every later day
+    was fit on that prefix, so everything from there on is recomputed.
+    """
+    have = stored.reindex(days).to_numpy(dtype=float)
+    stale = np.isnan(have) | (have != counts)
+    first = int(np.argmax(stale)) if stale.any() else len(days)
+    gone = stored.index.difference(days)
+    if len(gone):
+        first = min(first, int(np.searchsorted(days.values, gone.min().to_datetime64())))
+    return first
 
 
-def _cache_path(n_embeddings: int, k: int, refit_every: int):
-    """Disk-cache key for the computed features (so tune/final never recompute).
+def _refit_plan(bounds: np.ndarray, *, start: int, days_since_fit: int, fitted: bool, k: int,
+                refit_every: int) -> list[int]:
+    """Day positions in ``[start, len(bounds))`` where the causal loop refits.
 
-    CSV (not pickle): a small date-indexed numeric frame — no arbitrary-object
-    deserialization, safe to read back even though we're also the only writer.
+    The cadence only depends on the day index and the strictly-past row count
+    (``bounds[i]``), never on a fit's result, so every refit point is known up front.
     """
-    safe = EMBED_MODEL.replace("/", "_")
-    return _CACHE_DIR / f"narrative_{safe}_n{n_embeddings}_k{k}_r{refit_every}.csv"
+    plan = []
+    for i in range(start, len(bounds)):
+        if bounds[i] >= k and (not fitted or days_since_fit >= refit_every):
+            plan.append(i)
+            fitted, days_since_fit = True, 0
+        else:
+            days_since_fit += 1
+    return plan
+
 
+# Set before forking the refit pool: workers inherit the (memmapped) matrix, not a pickle.
+_fit_vectors = None
 
-def _entropy(counts: np.ndarray) -> float:
-    p = counts / counts.sum()
-    p = p[p > 0]
-    h = -(p * np.log(p)).sum()
-    return float(h / np.log(len(p))) if len(p) > 1 else 0.0
+
+def _fit_centers(vectors, n_past: int, k: int, threads: int | None = None) -> np.ndarray:
+    """MiniBatchKMeans centres fit on a seeded sample of the first ``n_past`` (strictly-past) rows.
+
+    Fit on a bounded random sample of the causal prefix: caps cost regardless of how large
+    the prefix has grown. The rng is seeded by ``(SEED, n_past)``, so the result does not
+    depend on which process fits it or in what order.
+    """
+    from sklearn.cluster import MiniBatchKMeans
+    from threadpoolctl import threadpool_limits
+
+    rng = np.random.default_rng([SEED, n_past])
+    if n_past > _FIT_SAMPLE_CAP:
+        fit_idx = np.sort(rng.choice(n_past, _FIT_SAMPLE_CAP, replace=False))
+    else:
+        fit_idx = np.arange(n_past)
+    model = MiniBatchKMeans(n_clusters=k, random_state=SEED, n_init=3, batch_size=256)
+    with threadpool_limits(threads):
+        model.fit(np.asarray(vectors[fit_idx], dtype=np.float32))
+    return model.cluster_centers_.astype(np.float32)
+
+
+def _fit_worker(n_past: int, k: int, threads: int) -> np.ndarray:
+    return _fit_centers(_fit_vectors, n_past, k, threads)
+
+
+def _fit_all(vectors, n_pasts: list[int], k: int, workers: int) -> list[np.ndarray]:
+    """Fit every planned refit — on a forked process pool when ``workers > 1``."""
+    global _fit_vectors
+    if workers <= 1 or len(n_pasts) <= 1 or "fork" not in get_all_start_methods():
+        return [_fit_centers(vectors, n, k) for n in n_pasts]
+    workers = min(workers, len(n_pasts))
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    _fit_vectors = vectors
+    try:
+        with ProcessPoolExecutor(workers, mp_context=get_context("fork")) as pool:
+            out = []
+            for i, centers in enumerate(pool.map(_fit_worker, n_pasts, repeat(k), repeat(threads)),
+                                        start=1):
+                out.append(centers)
+                if i % _PROGRESS_EVERY == 0 or i == len(n_pasts):
+                    logger.info("  narrative refits: {:,}/{:,}", i, len(n_pasts))
+            return out
+    finally:
+        _fit_vectors = None
+
+
+def _segment_features(centers: np.ndarray, vectors, bounds: np.ndarray, ends: np.ndarray,
+                      k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Dominant-cluster ratio and normalised entropy for a run of consecutive days.
+
+    All rows of the segment are labelled in one matrix product and counted per day with a
+    single ``bincount`` over ``day * k + label``.
+    """
+    lo, hi = int(bounds[0]), int(ends[-1])
+    labels = _assign(centers, np.asarray(vectors[lo:hi], dtype=np.float32))
+    day_of_row = np.repeat(np.arange(len(bounds)), ends - bounds)
+    counts = np.bincount(day_of_row * k + labels, minlength=len(bounds) * k)
+    counts = counts.reshape(len(bounds), k).astype(float)
+    totals = counts.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = counts / totals[:, None]
+        plogp = np.where(counts > 0, p * np.log(np.where(counts > 0, p, 1.0)), 0.0)
+        present = (counts > 0).sum(axis=1)
+        entropy = np.where(present > 1, -plogp.sum(axis=1) / np.log(np.maximum(present, 2)), 0.0)
+        ratio = counts.max(axis=1) / totals
+    empty = totals == 0
+    ratio[empty] = np.nan
+    entropy[empty] = np.nan
+    return ratio, entropy
+
+
+def _cluster_days(vectors, date_vals: np.ndarray, days: pd.DatetimeIndex, *, start: int,
+                  centers: np.ndarray | None, fit_date, k: int, refit_every: int,
+                  workers: int = 1) -> tuple[list[dict], list[dict]]:
+    """Run the causal loop over ``days[start:]``, continuing from a fitted state.
+
+    Planned in three steps: the refit days are computed up front (:func:`_refit_plan`),
+    fitted independently — in parallel with ``workers > 1`` — and each model's segment of days
+    (from its refit to the next) is then assigned in one vectorised block.
+
+    Args:
+        vectors: embeddings sorted by ``date_vals`` (may be a memmap).
+        centers: centres in force before ``days[start]`` (None = not fit yet).
+        fit_date: day those centres were first used (sets the refit cadence on resume).
+        workers: processes for the refits (1 = in-process).
+
+    Returns:
+        (per-day feature rows, new snapshots) — both carry their ``fit_date``.
+    """
+    # Contiguous row range per day (dates are sorted) — a view, not an index copy.
+    bounds = np.searchsorted(date_vals, days.values, side="left")
+    ends = np.append(bounds[1:], len(date_vals))
+    if centers is None:
+        days_since_fit = 10**9
+    else:
+        # Days strictly after the fit day; it may no longer be in ``days`` (its headlines were
+        # deleted or re-dated), so search rather than look it up.
+        days_since_fit = start - int(days.searchsorted(pd.Timestamp(fit_date), side="right"))
+
+    plan = _refit_plan(bounds, start=start, days_since_fit=days_since_fit,
+                       fitted=centers is not None, k=k, refit_every=refit_every)
+    logger.info("  narrative clustering: {:,} days, {:,} refits on {} worker(s)",
+                len(days) - start, len(plan), max(1, min(workers, len(plan))))
+    # Count of STRICTLY-earlier embeddings at a refit = that day's first row (dates sorted).
+    fitted = _fit_all(vectors, [int(bounds[i]) for i in plan], k, workers)
+    snapshots = [{"fit_date": days[i].date(), "n_fit": int(bounds[i]), "centers": c}
+                 for i, c in zip(plan, fitted)]
+
+    rows_out: list[dict] = []
+    cuts = [start, *[i for i in plan if i > start], len(days)]
+    models = dict(zip(plan, fitted))
+    for a, b in zip(cuts[:-1], cuts[1:]):
+        if a in models:
+            centers, fit_date = models[a], days[a]
+        seg = slice(a, b)
+        n_day = ends[seg] - bounds[seg]
+        if centers is None:
+            ratio = entropy = np.full(b - a, np.nan)
+        else:
+            ratio, entropy = _segment_features(centers, vectors, bounds[seg], ends[seg], k)
+        label_date = pd.Timestamp(fit_date).date() if centers is not None else None
+        rows_out.extend(
+            {"date": days[i], "dominant_cluster_ratio": float(ratio[j]),
+             "cluster_entropy": float(entropy[j]), "narrative_n_headlines": int(n_day[j]),
+             "fit_date": label_date if n_day[j] else None}
+            for j, i in enumerate(range(a, b)))
+    return rows_out, snapshots
+
+
+def _nullable(x):
+    return None if x is None or (isinstance(x, float) and np.isnan(x)) else x
 
 
 def build_narrative_features(engine=None, *, k: int = CLUSTER_K,
                              refit_every: int = CLUSTER_REFIT_EVERY,
-                             cutoff=CUTOFF_DATE) -> pd.DataFrame:
-    """Compute causal per-day narrative features from cached embeddings.
+                             cutoff=CUTOFF_DATE, rebuild: bool = False,
+                             workers: int = CLUSTER_WORKERS) -> pd.DataFrame:
+    """Compute causal per-day narrative features, resuming from the persisted tables.
 
     ``cutoff`` defaults to the project cutoff (modeling). Pass a later date for the
-    full-date visualization (the cache key keys on the embedding count, so CUT and
-    FULL get distinct cache files automatically).
+    full-date visualization — rows are cutoff-independent, so both share one series and the
+    later run only adds the post-cutoff days.
+
+    Args:
+        rebuild: drop this (model, k, refit_every) series and recompute every day.
+        workers: processes fitting the planned refits in parallel (1 = in-process).
 
     Returns:
         DataFrame indexed by date with dominant_cluster_ratio / cluster_entropy /
         narrative_n_headlines. Empty if no embeddings are cached.
     """
-    from sklearn.cluster import MiniBatchKMeans
-
+    engine = engine or get_engine()
     meta, vectors = load_embeddings(engine, cutoff=cutoff)
     if len(meta) == 0:
         logger.warning("No embeddings cached — run sentisense.embed.embeddings first. "
                        "Returning empty narrative features.")
         return pd.DataFrame()
 
-    # Reuse a prior computation if the embedding set + params are unchanged — tune and
-    # final both call this, and it's the slow stage.
-    cache = _cache_path(len(meta), k, refit_every)
-    if cache.exists():
-        logger.info("Narrative features: loading cached {} ({:,} embeddings).",
-                    cache.name, len(meta))
-        return pd.read_csv(cache, index_col="date", parse_dates=["date"])
-
     meta = meta.reset_index(drop=True)
-    order = np.argsort(meta["date"].values, kind="stable")
-    meta = meta.iloc[order].reset_index(drop=True)
-    vectors = vectors[order]
-    date_vals = meta["date"].values            # sorted ascending after the argsort
-    days = pd.DatetimeIndex(sorted(meta["date"].unique()))
-    logger.info("Narrative clustering over {:,} days / {:,} embeddings (k={}, refit_every={}) …",
-                len(days), len(meta), k, refit_every)
-
-    # Row index ranges per day for fast slicing.
-    day_to_rows = {d: np.where(date_vals == d)[0] for d in days}
-
-    rng = np.random.default_rng(SEED)
-    model: MiniBatchKMeans | None = None
-    days_since_fit = 10**9
-    rows_out: list[dict] = []
+    if not meta["date"].is_monotonic_increasing:
+        # The memmapped store is already date-sorted; only the SQL path needs this copy.
+        order = np.argsort(meta["date"].values, kind="stable")
+        meta = meta.iloc[order].reset_index(drop=True)
+        vectors = vectors[order]
+    date_vals = meta["date"].values            # sorted ascending
+    days = pd.DatetimeIndex(pd.unique(date_vals))
+    counts = np.diff(np.append(np.searchsorted(date_vals, days.values, side="left"),
+                               len(date_vals)))
 
-    for i, d in enumerate(days):
-        if i % _PROGRESS_EVERY == 0:
-            logger.info("  narrative clustering: day {:,}/{:,}", i, len(days))
-        # Count of STRICTLY-earlier embeddings (sorted → O(log n), no full-array scan).
-        n_past = int(np.searchsorted(date_vals, np.datetime64(d), side="left"))
-        if n_past >= k and (model is None or days_since_fit >= refit_every):
-            # Fit on a bounded random sample of the strictly-past rows (causal): caps
-            # cost regardless of how large the prefix has grown.
-            if n_past > _FIT_SAMPLE_CAP:
-                fit_idx = rng.choice(n_past, _FIT_SAMPLE_CAP, replace=False)
-            else:
-                fit_idx = np.arange(n_past)
-            model = MiniBatchKMeans(n_clusters=k, random_state=SEED, n_init=3, batch_size=256)
-            model.fit(vectors[fit_idx])
-            days_since_fit = 0
-        else:
-            days_since_fit += 1
+    ensure_narrative_tables(engine)
+    series = {"model": EMBED_MODEL, "k": k, "refit_every": refit_every}
+    with engine.connect() as conn:
+        stored = pd.DataFrame() if rebuild else pd.read_sql(
+            _STORED_SQL, conn, params={**series, "cutoff": pd.Timestamp(cutoff).date()},
+            parse_dates=["date"])
+    if stored.empty:
+        stored = pd.DataFrame(columns=["date", *_FEATURE_COLS])
+    stored = stored.set_index("date")
+    start = 0 if rebuild else _resume_index(
+        days, counts, stored["narrative_n_headlines"].astype(float))
 
-        idx = day_to_rows[d]
-        if model is None or len(idx) == 0:
-            rows_out.append({"date": d, "dominant_cluster_ratio": np.nan,
-                             "cluster_entropy": np.nan, "narrative_n_headlines": len(idx)})
-            continue
-
-        labels = model.predict(vectors[idx])
-        counts = np.bincount(labels, minlength=k).astype(float)
-        counts = counts[counts > 0]
-        ratio = counts.max() / counts.sum()
-        rows_out.append({"date": d, "dominant_cluster_ratio": float(ratio),
-                         "cluster_entropy": _entropy(counts),
-                         "narrative_n_headlines": int(len(idx))})
-
-    out = pd.DataFrame(rows_out).set_index("date").sort_index()
-    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    out.to_csv(cache)
-    logger.info("Narrative features built for {:,} days (k={}, refit_every={}) — cached → {}.",
-                len(out), k, refit_every, cache.name)
+    if start == len(days):
+        logger.info("Narrative features up to date: {:,} days (k={}, refit_every={}).",
+                    len(days), k, refit_every)
+        return stored[_FEATURE_COLS].reindex(days).rename_axis("date")
+
+    since = days[start].date() if start else _FAR_PAST
+    with engine.connect() as conn:
+        snap = None if start == 0 else conn.execute(
+            _SNAPSHOT_SQL, {**series, "before": since}).fetchone()
+    centers = (np.frombuffer(snap.centers, dtype=np.float32).reshape(k, snap.dim)
+               if snap is not None else None)
+    logger.info("Narrative clustering days {:,}–{:,} of {:,} / {:,} embeddings "
+                "(k={}, refit_every={}, resuming from snapshot {}) …",
+                start, len(days) - 1, len(days), len(meta), k, refit_every,
+                snap.fit_date if snap is not None else "none")
+    rows_out, snapshots = _cluster_days(
+        vectors, date_vals, days, start=start, centers=centers,
+        fit_date=snap.fit_date if snap is not None else None, k=k, refit_every=refit_every,
+        workers=workers)
+
+    with engine.begin() as conn:
+        # Later stored days (incl. past this cutoff) were fit on the stale prefix — drop them.
+        conn.execute(_DELETE_FEATURES_SQL, {**series, "since": since})
+        conn.execute(_DELETE_SNAPSHOTS_SQL, {**series, "since": since})
+        if snapshots:
+            conn.execute(_INSERT_SNAPSHOT_SQL, [
+                {**series, "fit_date": s["fit_date"], "n_fit": s["n_fit"],
+                 "dim": int(s["centers"].shape[1]), "centers": s["centers"].tobytes()}
+                for s in snapshots])
+        conn.execute(_INSERT_FEATURES_SQL, [
+            {**series, "date": r["date"].date(), "fit_date": r["fit_date"],
+             **{c: _nullable(r[c]) for c in _FEATURE_COLS}}
+            for r in rows_out])
+
+    out = pd.DataFrame(rows_out).set_index("date")[_FEATURE_COLS].reindex(days).rename_axis("date")
+    if start:
+        out.loc[days[:start], _FEATURE_COLS] = stored.loc[days[:start], _FEATURE_COLS]
+    out["narrative_n_headlines"] = out["narrative_n_headlines"].astype(int)
+    logger.info("Narrative features: {:,} new days, {} refits (k={}, refit_every={}) — "
+                "{:,} days total.", len(rows_out), len(snapshots), k, refit_every, len(out))
     return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build / resume the causal narrative features.")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Drop this (model, k, refit_every) series and recompute every day.")
+    parser.add_argument("--cutoff", default=None,
+                        help="Last date to cluster (default: the project cutoff).")
+    parser.add_argument("--workers", type=int, default=CLUSTER_WORKERS,
+                        help="Processes for the refits (default: SENTISENSE_CLUSTER_WORKERS).")
+    args = parser.parse_args()
+    cutoff = pd.Timestamp(args.cutoff).date() if args.cutoff else CUTOFF_DATE
+    build_narrative_features(cutoff=cutoff, rebuild=args.rebuild, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
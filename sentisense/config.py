@@ -15,6 +15,9 @@ def _float(key: str, default: float) -> float:
 
 # Feature shaping
 TOP_N_SOURCES: int = _int("SENTISENSE_TOP_N_SOURCES", 12)
+# Dataset-builder frame engine (sentisense.features.dataset): "pandas" or "polars" (the
+# polars extra; same frames, aggregation/pivot/joins run as Polars queries).
+FEATURE_ENGINE: str = os.environ.get("SENTISENSE_FEATURE_ENGINE", "pandas").lower()
 
 # Sequence model
 WINDOW_SIZE: int = _int("SENTISENSE_WINDOW_SIZE", 30)
@@ -34,9 +37,25 @@ LSTM_VIABILITY_MIN_DAYS: int = _int("SENTISENSE_MIN_TRADING_DAYS", 750)
 # Embeddings (Phase 4) — Hebrew-aware multilingual model.
 EMBED_MODEL: str = os.environ.get("SENTISENSE_EMBED_MODEL", "intfloat/multilingual-e5-base")
 EMBED_BATCH: int = _int("SENTISENSE_EMBED_BATCH", 128)
+# Embedding engine (sentisense.embed.encoder): "torch", "onnx" or "onnx-int8" (ONNX Runtime
+# with int8 dynamic quantisation for ONNX_QUANT = avx512_vnni | avx512 | avx2 | arm64; needs
+# the embed-onnx extra), and the number of CPU encoder processes (--workers). onnx-int8 rows are
+# stored under embed_model "<EMBED_MODEL>#onnx-int8" so they never mix with fp32 vectors.
+EMBED_BACKEND: str = os.environ.get("SENTISENSE_EMBED_BACKEND", "torch")
+EMBED_ONNX_QUANT: str = os.environ.get("SENTISENSE_EMBED_ONNX_QUANT", "avx512_vnni")
+EMBED_WORKERS: int = _int("SENTISENSE_EMBED_WORKERS", 1)
+# On-disk memmapped mirror of headline_embeddings (sentisense.embed.store): date-sorted .npy
+# arrays that load_embeddings opens zero-copy instead of pulling every BYTEA row. Off by
+# default; "1" = the embed stage syncs the mirror and readers use it once built (else they
+# read Postgres). DTYPE float16 halves the store; DIR "" = sentisense_cache/embeddings.
+EMBED_STORE: bool = os.environ.get("SENTISENSE_EMBED_STORE", "0").lower() in ("1", "true", "yes")
+EMBED_STORE_DTYPE: str = os.environ.get("SENTISENSE_EMBED_STORE_DTYPE", "float32")
+EMBED_STORE_DIR: str = os.environ.get("SENTISENSE_EMBED_STORE_DIR", "")
 # Clustering refit cadence (days) for the expanding-window MiniBatchKMeans.
 CLUSTER_K: int = _int("SENTISENSE_CLUSTER_K", 8)
 CLUSTER_REFIT_EVERY: int = _int("SENTISENSE_CLUSTER_REFIT_EVERY", 30)
+# Processes fitting the (pre-planned, independent) narrative refits; 1 = in-process.
+CLUSTER_WORKERS: int = _int("SENTISENSE_CLUSTER_WORKERS", 1)
 # Daily-centroid embedding dataset: PCA target dim (train-fit). 0 = no PCA.
 EMBED_PCA_COMPONENTS: int = _int("SENTISENSE_EMBED_PCA", 50)
 # Derived extra-feature block (daily_embedding_derived table): a compact PCA of the daily
@@ -49,6 +68,21 @@ EMBED_DERIVED_TRAIN_FRAC: float = _float("SENTISENSE_EMBED_DERIVED_TRAIN_FRAC",
 
 SEED: int = _int("SENTISENSE_SEED", 42)
 
+# Market data (sentisense.features.market): yfinance/Frankfurter series are kept in Postgres
+# and refreshed incrementally; a refresh younger than TTL_MIN minutes is reused as-is (one
+# pipeline run fetches once), and OFFLINE=1 builds datasets from the stored rows only.
+FINANCE_OFFLINE: bool = os.environ.get("SENTISENSE_FINANCE_OFFLINE", "0").lower() in ("1", "true", "yes")
+FINANCE_TTL_MIN: int = _int("SENTISENSE_FINANCE_TTL_MIN", 60)
+# Feature-frame cache (sentisense.features.frame_cache): finished dataset frames are pickled
+# under DIR ("" = sentisense_cache/frames), keyed by a fingerprint of the builder arguments,
+# the input tables' watermarks and the feature code. "0" = always rebuild.
+FRAME_CACHE: bool = os.environ.get("SENTISENSE_FRAME_CACHE", "1").lower() not in ("0", "false", "no")
+FRAME_CACHE_DIR: str = os.environ.get("SENTISENSE_FRAME_CACHE_DIR", "")
+# Serving frame (sentisense.features.serving): the champion's fused frame is extended by
+# recomputing its tail; every FULL_EVERY days it is rebuilt in full and the drift logged.
+# 0 = rebuild in full on every predict.
+SERVE_FULL_EVERY: int = _int("SENTISENSE_SERVE_FULL_EVERY", 7)
+
 # ─────────────────────────────────────────────────────────────────────
 # Live-ETA rate estimates (seconds). Rough priors used for the up-front
 # pipeline estimate; the live trackers (scoring subprocess log, HPO
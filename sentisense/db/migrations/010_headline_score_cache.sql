@@ -0,0 +1,24 @@
+-- 010: content-addressed LLM score cache. One row per (normalised headline text, model).
+-- text_hash = md5 of processing_engine.tools.normalize_hebrew_text(headline) (NFC, niqqud
+-- stripped, whitespace collapsed), so the same wire story carried by several outlets on
+-- mivzakim.net is scored by the LLM once. Written by scripts/process_headlines.py after
+-- every validated score and read before LLM batches are packed. source_headline_id is the
+-- raw_headlines row whose LLM call produced the scores. Idempotent.
+CREATE TABLE IF NOT EXISTS headline_score_cache (
+    text_hash             CHAR(32)     NOT NULL,
+    model_name            VARCHAR(100) NOT NULL,
+    relevance_politics    SMALLINT     NOT NULL,
+    relevance_economy     SMALLINT     NOT NULL,
+    relevance_security    SMALLINT     NOT NULL,
+    relevance_health      SMALLINT     NOT NULL,
+    relevance_science     SMALLINT     NOT NULL,
+    relevance_technology  SMALLINT     NOT NULL,
+    global_sentiment      SMALLINT     NOT NULL,
+    source_headline_id    BIGINT,
+    created_at            TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (text_hash, model_name)
+);
+
+-- Provenance of reused scores: the raw_headlines row whose LLM call produced this row's
+-- scores. NULL = this headline was scored by its own LLM call.
+ALTER TABLE nlp_vectors ADD COLUMN IF NOT EXISTS scored_from_headline_id BIGINT;
@@ -0,0 +1,20 @@
+-- 011: claim-based scoring work queue. One job per (model, scope, headline day); workers
+-- running scripts/process_headlines.py --pipeline --work-queue claim pending days with
+-- FOR UPDATE SKIP LOCKED, so several machines pull disjoint days without duplicate LLM work.
+-- A claim is a lease: claimed_at is refreshed on every write flush, and a job whose lease
+-- expired (worker died) is claimable again. scope = 'model' (no row for model_name) or
+-- 'any_model' (no validated row from any model), matching --unscored-any-model. Idempotent.
+CREATE TABLE IF NOT EXISTS scoring_jobs (
+    model_name   VARCHAR(100) NOT NULL,
+    scope        VARCHAR(16)  NOT NULL,
+    day          DATE         NOT NULL,
+    status       VARCHAR(16)  NOT NULL DEFAULT 'pending',   -- pending | claimed | done
+    claimed_by   TEXT,
+    claimed_at   TIMESTAMPTZ,
+    done_at      TIMESTAMPTZ,
+    scored       INTEGER      NOT NULL DEFAULT 0,
+    PRIMARY KEY (model_name, scope, day)
+);
+
+CREATE INDEX IF NOT EXISTS idx_scoring_jobs_claim
+    ON scoring_jobs (model_name, scope, status, day DESC);
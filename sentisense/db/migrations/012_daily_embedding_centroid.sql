@@ -0,0 +1,24 @@
+-- 012: persisted daily e5 centroid moments. One row per (date, embed_model) holding the
+-- running float64 sum and sum-of-squares of that day's embeddings (raw bytes, length = dim * 8)
+-- plus the row count, so the centroid (sum / n) and dispersion (sqrt(sumsq / n - mean^2)) are
+-- read back per date instead of re-streaming every row of headline_embeddings.
+-- Maintained incrementally by sentisense.embed.centroid.refresh_daily_centroid: only embeddings
+-- with headline_id above the per-model watermark are folded in; n_rows is checked against the
+-- cache to catch back-filled or deleted embeddings (→ full rebuild). Idempotent.
+CREATE TABLE IF NOT EXISTS daily_embedding_centroid (
+    date        DATE          NOT NULL,
+    embed_model VARCHAR(100)  NOT NULL,
+    dim         INTEGER       NOT NULL,
+    n           BIGINT        NOT NULL,
+    sum         BYTEA         NOT NULL,   -- np.float64 .tobytes()
+    sumsq       BYTEA         NOT NULL,   -- np.float64 .tobytes()
+    updated_at  TIMESTAMPTZ   NOT NULL DEFAULT NOW(),
+    CONSTRAINT pk_daily_embedding_centroid PRIMARY KEY (date, embed_model)
+);
+
+CREATE TABLE IF NOT EXISTS daily_embedding_centroid_watermark (
+    embed_model      VARCHAR(100) NOT NULL PRIMARY KEY,
+    last_headline_id BIGINT       NOT NULL,   -- every embedding with headline_id <= this is folded in
+    n_rows           BIGINT       NOT NULL,   -- embeddings folded in (sum of n)
+    updated_at       TIMESTAMPTZ  NOT NULL DEFAULT NOW()
+);
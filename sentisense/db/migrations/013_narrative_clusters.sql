@@ -0,0 +1,33 @@
+-- 013: persisted causal narrative clustering (sentisense.cluster.narrative).
+-- daily_narrative_features holds the per-day output of the expanding-window loop; each row
+-- only depends on embeddings dated on/before that day, so a run resumes from the first day
+-- whose stored headline count no longer matches (or is missing) instead of starting over.
+-- narrative_cluster_snapshot keeps the MiniBatchKMeans centres of every refit (fit_date =
+-- first day assigned with them; fit on embeddings strictly before it), so the resumed loop
+-- continues from the latest snapshot and refits only when the cadence comes due.
+-- Keyed by (embed_model, k, refit_every): changing either knob starts a separate series.
+-- Idempotent.
+CREATE TABLE IF NOT EXISTS narrative_cluster_snapshot (
+    embed_model VARCHAR(100)  NOT NULL,
+    k           INTEGER       NOT NULL,
+    refit_every INTEGER       NOT NULL,
+    fit_date    DATE          NOT NULL,
+    n_fit       BIGINT        NOT NULL,   -- strictly-past embeddings available at the refit
+    dim         INTEGER       NOT NULL,
+    centers     BYTEA         NOT NULL,   -- np.float32 (k, dim) .tobytes()
+    created_at  TIMESTAMPTZ   NOT NULL DEFAULT NOW(),
+    CONSTRAINT pk_narrative_cluster_snapshot PRIMARY KEY (embed_model, k, refit_every, fit_date)
+);
+
+CREATE TABLE IF NOT EXISTS daily_narrative_features (
+    date                   DATE             NOT NULL,
+    embed_model            VARCHAR(100)     NOT NULL,
+    k                      INTEGER          NOT NULL,
+    refit_every            INTEGER          NOT NULL,
+    dominant_cluster_ratio DOUBLE PRECISION,            -- NULL before the first fit
+    cluster_entropy        DOUBLE PRECISION,
+    narrative_n_headlines  INTEGER          NOT NULL,
+    fit_date               DATE,                        -- snapshot that labelled the day
+    updated_at             TIMESTAMPTZ      NOT NULL DEFAULT NOW(),
+    CONSTRAINT pk_daily_narrative_features PRIMARY KEY (date, embed_model, k, refit_every)
+);
@@ -0,0 +1,15 @@
+-- 014: versioned projection bases. embedding_pca_basis held one row per embed_model (the
+-- scaler→PCA→KMeans basis fit on daily centroids). It now keeps every fit as a new version,
+-- per kind:
+--   centroid — fit on the daily centroids by scripts/build_embedding_derived.py (the embpca_*
+--              features the models consume);
+--   headline — fit out-of-core on individual headline embeddings by sentisense.embed.basis
+--              (IncrementalPCA + MiniBatchKMeans over keyset pages) for the UI projections.
+-- Readers take the highest version of the kind they need. Existing rows become centroid v1.
+-- Additive + idempotent: the old single-column PK is replaced by a unique index.
+ALTER TABLE embedding_pca_basis ADD COLUMN IF NOT EXISTS kind VARCHAR(20) NOT NULL DEFAULT 'centroid';
+ALTER TABLE embedding_pca_basis ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE embedding_pca_basis ADD COLUMN IF NOT EXISTS n_fit BIGINT;   -- rows the basis was fit on
+ALTER TABLE embedding_pca_basis DROP CONSTRAINT IF EXISTS pk_embedding_pca_basis;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_embedding_pca_basis_version
+    ON embedding_pca_basis (embed_model, kind, version);
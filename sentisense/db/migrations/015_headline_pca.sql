@@ -0,0 +1,16 @@
+-- 015: per-headline coordinates under a stored projection basis. One row per
+-- (embed_model, kind, version, headline_id) holding the n_pca float32 coordinates (raw bytes,
+-- length = n_pca * 4) of that headline's embedding projected through embedding_pca_basis
+-- (scaler → PCA). The UI day view joins these 64-byte vectors by primary key instead of
+-- reading the 3 KB embeddings.
+-- Filled by sentisense.embed.projection.fill_headline_pca (from build_embedding_derived and
+-- sentisense.embed.basis): a new basis version is projected in full, later runs only add
+-- headlines that have no row yet; rows of superseded versions are pruned. Idempotent.
+CREATE TABLE IF NOT EXISTS headline_pca (
+    headline_id BIGINT       NOT NULL REFERENCES raw_headlines(id) ON DELETE CASCADE,
+    embed_model VARCHAR(100) NOT NULL,
+    kind        VARCHAR(20)  NOT NULL,   -- embedding_pca_basis.kind
+    version     INTEGER      NOT NULL,   -- embedding_pca_basis.version
+    coords      BYTEA        NOT NULL,   -- np.float32 .tobytes(), length = n_pca * 4
+    CONSTRAINT pk_headline_pca PRIMARY KEY (embed_model, kind, version, headline_id)
+);
@@ -0,0 +1,20 @@
+-- 016: local market-data store for the dataset builders (sentisense.features.market).
+-- One row per (series, date): daily closes from yfinance (SP500, Nasdaq, VIX, Brent_Oil, and
+-- the live TA125_Price / TA125_Volume extension past the CSV) and the Frankfurter USD/ILS rate.
+-- market_data_watermark holds per-series progress: last_date = newest stored day (NULL while a
+-- fetched series has returned nothing), fetched_at = last successful fetch. A refresh
+-- re-fetches only from a few days before last_date, skips the network entirely while
+-- fetched_at is younger than SENTISENSE_FINANCE_TTL_MIN, and SENTISENSE_FINANCE_OFFLINE=1
+-- reads the stored rows without any fetch. Idempotent.
+CREATE TABLE IF NOT EXISTS market_data (
+    series VARCHAR(40)      NOT NULL,
+    date   DATE             NOT NULL,
+    value  DOUBLE PRECISION NOT NULL,
+    CONSTRAINT pk_market_data PRIMARY KEY (series, date)
+);
+
+CREATE TABLE IF NOT EXISTS market_data_watermark (
+    series     VARCHAR(40) NOT NULL PRIMARY KEY,
+    last_date  DATE,
+    fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
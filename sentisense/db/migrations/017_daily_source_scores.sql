@@ -0,0 +1,38 @@
+-- 017: materialised per-(date, source) score aggregates for the dataset builders.
+-- One row per raw_headlines (date, source) over the LATEST validated nlp_vectors row of each
+-- headline (the _load_raw_scores contract): n headlines, and per score column the SUM and the
+-- non-NULL count, plus SUM(|sentiment|) and SUM(sentiment^2) for the intensity / dispersion
+-- interactions. Daily means, per-source pivots and interactions are exact functions of these.
+-- Maintained by sentisense.features.source_scores.refresh_daily_source_scores: dates touched by
+-- validated nlp_vectors rows above the watermark id are re-aggregated in SQL and replaced; a
+-- count mismatch at or below the watermark (delete / late-committed row) rebuilds. Idempotent.
+CREATE TABLE IF NOT EXISTS daily_source_scores (
+    date    DATE    NOT NULL,
+    source  TEXT    NOT NULL,
+    n       INTEGER NOT NULL,   -- headlines with a validated score
+    sum_relevance_politics BIGINT  NOT NULL,
+    sum_relevance_economy BIGINT  NOT NULL,
+    sum_relevance_security BIGINT  NOT NULL,
+    sum_relevance_health BIGINT  NOT NULL,
+    sum_relevance_science BIGINT  NOT NULL,
+    sum_relevance_technology BIGINT  NOT NULL,
+    sum_global_sentiment BIGINT  NOT NULL,
+    n_relevance_politics INTEGER NOT NULL,
+    n_relevance_economy INTEGER NOT NULL,
+    n_relevance_security INTEGER NOT NULL,
+    n_relevance_health INTEGER NOT NULL,
+    n_relevance_science INTEGER NOT NULL,
+    n_relevance_technology INTEGER NOT NULL,
+    n_global_sentiment INTEGER NOT NULL,
+    sum_abs_sentiment BIGINT NOT NULL,
+    sum_sq_sentiment  BIGINT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT pk_daily_source_scores PRIMARY KEY (date, source)
+);
+
+CREATE TABLE IF NOT EXISTS daily_source_scores_watermark (
+    id             SMALLINT    NOT NULL PRIMARY KEY CHECK (id = 1),   -- single row
+    last_vector_id BIGINT      NOT NULL,   -- every validated nlp_vectors.id <= this is folded in
+    n_vectors      BIGINT      NOT NULL,   -- validated nlp_vectors rows with id <= last_vector_id
+    updated_at     TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -1,10 +1,18 @@
 """Phase 4 narrative detection — Hebrew-aware headline embeddings + cache."""
 
+from sentisense.embed.centroid import (
+    load_daily_centroid,
+    refresh_daily_centroid,
+    stored_daily_centroid,
+)
 from sentisense.embed.embeddings import (
     daily_embedding_centroid,
     embed_missing,
     ensure_table,
     load_embeddings,
 )
+from sentisense.embed.similarity import similar, similar_many
 
-__all__ = ["daily_embedding_centroid", "embed_missing", "ensure_table", "load_embeddings"]
+__all__ = ["daily_embedding_centroid", "embed_missing", "ensure_table", "load_daily_centroid",
+           "load_embeddings", "refresh_daily_centroid", "similar", "similar_many",
+           "stored_daily_centroid"]
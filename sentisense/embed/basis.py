@@ -0,0 +1,189 @@
+"""Out-of-core headline-level projection basis (StandardScaler → IncrementalPCA + MiniBatchKMeans).
+
+The derived-feature basis (``embed.derived.fit_transform_derived``) is fit on ~5k daily
+centroids. The UI's day view projects *individual headlines*, whose spread is far wider than
+the centroids', so this module fits a second basis on the headline embeddings themselves —
+millions of rows, without loading them: two passes over the keyset-paged reader
+(``embeddings._keyset_pages``), each page fed to ``partial_fit``:
+
+1. ``StandardScaler.partial_fit`` — per-dimension mean / scale;
+2. ``IncrementalPCA.partial_fit`` and ``MiniBatchKMeans.partial_fit`` on the scaled page.
+
+Peak RAM is one page. Progress is checkpointed to ``sentisense_cache/basis/`` every
+``checkpoint_every`` pages (and between passes), so an interrupted fit resumes at the last
+page rather than from scratch; the checkpoint is removed once the basis is stored.
+
+The result has the same layout as the centroid basis and is stored in ``embedding_pca_basis``
+as a new ``kind='headline'`` version, then every headline is projected through it into
+``headline_pca`` (``embed.projection``). It feeds the UI only (never model features); rows
+are limited to dates ≤ ``fit_cutoff`` (default: the project cutoff).
+
+Run (server-side):
+    uv run --extra ml python -m sentisense.embed.basis
+    uv run --extra ml python -m sentisense.embed.basis --n-pca 16 --n-clusters 8 --fresh
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from sentisense.config import EMBED_DERIVED_CLUSTERS, EMBED_DERIVED_PCA, EMBED_MODEL, SEED
+from sentisense.constants import CUTOFF_DATE, REPO_ROOT
+from sentisense.db import get_engine
+from sentisense.embed.derived import persist_basis
+from sentisense.embed.embeddings import _keyset_pages
+from sentisense.embed.projection import fill_headline_pca
+
+_CKPT_DIR = REPO_ROOT / "sentisense_cache" / "basis"
+
+
+def _checkpoint_path(model: str, n_pca: int, n_clusters: int, fit_cutoff) -> Path:
+    """One checkpoint per fit configuration — a changed knob never resumes a stale fit."""
+    safe = model.replace("/", "_")
+    day = pd.Timestamp(fit_cutoff).date().isoformat()
+    return _CKPT_DIR / f"headline_{safe}_p{n_pca}_k{n_clusters}_{day}.joblib"
+
+
+def _save_checkpoint(path: Path, state: dict) -> None:
+    import joblib
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    joblib.dump(state, tmp)
+    tmp.replace(path)
+
+
+def _load_checkpoint(path: Path) -> dict | None:
+    import joblib
+
+    if not path.exists():
+        return None
+    # SECURITY: joblib.load is pickle-based. Safe here only because this process family is
+    # the sole writer of sentisense_cache/basis/ — never point it at a file from elsewhere.
+    state = joblib.load(path)
+    logger.info("Resuming headline basis fit from {} ({} pass, headline_id > {})",
+                path.name, state["stage"], state["last_id"])
+    return state
+
+
+def fit_headline_basis(engine=None, *, fit_cutoff=CUTOFF_DATE, n_pca: int = EMBED_DERIVED_PCA,
+                       n_clusters: int = EMBED_DERIVED_CLUSTERS, page: int = 20_000,
+                       checkpoint_every: int = 10, resume: bool = True, seed: int = SEED,
+                       model: str = EMBED_MODEL) -> dict:
+    """Fit the scaler→PCA→KMeans basis on every headline embedding dated ≤ ``fit_cutoff``.
+
+    Args:
+        page: rows per keyset page — the partial_fit batch (must be ≥ n_pca and n_clusters;
+            a smaller trailing page is carried into the next one).
+        checkpoint_every: pages between checkpoints.
+        resume: continue from a matching checkpoint if one exists.
+
+    Returns:
+        The basis dict (``persist_basis`` layout) with ``n_fit`` = headlines fit on.
+
+    Raises:
+        ValueError: if fewer headlines than ``max(n_pca, n_clusters) + 1`` are available.
+    """
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.decomposition import IncrementalPCA
+    from sklearn.preprocessing import StandardScaler
+
+    engine = engine or get_engine()
+    path = _checkpoint_path(model, n_pca, n_clusters, fit_cutoff)
+    state = _load_checkpoint(path) if resume else None
+    if state is None:
+        state = {"stage": "scale", "last_id": -1, "n_fit": 0, "scaler": StandardScaler(),
+                 "ipca": None, "kmeans": None, "pending": None}
+    min_rows = max(n_pca, n_clusters)
+
+    def pages():
+        for i, (last_id, _dates, vecs) in enumerate(
+                _keyset_pages(engine, fit_cutoff, after_id=state["last_id"], page=page,
+                              model=model), start=1):
+            yield vecs
+            state["last_id"] = last_id
+            if i % checkpoint_every == 0:
+                _save_checkpoint(path, state)
+                logger.info("  headline basis ({} pass): through headline_id {}",
+                            state["stage"], last_id)
+
+    if state["stage"] == "scale":
+        for vecs in pages():
+            state["scaler"].partial_fit(vecs)
+            state["n_fit"] += len(vecs)
+        if state["n_fit"] < min_rows + 1:
+            raise ValueError(f"too few headlines ({state['n_fit']}) ≤ {fit_cutoff} for "
+                             f"n_pca={n_pca}, n_clusters={n_clusters}")
+        n_features = state["scaler"].n_features_in_
+        state.update(stage="fit", last_id=-1,
+                     ipca=IncrementalPCA(n_components=min(n_pca, n_features)),
+                     kmeans=MiniBatchKMeans(n_clusters=n_clusters, random_state=seed, n_init=3))
+        _save_checkpoint(path, state)
+
+    ipca, kmeans = state["ipca"], state["kmeans"]
+    for vecs in pages():
+        xs = state["scaler"].transform(vecs)
+        if state["pending"] is not None:
+            xs, state["pending"] = np.vstack([state["pending"], xs]), None
+        if len(xs) < max(min_rows, ipca.n_components):
+            state["pending"] = xs
+            continue
+        ipca.partial_fit(xs)
+        kmeans.partial_fit(xs)
+    if state["pending"] is not None and hasattr(kmeans, "cluster_centers_"):
+        # Too few rows for an IncrementalPCA step; the cluster centres still take them.
+        kmeans.partial_fit(state["pending"])
+
+    scaler = state["scaler"]
+    basis = {
+        "n_features": int(scaler.n_features_in_), "n_pca": int(ipca.n_components_),
+        "fit_cutoff": pd.Timestamp(fit_cutoff).date(),
+        "scaler_mean": scaler.mean_.astype(np.float32),
+        "scaler_scale": scaler.scale_.astype(np.float32),
+        "pca_mean": ipca.mean_.astype(np.float32),
+        "pca_components": ipca.components_.astype(np.float32),
+        "n_clusters": int(n_clusters),
+        "kmeans_centers": kmeans.cluster_centers_.astype(np.float32),
+        "n_fit": int(state["n_fit"]),
+    }
+    logger.info("Headline basis fit on {:,} headlines (≤ {}): {}→{} dims, {} clusters, "
+                "{:.1%} variance explained", basis["n_fit"], basis["fit_cutoff"],
+                basis["n_features"], basis["n_pca"], n_clusters,
+                float(ipca.explained_variance_ratio_.sum()))
+    return basis
+
+
+def build_headline_basis(engine=None, *, fit_cutoff=CUTOFF_DATE, n_pca: int = EMBED_DERIVED_PCA,
+                         n_clusters: int = EMBED_DERIVED_CLUSTERS, model: str = EMBED_MODEL,
+                         **fit_kwargs) -> int:
+    """Fit (resuming any checkpoint), store as a ``headline`` version, project; returns it."""
+    engine = engine or get_engine()
+    basis = fit_headline_basis(engine, fit_cutoff=fit_cutoff, n_pca=n_pca,
+                               n_clusters=n_clusters, model=model, **fit_kwargs)
+    version = persist_basis(basis, engine=engine, model=model, kind="headline")
+    _checkpoint_path(model, n_pca, n_clusters, fit_cutoff).unlink(missing_ok=True)
+    fill_headline_pca(engine, kind="headline", model=model)
+    return version
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fit the out-of-core headline-level basis.")
+    parser.add_argument("--n-pca", type=int, default=EMBED_DERIVED_PCA)
+    parser.add_argument("--n-clusters", type=int, default=EMBED_DERIVED_CLUSTERS)
+    parser.add_argument("--fit-cutoff", default=None,
+                        help="Last headline date to fit on (default: the project cutoff).")
+    parser.add_argument("--page", type=int, default=20_000, help="Rows per partial_fit page.")
+    parser.add_argument("--fresh", action="store_true", help="Ignore an existing checkpoint.")
+    args = parser.parse_args()
+    fit_cutoff = pd.Timestamp(args.fit_cutoff).date() if args.fit_cutoff else CUTOFF_DATE
+    build_headline_basis(n_pca=args.n_pca, n_clusters=args.n_clusters, fit_cutoff=fit_cutoff,
+                         page=args.page, resume=not args.fresh)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Persisted, incrementally-maintained daily e5 centroid (``daily_embedding_centroid`` table).
+
+``daily_embedding_centroid()`` streams every row of ``headline_embeddings`` (~3M×768) on each
+call, even when only today's headlines are new. This module keeps the per-date moments —
+float64 sum, sum-of-squares, count — in Postgres and folds in only the embeddings whose
+``headline_id`` is above a stored per-model watermark, so a nightly refresh reads one day of
+vectors instead of the whole corpus. The dataset builders then read the finished per-date rows
+(:func:`stored_daily_centroid`), which yields the same frame as the streaming path.
+
+Keyset watermark caveat: embeddings written for *older* headline ids after the watermark moved
+(a back-fill) or deleted ones would be missed. The refresh therefore compares the cached row
+count with ``count(*)`` of embeddings at or below the watermark (an index-only range scan) and
+rebuilds from scratch when they disagree.
+
+Run (server-side):
+    uv run python -m sentisense.embed.centroid            # incremental refresh
+    uv run python -m sentisense.embed.centroid --rebuild  # drop this model's rows, re-stream all
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sqlalchemy import text
+
+from sentisense.config import EMBED_MODEL
+from sentisense.constants import CUTOFF_DATE, REPO_ROOT
+from sentisense.db import get_engine
+from sentisense.embed.derived import _split_sql
+from sentisense.embed.embeddings import _DailyMoments, _stream_moments
+
+CENTROID_TABLE = "daily_embedding_centroid"
+_MIGRATION = REPO_ROOT / "sentisense" / "db" / "migrations" / "012_daily_embedding_centroid.sql"
+_FAR_FUTURE = dt.date(2100, 1, 1)
+
+# Transaction-scoped lock per model: serialises refreshes even when there is no watermark row
+# to lock yet (first run, new model) or it is about to be dropped (rebuild).
+_LOCK_SQL = text("SELECT pg_advisory_xact_lock(hashtext('daily_embedding_centroid'), "
+                 "hashtext(:model))")
+_WATERMARK_SQL = text(
+    "SELECT last_headline_id, n_rows FROM daily_embedding_centroid_watermark "
+    "WHERE embed_model = :model FOR UPDATE"
+)
+_COVERED_SQL = text(
+    "SELECT count(*) FROM headline_embeddings "
+    "WHERE embed_model = :model AND headline_id <= :last_id"
+)
+_EXISTING_SQL = text(
+    "SELECT date, n, sum, sumsq FROM daily_embedding_centroid "
+    "WHERE embed_model = :model AND date = ANY(:dates) FOR UPDATE"
+)
+_UPSERT_SQL = text(
+    """
+    INSERT INTO daily_embedding_centroid (date, embed_model, dim, n, sum, sumsq)
+    VALUES (:date, :model, :dim, :n, :sum, :sumsq)
+    ON CONFLICT (date, embed_model) DO UPDATE
+        SET dim = EXCLUDED.dim, n = EXCLUDED.n, sum = EXCLUDED.sum,
+            sumsq = EXCLUDED.sumsq, updated_at = NOW()
+    """
+)
+_WATERMARK_UPSERT = text(
+    """
+    INSERT INTO daily_embedding_centroid_watermark (embed_model, last_headline_id, n_rows)
+    VALUES (:model, :last_id, :n_rows)
+    ON CONFLICT (embed_model) DO UPDATE
+        SET last_headline_id = EXCLUDED.last_headline_id, n_rows = EXCLUDED.n_rows,
+            updated_at = NOW()
+    """
+)
+_LOAD_SQL = text(
+    "SELECT date, dim, n, sum, sumsq FROM daily_embedding_centroid "
+    "WHERE embed_model = :model AND date BETWEEN :start AND :cutoff ORDER BY date"
+)
+
+
+def ensure_centroid_table(engine=None) -> None:
+    """Apply the centroid-moments migration (idempotent CREATE TABLE IF NOT EXISTS)."""
+    engine = engine or get_engine()
+    with engine.begin() as conn:
+        for stmt in _split_sql(_MIGRATION.read_text(encoding="utf-8")):
+            conn.execute(text(stmt))
+
+
+def _fold_into(conn, delta: _DailyMoments, model: str) -> None:
+    """Add ``delta`` to the persisted rows of the dates it touches (read-modify-write)."""
+    dates = [pd.Timestamp(d).date() for d in delta.ordinal]
+    existing = conn.execute(_EXISTING_SQL, {"model": model, "dates": dates}).fetchall()
+    for d, n, s, sq in existing:
+        delta.merge(d, int(n), np.frombuffer(s, dtype=np.float64),
+                    np.frombuffer(sq, dtype=np.float64))
+    rows = [{
+        "date": pd.Timestamp(d).date(), "model": model, "dim": delta.dim, "n": n,
+        "sum": sums.tobytes(), "sumsq": sqsums.tobytes(),
+    } for d, n, sums, sqsums in delta.rows()]
+    conn.execute(_UPSERT_SQL, rows)
+
+
+def refresh_daily_centroid(engine=None, *, rebuild: bool = False, page: int = 100_000,
+                           model: str = EMBED_MODEL) -> int:
+    """Fold embeddings above the watermark into ``daily_embedding_centroid``.
+
+    Args:
+        rebuild: drop this model's rows and watermark first, then stream everything.
+        page: keyset page size for the delta scan (bounds client RAM, as in the streaming path).
+        model: embedding model whose rows to maintain.
+
+    Returns:
+        The number of embeddings folded in by this call.
+    """
+    engine = engine or get_engine()
+    ensure_centroid_table(engine)
+    with engine.begin() as conn:
+        conn.execute(_LOCK_SQL, {"model": model})
+        mark = None if rebuild else conn.execute(_WATERMARK_SQL, {"model": model}).fetchone()
+        if mark is not None:
+            covered = conn.execute(_COVERED_SQL, {"model": model,
+                                                  "last_id": mark.last_headline_id}).scalar()
+            if covered != mark.n_rows:
+                logger.warning("Centroid cache covers {:,} embeddings but {:,} exist at or below "
+                               "headline_id {} (back-fill or delete) — rebuilding.",
+                               mark.n_rows, covered, mark.last_headline_id)
+                mark = None
+        if mark is None:
+            conn.execute(text("DELETE FROM daily_embedding_centroid WHERE embed_model = :model"),
+                         {"model": model})
+        after_id, n_rows = (mark.last_headline_id, mark.n_rows) if mark is not None else (-1, 0)
+
+        delta, last_id = _stream_moments(engine, _FAR_FUTURE, after_id=after_id, page=page,
+                                         model=model)
+        added = delta.n_rows if delta is not None else 0
+        if added:
+            _fold_into(conn, delta, model)
+        conn.execute(_WATERMARK_UPSERT, {"model": model, "last_id": last_id,
+                                         "n_rows": n_rows + added})
+    logger.info("Daily centroid table: folded {:,} new embeddings over {} dates (watermark {} → {})",
+                added, len(delta.ordinal) if delta is not None else 0, after_id, last_id)
+    return added
+
+
+def load_daily_centroid(engine=None, cutoff=CUTOFF_DATE, model: str = EMBED_MODEL,
+                        start=None) -> pd.DataFrame:
+    """Read the persisted per-date moments in ``[start, cutoff]`` as the centroid frame.
+
+    Same shape as ``daily_embedding_centroid()``: ``embc_000..NNN`` (mean), ``emb_dispersion``,
+    ``emb_count``, date-indexed. Empty frame if the table has no rows for ``model``.
+    """
+    engine = engine or get_engine()
+    with engine.connect() as conn:
+        rows = conn.execute(_LOAD_SQL, {"model": model, "start": start or dt.date.min,
+                                        "cutoff": cutoff}).fetchall()
+    if not rows:
+        return pd.DataFrame()
+    moments = _DailyMoments(int(rows[0].dim), capacity=len(rows))
+    for r in rows:
+        moments.merge(r.date, int(r.n), np.frombuffer(r.sum, dtype=np.float64),
+                      np.frombuffer(r.sumsq, dtype=np.float64))
+    return moments.frame()
+
+
+def stored_daily_centroid(engine=None, cutoff=CUTOFF_DATE, *, refresh: bool = True) -> pd.DataFrame:
+    """Incrementally refresh the centroid table, then read it (the dataset builders' entry point)."""
+    engine = engine or get_engine()
+    if refresh:
+        refresh_daily_centroid(engine)
+    out = load_daily_centroid(engine, cutoff)
+    if not out.empty:
+        logger.info("Daily centroid (stored, <= {}): {} days × {}-d", pd.Timestamp(cutoff).date(),
+                    len(out), sum(c.startswith("embc_") for c in out.columns))
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Refresh the persisted daily e5 centroid table.")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Drop this model's rows and re-stream every embedding.")
+    parser.add_argument("--page", type=int, default=100_000, help="Keyset page size.")
+    args = parser.parse_args()
+    refresh_daily_centroid(rebuild=args.rebuild, page=args.page)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,8 @@ from sentisense.db import get_engine
 DERIVED_TABLE = "daily_embedding_derived"
 _MIGRATION = REPO_ROOT / "sentisense" / "db" / "migrations" / "004_embedding_derived.sql"
 _BASIS_MIGRATION = REPO_ROOT / "sentisense" / "db" / "migrations" / "007_embedding_basis.sql"
+_BASIS_VERSION_MIGRATION = (REPO_ROOT / "sentisense" / "db" / "migrations"
+                            / "014_embedding_basis_version.sql")
 _FAR_FUTURE = dt.date(2100, 1, 1)
 
 
@@ -88,6 +90,7 @@ def fit_transform_derived(centroid_by_date: pd.DataFrame, *, fit_cutoff,
         "pca_components": pca.components_.astype(np.float32),   # (n_pca, n_features)
         "n_clusters": int(n_clusters),
         "kmeans_centers": km.cluster_centers_.astype(np.float32),   # (k, n_features), SCALED space
+        "n_fit": n_fit,
     }
     return out, basis
 
@@ -144,37 +147,90 @@ def persist_derived(derived: pd.DataFrame, *, fit_cutoff, n_pca: int, n_clusters
     return len(rows)
 
 
-_BASIS_UPSERT = text(
+_BASIS_INSERT = text(
     """
     INSERT INTO embedding_pca_basis
-        (embed_model, n_features, n_pca, fit_cutoff, scaler_mean, scaler_scale, pca_mean,
-         pca_components, n_clusters, kmeans_centers)
-    VALUES (:model, :n_features, :n_pca, :fit_cutoff, :scaler_mean, :scaler_scale, :pca_mean,
-            :pca_components, :n_clusters, :kmeans_centers)
-    ON CONFLICT (embed_model) DO UPDATE
-        SET n_features = EXCLUDED.n_features, n_pca = EXCLUDED.n_pca,
-            fit_cutoff = EXCLUDED.fit_cutoff, scaler_mean = EXCLUDED.scaler_mean,
-            scaler_scale = EXCLUDED.scaler_scale, pca_mean = EXCLUDED.pca_mean,
-            pca_components = EXCLUDED.pca_components, n_clusters = EXCLUDED.n_clusters,
-            kmeans_centers = EXCLUDED.kmeans_centers, created_at = NOW()
+        (embed_model, kind, version, n_fit, n_features, n_pca, fit_cutoff, scaler_mean,
+         scaler_scale, pca_mean, pca_components, n_clusters, kmeans_centers)
+    SELECT CAST(:model AS VARCHAR), CAST(:kind AS VARCHAR), COALESCE(MAX(version), 0) + 1,
+           :n_fit, :n_features, :n_pca, :fit_cutoff, :scaler_mean, :scaler_scale, :pca_mean,
+           :pca_components, :n_clusters, :kmeans_centers
+    FROM embedding_pca_basis
+    WHERE embed_model = CAST(:model AS VARCHAR) AND kind = CAST(:kind AS VARCHAR)
+    RETURNING version
     """
 )
+_BASIS_LATEST = text(
+    """
+    SELECT version, n_features, n_pca, fit_cutoff, scaler_mean, scaler_scale, pca_mean,
+           pca_components, n_clusters, kmeans_centers
+    FROM embedding_pca_basis WHERE embed_model = :model AND kind = :kind
+    ORDER BY version DESC LIMIT 1
+    """
+)
+BASIS_KINDS = ("centroid", "headline")
+_BASIS_ARRAYS = ("scaler_mean", "scaler_scale", "pca_mean", "pca_components", "kmeans_centers")
+
+
+def _same_basis(row, basis: dict) -> bool:
+    """True when stored ``row`` is the same fit as ``basis`` (float32 noise aside).
+
+    The daily rerun of ``build_embedding_derived`` refits on an unchanged train window; reusing
+    the stored version keeps every projection keyed by it (``headline_pca``) valid.
+    """
+    if (int(row["n_features"]), int(row["n_pca"]), row["n_clusters"]) != (
+            basis["n_features"], basis["n_pca"], basis.get("n_clusters")):
+        return False
+    if pd.Timestamp(row["fit_cutoff"]) != pd.Timestamp(basis["fit_cutoff"]):
+        return False
+    for key in _BASIS_ARRAYS:
+        new = basis.get(key)
+        if (row[key] is None) != (new is None):
+            return False
+        if new is not None and not np.allclose(np.frombuffer(row[key], dtype=np.float32),
+                                               np.asarray(new, dtype=np.float32).ravel(),
+                                               rtol=1e-5, atol=1e-6):
+            return False
+    return True
+
+
+def ensure_basis_table(engine=None) -> None:
+    """Apply the basis migrations (007 table + 014 kind/version columns), idempotently."""
+    engine = engine or get_engine()
+    with engine.begin() as conn:
+        for path in (_BASIS_MIGRATION, _BASIS_VERSION_MIGRATION):
+            for stmt in _split_sql(path.read_text(encoding="utf-8")):
+                conn.execute(text(stmt))
 
 
-def persist_basis(basis: dict, *, engine=None, model: str = EMBED_MODEL) -> None:
-    """Upsert the fitted scaler→PCA basis (float32 BYTEA) so the UI can project headlines.
+def persist_basis(basis: dict, *, engine=None, model: str = EMBED_MODEL,
+                  kind: str = "centroid") -> int:
+    """Store the fitted scaler→PCA basis (float32 BYTEA) as a new version so the UI can project.
 
     Args:
-        basis: the dict returned by ``fit_transform_derived(..., return_basis=True)``.
+        basis: the dict returned by ``fit_transform_derived(..., return_basis=True)`` or
+            ``sentisense.embed.basis.fit_headline_basis``.
         engine: SQLAlchemy engine; created from env if None.
         model: embedding model name the basis belongs to.
+        kind: 'centroid' (daily-centroid fit) or 'headline' (per-headline out-of-core fit).
+
+    Returns:
+        The version number assigned (1 + the latest for this model and kind), or the latest
+        version itself when ``basis`` is the same fit (nothing is written then).
     """
+    if kind not in BASIS_KINDS:
+        raise ValueError(f"kind must be one of {BASIS_KINDS}, got {kind!r}")
     engine = engine or get_engine()
+    ensure_basis_table(engine)
     with engine.begin() as conn:
-        for stmt in _split_sql(_BASIS_MIGRATION.read_text(encoding="utf-8")):
-            conn.execute(text(stmt))
-        conn.execute(_BASIS_UPSERT, {
-            "model": model, "n_features": basis["n_features"], "n_pca": basis["n_pca"],
+        latest = conn.execute(_BASIS_LATEST, {"model": model, "kind": kind}).mappings().first()
+        if latest is not None and _same_basis(latest, basis):
+            logger.info("{} PCA basis unchanged — keeping v{} (model={})",
+                        kind, latest["version"], model)
+            return int(latest["version"])
+        version = conn.execute(_BASIS_INSERT, {
+            "model": model, "kind": kind, "n_fit": basis.get("n_fit"),
+            "n_features": basis["n_features"], "n_pca": basis["n_pca"],
             "fit_cutoff": basis["fit_cutoff"],
             "scaler_mean": basis["scaler_mean"].tobytes(),
             "scaler_scale": basis["scaler_scale"].tobytes(),
@@ -183,18 +239,20 @@ def persist_basis(basis: dict, *, engine=None, model: str = EMBED_MODEL) -> None
             "n_clusters": basis.get("n_clusters"),
             "kmeans_centers": (basis["kmeans_centers"].tobytes()
                                if basis.get("kmeans_centers") is not None else None),
-        })
-    logger.info("Persisted PCA basis (model={}, {}→{} dims, fit_cutoff={})",
-                model, basis["n_features"], basis["n_pca"], basis["fit_cutoff"])
+        }).scalar_one()
+    logger.info("Persisted {} PCA basis v{} (model={}, {}→{} dims, fit_cutoff={})",
+                kind, version, model, basis["n_features"], basis["n_pca"], basis["fit_cutoff"])
+    return int(version)
 
 
 _LOAD_SQL = text(
     "SELECT date, features FROM daily_embedding_derived "
-    "WHERE embed_model = :model AND date <= :cutoff ORDER BY date"
+    "WHERE embed_model = :model AND date BETWEEN :start AND :cutoff ORDER BY date"
 )
 
 
-def load_embedding_derived(engine=None, cutoff=None, model: str = EMBED_MODEL) -> pd.DataFrame:
+def load_embedding_derived(engine=None, cutoff=None, model: str = EMBED_MODEL,
+                           start=None) -> pd.DataFrame:
     """Load derived features as a date-indexed wide frame. Empty frame if table absent/empty.
 
     Used by the dataset builders to join ``embpca_*``/``embclus_dist_*`` as extra columns; a
@@ -205,7 +263,8 @@ def load_embedding_derived(engine=None, cutoff=None, model: str = EMBED_MODEL) -
         return pd.DataFrame()
     cutoff = cutoff if cutoff is not None else _FAR_FUTURE
     with engine.connect() as conn:
-        df = pd.read_sql(_LOAD_SQL, conn, params={"model": model, "cutoff": cutoff})
+        df = pd.read_sql(_LOAD_SQL, conn, params={"model": model, "start": start or dt.date.min,
+                                                  "cutoff": cutoff})
     if df.empty:
         return pd.DataFrame()
     parsed = df["features"].apply(lambda s: s if isinstance(s, dict) else json.loads(s))
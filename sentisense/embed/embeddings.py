@@ -9,20 +9,29 @@ Run (server-side):
     uv sync --extra embed
     uv run python -m sentisense.embed.embeddings --dry-run
     uv run python -m sentisense.embed.embeddings --batch 128
+    uv sync --extra embed --extra embed-onnx   # for --backend onnx / onnx-int8
+    uv run python -m sentisense.embed.embeddings --backend onnx-int8 --workers 4
+    uv run python -m sentisense.embed.embeddings --rebuild-store   # memmap mirror only
 """
 
 from __future__ import annotations
 
 import argparse
+import queue
+import threading
+from collections.abc import Iterator
+from contextlib import ExitStack
 
 import numpy as np
 import pandas as pd
 from loguru import logger
 from sqlalchemy import text
 
-from sentisense.config import EMBED_BATCH, EMBED_MODEL
+from sentisense.config import EMBED_BACKEND, EMBED_BATCH, EMBED_MODEL, EMBED_STORE, EMBED_WORKERS
 from sentisense.constants import CUTOFF_DATE, REPO_ROOT
 from sentisense.db import get_engine
+from sentisense.embed.encoder import BACKENDS, EncoderPool, embed_key
+from sentisense.embed.store import EmbeddingStore
 
 _MIGRATION = REPO_ROOT / "sentisense" / "db" / "migrations" / "001_headline_embeddings.sql"
 
@@ -91,72 +100,230 @@ def ensure_table(engine) -> None:
             conn.execute(text(stmt))
 
 
-def _load_embedder():
-    """Import + construct the sentence-transformer, or fail fast with an install hint.
+class _BackgroundWriter:
+    """Insert embedding batches on a thread so encoding overlaps the DB round-trips.
 
-    Checked up front (before the expensive unembedded-count query) so a missing
-    optional dep doesn't surface as an opaque ModuleNotFoundError mid-run.
+    ``put`` blocks once ``depth`` batches are queued (bounded RAM). A failed insert is
+    re-raised from ``__exit__`` (or the next ``put``); later batches are drained, not written.
     """
-    try:
-        from sentence_transformers import SentenceTransformer
-    except ModuleNotFoundError as exc:
-        raise RuntimeError(
-            "The 'embed' extra is not installed (sentence-transformers/torch). "
-            "Install it before the embed stage:\n"
-            "    uv sync --extra ml --extra embed --extra finance\n"
-            "then re-run. (Embeddings need GPU/CPU torch — see docs/RUNBOOK.md.)"
-        ) from exc
-    return SentenceTransformer(EMBED_MODEL)
+
+    def __init__(self, engine, *, depth: int = 8) -> None:
+        self._engine = engine
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="embed-writer", daemon=True)
+        self.written = 0
+
+    def __enter__(self) -> _BackgroundWriter:
+        self._thread.start()
+        return self
+
+    def put(self, rows: list[dict]) -> None:
+        if self._error is not None:
+            raise RuntimeError("embedding writer failed") from self._error
+        self._queue.put(rows)
+
+    def _run(self) -> None:
+        while (rows := self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+            try:
+                with self._engine.begin() as conn:
+                    conn.execute(_INSERT_SQL, rows)
+                self.written += len(rows)
+            except BaseException as exc:  # noqa: BLE001 — surfaced in the caller's thread
+                self._error = exc
+
+    def __exit__(self, exc_type, *_exc) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None and exc_type is None:
+            raise RuntimeError("embedding writer failed") from self._error
 
 
 def embed_missing(engine=None, *, batch: int = EMBED_BATCH, dry_run: bool = False,
-                  scope: str = "precutoff") -> int:
+                  scope: str = "precutoff", workers: int = EMBED_WORKERS,
+                  backend: str = EMBED_BACKEND) -> int:
     """Embed headlines lacking a vector for the active model, scoped by date.
 
+    Headlines are encoded in length-sorted buckets (see :mod:`sentisense.embed.encoder`) and
+    written by a background thread, so a batch's INSERT overlaps the next batch's encode.
+    With ``SENTISENSE_EMBED_STORE`` on, the on-disk mirror is then synced (even when nothing
+    was new) — this is the only place it is written besides ``--rebuild-store``.
+
     Args:
         scope: 'precutoff' (≤ cutoff, the modeling corpus — default), 'postcutoff'
             (> cutoff — for the buy-overlay / forward use), or 'all'.
+        workers: encoder processes (1 = in-process).
+        backend: 'torch', 'onnx' or 'onnx-int8' (default ``SENTISENSE_EMBED_BACKEND``). Rows
+            are keyed by :func:`~sentisense.embed.encoder.embed_key` — int8 vectors under
+            ``<model>#onnx-int8``, never alongside full-precision ones.
 
     Returns:
         The number of new embeddings written (0 on dry-run).
     """
     if scope not in _DATE_CLAUSES:
         raise ValueError(f"scope must be one of {sorted(_DATE_CLAUSES)}, got {scope!r}")
+    key = embed_key(backend)
+    if key != EMBED_MODEL:
+        logger.warning("{} vectors are kept apart under embed_model={!r}; set "
+                       "SENTISENSE_EMBED_MODEL to it to use them downstream.", backend, key)
     engine = engine or get_engine()
     ensure_table(engine)
 
-    # Fail fast on a missing 'embed' extra BEFORE the long count query / dry-run.
-    model = None if dry_run else _load_embedder()
+    with ExitStack() as stack:
+        # Fail fast on a missing 'embed' extra BEFORE the long count query / dry-run.
+        pool = None if dry_run else stack.enter_context(
+            EncoderPool(workers=workers, backend=backend))
 
-    query = text(_UNEMBEDDED_SQL_TMPL.format(date_clause=_DATE_CLAUSES[scope]))
-    params = {"model": EMBED_MODEL}
-    if scope != "all":
-        params["cutoff"] = CUTOFF_DATE
-    with engine.connect() as conn:
-        todo = pd.read_sql(query, conn, params=params)
-    logger.info("{:,} headlines need embedding under {} (scope={}, cutoff {})",
-                len(todo), EMBED_MODEL, scope, CUTOFF_DATE.isoformat())
-    if dry_run or todo.empty:
-        return 0
-    written = 0
-    for start in range(0, len(todo), batch):
-        chunk = todo.iloc[start:start + batch]
-        texts = [f"passage: {h}" for h in chunk["headline"].tolist()]
-        vecs = model.encode(texts, normalize_embeddings=True,
-                            batch_size=batch, show_progress_bar=False).astype(np.float32)
-        rows = [
-            {"headline_id": int(hid), "embed_model": EMBED_MODEL,
-             "dim": int(vecs.shape[1]), "embedding": vecs[i].tobytes()}
-            for i, hid in enumerate(chunk["headline_id"].tolist())
-        ]
-        with engine.begin() as conn:
-            conn.execute(_INSERT_SQL, rows)
-        written += len(rows)
-        logger.info("  embedded {:,}/{:,}", min(start + batch, len(todo)), len(todo))
+        query = text(_UNEMBEDDED_SQL_TMPL.format(date_clause=_DATE_CLAUSES[scope]))
+        params = {"model": key}
+        if scope != "all":
+            params["cutoff"] = CUTOFF_DATE
+        with engine.connect() as conn:
+            todo = pd.read_sql(query, conn, params=params)
+        logger.info("{:,} headlines need embedding under {} (scope={}, cutoff {})",
+                    len(todo), key, scope, CUTOFF_DATE.isoformat())
+        if dry_run:
+            return 0
+        texts = [f"passage: {h}" for h in todo["headline"].tolist()]
+        ids = todo["headline_id"].to_numpy()
+        writer = stack.enter_context(_BackgroundWriter(engine))
+        done = 0
+        for idx, vecs in pool.encode(texts, batch):
+            writer.put([
+                {"headline_id": int(hid), "embed_model": key,
+                 "dim": int(vecs.shape[1]), "embedding": vecs[i].tobytes()}
+                for i, hid in enumerate(ids[idx].tolist())
+            ])
+            done += len(idx)
+            logger.info("  embedded {:,}/{:,}", done, len(todo))
+    written = writer.written
     logger.info("Done — wrote {:,} embeddings.", written)
+    if EMBED_STORE:
+        EmbeddingStore(model=key).sync(engine)
     return written
 
 
+class _DailyMoments:
+    """Per-date running sum / sum-of-squares / count in preallocated arrays.
+
+    Rows are indexed by a date ordinal (first-seen order); capacity doubles when a page
+    brings new dates, so the arrays are reallocated O(log n_dates) times, not per page.
+    """
+
+    def __init__(self, dim: int, capacity: int = 512) -> None:
+        self.dim = dim
+        self.ordinal: dict[np.datetime64, int] = {}
+        self.sums = np.zeros((capacity, dim))
+        self.sqsums = np.zeros((capacity, dim))
+        self.counts = np.zeros(capacity, dtype=np.int64)
+
+    def _ordinals(self, uniq: np.ndarray) -> np.ndarray:
+        for d in uniq:
+            self.ordinal.setdefault(d, len(self.ordinal))
+        if len(self.ordinal) > len(self.counts):
+            cap = max(len(self.ordinal), 2 * len(self.counts))
+            for name in ("sums", "sqsums", "counts"):
+                old = getattr(self, name)
+                grown = np.zeros((cap,) + old.shape[1:], dtype=old.dtype)
+                grown[:len(old)] = old
+                setattr(self, name, grown)
+        return np.fromiter((self.ordinal[d] for d in uniq), dtype=np.intp, count=len(uniq))
+
+    def add(self, vecs: np.ndarray, dates: np.ndarray) -> None:
+        """Fold one page in: sort rows by date once, then reduce each contiguous date segment.
+
+        Every row is touched once per page (a slice view per date, summed with a float64
+        accumulator, so no float64 copy of the page), instead of one boolean mask over the
+        whole page per date. Keyset pages are ``headline_id``-ordered, which is close to date
+        order, so the sort is usually just the monotonicity check.
+        """
+        uniq, inverse, seg_counts = np.unique(dates, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        if len(inverse) > 1 and np.any(inverse[1:] < inverse[:-1]):
+            vecs = vecs[np.argsort(inverse, kind="stable")]
+        bounds = np.concatenate(([0], np.cumsum(seg_counts)))
+        rows = self._ordinals(uniq)
+        for row, lo, hi in zip(rows, bounds[:-1], bounds[1:]):
+            seg = vecs[lo:hi]
+            self.sums[row] += seg.sum(axis=0, dtype=np.float64)
+            self.sqsums[row] += np.square(seg).sum(axis=0, dtype=np.float64)
+        self.counts[rows] += seg_counts
+
+    @property
+    def n_rows(self) -> int:
+        """Embeddings folded in so far."""
+        return int(self.counts.sum())
+
+    def rows(self):
+        """``(date, n, sum, sumsq)`` per date, in first-seen order (for persisting)."""
+        for d, i in self.ordinal.items():
+            yield d, int(self.counts[i]), self.sums[i], self.sqsums[i]
+
+    def merge(self, date, n: int, sums: np.ndarray, sqsums: np.ndarray) -> None:
+        """Add already-reduced moments for one date (e.g. a persisted row)."""
+        i = self._ordinals(np.array([date], dtype="datetime64[D]"))[0]
+        self.sums[i] += sums
+        self.sqsums[i] += sqsums
+        self.counts[i] += n
+
+    def frame(self) -> pd.DataFrame:
+        """Date-sorted ``embc_*`` means + ``emb_dispersion`` + ``emb_count``."""
+        order = sorted(self.ordinal)
+        rows = np.fromiter((self.ordinal[d] for d in order), dtype=np.intp, count=len(order))
+        n = self.counts[rows].astype(np.float64)[:, None]
+        mean = self.sums[rows] / n
+        var = np.clip(self.sqsums[rows] / n - mean ** 2, 0.0, None)
+        out = pd.DataFrame(mean, index=pd.DatetimeIndex(order),
+                           columns=[f"embc_{i:03d}" for i in range(self.dim)])
+        out["emb_dispersion"] = np.sqrt(var).mean(axis=1)
+        out["emb_count"] = self.counts[rows]
+        return out
+
+
+def _decode_vectors(blobs, dim: int) -> np.ndarray:
+    """float32 BYTEA column → ``(n, dim)`` matrix with a single copy."""
+    return np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(-1, dim)
+
+
+def _keyset_pages(engine, cutoff, *, after_id: int = -1, page: int = 100_000,
+                  model: str = EMBED_MODEL) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+    """Yield ``(last_headline_id, dates, vectors)`` per keyset page of embeddings ≤ ``cutoff``.
+
+    Pages follow ``headline_id > after_id`` in id order; ``dates`` is ``datetime64[D]`` and
+    ``vectors`` a float32 ``(rows, dim)`` matrix. Peak client RAM is one page.
+    """
+    last_id = after_id
+    while True:
+        with engine.connect() as conn:
+            chunk = pd.read_sql(_PAGE_SQL, conn, params={
+                "model": model, "cutoff": cutoff, "last_id": last_id, "page": page})
+        if chunk.empty:
+            return
+        last_id = int(chunk["headline_id"].iloc[-1])
+        yield (last_id, pd.to_datetime(chunk["date"]).to_numpy(dtype="datetime64[D]"),
+               _decode_vectors(chunk["embedding"], int(chunk["dim"].iloc[0])))
+        if len(chunk) < page:
+            return
+
+
+def _stream_moments(engine, cutoff, *, after_id: int = -1, page: int = 100_000,
+                    model: str = EMBED_MODEL) -> tuple[_DailyMoments | None, int]:
+    """Fold every embedding with ``headline_id > after_id`` (date ≤ ``cutoff``) into moments.
+
+    Returns ``(moments, last_headline_id)``; moments is ``None`` when no rows matched.
+    """
+    moments: _DailyMoments | None = None
+    last_id = after_id
+    for last_id, dates, vecs in _keyset_pages(engine, cutoff, after_id=after_id, page=page,
+                                              model=model):
+        if moments is None:
+            moments = _DailyMoments(vecs.shape[1])
+        moments.add(vecs, dates)
+    return moments, last_id
+
+
 def daily_embedding_centroid(engine=None, cutoff=CUTOFF_DATE, *, page: int = 100_000) -> pd.DataFrame:
     """Per-date e5 centroid (+ dispersion + count), keyset-paginated so RAM stays bounded.
 
@@ -166,66 +333,52 @@ def daily_embedding_centroid(engine=None, cutoff=CUTOFF_DATE, *, page: int = 100
     an index range scan with no global sort and peak client RAM is one page (~``page``×768×4
     bytes), regardless of corpus size or whether the driver honours server-side streaming. The
     sum/sum-of-squares/count accumulation is order-independent, so pages need no date ordering.
+    Within a page, rows are sorted by date once and each contiguous date segment is reduced into
+    arrays indexed by date ordinal (:class:`_DailyMoments`), rather than masking the whole page
+    once per date.
 
     Returns a date-indexed frame: ``embc_000..NNN`` (mean), ``emb_dispersion`` (mean per-dim
     std), ``emb_count``. Empty frame if no embeddings cached.
     """
     engine = engine or get_engine()
-    sums: dict = {}
-    sqsums: dict = {}
-    counts: dict = {}
-    dim = None
-    last_id = -1
-    while True:
-        with engine.connect() as conn:
-            chunk = pd.read_sql(_PAGE_SQL, conn, params={
-                "model": EMBED_MODEL, "cutoff": cutoff, "last_id": last_id, "page": page})
-        if chunk.empty:
-            break
-        if dim is None:
-            dim = int(chunk["dim"].iloc[0])
-        vecs = np.vstack([np.frombuffer(b, dtype=np.float32) for b in chunk["embedding"]]).reshape(-1, dim)
-        dates = pd.to_datetime(chunk["date"]).to_numpy()
-        for d in np.unique(dates):
-            v = vecs[dates == d].astype(np.float64)
-            key = pd.Timestamp(d)
-            if key not in sums:
-                sums[key] = np.zeros(dim); sqsums[key] = np.zeros(dim); counts[key] = 0
-            sums[key] += v.sum(0); sqsums[key] += (v ** 2).sum(0); counts[key] += len(v)
-        last_id = int(chunk["headline_id"].iloc[-1])
-        if len(chunk) < page:
-            break
-    if dim is None or not counts:
+    moments, _ = _stream_moments(engine, cutoff, page=page)
+    if moments is None or not moments.ordinal:
         return pd.DataFrame()
-    order = sorted(sums)
-    mean = np.vstack([sums[d] / counts[d] for d in order])
-    var = np.clip(np.vstack([sqsums[d] / counts[d] - (sums[d] / counts[d]) ** 2 for d in order]), 0.0, None)
-    idx = pd.DatetimeIndex(order)
-    out = pd.DataFrame(mean, index=idx, columns=[f"embc_{i:03d}" for i in range(dim)])
-    out["emb_dispersion"] = np.sqrt(var).mean(axis=1)
-    out["emb_count"] = [counts[d] for d in order]
-    logger.info("Daily centroid (keyset-paged, <= {}): {} days × {}-d", pd.Timestamp(cutoff).date(), len(out), dim)
+    out = moments.frame()
+    logger.info("Daily centroid (keyset-paged, <= {}): {} days × {}-d",
+                pd.Timestamp(cutoff).date(), len(out), moments.dim)
     return out
 
 
-def load_embeddings(engine=None, cutoff=CUTOFF_DATE) -> tuple[pd.DataFrame, np.ndarray]:
+def load_embeddings(engine=None, cutoff=CUTOFF_DATE, *,
+                    use_store: bool = EMBED_STORE) -> tuple[pd.DataFrame, np.ndarray]:
     """Load all cached embeddings ≤ ``cutoff`` for the active model.
 
     ``cutoff`` defaults to the project cutoff (the modeling corpus). Pass a later date
     (e.g. far-future) to include post-cutoff embeddings — used by the full-date
     visualizations, never by the leak-safe modeling path.
 
+    With ``use_store`` (default ``SENTISENSE_EMBED_STORE``) and a usable on-disk mirror, the
+    vectors come back as a read-only memmap slice found by binary search — no full matrix in
+    RAM. The mirror is only as fresh as the last ``embed_missing`` sync; it is never built
+    here, and without one this reads Postgres.
+
     Returns:
         ``(meta, vectors)`` where ``meta`` has columns [headline_id, date] aligned
-        row-for-row with ``vectors`` (float32 matrix, L2-normalised).
+        row-for-row with ``vectors`` (float32 — or the store's float16 — L2-normalised).
+        From the store, rows are sorted by date.
     """
     engine = engine or get_engine()
+    if use_store:
+        store = EmbeddingStore()
+        if store.exists():
+            return store.load(cutoff)
+        logger.info("Embedding store {} not built — reading Postgres.", store.path)
     with engine.connect() as conn:
         df = pd.read_sql(_LOAD_SQL, conn, params={"model": EMBED_MODEL, "cutoff": cutoff})
     if df.empty:
         return df[["headline_id", "date"]], np.empty((0, 0), dtype=np.float32)
-    dim = int(df["dim"].iloc[0])
-    vectors = np.vstack([np.frombuffer(b, dtype=np.float32) for b in df["embedding"]]).reshape(-1, dim)
+    vectors = _decode_vectors(df["embedding"], int(df["dim"].iloc[0]))
     df["date"] = pd.to_datetime(df["date"])
     return df[["headline_id", "date"]], vectors
 
@@ -236,10 +389,23 @@ def main() -> None:
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--scope", choices=["precutoff", "postcutoff", "all"], default="precutoff",
                         help="Which headlines to embed by date (default: precutoff = modeling corpus).")
+    parser.add_argument("--workers", type=int, default=EMBED_WORKERS,
+                        help="Encoder processes for CPU inference (default: SENTISENSE_EMBED_WORKERS).")
+    parser.add_argument("--backend", choices=BACKENDS, default=EMBED_BACKEND,
+                        help="torch | onnx | onnx-int8 (default: SENTISENSE_EMBED_BACKEND).")
+    parser.add_argument("--rebuild-store", action="store_true",
+                        help="Rebuild the on-disk embedding store from Postgres (e.g. after "
+                             "changing SENTISENSE_EMBED_STORE_DTYPE) and exit.")
     args = parser.parse_args()
     if args.batch < 1:
         parser.error("--batch must be >= 1")
-    embed_missing(batch=args.batch, dry_run=args.dry_run, scope=args.scope)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.rebuild_store:
+        EmbeddingStore().sync(get_engine(), rebuild=True)
+        return
+    embed_missing(batch=args.batch, dry_run=args.dry_run, scope=args.scope,
+                  workers=args.workers, backend=args.backend)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+"""CPU embedding engine for ``embed_missing``: backend choice, length buckets, worker pool.
+
+* **Backend** (``SENTISENSE_EMBED_BACKEND``): ``torch`` (the plain SentenceTransformer),
+  ``onnx`` (ONNX Runtime via sentence-transformers' ``backend="onnx"``), or ``onnx-int8``
+  (the ONNX graph with int8 dynamic quantisation — roughly 2-3× faster on AVX512-VNNI CPUs for a
+  small cosine drift). ONNX exports are written once under ``sentisense_cache/onnx/<model>``
+  and reused. Needs ``uv sync --extra embed --extra embed-onnx``. Because of that drift, int8
+  vectors are stored under their own key, ``<model>#onnx-int8`` (:func:`embed_key`), never
+  mixed into the full-precision corpus; point ``SENTISENSE_EMBED_MODEL`` at that key to
+  use them downstream.
+* **Length buckets**: texts are sorted by token length inside a window of many batches and cut
+  into batches of similar length, so a batch pads to its own longest headline instead of the
+  longest of a random id-ordered slice.
+* **Workers** (``--workers N``): batches are encoded on ``N`` spawned processes, each loading
+  its own encoder with ``cpu_count // N`` intra-op threads; ``N = 1`` encodes in-process.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+from loguru import logger
+
+from sentisense.config import EMBED_BACKEND, EMBED_MODEL, EMBED_ONNX_QUANT
+from sentisense.constants import REPO_ROOT
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+_QUANTISED = ("onnx-int8",)      # vectors differ from torch/onnx fp32 → own embed_model key
+_ONNX_ROOT = REPO_ROOT / "sentisense_cache" / "onnx"
+_BUCKET_WINDOW = 64          # batches per length-sorted window
+
+
+def _missing_extra(exc: ModuleNotFoundError, extras: str) -> RuntimeError:
+    return RuntimeError(
+        f"The embedding backend needs the {extras} extra(s) ({exc.name} is missing). "
+        "Install it before the embed stage:\n"
+        f"    uv sync --extra ml {' '.join('--extra ' + e for e in extras.split())} --extra finance\n"
+        "then re-run. (Embeddings need GPU/CPU torch — see docs/RUNBOOK.md.)"
+    )
+
+
+def embed_key(backend: str = EMBED_BACKEND, model: str = EMBED_MODEL) -> str:
+    """``headline_embeddings.embed_model`` key for vectors ``backend`` produces from ``model``.
+
+    ``torch`` and ``onnx`` (same fp32 weights) share the plain model name; a quantised backend
+    gets ``<model>#<backend>``. ``model`` may already carry a tag; one that names a different
+    backend raises, so precisions never mix under one key.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"embed backend must be one of {BACKENDS}, got {backend!r}")
+    base, _, tag = model.partition("#")
+    want = backend if backend in _QUANTISED else ""
+    if tag != want and tag:
+        raise ValueError(f"embed model {model!r} holds {tag} vectors; backend {backend!r} "
+                         f"would write {want or 'full-precision'} ones under it")
+    return f"{base}#{want}" if want else base
+
+
+def load_encoder(backend: str = EMBED_BACKEND, model_name: str = EMBED_MODEL):
+    """Construct the sentence-transformer for ``backend``, or fail fast with an install hint."""
+    if backend not in BACKENDS:
+        raise ValueError(f"embed backend must be one of {BACKENDS}, got {backend!r}")
+    model_name = model_name.partition("#")[0]       # an embed_key tag is not part of the HF id
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ModuleNotFoundError as exc:
+        raise _missing_extra(exc, "embed") from exc
+    if backend == "torch":
+        return SentenceTransformer(model_name)
+
+    export_dir = _ONNX_ROOT / model_name.replace("/", "_")
+    try:
+        if not (export_dir / "onnx" / "model.onnx").exists():
+            logger.info("Exporting {} to ONNX → {}", model_name, export_dir)
+            SentenceTransformer(model_name, backend="onnx").save_pretrained(str(export_dir))
+        if backend == "onnx":
+            return SentenceTransformer(str(export_dir), backend="onnx")
+        quant_file = f"onnx/model_qint8_{EMBED_ONNX_QUANT}.onnx"
+        if not (export_dir / quant_file).exists():
+            from sentence_transformers import export_dynamic_quantized_onnx_model
+
+            logger.info("Quantising ONNX export to int8 ({})", EMBED_ONNX_QUANT)
+            export_dynamic_quantized_onnx_model(
+                SentenceTransformer(str(export_dir), backend="onnx"),
+                EMBED_ONNX_QUANT, str(export_dir))
+        return SentenceTransformer(str(export_dir), backend="onnx",
+                                   model_kwargs={"file_name": quant_file})
+    except ModuleNotFoundError as exc:
+        raise _missing_extra(exc, "embed embed-onnx") from exc
+
+
+def token_lengths(encoder, texts: Sequence[str]) -> np.ndarray:
+    """Token count per text from the encoder's (fast) tokenizer; character count as fallback."""
+    tokenizer = getattr(encoder, "tokenizer", None)
+    if tokenizer is None:
+        return np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    ids = tokenizer(list(texts), add_special_tokens=True, truncation=True)["input_ids"]
+    return np.fromiter((len(x) for x in ids), dtype=np.int64, count=len(ids))
+
+
+def length_buckets(lengths: np.ndarray, batch: int) -> list[np.ndarray]:
+    """Index batches of ``batch`` texts with similar lengths (longest first).
+
+    Longest-first surfaces an out-of-memory batch immediately rather than at the end.
+    """
+    order = np.argsort(-np.asarray(lengths), kind="stable")
+    return [order[i:i + batch] for i in range(0, len(order), batch)]
+
+
+# ── worker processes ─────────────────────────────────────────────────────────────────
+
+_worker_encoder = None
+
+
+def _init_worker(backend: str, threads: int) -> None:
+    global _worker_encoder
+    # Before torch / onnxruntime are imported in this (spawned) process.
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    _worker_encoder = load_encoder(backend)
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except ModuleNotFoundError:
+        pass
+
+
+def _encode_batch(encoder, texts: list[str]) -> np.ndarray:
+    return encoder.encode(texts, normalize_embeddings=True, batch_size=len(texts),
+                          show_progress_bar=False).astype(np.float32)
+
+
+def _worker_encode(texts: list[str]) -> np.ndarray:
+    return _encode_batch(_worker_encoder, texts)
+
+
+class EncoderPool:
+    """Encode length-bucketed batches in-process (``workers=1``) or on spawned processes.
+
+    Use as a context manager; :meth:`encode` yields ``(index_batch, vectors)`` in bucket order
+    so the caller can hand each batch to the DB writer while the next one encodes.
+    """
+
+    def __init__(self, *, workers: int = 1, backend: str = EMBED_BACKEND) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.backend = backend
+        self._encoder = None
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> EncoderPool:
+        # Loaded in the parent even with workers > 1: fails fast on a missing extra, warms the
+        # ONNX export once, and provides the tokenizer used for length bucketing.
+        self._encoder = load_encoder(self.backend)
+        if self.workers > 1:
+            threads = max(1, (os.cpu_count() or 1) // self.workers)
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=get_context("spawn"),
+                                             initializer=_init_worker,
+                                             initargs=(self.backend, threads))
+            logger.info("Embedding on {} worker processes × {} threads ({})",
+                        self.workers, threads, self.backend)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def encode(self, texts: Sequence[str], batch: int) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Yield ``(indices into texts, float32 vectors)`` per length bucket."""
+        window = batch * _BUCKET_WINDOW
+        for start in range(0, len(texts), window):
+            part = list(texts[start:start + window])
+            buckets = length_buckets(token_lengths(self._encoder, part), batch)
+            groups = [[part[i] for i in idx] for idx in buckets]
+            if self._pool is None:
+                results = (_encode_batch(self._encoder, g) for g in groups)
+            else:
+                results = self._pool.map(_worker_encode, groups)
+            for idx, vecs in zip(buckets, results):
+                yield idx + start, vecs
@@ -0,0 +1,165 @@
+"""Precomputed per-headline coordinates under a stored projection basis (``headline_pca``).
+
+The UI day view used to pull every headline's raw 768-d embedding (3 KB each, ~6 MB per day)
+and project it through ``embedding_pca_basis`` on the UI host. This module does that
+projection once, server-side, and stores the ``n_pca`` float32 coordinates (64 bytes at
+n_pca=16) per headline, keyed by the basis ``(embed_model, kind, version)``:
+
+* a new basis version is projected in full (rows of superseded versions are pruned first);
+* later runs only add headlines that have no row for the current version yet (anti-join),
+  so the daily ``build_embedding_derived`` call costs one page per day of new headlines.
+
+The projection is the same affine map the UI applies — ``((x - scaler_mean) / scaler_scale
+- pca_mean) @ components.T`` — so stored and on-the-fly coordinates agree.
+
+Run (server-side):
+    uv run python -m sentisense.embed.projection                 # every stored basis kind
+    uv run python -m sentisense.embed.projection --kind headline
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sqlalchemy import text
+
+from sentisense.config import EMBED_MODEL
+from sentisense.constants import REPO_ROOT
+from sentisense.db import get_engine
+from sentisense.embed.derived import BASIS_KINDS, _split_sql, ensure_basis_table
+from sentisense.embed.embeddings import _decode_vectors
+
+_MIGRATION = REPO_ROOT / "sentisense" / "db" / "migrations" / "015_headline_pca.sql"
+
+_BASIS_SQL = text(
+    """
+    SELECT * FROM embedding_pca_basis
+    WHERE embed_model = :model AND kind = :kind
+    ORDER BY version DESC LIMIT 1
+    """
+)
+_MISSING_SQL = text(
+    """
+    SELECT he.headline_id, he.dim, he.embedding
+    FROM headline_embeddings he
+    WHERE he.embed_model = :model
+      AND he.headline_id > :last_id
+      AND NOT EXISTS (
+          SELECT 1 FROM headline_pca hp
+          WHERE hp.embed_model = he.embed_model AND hp.kind = :kind
+            AND hp.version = :version AND hp.headline_id = he.headline_id)
+    ORDER BY he.headline_id
+    LIMIT :page
+    """
+)
+_INSERT_SQL = text(
+    """
+    INSERT INTO headline_pca (headline_id, embed_model, kind, version, coords)
+    VALUES (:headline_id, :model, :kind, :version, :coords)
+    ON CONFLICT DO NOTHING
+    """
+)
+_PRUNE_SQL = text(
+    "DELETE FROM headline_pca WHERE embed_model = :model AND kind = :kind AND version <> :version"
+)
+
+
+def ensure_headline_pca_table(engine=None) -> None:
+    """Create ``headline_pca`` (and the basis table it references) if absent. Idempotent."""
+    engine = engine or get_engine()
+    ensure_basis_table(engine)
+    with engine.begin() as conn:
+        for stmt in _split_sql(_MIGRATION.read_text(encoding="utf-8")):
+            conn.execute(text(stmt))
+
+
+def load_basis(engine=None, *, kind: str = "centroid", model: str = EMBED_MODEL) -> dict | None:
+    """Newest stored basis of ``kind`` with its arrays decoded; None when none is stored.
+
+    Returns:
+        ``{version, n_features, n_pca, scaler_mean, scaler_scale, pca_mean, pca_components}``
+        — float32 arrays, ``scaler_scale`` with zeros replaced by 1 (constant dimensions).
+    """
+    engine = engine or get_engine()
+    with engine.connect() as conn:
+        row = conn.execute(_BASIS_SQL, {"model": model, "kind": kind}).mappings().first()
+    if row is None:
+        return None
+    nf, n_pca = int(row["n_features"]), int(row["n_pca"])
+    scale = np.frombuffer(row["scaler_scale"], dtype=np.float32).copy()
+    scale[scale == 0] = 1.0
+    return {
+        "version": int(row["version"]), "n_features": nf, "n_pca": n_pca,
+        "scaler_mean": np.frombuffer(row["scaler_mean"], dtype=np.float32),
+        "scaler_scale": scale,
+        "pca_mean": np.frombuffer(row["pca_mean"], dtype=np.float32),
+        "pca_components": np.frombuffer(row["pca_components"],
+                                        dtype=np.float32).reshape(n_pca, nf),
+    }
+
+
+def project(basis: dict, vecs: np.ndarray) -> np.ndarray:
+    """``(n, n_features)`` embeddings → ``(n, n_pca)`` float32 coordinates under ``basis``."""
+    scaled = (vecs - basis["scaler_mean"]) / basis["scaler_scale"] - basis["pca_mean"]
+    return (scaled @ basis["pca_components"].T).astype(np.float32)
+
+
+def fill_headline_pca(engine=None, *, kind: str = "centroid", model: str = EMBED_MODEL,
+                      page: int = 20_000) -> int:
+    """Project every embedded headline that has no ``headline_pca`` row for the current basis.
+
+    Args:
+        kind: which basis (``embedding_pca_basis.kind``) to project through.
+        page: headlines per read/insert round-trip.
+
+    Returns:
+        Rows written (0 when no basis of ``kind`` is stored or nothing is missing).
+    """
+    engine = engine or get_engine()
+    ensure_headline_pca_table(engine)
+    basis = load_basis(engine, kind=kind, model=model)
+    if basis is None:
+        logger.info("No {} basis stored for {} — nothing to project.", kind, model)
+        return 0
+    keys = {"model": model, "kind": kind, "version": basis["version"]}
+    with engine.begin() as conn:
+        pruned = conn.execute(_PRUNE_SQL, keys).rowcount
+    if pruned:
+        logger.info("Pruned {:,} headline_pca rows of superseded {} bases", pruned, kind)
+
+    last_id, n = -1, 0
+    while True:
+        with engine.connect() as conn:
+            chunk = pd.read_sql(_MISSING_SQL, conn, params={**keys, "last_id": last_id,
+                                                           "page": page})
+        if chunk.empty:
+            break
+        coords = project(basis, _decode_vectors(chunk["embedding"], int(chunk["dim"].iloc[0])))
+        rows = [{**keys, "headline_id": int(h), "coords": c.tobytes()}
+                for h, c in zip(chunk["headline_id"], coords)]
+        with engine.begin() as conn:
+            conn.execute(_INSERT_SQL, rows)
+        n += len(rows)
+        last_id = int(chunk["headline_id"].iloc[-1])
+        if len(chunk) < page:
+            break
+    logger.info("Projected {:,} headlines through the {} basis v{} (model={})",
+                n, kind, basis["version"], model)
+    return n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fill headline_pca for the stored bases.")
+    parser.add_argument("--kind", choices=BASIS_KINDS, default=None,
+                        help="Only this basis kind (default: every kind that has a basis).")
+    parser.add_argument("--page", type=int, default=20_000)
+    args = parser.parse_args()
+    for kind in ([args.kind] if args.kind else BASIS_KINDS):
+        fill_headline_pca(kind=kind, page=args.page)
+
+
+if __name__ == "__main__":
+    main()
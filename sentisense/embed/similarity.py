@@ -0,0 +1,103 @@
+"""Batched "stories like this one" k-NN over the pgvector ``headline_vectors`` table.
+
+``scripts/deploy_vectordb.py`` loads one row per embedded headline into ``headline_vectors``
+(``vector(dim)`` + an HNSW cosine index). This module queries it for MANY headline ids in a
+single round-trip: each query vector drives a ``CROSS JOIN LATERAL`` subquery whose
+``ORDER BY embedding <=> q.embedding LIMIT k`` is an HNSW index scan, optionally restricted
+to a date range and a set of sources.
+
+``ef_search`` sets ``hnsw.ef_search`` for the one transaction (``SET LOCAL``): the candidate
+list size of the HNSW search — higher = better recall, slower. pgvector returns at most
+``ef_search`` rows per probe *before* the date/source filters apply, so a narrow filter
+can yield fewer than ``k`` neighbours unless ``ef_search`` is raised.
+
+Embeddings are L2-normalised, so ``distance`` is cosine distance (``1 - cosine``).
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Iterable
+
+from sqlalchemy import text
+
+from sentisense.config import EMBED_MODEL
+from sentisense.db import get_engine
+
+MAX_K = 100
+_EF_RANGE = (1, 1000)           # pgvector's accepted hnsw.ef_search range
+
+_KNN_SQL = """
+    SELECT q.headline_id AS query_id, n.headline_id, n.date, n.source, n.headline, n.distance
+    FROM headline_vectors q
+    CROSS JOIN LATERAL (
+        SELECT hv.headline_id, hv.date, hv.source, hv.headline,
+               hv.embedding <=> q.embedding AS distance
+        FROM headline_vectors hv
+        WHERE hv.embed_model = q.embed_model AND hv.headline_id <> q.headline_id{filters}
+        ORDER BY hv.embedding <=> q.embedding
+        LIMIT :k
+    ) n
+    WHERE q.embed_model = :model AND q.headline_id = ANY(:ids)
+    ORDER BY q.headline_id, n.distance
+"""
+
+
+def _knn_query(*, start, end, sources) -> text:
+    filters = []
+    if start is not None:
+        filters.append("hv.date >= :start")
+    if end is not None:
+        filters.append("hv.date <= :end")
+    if sources:
+        filters.append("hv.source = ANY(:sources)")
+    return text(_KNN_SQL.format(filters="".join(f"\n          AND {f}" for f in filters)))
+
+
+def similar_many(engine=None, headline_ids: Iterable[int] = (), *, k: int = 10,
+                 start: dt.date | None = None, end: dt.date | None = None,
+                 sources: Iterable[str] | None = None, ef_search: int | None = None,
+                 model: str = EMBED_MODEL) -> dict[int, list[dict]]:
+    """Top-``k`` nearest headlines for each of ``headline_ids``, in one query.
+
+    Args:
+        start / end: inclusive date bounds on the neighbours (None = unbounded).
+        sources: only neighbours from these sources (None / empty = any).
+        ef_search: ``hnsw.ef_search`` for this call (None = the server default, 40).
+        model: embedding model whose vectors to search.
+
+    Returns:
+        ``{headline_id: [{"headline_id", "date", "source", "headline", "distance"}, ...]}``
+        ordered by distance. Every requested id is a key; ids without a vector map to ``[]``.
+
+    Raises:
+        ValueError: ``k`` or ``ef_search`` out of range.
+    """
+    ids = list(dict.fromkeys(int(i) for i in headline_ids))
+    if not 1 <= k <= MAX_K:
+        raise ValueError(f"k must be in [1, {MAX_K}], got {k}")
+    if ef_search is not None and not _EF_RANGE[0] <= ef_search <= _EF_RANGE[1]:
+        raise ValueError(f"ef_search must be in {list(_EF_RANGE)}, got {ef_search}")
+    out: dict[int, list[dict]] = {i: [] for i in ids}
+    if not ids:
+        return out
+
+    sources = list(sources) if sources else None
+    params = {"ids": ids, "k": k, "model": model, "start": start, "end": end, "sources": sources}
+    engine = engine or get_engine()
+    with engine.begin() as conn:
+        if ef_search is not None:
+            # SET cannot take a bind parameter; ef_search is a range-checked int.
+            conn.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+        rows = conn.execute(_knn_query(start=start, end=end, sources=sources), params).fetchall()
+    for r in rows:
+        out[int(r.query_id)].append({
+            "headline_id": int(r.headline_id), "date": r.date, "source": r.source,
+            "headline": r.headline, "distance": float(r.distance),
+        })
+    return out
+
+
+def similar(engine=None, headline_id: int = 0, **kwargs) -> list[dict]:
+    """Top-k nearest headlines to one ``headline_id`` (see :func:`similar_many`)."""
+    return similar_many(engine, [headline_id], **kwargs)[int(headline_id)]
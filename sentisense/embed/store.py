@@ -0,0 +1,341 @@
+"""On-disk, date-sorted, memory-mapped copy of ``headline_embeddings`` for one embed model.
+
+Postgres BYTEA stays the source of truth; this store is a read-optimised mirror so loaders
+never pull ~3M blobs through ``pd.read_sql`` and ``np.vstack`` a multi-GB matrix. Layout under
+``<root>/<model>/`` (parallel arrays, row ``i`` of each is the same headline):
+
+* ``vectors.npy``     — ``(n, dim)`` float32 (or float16 with ``SENTISENSE_EMBED_STORE_DTYPE``)
+* ``headline_id.npy`` — ``(n,)`` int64
+* ``day.npy``         — ``(n,)`` int32 day ordinal (days since 1970-01-01), ascending
+* ``meta.json``       — dim, dtype, ``last_headline_id`` watermark, row count
+
+Readers ``np.load(mmap_mode="r")`` the arrays (zero-copy, the OS pages in what is touched)
+and slice a date range by binary search on ``day``. ``sync`` mirrors new embeddings:
+embeddings above the watermark are appended in place. The ``.npy`` header is rewritten in place
+(numpy pads it for a growing first axis). When the new rows are dated before the tail, they are
+merge-inserted in bounded chunks. A count mismatch at or below the watermark (back-fill /
+delete) triggers a full two-pass rebuild, as in :mod:`sentisense.embed.centroid`.
+
+Writers (``sync``, ``append``, ``clear``) hold an exclusive ``flock`` on ``<model>/.lock``
+and ``load`` a shared one, so overlapping processes never append the same pages twice or read
+arrays another process is swapping out.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sqlalchemy import text
+
+from sentisense.config import EMBED_MODEL, EMBED_STORE_DIR, EMBED_STORE_DTYPE
+from sentisense.constants import REPO_ROOT
+
+_DEFAULT_ROOT = REPO_ROOT / "sentisense_cache" / "embeddings"
+_EPOCH = np.datetime64("1970-01-01", "D")
+_COPY_ROWS = 65_536          # rows per chunk when permuting/merging on disk
+_DTYPES = ("float32", "float16")
+
+_COUNT_SQL = text(
+    "SELECT count(*) FROM headline_embeddings "
+    "WHERE embed_model = :model AND headline_id <= :last_id"
+)
+_PAGE_SQL = text(
+    """
+    SELECT he.headline_id, rh.date::date AS date, he.dim, he.embedding
+    FROM headline_embeddings he
+    JOIN raw_headlines rh ON rh.id = he.headline_id
+    WHERE he.embed_model = :model
+      AND he.headline_id > :last_id
+    ORDER BY he.headline_id
+    LIMIT :page
+    """
+)
+
+
+def _to_days(dates) -> np.ndarray:
+    return (np.asarray(pd.to_datetime(dates).to_numpy(dtype="datetime64[D]")) - _EPOCH).astype(np.int32)
+
+
+def _to_day(value) -> int:
+    return int((np.datetime64(pd.Timestamp(value).date(), "D") - _EPOCH).astype(np.int64))
+
+
+class EmbeddingStore:
+    """Memory-mapped embedding mirror for one ``embed_model`` (see module docstring).
+
+    Args:
+        root: parent directory (default ``SENTISENSE_EMBED_STORE_DIR`` or
+            ``sentisense_cache/embeddings``); the model gets its own subdirectory.
+        model: embedding model name.
+        dtype: ``"float32"`` or ``"float16"`` (halves disk + page cache; only used when the
+            store is (re)built — an existing store keeps its dtype).
+    """
+
+    def __init__(self, root: Path | str | None = None, *, model: str = EMBED_MODEL,
+                 dtype: str = EMBED_STORE_DTYPE) -> None:
+        if dtype not in _DTYPES:
+            raise ValueError(f"dtype must be one of {_DTYPES}, got {dtype!r}")
+        root = Path(root or EMBED_STORE_DIR or _DEFAULT_ROOT)
+        self.model = model
+        self.dtype = dtype
+        self.path = root / model.replace("/", "_")
+
+    @contextmanager
+    def _locked(self, mode: int) -> Iterator[None]:
+        """Hold ``flock(mode)`` on the store's lock file (``LOCK_SH`` readers, ``LOCK_EX`` writers)."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / ".lock", "a") as fh:
+            fcntl.flock(fh, mode)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    # ── reading ──────────────────────────────────────────────────────────────────────
+
+    @property
+    def meta(self) -> dict | None:
+        f = self.path / "meta.json"
+        return json.loads(f.read_text(encoding="utf-8")) if f.exists() else None
+
+    def exists(self) -> bool:
+        """True when the arrays and ``meta.json`` agree (a crash mid-append leaves them apart).
+
+        Each file must also end exactly at its last row: a crash between an append's data
+        write and its header rewrite leaves orphaned bytes past the header's shape.
+        """
+        meta = self.meta
+        if meta is None:
+            return False
+        try:
+            return all(len(a) == meta["n_rows"] and
+                       (self.path / f"{name}.npy").stat().st_size == a.offset + a.nbytes
+                       for name, a in zip(("headline_id", "day", "vectors"), self.arrays()))
+        except (OSError, ValueError):
+            return False
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``(headline_id, day, vectors)`` as read-only memmaps (zero-copy)."""
+        return tuple(np.load(self.path / f"{name}.npy", mmap_mode="r")
+                     for name in ("headline_id", "day", "vectors"))
+
+    def rows_between(self, start=None, end=None) -> slice:
+        """Row slice for dates in ``[start, end]`` (either bound optional), by binary search."""
+        _, day, _ = self.arrays()
+        lo = 0 if start is None else int(np.searchsorted(day, _to_day(start), side="left"))
+        hi = len(day) if end is None else int(np.searchsorted(day, _to_day(end), side="right"))
+        return slice(lo, hi)
+
+    def load(self, cutoff=None, start=None) -> tuple[pd.DataFrame, np.ndarray]:
+        """``(meta, vectors)`` for dates in ``[start, cutoff]`` — the ``load_embeddings`` contract.
+
+        ``vectors`` is a memmap view (no copy); ``meta`` has [headline_id, date] aligned
+        row-for-row and sorted by date. Waits for a running ``sync`` to finish; the memmaps
+        stay valid after it (a rewrite swaps in new files, an append only grows them).
+        """
+        with self._locked(fcntl.LOCK_SH):
+            ids, day, vectors = self.arrays()
+            rows = self.rows_between(start, cutoff)
+        meta = pd.DataFrame({
+            "headline_id": np.asarray(ids[rows]),
+            "date": pd.to_datetime((np.asarray(day[rows]) + _EPOCH).astype("datetime64[ns]")),
+        })
+        return meta, vectors[rows]
+
+    # ── writing ──────────────────────────────────────────────────────────────────────
+
+    def _write_meta(self, *, dim: int, dtype: str, n: int, last_id: int) -> None:
+        tmp = self.path / "meta.json.tmp"
+        tmp.write_text(json.dumps({"model": self.model, "dim": dim, "dtype": dtype, "n_rows": n,
+                                   "last_headline_id": last_id}, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path / "meta.json")
+
+    @staticmethod
+    def _grow(path: Path, extra: np.ndarray) -> None:
+        """Append rows to a C-order ``.npy`` in place: data at the end, header shape rewritten."""
+        with open(path, "r+b") as f:
+            version = np.lib.format.read_magic(f)
+            read_header = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                           else np.lib.format.read_array_header_2_0)
+            write_header = (np.lib.format.write_array_header_1_0 if version == (1, 0)
+                            else np.lib.format.write_array_header_2_0)
+            shape, fortran, dtype = read_header(f)
+            offset = f.tell()
+            if fortran or dtype != extra.dtype or shape[1:] != extra.shape[1:]:
+                raise ValueError(f"cannot append {extra.dtype}{extra.shape} to {path.name}")
+            # Write right after the last row the header accounts for, dropping any bytes a
+            # torn earlier append left behind (data written, header never rewritten).
+            f.seek(offset + int(np.prod(shape, dtype=np.int64)) * dtype.itemsize)
+            f.truncate()
+            f.write(np.ascontiguousarray(extra).tobytes())
+            f.seek(0)
+            header = {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False,
+                      "shape": (shape[0] + len(extra),) + shape[1:]}
+            write_header(f, header)
+            if f.tell() != offset:          # numpy reserves room for this; guard anyway
+                raise RuntimeError(f"{path.name}: header size changed while appending")
+
+    def append(self, ids: np.ndarray, days: np.ndarray, vecs: np.ndarray, *, last_id: int) -> None:
+        """Add rows (any order) and advance the watermark to ``last_id``.
+
+        Rows dated on/after the current tail are appended in place; otherwise the arrays are
+        rewritten with the new rows merge-inserted (old rows streamed in chunks).
+        """
+        with self._locked(fcntl.LOCK_EX):
+            self._append(ids, days, vecs, last_id=last_id)
+
+    def _append(self, ids: np.ndarray, days: np.ndarray, vecs: np.ndarray, *, last_id: int) -> None:
+        meta = self.meta
+        order = np.argsort(days, kind="stable")
+        ids, days = ids[order].astype(np.int64), days[order].astype(np.int32)
+        vecs = vecs[order].astype(meta["dtype"] if meta else self.dtype, copy=False)
+        if meta is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            for name, arr in (("headline_id", ids), ("day", days), ("vectors", vecs)):
+                np.save(self.path / f"{name}.npy", arr)
+            self._write_meta(dim=int(vecs.shape[1]), dtype=str(vecs.dtype), n=len(ids),
+                             last_id=last_id)
+            return
+        new = {"headline_id": ids, "day": days, "vectors": vecs}
+        old = dict(zip(("headline_id", "day", "vectors"), self.arrays()))
+        old_day = old["day"]
+        if len(ids) and (len(old_day) == 0 or days[0] >= old_day[-1]):
+            for name, arr in new.items():
+                self._grow(self.path / f"{name}.npy", arr)
+        elif len(ids):
+            # Final position of each new row = its rank among the old rows + its own rank.
+            new_pos = np.searchsorted(old_day, days, side="right") + np.arange(len(days))
+            is_new = np.zeros(len(old_day) + len(days), dtype=bool)
+            is_new[new_pos] = True
+            old_pos = np.flatnonzero(~is_new)
+
+            def fill(out: np.ndarray, name: str, src: np.ndarray) -> None:
+                for lo in range(0, len(old_pos), _COPY_ROWS):
+                    out[old_pos[lo:lo + _COPY_ROWS]] = src[lo:lo + _COPY_ROWS]
+                out[new_pos] = new[name]
+
+            self._rewrite(len(is_new), fill=fill, sources=old)
+        self._write_meta(dim=int(meta["dim"]), dtype=meta["dtype"],
+                         n=int(meta["n_rows"]) + len(ids), last_id=last_id)
+
+    def _rewrite(self, n: int, *, fill, sources: dict[str, np.ndarray]) -> None:
+        """Write each array to ``<name>.npy.tmp`` via ``fill(out, name, src)``, then swap in."""
+        for name, src in sources.items():
+            tmp = self.path / f"{name}.npy.tmp"
+            out = np.lib.format.open_memmap(tmp, mode="w+", dtype=src.dtype,
+                                            shape=(n,) + src.shape[1:])
+            fill(out, name, src)
+            out.flush()
+            del out
+        for name in sources:
+            os.replace(self.path / f"{name}.npy.tmp", self.path / f"{name}.npy")
+
+    def clear(self) -> None:
+        with self._locked(fcntl.LOCK_EX):
+            self._clear()
+
+    def _clear(self) -> None:
+        for name in ("meta.json", "headline_id.npy", "day.npy", "vectors.npy"):
+            (self.path / name).unlink(missing_ok=True)
+
+    # ── mirroring Postgres ───────────────────────────────────────────────────────────
+
+    def sync(self, engine, *, rebuild: bool = False, page: int = 100_000) -> int:
+        """Mirror embeddings above the watermark (or everything) from Postgres.
+
+        Holds the store's exclusive lock throughout, so a concurrent sync waits and then
+        starts from the watermark this one leaves.
+
+        Returns:
+            The number of rows added by this call.
+        """
+        with self._locked(fcntl.LOCK_EX):
+            return self._sync(engine, rebuild=rebuild, page=page)
+
+    def _sync(self, engine, *, rebuild: bool, page: int) -> int:
+        meta = self.meta if not rebuild and self.exists() else None
+        if meta is not None:
+            with engine.connect() as conn:
+                covered = conn.execute(_COUNT_SQL, {"model": self.model,
+                                                    "last_id": meta["last_headline_id"]}).scalar()
+            if covered != meta["n_rows"]:
+                logger.warning("Embedding store holds {:,} rows but {:,} embeddings exist at or "
+                               "below headline_id {} (back-fill or delete) — rebuilding.",
+                               meta["n_rows"], covered, meta["last_headline_id"])
+                meta = None
+        if meta is None:
+            return self._build(engine, page=page)
+
+        pages = list(_pages(engine, self.model, meta["last_headline_id"], page))
+        if not pages:
+            return 0
+        ids, days, vecs, last_ids = zip(*pages)
+        added = sum(map(len, ids))
+        self._append(np.concatenate(ids), np.concatenate(days), np.concatenate(vecs),
+                    last_id=last_ids[-1])
+        logger.info("Embedding store {}: +{:,} rows (watermark {} → {})", self.path.name, added,
+                    meta["last_headline_id"], last_ids[-1])
+        return added
+
+    def _build(self, engine, *, page: int) -> int:
+        """Two passes, bounded RAM: stream pages in id order to a scratch file, then permute
+        into date order chunk by chunk."""
+        self._clear()
+        self.path.mkdir(parents=True, exist_ok=True)
+        scratch = self.path / "scratch.f"
+        ids, days, n, dim, last_id = [], [], 0, None, -1
+        with open(scratch, "wb") as f:
+            for chunk_ids, chunk_days, chunk_vecs, last_id in _pages(engine, self.model, -1, page):
+                dim = chunk_vecs.shape[1]
+                f.write(chunk_vecs.astype(self.dtype).tobytes())
+                ids.append(chunk_ids)
+                days.append(chunk_days)
+                n += len(chunk_ids)
+        if not n:
+            scratch.unlink()
+            logger.warning("Embedding store: no embeddings for {} — nothing to build.", self.model)
+            return 0
+        ids, days = np.concatenate(ids), np.concatenate(days)
+        order = np.argsort(days, kind="stable")
+        raw = np.memmap(scratch, dtype=self.dtype, mode="r", shape=(n, dim))
+        self._rewrite(n, fill=lambda out, name, src: _gather(out, src, order),
+                      sources={"headline_id": ids, "day": days, "vectors": raw})
+        del raw
+        scratch.unlink()
+        self._write_meta(dim=int(dim), dtype=self.dtype, n=n, last_id=last_id)
+        logger.info("Embedding store {} built: {:,} rows × {}-d {} ({:.1f} MB)", self.path.name, n,
+                    dim, self.dtype, n * dim * np.dtype(self.dtype).itemsize / 1e6)
+        return n
+
+
+def _gather(out: np.ndarray, src: np.ndarray, order: np.ndarray) -> None:
+    """``out[i] = src[order[i]]`` in chunks, reading each chunk's source rows in file order."""
+    for lo in range(0, len(order), _COPY_ROWS):
+        idx = order[lo:lo + _COPY_ROWS]
+        by_src = np.argsort(idx)
+        out[lo:lo + len(idx)][by_src] = src[idx[by_src]]
+
+
+def _pages(engine, model: str, after_id: int, page: int):
+    """Yield ``(ids, days, vectors, last_id)`` keyset pages of embeddings above ``after_id``."""
+    last_id = after_id
+    while True:
+        with engine.connect() as conn:
+            chunk = pd.read_sql(_PAGE_SQL, conn, params={"model": model, "last_id": last_id,
+                                                         "page": page})
+        if chunk.empty:
+            return
+        dim = int(chunk["dim"].iloc[0])
+        vecs = np.frombuffer(b"".join(chunk["embedding"]), dtype=np.float32).reshape(-1, dim)
+        last_id = int(chunk["headline_id"].iloc[-1])
+        yield chunk["headline_id"].to_numpy(np.int64), _to_days(chunk["date"]), vecs, last_id
+        if len(chunk) < page:
+            return
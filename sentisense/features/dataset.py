@@ -13,18 +13,23 @@ deliberate hardening changes documented inline:
 Returns two frames, both indexed by trading day with a `Target` column:
   * ``mt`` — daily-MEAN strategy (~tree-model shape)
   * ``ml`` — per-source SUM pivot (~LSTM shape)
+
+The public builders first consult the on-disk feature-frame cache
+(:mod:`sentisense.features.frame_cache`). A frame is rebuilt only when its arguments, the
+input tables' watermarks or the feature code changed. ``SENTISENSE_FRAME_CACHE=0`` disables it.
 """
 
 from __future__ import annotations
 
-import os
+import functools
+from types import SimpleNamespace
 
 import numpy as np
 import pandas as pd
 from loguru import logger
 from sqlalchemy import text
 
-from sentisense.config import TOP_N_SOURCES
+from sentisense.config import FEATURE_ENGINE, FINANCE_OFFLINE, TOP_N_SOURCES
 from sentisense.constants import (
     CUTOFF_DATE,
     CUTOFF_DATE_ISO,
@@ -37,36 +42,14 @@ from sentisense.db import get_engine
 
 _SCORE_COLS = list(SCORE_COLUMNS)
 
-# Combine ALL validated scores regardless of model_name, one row per headline (the
-# latest by created_at). The corpus mixes models on disjoint date ranges
-# (mistral-small-4 recent + locally-backfilled mistral-small3.2 olds); this uses the
-# whole corpus. DISTINCT ON (rh.id) + ORDER BY created_at DESC = latest score per
-# headline. Cutoff pushed into SQL.
-_RAW_SCORES_SQL = text(
-    """
-    SELECT DISTINCT ON (rh.id)
-           rh.id          AS headline_id,
-           rh.date::date  AS date,
-           rh.source,
-           nv.model_name,
-           nv.relevance_politics,
-           nv.relevance_economy,
-           nv.relevance_security,
-           nv.relevance_health,
-           nv.relevance_science,
-           nv.relevance_technology,
-           nv.global_sentiment
-    FROM raw_headlines rh
-    JOIN nlp_vectors nv ON nv.headline_id = rh.id
-    WHERE nv.validation_passed = TRUE
-      AND rh.date <= :cutoff
-    ORDER BY rh.id, nv.created_at DESC, nv.id DESC
-    """
-)
 
+def _load_source_scores(engine, cutoff=CUTOFF_DATE) -> pd.DataFrame:
+    """Per-(date, source) score sums + counts up to ``cutoff`` — all models combined.
 
-def _load_raw_scores(engine, cutoff=CUTOFF_DATE) -> pd.DataFrame:
-    """Load validated news scores up to ``cutoff`` — all models, one row per headline.
+    Read from the incrementally refreshed ``daily_source_scores`` table
+    (:mod:`sentisense.features.source_scores`), which aggregates the latest validated score
+    per headline regardless of ``model_name``. The corpus mixes models on disjoint date
+    ranges (mistral-small-4 recent + locally-backfilled mistral-small3.2 olds).
 
     ``cutoff`` defaults to the project cutoff (the leak-safe modeling bound); pass a
     later date to include more history (e.g. the full-history comparison pipeline).
@@ -76,32 +59,50 @@ def _load_raw_scores(engine, cutoff=CUTOFF_DATE) -> pd.DataFrame:
     the scoring model changes. This is an accepted trade-off for using the full
     backfilled corpus (operator chose 'combine all models').
     """
-    with engine.connect() as conn:
-        df = pd.read_sql(_RAW_SCORES_SQL, conn, params={"cutoff": cutoff})
-    df["date"] = pd.to_datetime(df["date"])
-    models = sorted(df["model_name"].unique()) if not df.empty else []
-    logger.info("Loaded {:,} validated headlines (<= {}), {} sources, models={}",
-                len(df), pd.Timestamp(cutoff).date(), df["source"].nunique(), models)
-    # model_name was only for dedupe/logging; drop before aggregation.
-    return df.drop(columns=["model_name", "headline_id"])
+    from sentisense.features.source_scores import stored_daily_source_scores
+
+    agg = stored_daily_source_scores(engine, cutoff)
+    logger.info("Loaded {:,} validated headlines (<= {}), {} sources, {} days",
+                int(agg["n"].sum()), pd.Timestamp(cutoff).date(), agg["source"].nunique(),
+                agg["date"].nunique())
+    return agg
 
 
 def _safe_col(name: str) -> str:
     return "".join(ch if (ch.isalnum() or ch in "_-") else "_" for ch in str(name))
 
 
-def _build_daily_mean(raw: pd.DataFrame) -> pd.DataFrame:
-    dm = raw.groupby("date", observed=True)[_SCORE_COLS].mean().add_prefix("mean_")
-    dm["n_headlines"] = raw.groupby("date", observed=True).size()
+def _daily_totals(agg: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Collapse sources → per-date ``(means, totals)``; a mean with no non-NULL score is NaN."""
+    totals = agg.drop(columns="source").groupby("date").sum()
+    sums = totals[[f"sum_{c}" for c in _SCORE_COLS]].to_numpy(dtype=float)
+    counts = totals[[f"n_{c}" for c in _SCORE_COLS]].to_numpy(dtype=float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = pd.DataFrame(sums / counts, index=totals.index, columns=_SCORE_COLS)
+    return means, totals
+
+
+def _build_daily_mean(agg: pd.DataFrame) -> pd.DataFrame:
+    means, totals = _daily_totals(agg)
+    dm = means.add_prefix("mean_")
+    dm["n_headlines"] = totals["n"]
     return dm
 
 
-def _build_per_source_wide(raw: pd.DataFrame, top_n: int) -> pd.DataFrame:
-    top_sources = raw["source"].value_counts().head(top_n).index.tolist()
-    long = raw.groupby(["date", "source"], observed=True)[_SCORE_COLS].sum().reset_index()
-    long["count"] = (
-        raw.groupby(["date", "source"], observed=True).size().reset_index(name="count")["count"]
-    )
+def _top_sources(per_source: pd.Series, top_n: int) -> list[str]:
+    """The ``top_n`` sources by headline count (``per_source``: source → n), ties by name."""
+    ranked = per_source.rename("n").rename_axis("source").reset_index()
+    return ranked.sort_values(["n", "source"], ascending=[False, True])["source"].head(top_n).tolist()
+
+
+def _build_per_source_wide(agg: pd.DataFrame, top_n: int,
+                           top_sources: list[str] | None = None) -> pd.DataFrame:
+    if top_sources is None:
+        top_sources = _top_sources(agg.groupby("source")["n"].sum(), top_n)
+    long = agg[["date", "source"]].copy()
+    for c in _SCORE_COLS:
+        long[c] = agg[f"sum_{c}"].astype(float)
+    long["count"] = agg["n"]
     long["source_group"] = long["source"].apply(
         lambda s: _safe_col(s) if s in top_sources else "_other"
     )
@@ -114,102 +115,131 @@ def _build_per_source_wide(raw: pd.DataFrame, top_n: int) -> pd.DataFrame:
     return pd.concat(pivots, axis=1).sort_index()
 
 
-def _load_finance() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Load TA-125 + VTA-35 (CSV) and S&P/VIX/Brent (yfinance) + USD/ILS (Frankfurter).
+def _convert_volume(val) -> float:
+    if pd.isna(val):
+        return 0.0
+    s = str(val).upper().replace(",", "")
+    if s.endswith("M"):
+        return float(s[:-1]) * 1e6
+    if s.endswith("B"):
+        return float(s[:-1]) * 1e9
+    if s.endswith("K"):
+        return float(s[:-1]) * 1e3
+    try:
+        return float(s)
+    except ValueError:
+        return 0.0
+
 
-    Lazy-imports yfinance/requests (the ``finance`` extra) so this module imports
-    cleanly in the Phase 0/1 base env.
-    """
-    import requests
-    import yfinance as yf
-
-    def convert_volume(val):
-        if pd.isna(val):
-            return 0.0
-        s = str(val).upper().replace(",", "")
-        if s.endswith("M"):
-            return float(s[:-1]) * 1e6
-        if s.endswith("B"):
-            return float(s[:-1]) * 1e9
-        if s.endswith("K"):
-            return float(s[:-1]) * 1e3
-        try:
-            return float(s)
-        except ValueError:
-            return 0.0
-
-    def to_float(s):
-        return (s.astype(float) if pd.api.types.is_numeric_dtype(s)
-                else s.astype(str).str.replace(",", "", regex=False).astype(float))
+def _to_float(s: pd.Series) -> pd.Series:
+    return (s.astype(float) if pd.api.types.is_numeric_dtype(s)
+            else s.astype(str).str.replace(",", "", regex=False).astype(float))
 
+
+@functools.lru_cache(maxsize=2)
+def _parse_index_csvs(ta125_mtime: int, vta35_mtime: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """TA-125 + VTA-35 CSVs → clean frames; memoised per file mtime (re-read only on change)."""
     ta125 = pd.read_csv(TA125_CSV)
     ta125["Date"] = pd.to_datetime(ta125["Date"])
     ta125 = ta125.set_index("Date").sort_index()
     ta125_clean = pd.DataFrame({
-        "TA125_Price": to_float(ta125["Price"]),
-        "TA125_Volume": ta125["Vol."].apply(convert_volume),
+        "TA125_Price": _to_float(ta125["Price"]),
+        "TA125_Volume": ta125["Vol."].apply(_convert_volume),
     })
 
     vta35 = pd.read_csv(VTA35_CSV)
     vta35["Date"] = pd.to_datetime(vta35["Date"])
     vta35 = vta35.set_index("Date").sort_index()
-    vta35_clean = pd.DataFrame({"VTA35_Price": to_float(vta35["Price"])})
+    vta35_clean = pd.DataFrame({"VTA35_Price": _to_float(vta35["Price"])})
     vta35_clean.loc[vta35_clean.index < pd.Timestamp(VTA35_INCEPTION), "VTA35_Price"] = np.nan
+    return ta125_clean, vta35_clean
+
+
+def _refresh_market(engine) -> None:
+    """Incremental market-data refresh; live TA-125 is fetched from a week before the CSV ends."""
+    from sentisense.features.market import refresh_market_data
+
+    ta125, _ = _parse_index_csvs(TA125_CSV.stat().st_mtime_ns, VTA35_CSV.stat().st_mtime_ns)
+    refresh_market_data(engine, since={"ta125": (ta125.index.max() - pd.Timedelta(days=7)).date()})
+
+
+def _refresh_inputs(engine, inputs: tuple[str, ...]) -> None:
+    """Bring the stored inputs a builder reads up to date (before the frame cache keys them)."""
+    if "scores" in inputs:
+        from sentisense.features.source_scores import refresh_daily_source_scores
+        refresh_daily_source_scores(engine)
+    if "centroid" in inputs:
+        from sentisense.embed.centroid import refresh_daily_centroid
+        refresh_daily_centroid(engine)
+    if "market" in inputs and not FINANCE_OFFLINE:
+        _refresh_market(engine)
+
+
+def _cached(engine, kind: str, build, inputs: tuple[str, ...], **params):
+    """Consult the on-disk feature-frame cache (:mod:`sentisense.features.frame_cache`)."""
+    from sentisense.features.frame_cache import cached_frame
+
+    return cached_frame(engine, kind, build, inputs=inputs,
+                        refresh=lambda: _refresh_inputs(engine, inputs), **params)
+
+
+def _load_finance(engine=None, *, offline: bool = FINANCE_OFFLINE
+                  ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Load TA-125 + VTA-35 (CSV) and S&P/VIX/Brent + USD/ILS from the market-data store.
+
+    The store (``sentisense.features.market``) is refreshed incrementally first — only days
+    past each series' watermark are fetched, and not at all within the refresh TTL — unless
+    ``offline`` (``SENTISENSE_FINANCE_OFFLINE``), which builds from the stored rows alone.
+    Network fetchers lazy-import yfinance/requests (the ``finance`` extra).
+
+    Raises:
+        RuntimeError: no S&P 500 rows stored (the one series the builders cannot do without).
+    """
+    from sentisense.features.market import (
+        FX_SERIES,
+        MARKET_TICKERS,
+        TA125_SERIES,
+        load_market_data,
+    )
+
+    ta125_clean, vta35_clean = _parse_index_csvs(TA125_CSV.stat().st_mtime_ns,
+                                                 VTA35_CSV.stat().st_mtime_ns)
+    ta125_clean, vta35_clean = ta125_clean.copy(), vta35_clean.copy()
+    last_csv = ta125_clean.index.max()
+
+    engine = engine or get_engine()
+    if not offline:
+        _refresh_market(engine)
+    stored = load_market_data(engine)
 
-    start = "2015-12-17"
-    end = pd.Timestamp.today().strftime("%Y-%m-%d")
-    # ^IXIC (Nasdaq) added — tech-heavy, strong overnight driver of TA-125. Rename BY TICKER
-    # (not positional) so column order from yfinance can't silently mis-map.
-    _tk = {"^GSPC": "SP500", "^IXIC": "Nasdaq", "^VIX": "VIX", "BZ=F": "Brent_Oil"}
-    market = yf.download(list(_tk), start=start, end=end, progress=False)["Close"].rename(columns=_tk)
-    present = [c for c in _tk.values() if c in market.columns]   # degrade gracefully if a ticker is missing
+    present = [c for c in MARKET_TICKERS.values()
+               if c in stored.columns and stored[c].notna().any()]
     if "SP500" not in present:
-        raise RuntimeError("yfinance returned no S&P 500 (^GSPC) — finance load failed; retry.")
-    if len(present) < len(_tk):
-        logger.warning("yfinance missing {} — proceeding without them.",
-                       sorted(set(_tk.values()) - set(present)))
-    market_clean = market[present].add_prefix("Market_")
-
-    resp = requests.get(f"https://api.frankfurter.app/{start}..?from=USD&to=ILS", timeout=30)
-    resp.raise_for_status()
-    fx = pd.DataFrame.from_dict(resp.json()["rates"], orient="index")
-    fx.index = pd.to_datetime(fx.index)
-    fx.columns = ["FX_USD_ILS"]
+        raise RuntimeError("no S&P 500 (^GSPC) rows in market_data — "
+                           + ("run `python -m sentisense.features.market` online first."
+                              if offline else "finance refresh failed; retry."))
+    if len(present) < len(MARKET_TICKERS):
+        logger.warning("market_data missing {} — proceeding without them.",
+                       sorted(set(MARKET_TICKERS.values()) - set(present)))
+    market_clean = stored[present].dropna(how="all").add_prefix("Market_")
+    fx_clean = stored[[FX_SERIES]].dropna() if FX_SERIES in stored.columns else (
+        pd.DataFrame(columns=[FX_SERIES], dtype=float))
+
     # Extend TA-125 with LIVE close prices so the pipeline reaches the current trading day
-    # (the static CSV lags). Yahoo ticker for the TA-125 index, env-overridable. Only dates
-    # AFTER the CSV's last day are appended — historical CSV values stay authoritative (no
-    # train-distribution shift). Empty/failed fetch → CSV-only (no crash), just a stale calendar.
-    try:
-        ta_ticker = os.environ.get("SENTISENSE_TA125_TICKER", "^TA125.TA")
-        last_csv = ta125_clean.index.max()
-        # end is EXCLUSIVE in yfinance → use today+1 so TODAY's close is captured (the daily
-        # cron runs after TASE close, so it's final). Lets the champion predict today→tomorrow.
-        ta_end = (pd.Timestamp.today() + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
-        live = yf.download(ta_ticker, start=(last_csv - pd.Timedelta(days=7)).strftime("%Y-%m-%d"),
-                           end=ta_end, progress=False)
-        if not live.empty:
-            close, vol = live["Close"], live.get("Volume")
-            if isinstance(close, pd.DataFrame):        # single-ticker multi-index → first column
-                close = close.iloc[:, 0]
-                vol = vol.iloc[:, 0] if vol is not None else None
-            add = pd.DataFrame({
-                "TA125_Price": close.astype(float),
-                "TA125_Volume": (vol.astype(float) if vol is not None else 0.0),
-            }).dropna(subset=["TA125_Price"])
-            add = add[add.index > last_csv]            # CSV authoritative for history; append only new
-            if not add.empty:
-                ta125_clean = pd.concat([ta125_clean, add]).sort_index()
-                ta125_clean = ta125_clean[~ta125_clean.index.duplicated(keep="first")]
-                logger.info("TA-125 extended with {} live day(s) via {} → last {}",
-                            len(add), ta_ticker, ta125_clean.index.max().date())
-        else:
-            logger.warning("Live TA-125 ({}) returned no rows — CSV only (last {}).",
-                           ta_ticker, last_csv.date())
-    except Exception as exc:  # noqa: BLE001 — a live-fetch hiccup must not break the build
-        logger.warning("Live TA-125 fetch failed ({}) — CSV only.", str(exc)[:100])
+    # (the static CSV lags). Only dates AFTER the CSV's last day are appended — historical
+    # CSV values stay authoritative (no train-distribution shift). Nothing stored → CSV only.
+    live = (stored[list(TA125_SERIES)].dropna(subset=["TA125_Price"])
+            if set(TA125_SERIES) <= set(stored.columns) else pd.DataFrame())
+    add = live[live.index > last_csv] if not live.empty else live
+    if not add.empty:
+        ta125_clean = pd.concat([ta125_clean, add.fillna({"TA125_Volume": 0.0})]).sort_index()
+        ta125_clean = ta125_clean[~ta125_clean.index.duplicated(keep="first")]
+        logger.info("TA-125 extended with {} live day(s) → last {}",
+                    len(add), ta125_clean.index.max().date())
+    else:
+        logger.warning("No live TA-125 rows past the CSV — CSV only (last {}).", last_csv.date())
 
-    fx_clean = fx.sort_index()
-    return ta125_clean, vta35_clean, market_clean, fx_clean
+    return ta125_clean, vta35_clean, market_clean, fx_clean.sort_index()
 
 
 def _roll_to_trading_days(df: pd.DataFrame, trading_days: pd.DatetimeIndex, agg: str) -> pd.DataFrame:
@@ -329,30 +359,62 @@ def add_overnight_features(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _build_interactions(raw: pd.DataFrame) -> pd.DataFrame:
+def _build_interactions(agg: pd.DataFrame) -> pd.DataFrame:
     """Global daily sentiment×relevance interaction features (per raw date).
 
     Domain prior: sentiment matters more when economy/security relevance is high, and
     headline *volume* + sentiment *intensity* carry signal beyond the means. Joined into
-    both modeling frames so every model can use them.
+    both modeling frames so every model can use them. Intensity and dispersion (sample
+    std) come from the stored ``sum_abs_sentiment`` / ``sum_sq_sentiment`` moments.
     """
     relevance_cols = [c for c in SCORE_COLUMNS if c != "global_sentiment"]
-    g = raw.groupby("date", observed=True)
-    econ = g["relevance_economy"].mean()
-    sec = g["relevance_security"].mean()
-    pol = g["relevance_politics"].mean()
-    sent = g["global_sentiment"].mean()
+    means, totals = _daily_totals(agg)
+    sent = means["global_sentiment"]
+    n = totals["n_global_sentiment"].astype(float)
+    s1 = totals["sum_global_sentiment"].astype(float)
+    var = (totals["sum_sq_sentiment"] - s1 * s1 / n) / (n - 1)
     out = pd.DataFrame({
-        "ix_econ_sent": econ * sent,
-        "ix_sec_sent": sec * sent,
-        "ix_pol_sent": pol * sent,
-        "ix_total_relevance": g[relevance_cols].mean().sum(axis=1),
-        "ix_sent_intensity": g["global_sentiment"].apply(lambda s: s.abs().mean()),
-        "ix_sent_dispersion": g["global_sentiment"].std(),
+        "ix_econ_sent": means["relevance_economy"] * sent,
+        "ix_sec_sent": means["relevance_security"] * sent,
+        "ix_pol_sent": means["relevance_politics"] * sent,
+        "ix_total_relevance": means[relevance_cols].sum(axis=1),
+        "ix_sent_intensity": totals["sum_abs_sentiment"] / n.where(n > 0),
+        "ix_sent_dispersion": np.sqrt(var.where(n > 1).clip(lower=0)),
     })
     return out
 
 
+def _join_blocks(base: pd.DataFrame, *blocks: pd.DataFrame) -> pd.DataFrame:
+    """LEFT-join date-indexed ``blocks`` onto ``base``, in order."""
+    for block in blocks:
+        base = base.join(block, how="left")
+    return base
+
+
+def _feature_ops(engine: str | None = None) -> SimpleNamespace:
+    """Frame-assembly steps for ``SENTISENSE_FEATURE_ENGINE`` (``pandas`` or ``polars``).
+
+    Both return identical pandas frames; ``polars`` (the ``polars`` extra) runs the
+    aggregation, pivot, calendar rollover and wide joins as Polars queries
+    (:mod:`sentisense.features.polars_frames`).
+    """
+    engine = engine or FEATURE_ENGINE
+    if engine == "pandas":
+        return SimpleNamespace(daily_mean=_build_daily_mean, per_source_wide=_build_per_source_wide,
+                               interactions=_build_interactions, roll=_roll_to_trading_days,
+                               roll_mean_and_count=_roll_mean_and_count, join=_join_blocks)
+    if engine != "polars":
+        raise ValueError(f"SENTISENSE_FEATURE_ENGINE must be 'pandas' or 'polars', got {engine!r}")
+    try:
+        from sentisense.features import polars_frames as pf
+    except ImportError as exc:
+        raise ImportError("SENTISENSE_FEATURE_ENGINE=polars needs polars: "
+                          "uv sync --extra polars") from exc
+    return SimpleNamespace(daily_mean=pf.build_daily_mean, per_source_wide=pf.build_per_source_wide,
+                           interactions=pf.build_interactions, roll=pf.roll_to_trading_days,
+                           roll_mean_and_count=pf.roll_mean_and_count, join=pf.join_blocks)
+
+
 def _finalize(df: pd.DataFrame, cutoff=CUTOFF_DATE, horizon: int = 1,
               keep_unlabeled: bool = False) -> pd.DataFrame:
     """Compute the H-day-ahead direction target, leak-free VTA-35, NaN cleanup, cutoff slice.
@@ -536,26 +598,41 @@ def build_datasets(
         ``(mt, ml)`` — daily-mean and per-source frames, each with a ``Target`` column.
     """
     engine = engine or get_engine()
+    from sentisense.features.frame_cache import frame_digest
+
+    return _cached(
+        engine, "datasets",
+        lambda: _build_datasets(engine, top_n=top_n, extra_daily_features=extra_daily_features,
+                                cutoff=cutoff, overnight=overnight, horizon=horizon,
+                                with_sim=with_sim),
+        ("scores", "market", "sim") if with_sim else ("scores", "market"),
+        top_n=top_n, extra=frame_digest(extra_daily_features), cutoff=pd.Timestamp(cutoff).date(),
+        overnight=overnight, horizon=horizon, with_sim=with_sim)
+
+
+def _build_datasets(engine, *, top_n, extra_daily_features, cutoff, overnight, horizon,
+                    with_sim) -> tuple[pd.DataFrame, pd.DataFrame]:
     if with_sim:
         sim = build_sim_features(engine, cutoff)
         if not sim.empty:
             extra_daily_features = (sim if extra_daily_features is None
                                     else extra_daily_features.join(sim, how="outer"))
-    raw = _load_raw_scores(engine, cutoff)
-    daily_mean = _build_daily_mean(raw)
-    per_source = _build_per_source_wide(raw, top_n)
+    ops = _feature_ops()
+    scores = _load_source_scores(engine, cutoff)
+    daily_mean = ops.daily_mean(scores)
+    per_source = ops.per_source_wide(scores, top_n)
 
-    base, trading_days, price_full = _finance_base(extra_daily_features)
+    base, trading_days, price_full = _finance_base(extra_daily_features, engine)
 
     # Global sentiment×relevance interactions → both frames (rolled mean to trading days).
-    interactions_td = _roll_to_trading_days(_build_interactions(raw), trading_days, agg="mean")
-    base = base.join(interactions_td, how="left")
+    interactions_td = ops.roll(ops.interactions(scores), trading_days, agg="mean")
+    base = ops.join(base, interactions_td)
 
-    dm_td = _roll_mean_and_count(daily_mean, trading_days)
-    ps_td = _roll_to_trading_days(per_source, trading_days, agg="sum")
+    dm_td = ops.roll_mean_and_count(daily_mean, trading_days)
+    ps_td = ops.roll(per_source, trading_days, agg="sum")
 
     def _assemble(news_td):
-        feat = add_cross_asset_features(add_ta125_features(base.join(news_td, how="left"), price_full))
+        feat = add_cross_asset_features(add_ta125_features(ops.join(base, news_td), price_full))
         if overnight:                       # open(T+1)-decision overnight global block
             feat = add_overnight_features(feat)
         return _finalize(feat, cutoff, horizon)
@@ -569,13 +646,13 @@ def build_datasets(
     return mt, ml
 
 
-def _finance_base(extra_daily_features: pd.DataFrame | None = None):
+def _finance_base(extra_daily_features: pd.DataFrame | None = None, engine=None):
     """Build the finance/market base frame on the TA-125 trading calendar.
 
     Returns ``(base, trading_days, price_full)`` — shared by the score dataset and
     the embedding dataset so both sit on the identical calendar + finance block.
     """
-    ta125, vta35, market, fx = _load_finance()
+    ta125, vta35, market, fx = _load_finance(engine)
     trading_days = pd.DatetimeIndex(ta125.index).sort_values()
 
     base = (
@@ -594,21 +671,19 @@ def _finance_base(extra_daily_features: pd.DataFrame | None = None):
     return base, trading_days, price_full
 
 
-def _join_embedding_derived(merged: pd.DataFrame, engine, cutoff,
-                            trading_days: pd.DatetimeIndex) -> pd.DataFrame:
+def _join_embedding_derived(merged: pd.DataFrame, der: pd.DataFrame,
+                            trading_days: pd.DatetimeIndex, ops: SimpleNamespace) -> pd.DataFrame:
     """LEFT-join the leak-safe derived PCA/cluster features (``embpca_*``/``embclus_dist_*``).
 
-    Rolled Fri/Sat → Sun like the centroid. No-op if the ``daily_embedding_derived`` table is
-    absent/empty (i.e. ``scripts/build_embedding_derived.py`` hasn't been run yet).
+    Rolled Fri/Sat → Sun like the centroid. No-op if ``der`` is empty, i.e. the
+    ``daily_embedding_derived`` table is absent/empty (``scripts/build_embedding_derived.py``
+    hasn't been run yet).
     """
-    from sentisense.embed.derived import load_embedding_derived
-
-    der = load_embedding_derived(engine, cutoff)
     if der.empty:
         return merged
-    der_td = _roll_to_trading_days(der, trading_days, agg="mean")
+    der_td = ops.roll(der, trading_days, agg="mean")
     logger.info("Joined {} derived embedding features.", der_td.shape[1])
-    return merged.join(der_td, how="left")
+    return ops.join(merged, der_td)
 
 
 def build_embedding_dataset(engine=None, *, cutoff=CUTOFF_DATE, overnight: bool = False,
@@ -625,12 +700,22 @@ def build_embedding_dataset(engine=None, *, cutoff=CUTOFF_DATE, overnight: bool
     an empty frame if no embeddings are cached.
     """
     engine = engine or get_engine()
-    from sentisense.embed import daily_embedding_centroid
+    return _cached(engine, "embedding",
+                   lambda: _build_embedding_dataset(engine, cutoff=cutoff, overnight=overnight,
+                                                    horizon=horizon),
+                   ("centroid", "derived", "market"),
+                   cutoff=pd.Timestamp(cutoff).date(), overnight=overnight, horizon=horizon)
 
-    # Streamed per-date centroid: never materialises the full ~3M×768 matrix (OOM-safe on
-    # the full-history corpus). 'embc_*' so PCA (pca_prefix='embc_') reduces ONLY the
-    # centroid block — the scalar dispersion/count + finance/TA-125 features stay raw.
-    cen = daily_embedding_centroid(engine, cutoff)
+
+def _build_embedding_dataset(engine, *, cutoff, overnight, horizon) -> pd.DataFrame:
+    from sentisense.embed import stored_daily_centroid
+    from sentisense.embed.derived import load_embedding_derived
+
+    # Per-date centroid from the persisted moments table, refreshed incrementally (only
+    # embeddings above the watermark are streamed) — never the full ~3M×768 matrix. 'embc_*'
+    # so PCA (pca_prefix='embc_') reduces ONLY the centroid block — the scalar
+    # dispersion/count + finance/TA-125 features stay raw.
+    cen = stored_daily_centroid(engine, cutoff)
     if cen.empty:
         logger.warning("No embeddings cached — run the 'embed' stage first. "
                        "Returning empty embedding dataset.")
@@ -639,11 +724,13 @@ def build_embedding_dataset(engine=None, *, cutoff=CUTOFF_DATE, overnight: bool
     extras = cen[["emb_dispersion", "emb_count"]]
     dim = centroid_by_date.shape[1]
 
-    base, trading_days, price_full = _finance_base()
-    emb_td = _roll_to_trading_days(centroid_by_date, trading_days, agg="mean")
-    extras_td = _roll_to_trading_days(extras, trading_days, agg="mean")
-    merged = base.join(emb_td, how="left").join(extras_td, how="left")
-    merged = _join_embedding_derived(merged, engine, cutoff, trading_days)
+    ops = _feature_ops()
+    base, trading_days, price_full = _finance_base(engine=engine)
+    emb_td = ops.roll(centroid_by_date, trading_days, agg="mean")
+    extras_td = ops.roll(extras, trading_days, agg="mean")
+    merged = ops.join(base, emb_td, extras_td)
+    merged = _join_embedding_derived(merged, load_embedding_derived(engine, cutoff),
+                                     trading_days, ops)
     feat = add_cross_asset_features(add_ta125_features(merged, price_full))
     if overnight:
         feat = add_overnight_features(feat)
@@ -689,35 +776,60 @@ def build_fused_dataset(engine=None, *, top_n: int = TOP_N_SOURCES, cutoff=CUTOF
     un-reduced. Returns an empty frame if no embeddings are cached (fused needs both).
     """
     engine = engine or get_engine()
-    from sentisense.embed import daily_embedding_centroid
+    return _cached(engine, "fused",
+                   lambda: _build_fused_dataset(engine, top_n=top_n, cutoff=cutoff,
+                                                overnight=overnight, horizon=horizon,
+                                                keep_unlabeled=keep_unlabeled),
+                   ("scores", "centroid", "derived", "market"),
+                   top_n=top_n, cutoff=pd.Timestamp(cutoff).date(), overnight=overnight,
+                   horizon=horizon, keep_unlabeled=keep_unlabeled)
+
+
+def _build_fused_dataset(engine, *, top_n, cutoff, overnight, horizon,
+                         keep_unlabeled) -> pd.DataFrame:
+    from sentisense.embed import stored_daily_centroid
+    from sentisense.embed.derived import load_embedding_derived
 
-    # Streamed per-date centroid (OOM-safe on the full-history corpus — see build_embedding_dataset).
-    cen = daily_embedding_centroid(engine, cutoff)
+    # Incrementally-refreshed stored per-date centroid (see build_embedding_dataset).
+    cen = stored_daily_centroid(engine, cutoff)
     if cen.empty:
         logger.warning("No embeddings cached — fused dataset needs both scores AND "
                        "embeddings. Returning empty frame (run the 'embed' stage).")
         return pd.DataFrame()
 
-    raw = _load_raw_scores(engine, cutoff)
-    per_source = _build_per_source_wide(raw, top_n)
-    interactions = _build_interactions(raw)
+    scores = _load_source_scores(engine, cutoff)
+    base, _, price_full = _finance_base(engine=engine)
+    feat = _fused_features(_feature_ops(), scores, cen, load_embedding_derived(engine, cutoff),
+                           base, price_full, top_n=top_n, overnight=overnight)
+    df = _finalize(feat, cutoff, horizon, keep_unlabeled=keep_unlabeled)
+    logger.info("Fused dataset built (<= {}, overnight={}): {} (scores + {}-d centroid + finance)",
+                pd.Timestamp(cutoff).date(), overnight, df.shape,
+                sum(c.startswith("embc_") for c in cen.columns))
+    return df
+
 
+def _fused_features(ops: SimpleNamespace, scores: pd.DataFrame, cen: pd.DataFrame,
+                    der: pd.DataFrame, base: pd.DataFrame, price_full: pd.Series, *, top_n: int,
+                    overnight: bool, top_sources: list[str] | None = None) -> pd.DataFrame:
+    """Fused frame before ``_finalize``, on ``base``'s trading days, from loaded input blocks.
+
+    Shared with the serving frame's tail window (:mod:`sentisense.features.serving`), which
+    passes a slice of ``base`` with the inputs bounded to it and pins ``top_sources``.
+    """
+    trading_days = base.index
+    per_source = ops.per_source_wide(scores, top_n, top_sources)
+    interactions = ops.interactions(scores)
     centroid_by_date = cen[[c for c in cen.columns if c.startswith("embc_")]]
     extras = cen[["emb_dispersion", "emb_count"]]
-    dim = centroid_by_date.shape[1]
 
-    base, trading_days, price_full = _finance_base()
-    base = base.join(_roll_to_trading_days(interactions, trading_days, agg="mean"), how="left")
-    ps_td = _roll_to_trading_days(per_source, trading_days, agg="sum")
-    emb_td = _roll_to_trading_days(centroid_by_date, trading_days, agg="mean")
-    extras_td = _roll_to_trading_days(extras, trading_days, agg="mean")
+    base = ops.join(base, ops.roll(interactions, trading_days, agg="mean"))
+    ps_td = ops.roll(per_source, trading_days, agg="sum")
+    emb_td = ops.roll(centroid_by_date, trading_days, agg="mean")
+    extras_td = ops.roll(extras, trading_days, agg="mean")
 
-    merged = base.join(ps_td, how="left").join(emb_td, how="left").join(extras_td, how="left")
-    merged = _join_embedding_derived(merged, engine, cutoff, trading_days)
+    merged = ops.join(base, ps_td, emb_td, extras_td)
+    merged = _join_embedding_derived(merged, der, trading_days, ops)
     feat = add_cross_asset_features(add_ta125_features(merged, price_full))
     if overnight:
         feat = add_overnight_features(feat)
-    df = _finalize(feat, cutoff, horizon, keep_unlabeled=keep_unlabeled)
-    logger.info("Fused dataset built (<= {}, overnight={}): {} (scores + {}-d centroid + finance)",
-                pd.Timestamp(cutoff).date(), overnight, df.shape, dim)
-    return df
+    return feat
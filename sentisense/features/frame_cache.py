@@ -0,0 +1,182 @@
+"""On-disk cache of finished feature frames, keyed by a fingerprint of everything they read.
+
+``sentisense.pipeline`` memoises datasets for one process only, so ``train_registry``,
+``pipeline_compare``, ``horizon_sweep``, ``challenger_hpo`` and the champion's
+``train_and_predict`` each rebuilt the same fused frame from scratch. The dataset builders
+now go through :func:`cached_frame`, which stores each result under
+``<root>/<kind>-<args digest>-<inputs digest>.pkl``:
+
+* the *args digest* covers the builder arguments (cutoff, horizon, overnight, top_n, …);
+* the *inputs digest* covers the input watermarks (:func:`input_state`). These are the
+  score-aggregate and centroid watermarks, the derived-feature, market-data and sim row
+  counts and latest timestamps, the TA-125/VTA-35 CSV mtimes, the embed model, the
+  feature engine, the offline-finance switch, and a hash of the feature code and
+  ``sentisense/config.py`` (:func:`code_version`).
+
+The input tables are refreshed before the fingerprint is taken, so new headlines,
+embeddings or market days change the key. Storing a frame deletes older entries for the
+same arguments. Entries are pickles (exact dtypes and index, no extra dependency) written
+only by this module. Never point ``SENTISENSE_FRAME_CACHE_DIR`` at files from elsewhere.
+
+Run:
+    uv run python -m sentisense.features.frame_cache           # list entries
+    uv run python -m sentisense.features.frame_cache --clear
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import text
+
+from sentisense.config import (
+    EMBED_MODEL,
+    FEATURE_ENGINE,
+    FINANCE_OFFLINE,
+    FRAME_CACHE,
+    FRAME_CACHE_DIR,
+)
+from sentisense.constants import REPO_ROOT, TA125_CSV, VTA35_CSV
+
+_DEFAULT_ROOT = REPO_ROOT / "sentisense_cache" / "frames"
+_FORMAT = 1                      # bump to orphan every entry after a layout change
+# Modules whose code shapes a frame; any edit to them changes every fingerprint.
+_CODE_FILES = [
+    REPO_ROOT / "sentisense" / "features" / "dataset.py",
+    REPO_ROOT / "sentisense" / "features" / "source_scores.py",
+    REPO_ROOT / "sentisense" / "features" / "market.py",
+    REPO_ROOT / "sentisense" / "features" / "polars_frames.py",
+    REPO_ROOT / "sentisense" / "features" / "serving.py",
+    REPO_ROOT / "sentisense" / "embed" / "centroid.py",
+    REPO_ROOT / "sentisense" / "embed" / "embeddings.py",
+    REPO_ROOT / "sentisense" / "embed" / "derived.py",
+    REPO_ROOT / "sentisense" / "embed" / "basis.py",
+    REPO_ROOT / "sentisense" / "embed" / "similarity.py",
+    REPO_ROOT / "sentisense" / "constants.py",
+    REPO_ROOT / "sentisense" / "config.py",     # defaults the builders read (TOP_N_SOURCES, …)
+]
+# input name → probe; one small aggregate or watermark row each (all index / tiny-table reads).
+_PROBES = {
+    "scores": "SELECT last_vector_id, n_vectors FROM daily_source_scores_watermark",
+    "centroid": "SELECT last_headline_id, n_rows FROM daily_embedding_centroid_watermark "
+                "WHERE embed_model = :model",
+    "derived": "SELECT count(*), max(created_at) FROM daily_embedding_derived "
+               "WHERE embed_model = :model",
+    "market": "SELECT count(*), max(date), sum(value) FROM market_data",
+    "sim": "SELECT count(*), max(created_at) FROM narrative_sim",
+}
+
+
+def _root() -> Path:
+    return Path(FRAME_CACHE_DIR or _DEFAULT_ROOT)
+
+
+def _digest(obj) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=1)
+def code_version() -> str:
+    """Hash of the feature-building source files (see ``_CODE_FILES``)."""
+    h = hashlib.sha256(str(_FORMAT).encode())
+    for f in _CODE_FILES:
+        h.update(f.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def frame_digest(frame: pd.DataFrame | None) -> str | None:
+    """Content hash of a caller-supplied frame (e.g. ``extra_daily_features``)."""
+    if frame is None:
+        return None
+    h = hashlib.sha256(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    h.update(json.dumps([str(c) for c in frame.columns]).encode())
+    return h.hexdigest()[:16]
+
+
+def input_state(engine, inputs: Iterable[str], *, model: str = EMBED_MODEL) -> dict:
+    """Current watermark of each named input (``None`` for a table that does not exist yet)."""
+    state: dict = {"code": code_version(), "model": model, "engine": FEATURE_ENGINE,
+                   "offline": FINANCE_OFFLINE,
+                   "csv": [f.stat().st_mtime_ns if f.exists() else None
+                           for f in (TA125_CSV, VTA35_CSV)]}
+    for name in inputs:
+        try:
+            with engine.connect() as conn:
+                row = conn.execute(text(_PROBES[name]), {"model": model}).fetchone()
+        except Exception as exc:  # noqa: BLE001 — a missing table is a valid (empty) state
+            logger.debug("Frame-cache probe '{}' failed ({}).", name, str(exc)[:80])
+            row = None
+        state[name] = list(row) if row is not None else None
+    return state
+
+
+def _paths(kind: str, params: dict, state: dict) -> tuple[Path, str]:
+    stem = f"{kind}-{_digest(params)}"
+    return _root() / f"{stem}-{_digest(state)}.pkl", stem
+
+
+def cached_frame(engine, kind: str, build: Callable[[], object], *, inputs: Iterable[str],
+                 refresh: Callable[[], None] | None = None, **params):
+    """Return the cached result of ``build()`` for these inputs, building + storing on a miss.
+
+    Args:
+        kind: builder name (part of the file name).
+        build: zero-arg callable producing the frame (or tuple of frames).
+        inputs: :data:`_PROBES` keys the builder reads.
+        refresh: brings the input tables up to date before they are fingerprinted.
+        **params: the builder arguments that shape the result (JSON-serialisable).
+    """
+    if not FRAME_CACHE:
+        return build()
+    if refresh is not None:
+        refresh()
+    path, stem = _paths(kind, params, input_state(engine, inputs))
+    if path.exists():
+        try:
+            out = pd.read_pickle(path)
+        except Exception as exc:  # noqa: BLE001 — a truncated/foreign entry is just a miss
+            logger.warning("Unreadable frame-cache entry {} ({}) — rebuilding.", path.name, exc)
+        else:
+            logger.info("Feature frame cache hit: {} {}", kind, params)
+            return out
+    out = build()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    pd.to_pickle(out, tmp)
+    tmp.replace(path)
+    for stale in path.parent.glob(f"{stem}-*.pkl"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    logger.info("Feature frame cached: {} → {}", kind, path.name)
+    return out
+
+
+def clear_frame_cache() -> int:
+    """Delete every cached frame; returns the number of files removed."""
+    files = list(_root().glob("*.pkl")) if _root().exists() else []
+    for f in files:
+        f.unlink(missing_ok=True)
+    return len(files)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect or clear the feature-frame cache.")
+    parser.add_argument("--clear", action="store_true", help="Delete every cached frame.")
+    args = parser.parse_args()
+    if args.clear:
+        logger.info("Removed {} cached frames from {}", clear_frame_cache(), _root())
+        return
+    for f in sorted(_root().glob("*.pkl")) if _root().exists() else []:
+        logger.info("{}  {:.1f} MB", f.name, f.stat().st_size / 1e6)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Local market-data store: yfinance + Frankfurter series in Postgres, refreshed incrementally.
+
+Every dataset build used to download S&P/Nasdaq/VIX/Brent (yfinance) and USD/ILS
+(Frankfurter) from 2015 onward — several times per pipeline run, failing outright whenever
+Yahoo had a bad minute. The series now live in ``market_data`` (one row per series and day)
+with a per-series watermark in ``market_data_watermark`` (migration 016):
+
+* :func:`refresh_market_data` fetches each source group only from ``_OVERLAP_DAYS`` before
+  its oldest watermark (late revisions / holidays are re-read and upserted), and not at all
+  while the group's last fetch is younger than ``SENTISENSE_FINANCE_TTL_MIN`` minutes. A failed
+  fetch logs a warning and leaves the stored rows in place.
+* :func:`load_market_data` reads the stored rows back as a wide date-indexed frame — with
+  ``SENTISENSE_FINANCE_OFFLINE=1`` the dataset builders use it without touching the network,
+  so a build is reproducible from the database alone.
+
+Run (server-side; the daily pipeline refreshes implicitly through the dataset builders):
+    uv run --extra finance python -m sentisense.features.market
+    uv run --extra finance python -m sentisense.features.market --force
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+from collections.abc import Callable
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import text
+
+from sentisense.config import FINANCE_TTL_MIN
+from sentisense.constants import REPO_ROOT
+from sentisense.db import get_engine
+from sentisense.embed.derived import _split_sql
+
+_MIGRATION = REPO_ROOT / "sentisense" / "db" / "migrations" / "016_market_data.sql"
+START = dt.date(2015, 12, 17)
+_OVERLAP_DAYS = 7
+
+# ^IXIC (Nasdaq) — tech-heavy, strong overnight driver of TA-125. Mapped BY TICKER (not
+# positional) so column order from yfinance can't silently mis-map.
+MARKET_TICKERS = {"^GSPC": "SP500", "^IXIC": "Nasdaq", "^VIX": "VIX", "BZ=F": "Brent_Oil"}
+FX_SERIES = "FX_USD_ILS"
+TA125_SERIES = ("TA125_Price", "TA125_Volume")
+
+_UPSERT_SQL = text(
+    """
+    INSERT INTO market_data (series, date, value) VALUES (:series, :date, :value)
+    ON CONFLICT (series, date) DO UPDATE SET value = EXCLUDED.value
+    """
+)
+_WATERMARK_SQL = text(
+    """
+    INSERT INTO market_data_watermark (series, last_date, fetched_at)
+    VALUES (:series, :last_date, NOW())
+    ON CONFLICT (series) DO UPDATE
+        SET last_date = GREATEST(market_data_watermark.last_date, EXCLUDED.last_date),  -- NULL-safe
+            fetched_at = NOW()
+    """
+)
+_MARKS_SQL = text(
+    "SELECT series, last_date, NOW() - fetched_at <= make_interval(mins => :ttl) AS fresh "
+    "FROM market_data_watermark"
+)
+_LOAD_SQL = text("SELECT series, date, value FROM market_data WHERE series = ANY(:series)")
+
+
+def ensure_market_tables(engine=None) -> None:
+    """Create ``market_data`` + ``market_data_watermark`` if absent. Idempotent."""
+    engine = engine or get_engine()
+    with engine.begin() as conn:
+        for stmt in _split_sql(_MIGRATION.read_text(encoding="utf-8")):
+            conn.execute(text(stmt))
+
+
+# ── fetchers: (start) → wide date-indexed frame, one column per series ────────────────
+
+def _fetch_market(start: dt.date) -> pd.DataFrame:
+    import yfinance as yf
+
+    # end is EXCLUSIVE in yfinance → today's (not yet final) US close is left out.
+    end = pd.Timestamp.today().strftime("%Y-%m-%d")
+    market = yf.download(list(MARKET_TICKERS), start=start.isoformat(), end=end,
+                         progress=False)["Close"]
+    return market.rename(columns=MARKET_TICKERS)
+
+
+def _fetch_fx(start: dt.date) -> pd.DataFrame:
+    import requests
+
+    resp = requests.get(f"https://api.frankfurter.app/{start.isoformat()}..?from=USD&to=ILS",
+                        timeout=30)
+    resp.raise_for_status()
+    fx = pd.DataFrame.from_dict(resp.json()["rates"], orient="index")
+    fx.index = pd.to_datetime(fx.index)
+    fx.columns = [FX_SERIES]
+    return fx
+
+
+def _fetch_ta125(start: dt.date) -> pd.DataFrame:
+    """Live TA-125 closes (Yahoo ticker env-overridable) — extends the lagging static CSV."""
+    import yfinance as yf
+
+    ticker = os.environ.get("SENTISENSE_TA125_TICKER", "^TA125.TA")
+    # end is EXCLUSIVE → today+1 so TODAY's close is captured (the daily cron runs after
+    # TASE close, so it's final). Lets the champion predict today→tomorrow.
+    end = (pd.Timestamp.today() + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    live = yf.download(ticker, start=start.isoformat(), end=end, progress=False)
+    if live.empty:
+        return pd.DataFrame(columns=list(TA125_SERIES))
+    close, vol = live["Close"], live.get("Volume")
+    if isinstance(close, pd.DataFrame):        # single-ticker multi-index → first column
+        close = close.iloc[:, 0]
+        vol = vol.iloc[:, 0] if vol is not None else None
+    return pd.DataFrame({
+        "TA125_Price": close.astype(float),
+        "TA125_Volume": (vol.astype(float) if vol is not None else 0.0),
+    }).dropna(subset=["TA125_Price"])
+
+
+# group → (series it writes, fetcher). A group is fetched in one request and shares a start.
+GROUPS: dict[str, tuple[tuple[str, ...], Callable[[dt.date], pd.DataFrame]]] = {
+    "market": (tuple(MARKET_TICKERS.values()), _fetch_market),
+    "fx": ((FX_SERIES,), _fetch_fx),
+    "ta125": (TA125_SERIES, _fetch_ta125),
+}
+
+
+def _fetch_start(marks: dict, series: tuple[str, ...], default: dt.date) -> dt.date:
+    """Oldest watermark of ``series`` minus the overlap; ``default`` if any was never fetched.
+
+    A series that was fetched but never returned rows (NULL ``last_date``, e.g. a delisted
+    ticker) does not drag the group back to ``default`` on every run.
+    """
+    if any(s not in marks for s in series):
+        return default
+    lasts = [marks[s]["last_date"] for s in series if marks[s]["last_date"] is not None]
+    return min(lasts) - dt.timedelta(days=_OVERLAP_DAYS) if lasts else default
+
+
+def _store(engine, frame: pd.DataFrame, series: tuple[str, ...]) -> int:
+    """Upsert the non-null cells of ``frame`` and advance every series' watermark."""
+    rows, marks = [], []
+    for s in series:
+        col = frame[s].dropna() if s in frame.columns else pd.Series(dtype=float)
+        rows += [{"series": s, "date": pd.Timestamp(d).date(), "value": float(v)}
+                 for d, v in col.items()]
+        marks.append({"series": s,
+                      "last_date": pd.Timestamp(col.index.max()).date() if len(col) else None})
+    with engine.begin() as conn:
+        if rows:
+            conn.execute(_UPSERT_SQL, rows)
+        conn.execute(_WATERMARK_SQL, marks)
+    return len(rows)
+
+
+def refresh_market_data(engine=None, *, groups=None, since: dict[str, dt.date] | None = None,
+                        ttl_minutes: int = FINANCE_TTL_MIN, force: bool = False) -> dict[str, int]:
+    """Fetch new days for each source group into ``market_data``; returns rows written per group.
+
+    Args:
+        groups: subset of :data:`GROUPS` (default: all).
+        since: first day to fetch for a group with no stored rows yet (default ``START``).
+        ttl_minutes: skip a group whose last successful fetch is younger than this.
+        force: ignore the TTL (still incremental).
+
+    A group whose fetch raises is logged and skipped — its stored rows stay authoritative.
+    """
+    engine = engine or get_engine()
+    ensure_market_tables(engine)
+    with engine.connect() as conn:
+        marks = {r.series: {"last_date": r.last_date, "fresh": r.fresh}
+                 for r in conn.execute(_MARKS_SQL, {"ttl": int(ttl_minutes)})}
+    since = since or {}
+    written: dict[str, int] = {}
+    for name in groups or GROUPS:
+        series, fetch = GROUPS[name]
+        if not force and all(s in marks and marks[s]["fresh"] for s in series):
+            written[name] = 0
+            continue
+        start = _fetch_start(marks, series, since.get(name, START))
+        try:
+            frame = fetch(start)
+        except Exception as exc:  # noqa: BLE001 — an outage must not break the build
+            logger.warning("Market refresh '{}' failed ({}) — using stored rows.",
+                           name, str(exc)[:100])
+            continue
+        written[name] = _store(engine, frame, series)
+        logger.info("Market refresh '{}': {} rows from {}", name, written[name], start)
+    return written
+
+
+def load_market_data(engine=None, series=None) -> pd.DataFrame:
+    """Stored series as a wide date-indexed frame (columns = series; empty when none stored)."""
+    engine = engine or get_engine()
+    series = list(series) if series else [s for ss, _ in GROUPS.values() for s in ss]
+    ensure_market_tables(engine)
+    with engine.connect() as conn:
+        long = pd.read_sql(_LOAD_SQL, conn, params={"series": series})
+    if long.empty:
+        return pd.DataFrame(columns=series, index=pd.DatetimeIndex([], name="date"))
+    wide = long.pivot(index="date", columns="series", values="value")
+    wide.index = pd.to_datetime(wide.index)
+    wide.columns.name = None
+    return wide.sort_index()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Refresh the local market-data store.")
+    parser.add_argument("--group", choices=list(GROUPS), action="append",
+                        help="Only this source group (repeatable; default: all).")
+    parser.add_argument("--force", action="store_true", help="Ignore the refresh TTL.")
+    args = parser.parse_args()
+    refresh_market_data(groups=args.group, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
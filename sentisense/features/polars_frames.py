@@ -0,0 +1,150 @@
+"""Polars implementations of the dataset builders' frame-assembly steps.
+
+Selected with ``SENTISENSE_FEATURE_ENGINE=polars`` (needs the ``polars`` extra). The pandas
+path in :mod:`sentisense.features.dataset` does the per-source pivot as one ``pivot`` per
+score column plus a ``concat``, maps source names row by row with ``.apply``, and chains
+``.join`` calls across the ~800-column fused frame. Here the same steps are lazy Polars
+queries. The per-source block is one multi-column pivot, the source → group mapping is a
+``replace_strict`` over the distinct sources, and the Fri/Sat → Sun rollover is a
+column-parallel group-by on the trading day each row rolls to. That day is found by the same
+``searchsorted`` the pandas path uses.
+
+Frames cross the boundary as per-column numpy arrays (no pyarrow). The ``.join`` chain
+becomes one ``pd.concat`` of the aligned blocks. Those blocks are already pandas, and
+re-encoding ~800 columns into Polars would cost more than the concat itself.
+
+Every function takes and returns pandas frames with the same index, columns and NaN
+semantics as its pandas counterpart (see ``tests/test_feature_engine.py``). Finance, TA-125,
+cross-asset features and ``_finalize`` stay in pandas: they are narrow time-series steps.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from sentisense.constants import SCORE_COLUMNS
+
+_SCORE_COLS = list(SCORE_COLUMNS)
+_RELEVANCE_COLS = [c for c in _SCORE_COLS if c != "global_sentiment"]
+
+
+def _safe_col(name: str) -> str:
+    return "".join(ch if (ch.isalnum() or ch in "_-") else "_" for ch in str(name))
+
+
+def _from_pandas(df: pd.DataFrame) -> pl.DataFrame:
+    """Column-wise numpy hand-off; NaN becomes null so aggregations skip it like pandas."""
+    return pl.DataFrame({c: df[c].to_numpy() for c in df.columns}, nan_to_null=True)
+
+
+def _to_pandas(frame: pl.DataFrame, index: str = "date") -> pd.DataFrame:
+    out = pd.DataFrame({c: frame[c].to_numpy() for c in frame.columns})
+    return out.set_index(index)
+
+
+def _daily_totals(agg: pd.DataFrame) -> pl.LazyFrame:
+    """Per-date sums over sources, with the per-column means (NaN where nothing was scored)."""
+    return (
+        _from_pandas(agg.drop(columns="source")).lazy()
+        .group_by("date").agg(pl.all().sum())
+        .with_columns([(pl.col(f"sum_{c}") / pl.col(f"n_{c}")).alias(c) for c in _SCORE_COLS])
+        .sort("date")
+    )
+
+
+def build_daily_mean(agg: pd.DataFrame) -> pd.DataFrame:
+    out = _daily_totals(agg).select(
+        "date", *[pl.col(c).alias(f"mean_{c}") for c in _SCORE_COLS],
+        pl.col("n").cast(pl.Int64).alias("n_headlines"),
+    ).collect()
+    return _to_pandas(out)
+
+
+def build_per_source_wide(agg: pd.DataFrame, top_n: int,
+                          top_sources: list[str] | None = None) -> pd.DataFrame:
+    lf = _from_pandas(agg[["date", "source", "n", *[f"sum_{c}" for c in _SCORE_COLS]]]).lazy()
+    per_source = lf.group_by("source").agg(pl.col("n").sum()).collect()
+    top = set(top_sources if top_sources is not None else
+              per_source.sort(["n", "source"], descending=[True, False])
+              .head(top_n)["source"].to_list())
+    groups = {s: (_safe_col(s) if s in top else "_other") for s in per_source["source"].to_list()}
+    values = [*_SCORE_COLS, "count"]
+    grouped = (
+        lf.with_columns(pl.col("source").replace_strict(groups).alias("source_group"))
+        .group_by("date", "source_group")
+        .agg(*[pl.col(f"sum_{c}").sum().cast(pl.Float64).alias(c) for c in _SCORE_COLS],
+             pl.col("n").sum().cast(pl.Float64).alias("count"))
+        .collect()
+    )
+    wide = grouped.pivot(on="source_group", index="date", values=values).sort("date").fill_null(0.0)
+    order = [f"{col}_{g}" for col in values for g in sorted(set(groups.values()))]
+    return _to_pandas(wide.select("date", *[c for c in order if c in wide.columns]))
+
+
+def build_interactions(agg: pd.DataFrame) -> pd.DataFrame:
+    n = pl.col("n_global_sentiment").cast(pl.Float64)
+    s1 = pl.col("sum_global_sentiment").cast(pl.Float64)
+    var = (pl.col("sum_sq_sentiment") - s1 * s1 / n) / (n - 1)
+    sent = pl.col("global_sentiment")
+    out = _daily_totals(agg).select(
+        "date",
+        (pl.col("relevance_economy") * sent).alias("ix_econ_sent"),
+        (pl.col("relevance_security") * sent).alias("ix_sec_sent"),
+        (pl.col("relevance_politics") * sent).alias("ix_pol_sent"),
+        pl.sum_horizontal([pl.col(c).fill_nan(None) for c in _RELEVANCE_COLS])
+        .alias("ix_total_relevance"),
+        pl.when(n > 0).then(pl.col("sum_abs_sentiment") / n).alias("ix_sent_intensity"),
+        pl.when(n > 1).then(var.clip(lower_bound=0).sqrt()).alias("ix_sent_dispersion"),
+    ).collect()
+    return _to_pandas(out).astype(float)
+
+
+def _rolled(df: pd.DataFrame, trading_days: pd.DatetimeIndex, how: str) -> pl.LazyFrame:
+    """``df`` (date-indexed) grouped onto the first trading day ≥ each date (``how`` = mean|sum).
+
+    NULL results of a group (every input NaN) come back as NaN, as pandas' groupby does.
+    """
+    cols = list(df.columns)
+    arr = np.asarray(trading_days)
+    pos = np.searchsorted(arr, df.index.values, side="left")
+    mask = pos < len(arr)
+    # Column-major, so Polars adopts each column as a contiguous slice (free when pandas already
+    # hands back its consolidated block, which is stored transposed).
+    values = np.asfortranarray(df.to_numpy(dtype=np.float64))
+    # NaN → null only where present: a dense centroid block skips the conversion entirely.
+    nan_cols = {c for c, has in zip(cols, np.isnan(values[mask]).any(axis=0)) if has}
+    attached = (pl.from_numpy(values, schema=cols).lazy()
+                .with_columns(pl.col(sorted(nan_cols)).fill_nan(None),
+                              _td=pl.Series(arr[np.minimum(pos, len(arr) - 1)]))
+                .filter(pl.Series(mask)))
+    agg = [getattr(pl.col(c), how)().fill_null(float("nan")) if c in nan_cols
+           else getattr(pl.col(c), how)() for c in cols]
+    calendar = pl.DataFrame({"_td": arr}).lazy()
+    return calendar.join(attached.group_by("_td").agg(agg), on="_td", how="left",
+                         maintain_order="left").select(cols)
+
+
+def _indexed(frame: pl.DataFrame, trading_days: pd.DatetimeIndex) -> pd.DataFrame:
+    return pd.DataFrame(frame.to_numpy(), columns=frame.columns,
+                        index=trading_days.rename(trading_days.name or "date"))
+
+
+def roll_to_trading_days(df: pd.DataFrame, trading_days: pd.DatetimeIndex, agg: str) -> pd.DataFrame:
+    """Polars ``_roll_to_trading_days``: roll Fri/Sat → Sun, aggregate, 0 on days with no rows."""
+    return _indexed(_rolled(df, trading_days, agg).fill_null(0.0).collect(), trading_days)
+
+
+def roll_mean_and_count(dm: pd.DataFrame, trading_days: pd.DatetimeIndex) -> pd.DataFrame:
+    """Polars ``_roll_mean_and_count``: mean scores + summed ``n_headlines``, NaN on empty days."""
+    score_cols = [c for c in dm.columns if c != "n_headlines"]
+    parts = [_rolled(dm[score_cols], trading_days, "mean")]
+    if "n_headlines" in dm.columns:
+        parts.append(_rolled(dm[["n_headlines"]], trading_days, "sum"))
+    return _indexed(pl.concat(parts, how="horizontal").collect(), trading_days)
+
+
+def join_blocks(base: pd.DataFrame, *blocks: pd.DataFrame) -> pd.DataFrame:
+    """LEFT-join date-indexed ``blocks`` onto ``base`` as one concat (no per-join copy)."""
+    return pd.concat([base, *(b.reindex(base.index) for b in blocks)], axis=1)
@@ -0,0 +1,238 @@
+"""Incrementally maintained fused serving frame (the champion's daily predict input).
+
+``champion.predict_today`` needs the whole fused frame: labeled history to (re)train on, plus
+the trailing ``Target == -1`` rows to predict. Rebuilding it every night rolls, joins and
+feature-engineers the full history just to add one day. This module keeps the last frame on
+disk (``sentisense_cache/serving/``) and recomputes only its tail:
+
+* the last ``_RECOMPUTE`` stored rows (late news or embeddings for those days), the rows that
+  were still unlabeled, and any new trading days;
+* each recompute reads only the inputs from ``_WARMUP`` trading days before its first row.
+  That warm-up covers every rolling window in ``add_ta125_features`` and
+  ``add_cross_asset_features`` (the 20-day std/volume z-score after a one-day shift is the
+  widest), so the recomputed rows equal a full build's;
+* the per-source pivot keeps the top sources ranked at the last full build.
+
+Every ``SENTISENSE_SERVE_FULL_EVERY`` days (default 7; ``0`` = always) the frame is rebuilt in
+full through ``build_fused_dataset``. The appended frame is compared against it first, and
+any drift is logged (a re-ranked source, a refit derived basis, back-filled history). A
+calendar or column change the tail cannot absorb also triggers a full rebuild, as does a
+missing state or a change in the feature code.
+
+Run:
+    uv run python -m sentisense.features.serving          # bring the frame up to date
+    uv run python -m sentisense.features.serving --full   # full rebuild + drift check
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from sentisense.config import EMBED_MODEL, SERVE_FULL_EVERY, TOP_N_SOURCES
+from sentisense.constants import REPO_ROOT
+from sentisense.db import get_engine
+
+_ROOT = REPO_ROOT / "sentisense_cache" / "serving"
+_FAR_FUTURE = dt.date(2100, 1, 1)
+_WARMUP = 40      # trading days of context before the first recomputed row (widest window: 21)
+_RECOMPUTE = 5    # trailing stored rows rebuilt every run (late news / embeddings)
+
+
+class _StaleState(Exception):
+    """The stored frame cannot be extended in place; a full rebuild is needed."""
+
+
+def _state_path(params: dict):
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+    return _ROOT / f"fused-{digest}.pkl"
+
+
+def _read_state(path) -> dict | None:
+    if not path.exists():
+        return None
+    try:
+        return pd.read_pickle(path)
+    except Exception as exc:  # noqa: BLE001 — a truncated state is just a missing one
+        logger.warning("Unreadable serving state {} ({}) — rebuilding.", path.name, exc)
+        return None
+
+
+def _write_state(path, state: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    pd.to_pickle(state, tmp)
+    tmp.replace(path)
+
+
+def _full_frame(engine, params: dict) -> tuple[pd.DataFrame, list[str]]:
+    """Full fused build (frame cache applies) and the top sources it pivoted on."""
+    from sentisense.features.dataset import _top_sources, build_fused_dataset
+    from sentisense.features.source_scores import load_source_totals
+
+    frame = build_fused_dataset(engine, top_n=params["top_n"], cutoff=_FAR_FUTURE,
+                                overnight=params["overnight"], horizon=params["horizon"],
+                                keep_unlabeled=True)
+    return frame, _top_sources(load_source_totals(engine, _FAR_FUTURE), params["top_n"])
+
+
+def append_tail(frame: pd.DataFrame, base: pd.DataFrame, price_full: pd.Series, load_inputs, *,
+                top_sources: list[str], params: dict) -> tuple[pd.DataFrame, int]:
+    """Recompute ``frame``'s tail and append new trading days; returns ``(frame, n_new)``.
+
+    Args:
+        frame: the stored serving frame (``_finalize(..., keep_unlabeled=True)`` output).
+        base, price_full: the current finance base and TA-125 closes (``_finance_base``).
+        load_inputs: ``start -> (scores, centroid, derived)`` for dates ≥ ``start``
+            (``None`` = from the beginning).
+
+    Raises:
+        _StaleState: the calendar before the tail changed, or the tail grew columns
+            the stored frame does not have.
+    """
+    from sentisense.features.dataset import _feature_ops, _finalize, _fused_features
+
+    trading_days = base.index
+    if len(frame) < _RECOMPUTE:
+        raise _StaleState(f"only {len(frame)} stored rows")
+    unlabeled = frame.index[frame["Target"] == -1]
+    start_day = min(frame.index[-_RECOMPUTE], unlabeled.min() if len(unlabeled) else frame.index[-1])
+    i = int(trading_days.searchsorted(start_day))
+    kept = frame[frame.index < start_day]
+    if not trading_days[:i].equals(kept.index):
+        raise _StaleState("trading calendar changed before the tail")
+
+    w0 = max(i - _WARMUP, 0)
+    # News dated after the previous trading day rolls onto the window's first day.
+    start = (trading_days[w0 - 1] + pd.Timedelta(days=1)).date() if w0 else None
+    scores, cen, der = load_inputs(start)
+    if scores.empty or cen.empty:
+        raise _StaleState("no scores/embeddings in the tail window")
+    feat = _fused_features(_feature_ops(), scores, cen, der, base.iloc[w0:], price_full,
+                           top_n=params["top_n"], overnight=params["overnight"],
+                           top_sources=top_sources)
+    tail = _finalize(feat, _FAR_FUTURE, params["horizon"], keep_unlabeled=True).iloc[i - w0:]
+    extra = tail.columns.difference(frame.columns)
+    if len(extra):
+        raise _StaleState(f"new columns {list(extra[:5])}")
+    # Columns absent from the window (a source group with no rows in it) are 0 in a full build.
+    tail = tail.reindex(columns=frame.columns, fill_value=0).astype(frame.dtypes.to_dict())
+    return pd.concat([kept, tail]), int((tail.index > frame.index[-1]).sum())
+
+
+def _loader(engine):
+    from sentisense.embed import load_daily_centroid
+    from sentisense.embed.derived import load_embedding_derived
+    from sentisense.features.source_scores import load_daily_source_scores
+
+    def load(start):
+        return (load_daily_source_scores(engine, _FAR_FUTURE, start),
+                load_daily_centroid(engine, _FAR_FUTURE, start=start),
+                load_embedding_derived(engine, _FAR_FUTURE, start=start))
+    return load
+
+
+def _incremental(engine, state: dict, params: dict) -> tuple[pd.DataFrame, int]:
+    from sentisense.features.dataset import _finance_base, _refresh_inputs
+
+    _refresh_inputs(engine, ("scores", "centroid"))
+    base, _, price_full = _finance_base(engine=engine)
+    return append_tail(state["frame"], base, price_full, _loader(engine),
+                       top_sources=state["top_sources"], params=params)
+
+
+def compare_frames(appended: pd.DataFrame, full: pd.DataFrame, *, rtol: float = 1e-6,
+                   atol: float = 1e-9) -> dict:
+    """Rows/columns on which the appended frame disagrees with a full rebuild."""
+    rows = appended.index.intersection(full.index)
+    cols = appended.columns.intersection(full.columns)
+    a = appended.loc[rows, cols].to_numpy(np.float64)
+    b = full.loc[rows, cols].to_numpy(np.float64)
+    bad = ~np.isclose(a, b, rtol=rtol, atol=atol)
+    return {
+        "rows": len(rows),
+        "rows_differ": int(bad.any(axis=1).sum()),
+        "max_abs_diff": float(np.abs(a - b).max()) if a.size else 0.0,
+        "cols_differ": list(cols[bad.any(axis=0)]),
+        "cols_only_appended": list(appended.columns.difference(full.columns)),
+        "cols_only_full": list(full.columns.difference(appended.columns)),
+        "days_missing": len(full.index.difference(appended.index)),
+    }
+
+
+def _log_drift(report: dict) -> None:
+    drift = (report["rows_differ"] or report["cols_only_appended"] or report["cols_only_full"]
+             or report["days_missing"])
+    (logger.warning if drift else logger.info)(
+        "Serving frame vs full rebuild: {}/{} rows differ (max |Δ| {:.3g}; cols {}), "
+        "columns only appended/full {}/{}, {} day(s) missing",
+        report["rows_differ"], report["rows"], report["max_abs_diff"], report["cols_differ"][:5],
+        report["cols_only_appended"][:5], report["cols_only_full"][:5], report["days_missing"])
+
+
+def serving_frame(engine=None, *, overnight: bool = True, horizon: int = 1,
+                  top_n: int = TOP_N_SOURCES, full: bool = False,
+                  full_every: int = SERVE_FULL_EVERY) -> pd.DataFrame:
+    """The fused frame for serving (labeled rows + ``Target == -1`` rows to predict).
+
+    Same content as ``build_fused_dataset(cutoff=far future, keep_unlabeled=True)``, kept
+    up to date by recomputing its tail. ``full`` (or a state older than ``full_every``
+    days) rebuilds it in full and logs how far the appended frame had drifted.
+    """
+    from sentisense.features.frame_cache import code_version
+
+    engine = engine or get_engine()
+    params = {"overnight": overnight, "horizon": horizon, "top_n": top_n, "model": EMBED_MODEL}
+    path = _state_path(params)
+    state = _read_state(path)
+    today = dt.date.today()
+    if state is not None and state.get("code") != code_version():
+        logger.info("Feature code changed since the serving frame was built — full rebuild.")
+        state, full = None, True
+    due = full or state is None or full_every <= 0 or (today - state["built_on"]).days >= full_every
+
+    appended = None
+    if state is not None:
+        try:
+            appended, n_new = _incremental(engine, state, params)
+        except _StaleState as exc:
+            logger.info("Serving frame cannot be extended ({}) — full rebuild.", exc)
+            due = True
+    if not due:
+        logger.info("Serving frame extended in place: {} new trading day(s) → {}", n_new,
+                    appended.shape)
+        _write_state(path, {**state, "frame": appended})
+        return appended
+
+    frame, top_sources = _full_frame(engine, params)
+    if frame.empty:
+        return frame
+    if appended is not None:
+        _log_drift(compare_frames(appended, frame))
+    _write_state(path, {"frame": frame, "top_sources": top_sources, "built_on": today,
+                        "code": code_version(), "params": params})
+    logger.info("Serving frame rebuilt in full: {}", frame.shape)
+    return frame
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bring the incremental serving frame up to date.")
+    parser.add_argument("--full", action="store_true",
+                        help="Rebuild in full and log the drift of the appended frame.")
+    parser.add_argument("--no-overnight", action="store_true", help="Close(T) decision frame.")
+    args = parser.parse_args()
+    frame = serving_frame(overnight=not args.no_overnight, full=args.full)
+    if not frame.empty:
+        logger.info("{} rows ({} … {}), {} to predict", len(frame), frame.index.min().date(),
+                    frame.index.max().date(), int((frame["Target"] == -1).sum()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Materialised per-(date, source) score aggregates (``daily_source_scores`` table).
+
+Every dataset build used to pull one row per validated headline (~3M rows, ``DISTINCT ON``
+over ``nlp_vectors``) into pandas and group it three ways — daily means, the per-source SUM
+pivot and the sentiment×relevance interactions. All three are exact functions of per-(date,
+source) sums and non-NULL counts, so those are kept in Postgres instead (migration 017) and
+the builders read a few thousand rows per build.
+
+Maintenance follows the centroid table (``sentisense.embed.centroid``): a single-row watermark
+holds the highest folded ``nlp_vectors.id`` and the number of validated rows at or below it.
+A refresh re-aggregates — in SQL, over the latest validated score per headline — only the
+dates of headlines that received a validated score above the watermark, and replaces those
+rows. A re-score of an old headline therefore lands on its date; a deleted or late-committed
+vector row below the watermark shows up as a count mismatch and triggers a rebuild.
+
+Run (server-side; the daily pipeline refreshes it after scoring):
+    uv run python -m sentisense.features.source_scores            # incremental refresh
+    uv run python -m sentisense.features.source_scores --rebuild  # re-aggregate every date
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import text
+
+from sentisense.constants import CUTOFF_DATE, REPO_ROOT, SCORE_COLUMNS
+from sentisense.db import get_engine
+from sentisense.embed.derived import _split_sql
+
+_MIGRATION = REPO_ROOT / "sentisense" / "db" / "migrations" / "017_daily_source_scores.sql"
+_SCORE_COLS = list(SCORE_COLUMNS)
+
+# Transaction-scoped lock: serialises refreshes even before the watermark row exists (first run)
+# and across a rebuild, which never reads it.
+_LOCK_SQL = text("SELECT pg_advisory_xact_lock(hashtext('daily_source_scores'))")
+_WATERMARK_SQL = text(
+    "SELECT last_vector_id, n_vectors FROM daily_source_scores_watermark WHERE id = 1 FOR UPDATE"
+)
+_COVERED_SQL = text(
+    "SELECT count(*) FROM nlp_vectors WHERE validation_passed = TRUE AND id <= :last_id"
+)
+_HEAD_SQL = text(
+    "SELECT COALESCE(MAX(id), :last_id) AS last_id, count(*) AS n FROM nlp_vectors "
+    "WHERE validation_passed = TRUE AND id > :last_id"
+)
+_DIRTY_DATES_SQL = text(
+    """
+    SELECT DISTINCT rh.date
+    FROM nlp_vectors nv
+    JOIN raw_headlines rh ON rh.id = nv.headline_id
+    WHERE nv.validation_passed = TRUE AND nv.id > :last_id AND nv.id <= :new_id
+    """
+)
+# Latest validated score per headline (same DISTINCT ON contract the builders always used),
+# aggregated per (date, source). NULL scores are skipped by SUM/COUNT, as pandas skips NaN.
+_AGG_SELECT = """
+    INSERT INTO daily_source_scores (
+        date, source, n, {sum_cols}, {n_cols}, sum_abs_sentiment, sum_sq_sentiment)
+    SELECT s.date, s.source, COUNT(*), {sum_exprs}, {n_exprs},
+           COALESCE(SUM(ABS(s.global_sentiment)), 0),
+           COALESCE(SUM(s.global_sentiment::BIGINT * s.global_sentiment), 0)
+    FROM (
+        SELECT DISTINCT ON (rh.id) rh.date, rh.source, {nv_cols}
+        FROM raw_headlines rh
+        JOIN nlp_vectors nv ON nv.headline_id = rh.id
+        WHERE nv.validation_passed = TRUE {{where}}
+        ORDER BY rh.id, nv.created_at DESC, nv.id DESC
+    ) s
+    GROUP BY s.date, s.source
+""".format(
+    sum_cols=", ".join(f"sum_{c}" for c in _SCORE_COLS),
+    n_cols=", ".join(f"n_{c}" for c in _SCORE_COLS),
+    sum_exprs=", ".join(f"COALESCE(SUM(s.{c}), 0)" for c in _SCORE_COLS),
+    n_exprs=", ".join(f"COUNT(s.{c})" for c in _SCORE_COLS),
+    nv_cols=", ".join(f"nv.{c}" for c in _SCORE_COLS),
+)
+_AGG_ALL_SQL = text(_AGG_SELECT.format(where=""))
+_AGG_DATES_SQL = text(_AGG_SELECT.format(where="AND rh.date = ANY(:dates)"))
+_WATERMARK_UPSERT = text(
+    """
+    INSERT INTO daily_source_scores_watermark (id, last_vector_id, n_vectors)
+    VALUES (1, :last_id, :n_vectors)
+    ON CONFLICT (id) DO UPDATE
+        SET last_vector_id = EXCLUDED.last_vector_id, n_vectors = EXCLUDED.n_vectors,
+            updated_at = NOW()
+    """
+)
+_LOAD_SQL = text("SELECT * FROM daily_source_scores WHERE date BETWEEN :start AND :cutoff "
+                 "ORDER BY date, source")
+_TOTALS_SQL = text("SELECT source, SUM(n) AS n FROM daily_source_scores WHERE date <= :cutoff "
+                   "GROUP BY source")
+
+
+def ensure_source_scores_table(engine=None) -> None:
+    """Apply the score-aggregates migration (idempotent CREATE TABLE IF NOT EXISTS)."""
+    engine = engine or get_engine()
+    with engine.begin() as conn:
+        for stmt in _split_sql(_MIGRATION.read_text(encoding="utf-8")):
+            conn.execute(text(stmt))
+
+
+def refresh_daily_source_scores(engine=None, *, rebuild: bool = False) -> int:
+    """Re-aggregate the dates touched by validated scores above the watermark.
+
+    Args:
+        rebuild: drop every row and the watermark first, then aggregate the whole corpus.
+
+    Returns:
+        The number of (date, source) rows written by this call.
+    """
+    engine = engine or get_engine()
+    ensure_source_scores_table(engine)
+    with engine.begin() as conn:
+        conn.execute(_LOCK_SQL)
+        mark = None if rebuild else conn.execute(_WATERMARK_SQL).fetchone()
+        if mark is not None:
+            covered = conn.execute(_COVERED_SQL, {"last_id": mark.last_vector_id}).scalar()
+            if covered != mark.n_vectors:
+                logger.warning("Score aggregates cover {:,} validated vectors but {:,} exist at "
+                               "or below id {} (delete or late commit) — rebuilding.",
+                               mark.n_vectors, covered, mark.last_vector_id)
+                mark = None
+        last_id, n_vectors = (mark.last_vector_id, mark.n_vectors) if mark is not None else (-1, 0)
+        head = conn.execute(_HEAD_SQL, {"last_id": last_id}).fetchone()
+
+        if mark is None:
+            conn.execute(text("DELETE FROM daily_source_scores"))
+            written = conn.execute(_AGG_ALL_SQL).rowcount
+            n_dates = "all"
+        else:
+            dates = [r.date for r in conn.execute(_DIRTY_DATES_SQL, {"last_id": last_id,
+                                                                     "new_id": head.last_id})]
+            written, n_dates = 0, len(dates)
+            if dates:
+                conn.execute(text("DELETE FROM daily_source_scores WHERE date = ANY(:dates)"),
+                             {"dates": dates})
+                written = conn.execute(_AGG_DATES_SQL, {"dates": dates}).rowcount
+        conn.execute(_WATERMARK_UPSERT, {"last_id": head.last_id,
+                                         "n_vectors": n_vectors + head.n})
+    logger.info("Score aggregates: {:,} new validated vectors → {:,} (date, source) rows over {} "
+                "dates (watermark {} → {})", head.n, written, n_dates, last_id, head.last_id)
+    return written
+
+
+def load_daily_source_scores(engine=None, cutoff=CUTOFF_DATE, start=None) -> pd.DataFrame:
+    """Stored aggregates in ``[start, cutoff]``: one row per (date, source), ``date`` as datetime64."""
+    engine = engine or get_engine()
+    with engine.connect() as conn:
+        agg = pd.read_sql(_LOAD_SQL, conn, params={"start": start or dt.date.min, "cutoff": cutoff})
+    agg["date"] = pd.to_datetime(agg["date"])
+    return agg.drop(columns=["updated_at"])
+
+
+def load_source_totals(engine=None, cutoff=CUTOFF_DATE) -> pd.Series:
+    """Headline count per source over every stored date ≤ ``cutoff`` (the top-N ranking input)."""
+    engine = engine or get_engine()
+    with engine.connect() as conn:
+        rows = conn.execute(_TOTALS_SQL, {"cutoff": cutoff}).fetchall()
+    return pd.Series({r.source: int(r.n) for r in rows}, name="n", dtype="int64")
+
+
+def stored_daily_source_scores(engine=None, cutoff=CUTOFF_DATE, *,
+                               refresh: bool = True) -> pd.DataFrame:
+    """Incrementally refresh the aggregates, then read them (the dataset builders' entry point)."""
+    engine = engine or get_engine()
+    if refresh:
+        refresh_daily_source_scores(engine)
+    return load_daily_source_scores(engine, cutoff)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Refresh the per-(date, source) score aggregates.")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Drop every row and re-aggregate the whole corpus.")
+    args = parser.parse_args()
+    refresh_daily_source_scores(rebuild=args.rebuild)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,6 @@ latest trading day(s) with an unknown next-day close are retained as ``Target ==
 
 from __future__ import annotations
 
-import datetime as dt
 import json
 
 import numpy as np
@@ -26,7 +25,6 @@ from sentisense.constants import REPO_ROOT
 from sentisense.db import get_engine
 
 CHAMPION_PATH = REPO_ROOT / "models" / "champion.json"
-_FAR_FUTURE = dt.date(2100, 1, 1)
 
 # Pinned default champion. Params are a sane XGBoost config (not daily-re-tuned — that's the
 # challenger's job). datatype/regime/overnight define the feature frame it serves on.
@@ -94,11 +92,11 @@ def save_champion(cfg: dict) -> None:
 
 
 def _serving_frames(engine, cfg: dict) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Build the fused serving frame → ``(labeled, to_predict)`` split on the -1 sentinel."""
-    from sentisense.features import build_fused_dataset
+    """The fused serving frame (extended in place, see ``features.serving``) → ``(labeled,
+    to_predict)`` split on the -1 sentinel."""
+    from sentisense.features.serving import serving_frame
 
-    df = build_fused_dataset(engine, cutoff=_FAR_FUTURE, overnight=bool(cfg.get("overnight", True)),
-                             keep_unlabeled=True)
+    df = serving_frame(engine, overnight=bool(cfg.get("overnight", True)))
     if df.empty:
         return df, df
     labeled = df[df["Target"] != -1].copy()
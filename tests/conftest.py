@@ -0,0 +1,9 @@
+"""Shared test setup."""
+
+from __future__ import annotations
+
+import os
+
+# Importing processing_engine adds a loguru file sink under SENTISENSE_LOG_DIR (default
+# "logs", relative to the cwd); keep test runs from writing one into the checkout.
+os.environ["SENTISENSE_LOG_DIR"] = ""
@@ -0,0 +1,110 @@
+"""Compact tool-evidence format: terse hits only, bigger batches, golden-set comparison helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("regex")
+
+import processing_engine.fast_pipeline as fp  # noqa: E402
+import processing_engine.tokens as tokens  # noqa: E402
+from evaluation import compare_evidence  # noqa: E402
+from processing_engine.models import BatchHeadlineScores, HeadlineScoreEntry  # noqa: E402
+from processing_engine.tokens import TokenCounter  # noqa: E402
+
+_HEADLINE = "בנק ישראל העלה את הריבית ב-0.25% בעקבות האינפלציה; הבורסה בתל אביב ירדה"
+
+
+def test_compact_drops_empty_sections_and_dedupes():
+    full = fp.precompute_tool_evidence(_HEADLINE)
+    compact = fp.precompute_tool_evidence(_HEADLINE, "compact")
+    assert "No " in full and "detected" in full
+    assert "detected" not in compact
+    assert compact.startswith("words:")
+    assert "eco:" in compact and "→" in compact
+    terms = [tok.split("→")[0] for line in compact.splitlines()[1:] for tok in line.split("; ")]
+    assert len(terms) == len(set(terms))
+    assert len(compact) * 5 < len(full)
+
+
+def test_compact_without_hits_says_so():
+    assert fp.precompute_tool_evidence("החתול ישן על הספה", "compact").endswith("(no signals)")
+
+
+def test_many_matches_single_and_rejects_unknown_format():
+    texts = [_HEADLINE, "החתול ישן על הספה", _HEADLINE]
+    assert fp.precompute_tool_evidence_many(texts, "compact") == [
+        fp.precompute_tool_evidence(t, "compact") for t in texts
+    ]
+    with pytest.raises(ValueError):
+        fp.precompute_tool_evidence(_HEADLINE, "tiny")
+    with pytest.raises(ValueError):
+        fp.precompute_tool_evidence_many(texts, "tiny")
+
+
+def test_compact_raises_batch_ceiling_and_adds_legend():
+    assert fp.max_batch_size("compact") > 1.5 * fp.max_batch_size("full")
+    assert fp.max_batch_size("full") == fp.MAX_BATCH_SIZE
+    prompt = fp._with_legend(fp._BATCH_SYSTEM_PROMPT, "compact")
+    assert prompt.startswith(fp._BATCH_SYSTEM_PROMPT) and "tag:term→gloss" in prompt
+    assert fp._with_legend(fp._BATCH_SYSTEM_PROMPT, "full") == fp._BATCH_SYSTEM_PROMPT
+
+
+class _RecordingLLM:
+    """Answers every batch with zeros and keeps the messages it was sent."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[dict]] = []
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, messages):
+        self.calls.append(messages)
+        n = messages[1]["content"].count("## Headline [")
+        return BatchHeadlineScores(results=[
+            HeadlineScoreEntry(
+                headline_index=i, chain_of_thought="", politics_government=0,
+                economy_finance=3, security_military=0, health_medicine=0,
+                science_climate=0, technology=0, global_sentiment=-1,
+            )
+            for i in range(n)
+        ])
+
+
+def test_batch_scoring_sends_compact_evidence(monkeypatch):
+    monkeypatch.setattr(tokens, "_counter", TokenCounter())
+    monkeypatch.setattr(fp, "PACKING_STATS", fp.PackingStats())
+    llm = _RecordingLLM()
+    obs = [{"headline": _HEADLINE} for _ in range(6)]
+    results = asyncio.run(fp.score_headlines_batch(
+        obs, llm=llm, batch_size=6, evidence_format="compact",
+    ))
+    assert all(r["validation_passed"] for r in results)
+    system, user = llm.calls[0][0]["content"], llm.calls[0][1]["content"]
+    assert "Tool Evidence Format (compact)" in system
+    assert "detected" not in user and "eco:" in user
+
+
+def test_comparison_helpers(tmp_path):
+    golden = tmp_path / "golden.csv"
+    golden.write_text(
+        "headline," + ",".join(compare_evidence.CATEGORY_COLUMNS) + "\n"
+        f"\"{_HEADLINE}\",0,9,0,0,0,0\n",
+        encoding="utf-8",
+    )
+    rows = compare_evidence.load_golden_rows(golden)
+    assert rows[0]["economy_finance"] == 9
+
+    stats = compare_evidence.evidence_token_stats([_HEADLINE, "החתול ישן על הספה"])
+    assert stats["full"]["mean"] > stats["compact"]["mean"]
+    assert stats["ratio"]["mean"] > 5
+
+    full = [{"relevance_category_2": 9, "global_sentiment": -2}]
+    compact = [{"relevance_category_2": 7, "global_sentiment": -1}]
+    agree = compare_evidence.format_agreement(full, compact)
+    assert agree["relevance_within1"] == pytest.approx(5 / 6)
+    assert agree["sentiment_mae"] == 1.0
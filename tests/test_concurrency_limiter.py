@@ -0,0 +1,154 @@
+"""Adaptive (AIMD + latency-gradient) concurrency limit for LLM calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import urllib.error
+
+import pytest
+
+from processing_engine.concurrency import AdaptiveLimiter, classify_error
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int, msg: str = "") -> None:
+        super().__init__(msg or f"Error code: {status_code}")
+        self.status_code = status_code
+
+
+def test_error_classes():
+    assert classify_error(_StatusError(429)) == "overload"
+    assert classify_error(_StatusError(503)) == "overload"
+    assert classify_error(urllib.error.HTTPError("u", 502, "Bad Gateway", {}, None)) == "overload"
+    assert classify_error(TimeoutError()) == "timeout"
+    assert classify_error(urllib.error.URLError("timed out")) == "timeout"
+    assert classify_error(_StatusError(400, "maximum context length is 32768 tokens")) == "client"
+    assert classify_error(ValueError("bad json")) == "error"
+
+
+def test_additive_increase_and_multiplicative_decrease():
+    lim = AdaptiveLimiter(4, min_limit=1, max_limit=8)
+    for _ in range(4):
+        lim.record(1.0, "ok")
+    assert lim.limit == 4                          # +1/limit per call → +1 per round
+    lim.record(1.0, "ok")
+    assert lim.limit == 5
+
+    lim.record(1.0, "overload")
+    assert lim.limit == 3                          # 5.x × 0.7
+    lim.record(1.0, "overload")                    # same round-trip → no second cut
+    assert lim.limit == 3
+    assert lim.snapshot()["outcomes"] == {"ok": 5, "overload": 2}
+
+
+def test_unsaturated_or_neutral_calls_do_not_move_the_limit():
+    lim = AdaptiveLimiter(2, max_limit=8)
+    for _ in range(20):
+        lim.record(1.0, "ok", saturated=False)
+        lim.record(1.0, "client")
+    assert lim.limit == 2
+
+
+def test_latency_gradient_backs_off_before_errors():
+    lim = AdaptiveLimiter(8, max_limit=16, tolerance=2.0)
+    lim.record(1.0, "ok", tokens=100)              # baseline 10 ms/token
+    for _ in range(5):
+        lim.record(1.0, "ok", tokens=100, saturated=False)
+    assert lim.limit == 8
+    lim.record(10.0, "ok", tokens=100)             # queueing: 100 ms/token
+    assert lim.limit == 5                          # 8 × max(gradient, backoff)
+
+
+def test_fixed_and_configured_bounds():
+    fixed = AdaptiveLimiter.configured(4, adaptive=False)
+    for _ in range(50):
+        fixed.record(0.1, "ok")
+    fixed.record(0.1, "overload")
+    assert (fixed.limit, fixed.min_limit, fixed.max_limit) == (4, 4, 4)
+
+    lim = AdaptiveLimiter.configured(5, floor=2, ceiling=0)
+    assert (lim.min_limit, lim.max_limit) == (2, 10)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(4, min_limit=5, max_limit=8)
+
+
+def test_async_slots_cap_inflight_and_record_errors():
+    lim = AdaptiveLimiter(3, min_limit=3, max_limit=3)
+    state = {"now": 0, "max": 0}
+
+    async def call(i: int) -> None:
+        async with lim.slot(tokens=10):
+            state["now"] += 1
+            state["max"] = max(state["max"], state["now"])
+            await asyncio.sleep(0.002)
+            state["now"] -= 1
+            if i % 5 == 0:
+                raise _StatusError(429)
+
+    async def main() -> None:
+        await asyncio.gather(*(call(i) for i in range(20)), return_exceptions=True)
+
+    asyncio.run(main())
+    assert state["max"] == 3
+    assert lim.inflight == 0
+    assert lim.snapshot()["outcomes"] == {"ok": 16, "overload": 4}
+
+
+def test_thread_slots_cap_inflight():
+    lim = AdaptiveLimiter(2, min_limit=2, max_limit=2)
+    state = {"now": 0, "max": 0}
+    guard = threading.Lock()
+
+    def call() -> None:
+        with lim.slot_sync():
+            with guard:
+                state["now"] += 1
+                state["max"] = max(state["max"], state["now"])
+            time.sleep(0.005)
+            with guard:
+                state["now"] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert state["max"] == 2 and lim.inflight == 0
+
+
+def test_agent_node_times_each_attempt_without_rpm_waits(monkeypatch):
+    pytest.importorskip("langchain_core")
+    from types import SimpleNamespace
+
+    from processing_engine import nodes as N
+    from processing_engine.config import RetryConfig
+
+    lim = AdaptiveLimiter(2, min_limit=1, max_limit=4)
+    waits = []
+
+    async def throttled() -> None:
+        waits.append(lim.inflight)                 # the RPM wait holds no slot
+        await asyncio.sleep(0.05)
+
+    monkeypatch.setattr(N, "_agent_limiter", lim)
+    monkeypatch.setattr(N._rate_limiter, "acquire", throttled)
+    monkeypatch.setattr(N, "_retry_cfg", RetryConfig(max_attempts=2, wait_min=0, wait_max=0))
+
+    class _Agent:
+        calls = 0
+
+        async def ainvoke(self, _payload):
+            self.calls += 1
+            if self.calls == 1:
+                return {"messages": ["no tool call"]}  # no structured_response → retried
+            return {"structured_response": SimpleNamespace(score=3, chain_of_thought="")}
+
+    node = N.make_agent_node(_Agent(), "sentiment", "Sentiment")
+    out = asyncio.run(node({"headline": "h"}))
+
+    assert out["sentiment"]["score"] == 3 and out["sentiment"]["error"] is None
+    assert waits == [0, 0]
+    snap = lim.snapshot()
+    assert snap["calls"] == 2 and snap["mean_latency_s"] < 0.05
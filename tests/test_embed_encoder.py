@@ -0,0 +1,136 @@
+"""Embedding engine: length buckets, in-process EncoderPool, background DB writer, embed_missing."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import sentisense.embed.embeddings as E
+import sentisense.embed.encoder as enc
+
+
+class _FakeTokenizer:
+    def __call__(self, texts, add_special_tokens=True, truncation=True):
+        return {"input_ids": [t.split() for t in texts]}
+
+
+class _FakeEncoder:
+    """Deterministic 'embedding': (word count, batch size seen) — exposes the bucketing."""
+
+    tokenizer = _FakeTokenizer()
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts, normalize_embeddings, batch_size, show_progress_bar):
+        self.batches.append([len(t.split()) for t in texts])
+        return np.array([[len(t.split()), len(texts)] for t in texts], dtype=np.float64)
+
+
+class _FakeConn:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt, rows=None):
+        if rows is not None and "boom" in str(rows):
+            raise RuntimeError("insert failed")
+        self.log.append(rows)
+
+
+class _FakeEngine:
+    def __init__(self):
+        self.inserts = []
+
+    def begin(self):
+        return _FakeConn(self.inserts)
+
+    def connect(self):
+        return _FakeConn([])
+
+
+def test_length_buckets_group_similar_lengths_longest_first():
+    lengths = np.array([3, 9, 1, 7, 5, 2])
+    buckets = enc.length_buckets(lengths, 2)
+    assert [lengths[b].tolist() for b in buckets] == [[9, 7], [5, 3], [2, 1]]
+    assert sorted(np.concatenate(buckets).tolist()) == list(range(6))
+
+
+def test_encoder_pool_in_process_maps_vectors_back_to_inputs(monkeypatch):
+    fake = _FakeEncoder()
+    monkeypatch.setattr(enc, "load_encoder", lambda backend: fake)
+    monkeypatch.setattr(enc, "_BUCKET_WINDOW", 2)
+    texts = ["w " * n for n in [1, 6, 2, 5, 3, 4, 8]]
+
+    with enc.EncoderPool(workers=1, backend="torch") as pool:
+        out = list(pool.encode(texts, batch=2))
+
+    seen = np.concatenate([idx for idx, _ in out])
+    assert sorted(seen.tolist()) == list(range(len(texts)))
+    for idx, vecs in out:
+        assert vecs.dtype == np.float32
+        assert vecs[:, 0].tolist() == [len(texts[i].split()) for i in idx]
+    # Windows of 2 batches × 2 texts, each sorted longest-first.
+    assert fake.batches == [[6, 5], [2, 1], [8, 4], [3]]
+
+
+def test_background_writer_inserts_and_surfaces_errors():
+    engine = _FakeEngine()
+    with E._BackgroundWriter(engine, depth=1) as writer:
+        for i in range(5):
+            writer.put([{"headline_id": i}])
+    assert writer.written == 5 and [r[0]["headline_id"] for r in engine.inserts] == list(range(5))
+
+    with pytest.raises(RuntimeError, match="writer failed"):
+        with E._BackgroundWriter(_FakeEngine()) as writer:
+            writer.put([{"headline_id": "boom"}])
+            writer.put([{"headline_id": 1}])
+
+
+def test_embed_missing_writes_every_row_once(monkeypatch):
+    fake = _FakeEncoder()
+    monkeypatch.setattr(enc, "load_encoder", lambda backend: fake)
+    monkeypatch.setattr(E, "ensure_table", lambda engine: None)
+    monkeypatch.setattr(E, "EMBED_STORE", False)
+    todo = pd.DataFrame({"headline_id": [10, 11, 12, 13, 14],
+                         "headline": ["a b c", "a", "a b c d e", "a b", "a b c d"]})
+    monkeypatch.setattr(E.pd, "read_sql", lambda *a, **k: todo)
+    engine = _FakeEngine()
+
+    assert E.embed_missing(engine, batch=2, backend="torch") == 5
+    rows = {r["headline_id"]: r for batch in engine.inserts for r in batch}
+    assert sorted(rows) == [10, 11, 12, 13, 14]
+    for hid, headline in zip(todo["headline_id"], todo["headline"]):
+        vec = np.frombuffer(rows[hid]["embedding"], dtype=np.float32)
+        assert vec[0] == len(f"passage: {headline}".split())
+        assert rows[hid]["dim"] == 2 and rows[hid]["embed_model"] == E.EMBED_MODEL
+
+
+def test_quantised_vectors_get_their_own_embed_key(monkeypatch):
+    assert enc.embed_key("torch", "org/m") == enc.embed_key("onnx", "org/m") == "org/m"
+    assert enc.embed_key("onnx-int8", "org/m") == "org/m#onnx-int8"
+    assert enc.embed_key("onnx-int8", "org/m#onnx-int8") == "org/m#onnx-int8"
+    with pytest.raises(ValueError, match="full-precision"):
+        enc.embed_key("torch", "org/m#onnx-int8")             # would mix precisions
+
+    monkeypatch.setattr(enc, "load_encoder", lambda backend: _FakeEncoder())
+    monkeypatch.setattr(E, "ensure_table", lambda engine: None)
+    monkeypatch.setattr(E, "EMBED_STORE", False)
+    seen = {}
+
+    def read_sql(query, conn, params):
+        seen.update(params)
+        return pd.DataFrame({"headline_id": [1], "headline": ["a"]})
+
+    monkeypatch.setattr(E.pd, "read_sql", read_sql)
+    engine = _FakeEngine()
+    E.embed_missing(engine, backend="onnx-int8")
+    key = f"{E.EMBED_MODEL}#onnx-int8"
+    assert seen["model"] == key                               # "missing" means missing in the int8 set
+    assert [r["embed_model"] for batch in engine.inserts for r in batch] == [key]
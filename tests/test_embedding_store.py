@@ -0,0 +1,132 @@
+"""Memmapped embedding store: date-sorted append/merge, zero-copy range loads, float16 mode."""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sentisense.embed import embeddings as E
+from sentisense.embed.store import EmbeddingStore, _to_days
+
+
+def _batch(rng, ids, dates, dim=8):
+    return (np.asarray(ids, dtype=np.int64), _to_days(pd.to_datetime(dates)),
+            rng.standard_normal((len(ids), dim)).astype(np.float32))
+
+
+def _reference(batches):
+    ids = np.concatenate([b[0] for b in batches])
+    days = np.concatenate([b[1] for b in batches])
+    vecs = np.concatenate([b[2] for b in batches])
+    order = np.lexsort((ids, days))
+    return ids[order], days[order], vecs[order]
+
+
+def test_append_in_order_then_merge_older_rows(tmp_path):
+    rng = np.random.default_rng(0)
+    store = EmbeddingStore(tmp_path, model="org/m")
+    first = _batch(rng, [5, 1, 3, 2], ["2024-01-03", "2024-01-01", "2024-01-02", "2024-01-01"])
+    later = _batch(rng, [9, 8], ["2024-01-05", "2024-01-04"])
+    older = _batch(rng, [11, 12, 10], ["2024-01-02", "2024-01-01", "2024-01-04"])
+
+    store.append(*first, last_id=5)
+    size = (store.path / "vectors.npy").stat().st_size
+    store.append(*later, last_id=9)                          # in place: file only grows
+    assert (store.path / "vectors.npy").stat().st_size == size + 2 * 8 * 4
+    store.append(*older, last_id=12)                         # merge-insert rewrite
+
+    ids, days, vecs = store.arrays()
+    assert isinstance(vecs, np.memmap) and vecs.dtype == np.float32
+    assert np.all(np.diff(days) >= 0)
+    assert store.meta["n_rows"] == 9 and store.meta["last_headline_id"] == 12
+    assert store.exists()
+    ref_ids, _, ref_vecs = _reference([first, later, older])
+    by_id = dict(zip(ids.tolist(), np.asarray(vecs)))
+    for i, v in zip(ref_ids.tolist(), ref_vecs):
+        np.testing.assert_array_equal(by_id[i], v)
+
+
+def test_load_slices_date_range_by_binary_search(tmp_path):
+    rng = np.random.default_rng(1)
+    store = EmbeddingStore(tmp_path, model="m")
+    dates = pd.date_range("2024-01-01", periods=10, freq="D").repeat(3)
+    store.append(*_batch(rng, range(30), dates), last_id=29)
+
+    meta, vecs = store.load(cutoff="2024-01-04", start="2024-01-02")
+    assert len(meta) == len(vecs) == 9
+    assert meta["date"].min() == pd.Timestamp("2024-01-02")
+    assert meta["date"].max() == pd.Timestamp("2024-01-04")
+    assert isinstance(vecs, np.memmap)                      # a view, not a copy
+    assert store.rows_between(end="2023-12-31") == slice(0, 0)
+
+
+def test_float16_mode_and_inconsistent_store(tmp_path):
+    rng = np.random.default_rng(2)
+    store = EmbeddingStore(tmp_path, model="m", dtype="float16")
+    batch = _batch(rng, [1, 2], ["2024-01-01", "2024-01-02"])
+    store.append(*batch, last_id=2)
+    _, _, vecs = store.arrays()
+    assert vecs.dtype == np.float16
+    np.testing.assert_allclose(np.asarray(vecs, dtype=np.float32), batch[2], atol=2e-3)
+
+    EmbeddingStore._grow(store.path / "day.npy", np.array([19725], dtype=np.int32))
+    assert not store.exists()                                # arrays disagree with meta → rebuild
+    with pytest.raises(ValueError):
+        EmbeddingStore(tmp_path, dtype="int8")
+
+
+def test_torn_append_is_detected_and_its_bytes_dropped(tmp_path):
+    rng = np.random.default_rng(3)
+    store = EmbeddingStore(tmp_path, model="m")
+    store.append(*_batch(rng, [1, 2], ["2024-01-01", "2024-01-02"]), last_id=2)
+    # A crash after the data write but before the header rewrite: orphaned trailing bytes.
+    with open(store.path / "vectors.npy", "ab") as f:
+        f.write(np.full((1, 8), 7.0, dtype=np.float32).tobytes())
+    assert not store.exists()                                # sync() rebuilds from Postgres
+
+    later = _batch(rng, [3], ["2024-01-03"])
+    store.append(*later, last_id=3)                          # the orphaned row is overwritten
+    assert store.exists()
+    ids, _, vecs = store.arrays()
+    np.testing.assert_array_equal(vecs[list(ids).index(3)], later[2][0])
+
+
+def test_writers_exclude_each_other_and_readers(tmp_path):
+    rng = np.random.default_rng(4)
+    store = EmbeddingStore(tmp_path, model="m")
+    store.append(*_batch(rng, [1], ["2024-01-01"]), last_id=1)
+    events = []
+
+    def load():
+        store.load()
+        events.append("load")
+
+    with store._locked(fcntl.LOCK_EX):                      # a sync in flight elsewhere
+        reader = threading.Thread(target=load)
+        reader.start()
+        reader.join(timeout=0.2)
+        assert reader.is_alive()                             # blocked behind the writer
+        events.append("sync")
+    reader.join()
+    assert events == ["sync", "load"]
+
+
+def test_load_embeddings_reads_postgres_instead_of_building_the_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(E, "EmbeddingStore", lambda: EmbeddingStore(tmp_path, model="m"))
+    monkeypatch.setattr(EmbeddingStore, "sync", lambda *a, **k: pytest.fail("readers never sync"))
+    rows = pd.DataFrame({"headline_id": [1], "date": ["2024-01-01"], "dim": [2],
+                         "embedding": [np.ones(2, dtype=np.float32).tobytes()]})
+    monkeypatch.setattr(E.pd, "read_sql", lambda *a, **k: rows)
+
+    class _Engine:
+        def connect(self):
+            return contextlib.nullcontext()
+
+    meta, vecs = E.load_embeddings(_Engine(), use_store=True)
+    assert meta["headline_id"].tolist() == [1] and vecs.shape == (1, 2)
+    assert not (tmp_path / "m" / "meta.json").exists()
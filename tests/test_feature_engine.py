@@ -0,0 +1,108 @@
+"""Polars feature engine: every assembly step and the finished mt/ml/fused frames match pandas."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("polars")
+
+from sentisense.constants import SCORE_COLUMNS  # noqa: E402
+from sentisense.features import dataset as ds  # noqa: E402
+
+_COLS = list(SCORE_COLUMNS)
+_PD, _PL = ds._feature_ops("pandas"), ds._feature_ops("polars")
+
+
+@pytest.fixture
+def agg():
+    """Synthetic daily_source_scores rows: calendar days incl. Fri/Sat, sparse sources, zero counts."""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2023-01-01", "2023-03-10")
+    sources = ["ynet", "Haaretz.com", "walla!", "kan", "i24", "maariv"]
+    rows = [(d, s) for d in dates for s in sources if rng.random() < 0.6]
+    frame = pd.DataFrame(rows, columns=["date", "source"])
+    n = rng.integers(1, 30, len(frame))
+    frame["n"] = n
+    for c in _COLS:
+        cnt = np.where(rng.random(len(frame)) < 0.05, 0, rng.integers(1, n + 1))
+        frame[f"sum_{c}"] = rng.integers(-10, 11, len(frame)) * cnt
+        frame[f"n_{c}"] = cnt
+    frame["sum_abs_sentiment"] = frame["sum_global_sentiment"].abs() + frame["n_global_sentiment"]
+    frame["sum_sq_sentiment"] = frame["sum_abs_sentiment"] * 10
+    lone = frame.iloc[[0]].assign(date=pd.Timestamp("2023-03-11"), n=1, n_global_sentiment=1)
+    return pd.concat([frame, lone], ignore_index=True)         # a single-score day → NaN std
+
+
+@pytest.fixture
+def trading_days():
+    days = pd.date_range("2023-01-01", "2023-03-05")
+    return pd.DatetimeIndex(days[days.dayofweek.isin([6, 0, 1, 2, 3])], name="Date")
+
+
+def _eq(a, b):
+    pd.testing.assert_frame_equal(a, b, check_dtype=False, check_index_type=False,
+                                  rtol=1e-9, atol=1e-9)
+
+
+def test_score_blocks_match(agg):
+    _eq(_PL.daily_mean(agg), _PD.daily_mean(agg))
+    _eq(_PL.per_source_wide(agg, 3), _PD.per_source_wide(agg, 3))
+    _eq(_PL.interactions(agg), _PD.interactions(agg))
+
+
+def test_calendar_rollover_and_join_match(agg, trading_days):
+    dm = _PD.daily_mean(agg)
+    dm.iloc[5, :3] = np.nan                                   # all-NaN group values stay NaN
+    for how in ("mean", "sum"):
+        _eq(_PL.roll(dm, trading_days, how), _PD.roll(dm, trading_days, how))
+    _eq(_PL.roll_mean_and_count(dm, trading_days), _PD.roll_mean_and_count(dm, trading_days))
+    base = pd.DataFrame({"x": np.arange(len(trading_days), dtype=float)}, index=trading_days)
+    a = _PD.roll(dm, trading_days, "mean")
+    b = _PD.roll(dm.add_prefix("b_"), trading_days, "sum").iloc[::2]   # unaligned block
+    _eq(_PL.join(base, a, b), _PD.join(base, a, b))
+
+
+def _finance(trading_days):
+    rng = np.random.default_rng(1)
+    price = pd.Series(1800 + rng.standard_normal(len(trading_days)).cumsum() * 10,
+                      index=trading_days)
+    base = pd.DataFrame({"TA125_Price": price, "TA125_Volume": 1e6,
+                         "Market_SP500": 4000 + rng.standard_normal(len(price)).cumsum(),
+                         "VTA35_Price": 20.0}, index=trading_days)
+    base.index.name = "date"
+    return base, trading_days, price
+
+
+@pytest.mark.parametrize("builder", ["datasets", "fused"])
+def test_finished_frames_match(monkeypatch, agg, trading_days, builder):
+    import sentisense.embed as embed
+    import sentisense.embed.derived as derived
+
+    rng = np.random.default_rng(2)
+    cal = pd.date_range("2023-01-01", "2023-03-10", name="date")
+    cen = pd.DataFrame(rng.standard_normal((len(cal), 16)), index=cal,
+                       columns=[f"embc_{i:03d}" for i in range(16)])
+    cen["emb_dispersion"], cen["emb_count"] = 1.0, 5
+    der = pd.DataFrame(rng.standard_normal((len(cal), 2)), index=cal, columns=["embpca_000", "x"])
+    monkeypatch.setattr(ds, "_load_source_scores", lambda engine, cutoff: agg)
+    monkeypatch.setattr(ds, "_finance_base", lambda extra=None, engine=None: _finance(trading_days))
+    monkeypatch.setattr(embed, "stored_daily_centroid", lambda engine, cutoff: cen)
+    monkeypatch.setattr(derived, "load_embedding_derived", lambda engine, cutoff: der)
+
+    def build(engine_name):
+        monkeypatch.setattr(ds, "FEATURE_ENGINE", engine_name)
+        kw = {"top_n": 3, "cutoff": pd.Timestamp("2023-03-01"), "overnight": True, "horizon": 1}
+        if builder == "fused":
+            return [ds._build_fused_dataset(None, keep_unlabeled=False, **kw)]
+        return list(ds._build_datasets(None, extra_daily_features=None, with_sim=False, **kw))
+
+    for got, ref in zip(build("polars"), build("pandas")):
+        assert list(got.columns) == list(ref.columns) and len(ref) > 20
+        _eq(got, ref)
+
+
+def test_unknown_engine_raises():
+    with pytest.raises(ValueError, match="FEATURE_ENGINE"):
+        ds._feature_ops("arrow")
@@ -0,0 +1,100 @@
+"""Feature-frame cache: hits on unchanged inputs, misses + prunes on new ones, probes degrade."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sentisense.constants import REPO_ROOT
+from sentisense.features import frame_cache as FC
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    state = {"scores": [10, 10]}
+    monkeypatch.setattr(FC, "FRAME_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(FC, "input_state", lambda engine, inputs: dict(state))
+    return tmp_path, state
+
+
+def _builder(calls):
+    def build():
+        calls.append(1)
+        idx = pd.date_range("2024-01-01", periods=3, name="date")
+        return pd.DataFrame({"x": [1.0, np.nan, 3.0],
+                             "Target": pd.array([1, 0, pd.NA], dtype="Int64")}, index=idx)
+    return build
+
+
+def test_hit_returns_identical_frame_without_rebuilding(cache):
+    calls, refreshed = [], []
+    kw = {"inputs": ("scores",), "refresh": lambda: refreshed.append(1), "cutoff": "2024-01-03"}
+    first = FC.cached_frame(object(), "fused", _builder(calls), **kw)
+    second = FC.cached_frame(object(), "fused", _builder(calls), **kw)
+    assert len(calls) == 1 and len(refreshed) == 2
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_new_inputs_rebuild_and_prune_only_their_own_entry(cache):
+    root, state = cache
+    calls = []
+    FC.cached_frame(object(), "fused", _builder(calls), inputs=(), horizon=1)
+    FC.cached_frame(object(), "fused", _builder(calls), inputs=(), horizon=5)
+    state["scores"] = [11, 11]                                  # a new score landed
+    FC.cached_frame(object(), "fused", _builder(calls), inputs=(), horizon=1)
+    assert len(calls) == 3
+    assert len(list(root.glob("fused-*.pkl"))) == 2            # horizon=1 (new) + horizon=5
+
+
+def test_disabled_cache_always_builds(cache, monkeypatch):
+    root, _ = cache
+    monkeypatch.setattr(FC, "FRAME_CACHE", False)
+    calls = []
+    for _ in range(2):
+        FC.cached_frame(object(), "fused", _builder(calls), inputs=())
+    assert len(calls) == 2 and not list(root.iterdir())
+
+
+def test_input_state_tolerates_missing_tables():
+    class Conn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, stmt, params=None):
+            if "narrative_sim" in str(stmt):
+                raise RuntimeError('relation "narrative_sim" does not exist')
+            return SimpleNamespace(fetchone=lambda: (7, 7))
+
+    state = FC.input_state(SimpleNamespace(connect=Conn), ("scores", "sim"))
+    assert state["scores"] == [7, 7] and state["sim"] is None
+    assert state["code"] == FC.code_version() and len(state["csv"]) == 2
+
+
+def test_frame_digest_tracks_content_and_columns():
+    df = pd.DataFrame({"a": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2))
+    assert FC.frame_digest(df) == FC.frame_digest(df.copy())
+    assert FC.frame_digest(df) != FC.frame_digest(df.assign(a=[1.0, 2.5]))
+    assert FC.frame_digest(df) != FC.frame_digest(df.rename(columns={"a": "b"}))
+    assert FC.frame_digest(None) is None
+
+
+def test_code_version_covers_config_and_similarity_modules(tmp_path, monkeypatch):
+    names = {f.relative_to(REPO_ROOT).as_posix() for f in FC._CODE_FILES}
+    assert {"sentisense/config.py", "sentisense/embed/similarity.py"} <= names
+    assert all(f.exists() for f in FC._CODE_FILES)
+
+    cfg = tmp_path / "config.py"
+    cfg.write_text("TOP_N_SOURCES = 12\n")
+    monkeypatch.setattr(FC, "_CODE_FILES", [cfg])
+    FC.code_version.cache_clear()
+    before = FC.code_version()
+    cfg.write_text("TOP_N_SOURCES = 8\n")
+    FC.code_version.cache_clear()
+    assert FC.code_version() != before
+    FC.code_version.cache_clear()
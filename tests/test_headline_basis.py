@@ -0,0 +1,145 @@
+"""Out-of-core headline basis: paged partial_fit ≈ full-batch fit, checkpoints resume cleanly."""
+
+from __future__ import annotations
+
+import datetime as dt
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from sentisense.embed import basis as B  # noqa: E402
+from sentisense.embed import derived as D  # noqa: E402
+
+
+def _corpus(n=1_000, dim=12, seed=0):
+    rng = np.random.default_rng(seed)
+    # Rank-3 signal + small noise: a well-separated top-3 subspace that survives scaling.
+    latent = rng.standard_normal((n, 3)) * [3.0, 2.0, 1.5]
+    noise = 0.1 * rng.standard_normal((n, dim))
+    return (latent @ rng.standard_normal((3, dim)) + noise + 3.0).astype(np.float32)
+
+
+def _fake_pages(vecs, calls=None):
+    """Keyset reader over an in-memory matrix; headline_id == row index."""
+    def pages(engine, cutoff, *, after_id, page, model):
+        start = after_id + 1
+        while start < len(vecs):
+            stop = min(start + page, len(vecs))
+            if calls is not None:
+                calls.append(start)
+            yield stop - 1, np.zeros(stop - start, dtype="datetime64[D]"), vecs[start:stop]
+            start = stop
+    return pages
+
+
+@pytest.fixture
+def ckpt_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(B, "_CKPT_DIR", tmp_path)
+    return tmp_path
+
+
+def test_paged_fit_matches_full_batch(monkeypatch, ckpt_dir):
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+
+    vecs = _corpus()
+    monkeypatch.setattr(B, "_keyset_pages", _fake_pages(vecs))
+    basis = B.fit_headline_basis(object(), fit_cutoff=dt.date(2024, 1, 1), n_pca=3,
+                                 n_clusters=4, page=128)
+
+    scaler = StandardScaler().fit(vecs)
+    np.testing.assert_allclose(basis["scaler_mean"], scaler.mean_, rtol=1e-4)
+    np.testing.assert_allclose(basis["scaler_scale"], scaler.scale_, rtol=1e-4)
+    full = PCA(n_components=3).fit(scaler.transform(vecs))
+    # Same subspace: the projection of one basis onto the other is (close to) orthonormal.
+    overlap = np.abs(basis["pca_components"] @ full.components_.T)
+    np.testing.assert_allclose(np.sort(overlap.max(axis=1)), np.ones(3), atol=1e-2)
+    assert basis["n_fit"] == len(vecs) and basis["kmeans_centers"].shape == (4, 12)
+
+
+def test_interrupted_fit_resumes_from_checkpoint(monkeypatch, ckpt_dir):
+    vecs = _corpus(seed=1)
+    kw = {"fit_cutoff": dt.date(2024, 1, 1), "n_pca": 3, "n_clusters": 4, "page": 100,
+          "checkpoint_every": 2}
+    monkeypatch.setattr(B, "_keyset_pages", _fake_pages(vecs))
+    reference = B.fit_headline_basis(object(), resume=False, **kw)
+    for p in ckpt_dir.iterdir():
+        p.unlink()
+
+    served = []
+
+    def crashing(engine, cutoff, *, after_id, page, model):
+        for item in _fake_pages(vecs)(engine, cutoff, after_id=after_id, page=page, model=model):
+            served.append(item[0])
+            if len(served) == 15:                       # 10 scale pages, then 5 into the fit pass
+                raise KeyboardInterrupt
+            yield item
+
+    monkeypatch.setattr(B, "_keyset_pages", crashing)
+    with pytest.raises(KeyboardInterrupt):
+        B.fit_headline_basis(object(), **kw)
+    assert list(ckpt_dir.glob("*.joblib"))
+
+    calls: list[int] = []
+    monkeypatch.setattr(B, "_keyset_pages", _fake_pages(vecs, calls))
+    resumed = B.fit_headline_basis(object(), **kw)
+    assert calls[0] == 400                             # fit pass, after the last checkpoint
+    for key in ("scaler_mean", "scaler_scale", "pca_components", "kmeans_centers"):
+        np.testing.assert_allclose(resumed[key], reference[key], rtol=1e-5, atol=1e-6)
+    assert resumed["n_fit"] == reference["n_fit"]
+
+
+def test_too_few_headlines_raise(monkeypatch, ckpt_dir):
+    monkeypatch.setattr(B, "_keyset_pages", _fake_pages(_corpus(n=4)))
+    with pytest.raises(ValueError, match="too few headlines"):
+        B.fit_headline_basis(object(), n_pca=3, n_clusters=4, page=2)
+
+
+def test_persist_basis_rejects_unknown_kind():
+    with pytest.raises(ValueError, match="kind"):
+        D.persist_basis({}, engine=object(), kind="daily")
+
+
+class _FakeConn:
+    def __init__(self, rows, legacy):
+        self.rows, self.legacy = rows, legacy
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt, params=None):
+        if params is None:                         # _BASIS_LEGACY
+            row = self.legacy
+        elif self.legacy is not None:
+            raise RuntimeError('column "kind" does not exist')
+        else:
+            row = self.rows.get(params["kind"])
+        return SimpleNamespace(mappings=lambda: SimpleNamespace(first=lambda: row))
+
+
+class _FakeEngine:
+    def __init__(self, rows=None, legacy=None):
+        self.rows, self.legacy = rows or {}, legacy
+
+    def connect(self):
+        return _FakeConn(self.rows, self.legacy)
+
+
+def test_latest_basis_prefers_kinds_in_order_and_falls_back_pre_014():
+    from ui.queries import _latest_basis
+
+    both = _FakeEngine({"centroid": {"kind": "centroid"}, "headline": {"kind": "headline"}})
+    assert _latest_basis(both, ("headline", "centroid"))["kind"] == "headline"
+    assert _latest_basis(both, ("centroid",))["kind"] == "centroid"
+    only = _FakeEngine({"centroid": {"kind": "centroid"}})
+    assert _latest_basis(only, ("headline", "centroid"))["kind"] == "centroid"
+    assert _latest_basis(only, ("headline",)) is None
+    legacy = _FakeEngine(legacy={"embed_model": "m"})   # unversioned row == the centroid basis
+    assert _latest_basis(legacy, ("headline", "centroid")) == {"embed_model": "m"}
+    assert _latest_basis(legacy, ("headline",)) is None
@@ -0,0 +1,113 @@
+"""Precomputed headline coordinates: projection parity, basis reuse, mixed stored/fresh day rows."""
+
+from __future__ import annotations
+
+import datetime as dt
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from sentisense.embed import derived as D  # noqa: E402
+from sentisense.embed import projection as P  # noqa: E402
+
+
+def _fit(seed=0, dim=24, n_pca=4):
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+
+    x = np.random.default_rng(seed).standard_normal((200, dim)).astype(np.float32)
+    scaler = StandardScaler().fit(x)
+    pca = PCA(n_components=n_pca, random_state=seed).fit(scaler.transform(x))
+    basis = {"n_features": dim, "n_pca": n_pca, "fit_cutoff": dt.date(2024, 1, 1),
+             "scaler_mean": scaler.mean_.astype(np.float32),
+             "scaler_scale": scaler.scale_.astype(np.float32),
+             "pca_mean": pca.mean_.astype(np.float32),
+             "pca_components": pca.components_.astype(np.float32),
+             "n_clusters": None, "kmeans_centers": None}
+    return x, scaler, pca, basis
+
+
+def _stored(basis, version=1):
+    """``basis`` as the DB row would hold it (float32 bytes)."""
+    row = {k: (v.tobytes() if isinstance(v, np.ndarray) else v) for k, v in basis.items()}
+    return {**row, "version": version, "kind": "centroid", "embed_model": "m"}
+
+
+def test_project_matches_sklearn_transform():
+    x, scaler, pca, basis = _fit()
+    decoded = dict(basis, scaler_scale=basis["scaler_scale"].copy())
+    np.testing.assert_allclose(P.project(decoded, x[:10]),
+                               pca.transform(scaler.transform(x[:10])), rtol=1e-3, atol=1e-3)
+
+
+def test_same_basis_reuses_only_an_identical_fit():
+    _, _, _, basis = _fit()
+    row = _stored(basis)
+    assert D._same_basis(row, basis)
+    noisy = dict(basis, pca_mean=basis["pca_mean"] + np.float32(1e-8))
+    assert D._same_basis(row, noisy)
+    assert not D._same_basis(row, dict(basis, pca_components=-basis["pca_components"]))
+    assert not D._same_basis(row, dict(basis, fit_cutoff=dt.date(2024, 6, 1)))
+    assert not D._same_basis(row, dict(basis, n_clusters=8,
+                                       kmeans_centers=np.zeros((8, 24), np.float32)))
+
+
+class _FakeConn:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt, params=None):
+        return SimpleNamespace(mappings=lambda: SimpleNamespace(all=lambda: self.rows))
+
+
+def test_day_view_mixes_stored_and_fresh_coordinates(monkeypatch):
+    from ui import queries as Q
+
+    x, scaler, pca, basis = _fit(seed=1)
+    ref = pca.transform(scaler.transform(x[:6]))
+    rows = [{"headline_id": i, "source": "ynet", "headline": f"h{i}", "sentiment": 1,
+             "coords": ref[i].astype(np.float32).tobytes() if i % 2 else None,
+             "embedding": None if i % 2 else x[i].tobytes()} for i in range(6)]
+    monkeypatch.setattr(Q, "_latest_basis", lambda engine, kinds: _stored(basis, version=3))
+    monkeypatch.setattr(Q, "resolved_model", lambda engine: "m")
+    engine = SimpleNamespace(connect=lambda: _FakeConn(rows))
+
+    out = Q.day_centroid_points(engine, day=dt.date(2024, 1, 2))
+    np.testing.assert_allclose([p["v"] for p in out["points"]], ref, atol=2e-3)
+    np.testing.assert_allclose(out["centroid"],
+                               pca.transform(scaler.transform(x[:6].mean(axis=0, keepdims=True)))[0],
+                               atol=2e-3)
+    assert out["basis"] == {"kind": "centroid", "version": 3} and out["clusters"] == []
+
+
+@pytest.mark.parametrize("sqlstate, warned", [("42P01", False), ("42883", True)])
+def test_day_view_falls_back_quietly_only_for_a_missing_table(monkeypatch, sqlstate, warned):
+    from loguru import logger
+    from sqlalchemy.exc import ProgrammingError
+
+    from ui import queries as Q
+
+    class _Failing(_FakeConn):
+        def execute(self, stmt, params=None):
+            if "headline_pca" in str(stmt):
+                raise ProgrammingError(str(stmt), params, SimpleNamespace(sqlstate=sqlstate))
+            return super().execute(stmt, params)
+
+    rows = [{"headline_id": 1, "source": "ynet", "headline": "h", "sentiment": 1}]
+    engine = SimpleNamespace(connect=lambda: _Failing(rows))
+    messages = []
+    sink = logger.add(messages.append, level="WARNING")
+    try:
+        assert Q._day_rows(engine, {"kind": "centroid", "version": 1}, {}) == rows
+    finally:
+        logger.remove(sink)
+    assert bool(messages) is warned
@@ -0,0 +1,107 @@
+"""Compiled lexicon scan must render exactly what the individual @tool calls return."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("regex")
+
+from processing_engine import tools as T  # noqa: E402
+from processing_engine.fast_pipeline import _run_tool, precompute_tool_evidence  # noqa: E402
+from processing_engine.lexicon import LEXICON, LEXICONS, render_tool  # noqa: E402
+
+_ALL_TOOLS = {t.name: t for t in T.SHARED_TOOLS + T.SENTIMENT_TOOLS}
+for _tools in T.TOOLS_BY_CATEGORY.values():
+    _ALL_TOOLS.update({t.name: t for t in _tools})
+
+_HEADLINES = [
+    "בנק ישראל הכריז על העלאת הריבית ב-0.25% לאחר עלייה באינפלציה",
+    "צה״ל תקף מטרות בדרום לבנון בתגובה לירי רקטות",
+    'צה"ל: סגן שר הביטחון הגיע לגבול; הסכם שלום עם סעודיה "קרוב"',
+    "חוקרים ישראלים פיתחו תרופה חדשה לסרטן הלבלב",
+    "הכנסת אישרה את תקציב המדינה לשנת 2025 ברוב של 61 חברי כנסת",
+    "מבזק: זינוק חד של 7.5% במניות אנבידיה אחרי דוח AI; גייסה $3.2B",
+    "ירידה מתונה בת\"א 125, הבורסה נפלה 1.2% בעקבות הסלמה",
+    "",
+    "plain latin text with no hebrew at all",
+]
+
+
+def test_terms_in_matches_substring_semantics():
+    text = _HEADLINES[2]
+    expected = {t for entries in LEXICONS.values() for t, _ in entries if t in text}
+    assert LEXICON.terms_in(text) == expected
+    # nested + overlapping terms are all reported
+    assert {"שר", "סגן שר", "הסכם", "הסכם שלום", "שלום"} <= expected
+
+
+@pytest.mark.parametrize("headline", _HEADLINES)
+def test_render_tool_matches_invoke(headline):
+    hits = LEXICON.scan(headline)
+    for name, tool_fn in _ALL_TOOLS.items():
+        assert render_tool(tool_fn, headline, hits) == _run_tool(tool_fn, headline), name
+
+
+def test_every_registered_tool_has_a_renderer():
+    hits = LEXICON.scan("")
+    assert all(render_tool(t, "", hits) is not None for t in _ALL_TOOLS.values())
+
+
+def test_precompute_evidence_lists_every_tool():
+    evidence = precompute_tool_evidence(_HEADLINES[0])
+    assert "**scan_financial_entities:** Financial entities (1):" in evidence
+    assert "**assess_threat_level:** Threat level: NONE" in evidence
+
+
+def test_evidence_many_matches_per_headline_inline():
+    from processing_engine.fast_pipeline import precompute_tool_evidence_many
+
+    texts = _HEADLINES + _HEADLINES[:3]  # duplicates are rendered once, fanned back out
+    assert precompute_tool_evidence_many(texts) == [precompute_tool_evidence(t) for t in texts]
+
+
+def test_evidence_many_process_pool_path(monkeypatch):
+    from processing_engine import fast_pipeline as FP
+
+    monkeypatch.setattr(FP, "EVIDENCE_POOL_THRESHOLD", 2)
+    monkeypatch.setattr(FP, "EVIDENCE_WORKERS", 2)
+    try:
+        out = FP.precompute_tool_evidence_many(_HEADLINES)
+    finally:
+        if FP._evidence_pool is not None:
+            FP._evidence_pool.shutdown()
+            FP._evidence_pool = None
+    assert out == [precompute_tool_evidence(t) for t in _HEADLINES]
+
+
+def test_evidence_pool_is_started_once_across_threads(monkeypatch):
+    from processing_engine import fast_pipeline as FP
+
+    started: list[object] = []
+    exit_hooks: list[object] = []
+
+    class _Pool:
+        def __init__(self, **kwargs):
+            time.sleep(0.05)  # widen the check-then-create window
+            started.append(self)
+
+        def shutdown(self, **kwargs):
+            pass
+
+    monkeypatch.setattr(FP, "ProcessPoolExecutor", _Pool)
+    monkeypatch.setattr(FP.atexit, "register", lambda fn, **kw: exit_hooks.append(fn))
+    monkeypatch.setattr(FP, "_evidence_pool", None)
+
+    pools = []
+    threads = [threading.Thread(target=lambda: pools.append(FP._get_evidence_pool(2))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(started) == 1 and all(p is started[0] for p in pools)
+    assert exit_hooks == [started[0].shutdown]
@@ -0,0 +1,95 @@
+"""Market-data store: incremental fetch windows, TTL/outage handling, offline dataset finance."""
+
+from __future__ import annotations
+
+import datetime as dt
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sentisense.features import dataset as ds
+from sentisense.features import market as M
+
+
+def test_fetch_start_uses_oldest_watermark_minus_overlap():
+    d = dt.date(2024, 3, 1)
+    marks = {"a": {"last_date": d}, "b": {"last_date": d - dt.timedelta(days=3)}}
+    assert M._fetch_start(marks, ("a", "b"), M.START) == d - dt.timedelta(days=3 + M._OVERLAP_DAYS)
+    assert M._fetch_start(marks, ("a", "c"), M.START) == M.START          # c never fetched
+    marks["c"] = {"last_date": None}                                       # fetched, never had rows
+    assert M._fetch_start(marks, ("a", "c"), M.START) == d - dt.timedelta(days=M._OVERLAP_DAYS)
+
+
+class _FakeConn:
+    def __init__(self, marks):
+        self.marks = marks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt, params=None):
+        return iter(self.marks)
+
+
+def test_refresh_skips_fresh_groups_and_survives_an_outage(monkeypatch):
+    marks = [SimpleNamespace(series="FX_USD_ILS", last_date=dt.date(2024, 3, 1), fresh=True)]
+    engine = SimpleNamespace(connect=lambda: _FakeConn(marks))
+    calls, stored = [], []
+
+    def ok(start):
+        calls.append(start)
+        return pd.DataFrame({s: [1.0] for s in M.GROUPS["market"][0]},
+                            index=pd.to_datetime(["2024-03-04"]))
+
+    def down(start):
+        raise ConnectionError("yahoo down")
+
+    monkeypatch.setattr(M, "ensure_market_tables", lambda engine: None)
+    monkeypatch.setattr(M, "_store", lambda engine, frame, series: stored.append(series) or 4)
+    monkeypatch.setitem(M.GROUPS, "market", (M.GROUPS["market"][0], ok))
+    monkeypatch.setitem(M.GROUPS, "fx", (M.GROUPS["fx"][0], pytest.fail))
+    monkeypatch.setitem(M.GROUPS, "ta125", (M.GROUPS["ta125"][0], down))
+
+    out = M.refresh_market_data(engine, since={"market": dt.date(2020, 1, 1)})
+    assert out == {"market": 4, "fx": 0}              # fx fresh, ta125 failed → not written
+    assert calls == [dt.date(2020, 1, 1)] and stored == [M.GROUPS["market"][0]]
+
+
+@pytest.fixture
+def index_csvs(tmp_path, monkeypatch):
+    pd.DataFrame({"Date": ["02/27/2024", "02/28/2024"], "Price": ["1,890.0", "1,900.5"],
+                  "Vol.": ["900K", "1.2M"]}).to_csv(tmp_path / "ta.csv", index=False)
+    pd.DataFrame({"Date": ["02/28/2024"], "Price": ["20.1"]}).to_csv(tmp_path / "vta.csv",
+                                                                  index=False)
+    monkeypatch.setattr(ds, "TA125_CSV", tmp_path / "ta.csv")
+    monkeypatch.setattr(ds, "VTA35_CSV", tmp_path / "vta.csv")
+    ds._parse_index_csvs.cache_clear()
+    yield
+    ds._parse_index_csvs.cache_clear()
+
+
+def test_offline_finance_reads_the_store_only(monkeypatch, index_csvs):
+    days = pd.to_datetime(["2024-02-27", "2024-02-28", "2024-02-29"])
+    stored = pd.DataFrame({"SP500": [1.0, 2.0, 3.0], "VIX": [np.nan, 9.0, 9.5],
+                           "FX_USD_ILS": [3.6, 3.7, np.nan],
+                           "TA125_Price": [1.0, np.nan, 1905.0],
+                           "TA125_Volume": [np.nan, np.nan, np.nan]}, index=days)
+    monkeypatch.setattr(M, "refresh_market_data", pytest.fail)
+    monkeypatch.setattr(M, "load_market_data", lambda engine: stored)
+
+    ta125, vta35, market, fx = ds._load_finance(object(), offline=True)
+    assert list(ta125.index) == list(days)            # CSV history + one live day past it
+    assert ta125.loc["2024-02-27", "TA125_Price"] == 1890.0 and ta125.iloc[-1].tolist() == [1905.0, 0.0]
+    assert list(market.columns) == ["Market_SP500", "Market_VIX"] and len(fx) == 2
+    assert vta35["VTA35_Price"].tolist() == [20.1]
+
+
+def test_offline_finance_without_sp500_raises(monkeypatch, index_csvs):
+    monkeypatch.setattr(M, "load_market_data", lambda engine: pd.DataFrame())
+    with pytest.raises(RuntimeError, match="S&P 500"):
+        ds._load_finance(object(), offline=True)
@@ -0,0 +1,99 @@
+"""Incremental narrative clustering: a resumed run == a full recompute, stale days are detected."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("sklearn")
+
+from sentisense.cluster import narrative as N  # noqa: E402
+
+
+def _corpus(rng, n_days=40, dim=6):
+    days = pd.date_range("2024-01-01", periods=n_days, freq="D")
+    per_day = rng.integers(1, 6, size=n_days)
+    date_vals = np.repeat(days.values, per_day)
+    return days, date_vals, rng.standard_normal((len(date_vals), dim)).astype(np.float32)
+
+
+def test_resume_from_snapshot_matches_full_run():
+    days, date_vals, vectors = _corpus(np.random.default_rng(0))
+    kw = {"k": 3, "refit_every": 4}
+    full_rows, full_snaps = N._cluster_days(vectors, date_vals, days, start=0, centers=None,
+                                            fit_date=None, **kw)
+
+    start = 27
+    before = [s for s in full_snaps if pd.Timestamp(s["fit_date"]) < days[start]][-1]
+    rows, snaps = N._cluster_days(vectors, date_vals, days, start=start,
+                                  centers=before["centers"], fit_date=before["fit_date"], **kw)
+
+    assert [s["fit_date"] for s in snaps] == [s["fit_date"] for s in full_snaps
+                                              if pd.Timestamp(s["fit_date"]) >= days[start]]
+    pd.testing.assert_frame_equal(pd.DataFrame(rows), pd.DataFrame(full_rows[start:]).reset_index(drop=True))
+    # Leak-safety: every snapshot was fit on rows strictly before its first assigned day.
+    for s in full_snaps:
+        assert s["n_fit"] == np.searchsorted(date_vals, np.datetime64(s["fit_date"]))
+
+
+def test_resume_when_the_snapshot_fit_day_is_gone():
+    days, date_vals, vectors = _corpus(np.random.default_rng(2))
+    kw = {"k": 3, "refit_every": 4}
+    _, full_snaps = N._cluster_days(vectors, date_vals, days, start=0, centers=None,
+                                    fit_date=None, **kw)
+    start = 27
+    before = [s for s in full_snaps if pd.Timestamp(s["fit_date"]) < days[start]][-1]
+    # Every headline of the fit day was deleted: the day drops out of the calendar.
+    gone = pd.Timestamp(before["fit_date"])
+    keep = date_vals != gone.to_datetime64()
+    days_left = days[days != gone]
+    rows, _ = N._cluster_days(vectors[keep], date_vals[keep], days_left,
+                              start=int(days_left.searchsorted(days[start])),
+                              centers=before["centers"], fit_date=before["fit_date"], **kw)
+    assert rows[0]["date"] == days[start]
+
+
+def test_resume_index_finds_first_missing_or_changed_day():
+    days = pd.date_range("2024-01-01", periods=5, freq="D")
+    counts = np.array([3, 1, 2, 4, 2])
+    stored = pd.Series([3.0, 1.0, 2.0], index=days[:3])
+    assert N._resume_index(days, counts, stored) == 3                  # new days only
+    assert N._resume_index(days, counts, pd.Series(counts.astype(float), index=days)) == 5
+    assert N._resume_index(days, counts, pd.Series([3.0, 2.0, 2.0], index=days[:3])) == 1
+    gone = pd.Series([3.0, 9.0, 1.0], index=[days[0], pd.Timestamp("2024-01-01 12:00"), days[1]])
+    assert N._resume_index(days, counts, gone) == 1                    # a stored day vanished
+
+
+def _reference_loop(vectors, date_vals, days, k, refit_every):
+    """The original one-day-at-a-time loop (sequential fit → predict)."""
+    rows, centers, since = [], None, 10**9
+    for d in days:
+        n_past = int(np.searchsorted(date_vals, d.to_datetime64()))
+        if n_past >= k and (centers is None or since >= refit_every):
+            centers, since = N._fit_centers(vectors, n_past, k), 0
+        else:
+            since += 1
+        day = vectors[date_vals == d.to_datetime64()]
+        if centers is None:
+            rows.append((np.nan, np.nan, len(day)))
+            continue
+        counts = np.bincount(N._assign(centers, day), minlength=k).astype(float)
+        counts = counts[counts > 0]
+        p = counts / counts.sum()
+        h = float(-(p * np.log(p)).sum() / np.log(len(p))) if len(p) > 1 else 0.0
+        rows.append((counts.max() / counts.sum(), h, len(day)))
+    return pd.DataFrame(rows, columns=N._FEATURE_COLS, index=days)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_planned_parallel_refits_match_sequential_loop(workers):
+    days, date_vals, vectors = _corpus(np.random.default_rng(1), n_days=30)
+    rows, snaps = N._cluster_days(vectors, date_vals, days, start=0, centers=None,
+                                  fit_date=None, k=3, refit_every=4, workers=workers)
+    got = pd.DataFrame(rows).set_index("date")[N._FEATURE_COLS].rename_axis(None)
+    pd.testing.assert_frame_equal(got, _reference_loop(vectors, date_vals, days, 3, 4),
+                                  check_freq=False)
+    assert len(snaps) == len(N._refit_plan(np.searchsorted(date_vals, days.values), start=0,
+                                           days_since_fit=10**9, fitted=False, k=3,
+                                           refit_every=4))
@@ -0,0 +1,75 @@
+"""MinHash-LSH near-duplicate collapsing ahead of LLM scoring."""
+
+from __future__ import annotations
+
+import importlib.util
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("regex")
+
+from processing_engine.near_dup import (  # noqa: E402
+    jaccard,
+    lsh_params,
+    near_duplicate_representatives,
+    shingles,
+)
+
+_path = Path(__file__).resolve().parent.parent / "scripts" / "process_headlines.py"
+_spec = importlib.util.spec_from_file_location("process_headlines", _path)
+process_headlines = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(process_headlines)
+
+_FLASH = "צה״ל תקף מטרות בדרום לבנון בתגובה לירי רקטות"
+
+
+def test_quote_variants_share_shingles():
+    assert shingles(_FLASH) == shingles('צה"ל תקף מטרות בדרום לבנון בתגובה לירי רקטות')
+
+
+def test_lsh_midpoint_below_threshold():
+    for t in (0.5, 0.7, 0.8, 0.9):
+        b, r = lsh_params(t)
+        assert (1 / b) ** (1 / r) <= t
+
+
+def test_rewrites_collapse_onto_first_representative():
+    texts = [
+        _FLASH,
+        'צה"ל תקף מטרות בדרום לבנון בתגובה לירי רקטות',
+        _FLASH + " | ynet",
+        "הבורסה ננעלה בעליות",
+        "צה״ל תקף מטרות בדרום לבנון",          # same topic, a different headline
+    ]
+    assert near_duplicate_representatives(texts, threshold=0.8) == [0, 0, 0, 3, 4]
+    assert jaccard(shingles(texts[0]), shingles(texts[4])) < 0.8
+
+
+def test_date_window_and_threshold_validation():
+    texts = [_FLASH, _FLASH, _FLASH]
+    dates = [date(2025, 3, 1), date(2025, 3, 2), "2025-03-10"]
+    assert near_duplicate_representatives(texts, dates, threshold=0.9, window_days=1) == [0, 0, 2]
+    with pytest.raises(ValueError):
+        near_duplicate_representatives(texts, threshold=0.0)
+
+
+def test_fan_out_records_representative():
+    rows = [
+        {"id": 10, "date": "2025-03-01", "headline": _FLASH},
+        {"id": 11, "date": "2025-03-01", "headline": _FLASH + " | ynet"},
+        {"id": 12, "date": "2025-03-01", "headline": "הבורסה ננעלה בעליות"},
+    ]
+    to_score, members = process_headlines._collapse_near_duplicates(rows, 0.8)
+    assert [r["id"] for r in to_score] == [10, 12]
+    assert {k: [r["id"] for r in v] for k, v in members.items()} == {10: [11]}
+
+    res = {"global_sentiment": -4, "validation_passed": True, "processing_time_seconds": 2.0}
+    scored = process_headlines._fan_out([(10, res, None), (12, res, 7)], members)
+    assert [(hid, src) for hid, _, src in scored] == [(10, None), (12, 7), (11, 10)]
+    assert scored[2][1]["global_sentiment"] == -4
+    assert scored[2][1]["processing_time_seconds"] == 0.0
+
+    assert process_headlines._collapse_near_duplicates(rows, 0.0) == (rows, {})
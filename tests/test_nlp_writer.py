@@ -0,0 +1,106 @@
+"""Bulk nlp_vectors writer: COPY into the stage, one INSERT … SELECT per chunk."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+_path = Path(__file__).resolve().parent.parent / "scripts" / "process_headlines.py"
+_spec = importlib.util.spec_from_file_location("process_headlines", _path)
+process_headlines = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(process_headlines)
+
+
+class _FakeCopy:
+    def __init__(self, sink):
+        self.sink = sink
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self.sink.append(row)
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql, params=None):
+        self.conn.sql.append(" ".join(sql.split()))
+
+    def copy(self, sql):
+        self.conn.sql.append(sql)
+        return _FakeCopy(self.conn.copied)
+
+    def fetchall(self):
+        # RETURNING: only the first staged row is new, the rest conflicted.
+        return [(self.conn.copied[0][0],)]
+
+    def close(self):
+        pass
+
+
+class _FakeConn:
+    def __init__(self):
+        self.sql: list[str] = []
+        self.copied: list[tuple] = []
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+
+def _res(v: int) -> dict:
+    return {"relevance_category_1": v, "global_sentiment": v, "validation_passed": True,
+            "processing_time_seconds": 1.0, "errors": []}
+
+
+def test_bulk_write_counts_inserted_and_conflicted():
+    conn = _FakeConn()
+    writer = process_headlines.NlpVectorWriter(conn, "m")
+    assert writer.write([(1, _res(1), None), (2, _res(2), None), (3, _res(3), None)]) == (1, 2, [])
+
+    assert [row[0] for row in conn.copied] == [1, 2, 3]
+    assert conn.copied[0][:3] == (1, "m", 1) and conn.copied[0][-1] is None
+    assert sum(s.startswith("COPY nlp_vectors_stage") for s in conn.sql) == 1
+    inserts = [s for s in conn.sql if s.startswith("INSERT INTO nlp_vectors ")]
+    assert len(inserts) == 1
+    assert "scored_from_headline_id" not in inserts[0]   # no copies → no migration-010 column
+    assert "ON CONFLICT (headline_id, model_name) DO NOTHING" in inserts[0]
+    assert (writer.inserted, writer.conflicted) == (1, 2)
+
+
+def test_provenance_column_only_when_needed():
+    conn = _FakeConn()
+    writer = process_headlines.NlpVectorWriter(conn, "m")
+    writer.write([(1, _res(1), None), (2, _res(1), 1)])
+    insert = next(s for s in conn.sql if s.startswith("INSERT INTO nlp_vectors "))
+    assert "scored_from_headline_id" in insert
+    assert writer.write([]) == (0, 0, [])
+
+
+def test_bulk_failure_rolls_back_to_savepoint_only():
+    class _FailingCursor(_FakeCursor):
+        rowcount = 1
+
+        def execute(self, sql, params=None):
+            super().execute(sql, params)
+            if "FROM nlp_vectors_stage" in sql:
+                raise RuntimeError("check constraint violated")
+
+    class _Conn(_FakeConn):
+        def cursor(self):
+            return _FailingCursor(self)
+
+        def rollback(self):                    # would drop the cache's uncommitted writes
+            raise AssertionError("whole-transaction rollback")
+
+    conn = _Conn()
+    writer = process_headlines.NlpVectorWriter(conn, "m")
+    assert writer.write([(1, _res(1), None), (2, _res(2), None)]) == (2, 0, [])
+    bulk = conn.sql.index("SAVEPOINT nlp_bulk")
+    assert "ROLLBACK TO SAVEPOINT nlp_bulk" in conn.sql[bulk + 1:]
+    assert conn.sql.count("SAVEPOINT nlp_row") == 2            # then row by row
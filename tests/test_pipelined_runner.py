@@ -0,0 +1,217 @@
+"""Pipelined fast-batch runner: keyset pages → N in-flight LLM batches → bulk writer."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+_path = Path(__file__).resolve().parent.parent / "scripts" / "process_headlines.py"
+_spec = importlib.util.spec_from_file_location("process_headlines", _path)
+process_headlines = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(process_headlines)
+
+
+class _Conn:
+    def __init__(self):
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+
+class _Writer:
+    written: list[int] = []
+
+    def __init__(self, conn, model_name):
+        self.inserted = self.conflicted = 0
+
+    def write(self, rows):
+        _Writer.written.extend(hid for hid, _, _ in rows)
+        self.inserted += len(rows)
+        return len(rows), 0, []
+
+
+def test_pipeline_streams_pages_and_caps_inflight_calls(monkeypatch):
+    table = [{"id": i, "date": "2025-01-01", "headline": f"כותרת מספר {i}"} for i in range(1, 238)]
+    afters = []
+
+    def fake_page(conn, model_name, after, page_size, date_from, date_to, any_model):
+        afters.append(after)
+        start = 0 if after is None else next(i for i, r in enumerate(table) if r["id"] == after[1]) + 1
+        return table[start : start + page_size]
+
+    inflight = {"now": 0, "max": 0, "calls": 0}
+
+    limiters = set()
+
+    async def fake_score(obs, llm=None, batch_size=15, concurrency=4, limiter=None):
+        assert len(obs) <= batch_size
+        limiters.add(id(limiter))
+        async with limiter.slot(tokens=len(obs)):
+            inflight["now"] += 1
+            inflight["calls"] += 1
+            inflight["max"] = max(inflight["max"], inflight["now"])
+            await asyncio.sleep(0.001 * (len(obs) % 3))
+            inflight["now"] -= 1
+        return [{"global_sentiment": 1, "validation_passed": True} for _ in obs]
+
+    import processing_engine.fast_pipeline as fp
+    import processing_engine.prompts as prompts
+
+    monkeypatch.setattr(fp, "score_headlines_batch", fake_score)
+    monkeypatch.setattr(prompts, "build_llm", lambda: None)
+    monkeypatch.setattr(process_headlines, "fetch_unprocessed_page", fake_page)
+    monkeypatch.setattr(process_headlines, "NlpVectorWriter", _Writer)
+    _Writer.written = []
+
+    conn = _Conn()
+    asyncio.run(process_headlines.run_batch_pipelined(
+        conn, "m", flush_size=50, headlines_per_call=10, concurrency=3,
+        limit=230, score_cache=False, page_size=100,
+    ))
+
+    assert sorted(_Writer.written) == list(range(1, 231))   # limit honoured, each row once
+    assert afters == [None, ("2025-01-01", 100), ("2025-01-01", 200)]
+    assert len(limiters) == 1                    # one adaptive limit for the whole run
+    assert 1 <= inflight["max"] <= 6            # starts at 3, ceiling 2 × 3
+    assert inflight["calls"] == 23
+    assert conn.commits >= 1
+
+
+class _Queue:
+    def __init__(self, days):
+        self.days = list(days)
+        self.completed: dict = {}
+        self.released: list = []
+        self.heartbeats = 0
+
+    def claim(self):
+        return self.days.pop(0) if self.days else None
+
+    def heartbeat(self):
+        self.heartbeats += 1
+
+    def complete(self, day, scored):
+        self.completed[day] = scored
+
+    def release(self, day):
+        self.released.append(day)
+
+
+def test_work_queue_completes_finished_days_and_releases_partial(monkeypatch):
+    table = {
+        "2025-01-03": [{"id": i, "date": "2025-01-03", "headline": f"א {i}"} for i in range(1, 26)],
+        "2025-01-02": [],                                    # nothing left to score that day
+        "2025-01-01": [{"id": i, "date": "2025-01-01", "headline": f"ב {i}"} for i in range(26, 66)],
+    }
+
+    def fake_page(conn, model_name, after, page_size, date_from, date_to, any_model):
+        assert date_from == date_to
+        rows = [r for r in table[date_from] if after is None or r["id"] > after[1]]
+        return rows[:page_size]
+
+    async def fake_score(obs, llm=None, batch_size=15, concurrency=4, limiter=None):
+        return [{"global_sentiment": 0, "validation_passed": True} for _ in obs]
+
+    import processing_engine.fast_pipeline as fp
+    import processing_engine.prompts as prompts
+
+    queue = _Queue(table)
+    monkeypatch.setattr(fp, "score_headlines_batch", fake_score)
+    monkeypatch.setattr(prompts, "build_llm", lambda: None)
+    monkeypatch.setattr(process_headlines, "fetch_unprocessed_page", fake_page)
+    monkeypatch.setattr(process_headlines, "NlpVectorWriter", _Writer)
+    monkeypatch.setattr(process_headlines, "make_work_queue", lambda *a, **k: queue)
+    _Writer.written = []
+
+    asyncio.run(process_headlines.run_batch_pipelined(
+        _Conn(), "m", flush_size=7, headlines_per_call=5, concurrency=2,
+        limit=45, score_cache=False, page_size=10, work_queue=True,
+    ))
+
+    assert queue.completed == {"2025-01-03": 25, "2025-01-02": 0}
+    assert queue.released == ["2025-01-01"]                  # limit hit mid-day
+    assert sorted(_Writer.written) == list(range(1, 46))
+    assert queue.heartbeats >= 1
+
+
+def test_work_queue_releases_days_with_failed_writes(monkeypatch):
+    table = {
+        "2025-01-02": [{"id": i, "date": "2025-01-02", "headline": f"א {i}"} for i in range(1, 11)],
+        "2025-01-01": [{"id": i, "date": "2025-01-01", "headline": f"ב {i}"} for i in range(11, 21)],
+    }
+
+    def fake_page(conn, model_name, after, page_size, date_from, date_to, any_model):
+        rows = [r for r in table[date_from] if after is None or r["id"] > after[1]]
+        return rows[:page_size]
+
+    async def fake_score(obs, llm=None, batch_size=15, concurrency=4, limiter=None):
+        return [{"global_sentiment": 0, "validation_passed": True} for _ in obs]
+
+    class _FailingWriter(_Writer):
+        def write(self, rows):
+            bad = [hid for hid, _, _ in rows if hid in (3, 4)]   # nlp_vectors write failed
+            return len(rows) - len(bad), 0, bad
+
+    import processing_engine.fast_pipeline as fp
+    import processing_engine.prompts as prompts
+
+    queue = _Queue(table)
+    monkeypatch.setattr(fp, "score_headlines_batch", fake_score)
+    monkeypatch.setattr(prompts, "build_llm", lambda: None)
+    monkeypatch.setattr(process_headlines, "fetch_unprocessed_page", fake_page)
+    monkeypatch.setattr(process_headlines, "NlpVectorWriter", _FailingWriter)
+    monkeypatch.setattr(process_headlines, "make_work_queue", lambda *a, **k: queue)
+
+    asyncio.run(process_headlines.run_batch_pipelined(
+        _Conn(), "m", flush_size=4, headlines_per_call=5, concurrency=2,
+        score_cache=False, page_size=10, work_queue=True,
+    ))
+
+    assert queue.completed == {"2025-01-01": 10}             # only the clean day is done
+    assert queue.released == ["2025-01-02"]                  # retried by the next run
+
+
+def test_reopen_requeues_done_days_that_still_have_unscored_headlines():
+    from processing_engine.work_queue import WorkQueue
+
+    class _Cursor:
+        description = None
+        rowcount = 0
+
+        def __init__(self, log):
+            self.log = log
+
+        def execute(self, sql, params):
+            assert sql.count("%s") == len(params)
+            self.log.append((sql, params))
+
+        def close(self):
+            pass
+
+    class _QConn(_Conn):
+        def __init__(self):
+            super().__init__()
+            self.log = []
+
+        def cursor(self):
+            return _Cursor(self.log)
+
+    for any_model, scored in ((False, "nv.model_name = %s"), (True, "nv.validation_passed")):
+        conn = _QConn()
+        queue = WorkQueue(conn, "m", any_model=any_model, date_from="2024-01-01")
+        queue.seed()
+        recent, recent_params = conn.log[1]                 # seeding re-checks recent days only
+        assert "NOT EXISTS" in recent and scored in recent
+        assert recent_params[0] == (date.today() - timedelta(days=1)).isoformat()
+        queue.reopen()
+        reopen, params = conn.log[2]
+        assert "NOT EXISTS" in reopen and scored in reopen
+        assert "interval '2 days'" not in reopen                # no scraper-lag heuristic
+        assert params[0] == "2024-01-01" and params[-2:] == ("m", "any_model" if any_model else "model")
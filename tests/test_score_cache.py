@@ -0,0 +1,94 @@
+"""Score cache: normalised keys, and one LLM call per distinct headline text."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("regex")
+
+from processing_engine.score_cache import CacheStats, headline_cache_key  # noqa: E402
+
+_path = Path(__file__).resolve().parent.parent / "scripts" / "process_headlines.py"
+_spec = importlib.util.spec_from_file_location("process_headlines", _path)
+process_headlines = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(process_headlines)
+
+
+def test_cache_key_ignores_niqqud_and_whitespace():
+    plain = "הכנסת אישרה את התקציב"
+    assert headline_cache_key(plain) == headline_cache_key("  הַכְּנֶסֶת   אישרה\tאת התקציב ")
+    assert headline_cache_key(plain) != headline_cache_key("הכנסת דחתה את התקציב")
+
+
+class _MemoryCache:
+    """In-memory stand-in for ScoreCache (same lookup/store_many/stats surface)."""
+
+    def __init__(self, seed: dict | None = None) -> None:
+        self.rows = dict(seed or {})
+        self.stats = CacheStats()
+
+    def lookup(self, keys):
+        return {k: self.rows[k] for k in set(keys) if k in self.rows}
+
+    def store_many(self, entries):
+        n = 0
+        for key, result, src in entries:
+            if result.get("validation_passed"):
+                self.rows.setdefault(key, (result, src))
+                n += 1
+        return n
+
+
+def _result(sentiment: int, ok: bool = True) -> dict:
+    return {"global_sentiment": sentiment, "validation_passed": ok,
+            "processing_time_seconds": 1.5, "errors": []}
+
+
+def _scorer(calls: list):
+    async def score(obs_list):
+        calls.append([o["headline"] for o in obs_list])
+        return [_result(len(o["headline"])) for o in obs_list]
+    return score
+
+
+def test_score_chunk_scores_each_distinct_text_once():
+    rows = [
+        {"id": 1, "headline": "ירי רקטות לעבר הצפון"},
+        {"id": 2, "headline": "ירי  רקטות לעבר הצפון "},   # same story, other outlet
+        {"id": 3, "headline": "הבורסה ננעלה בעליות"},
+        {"id": 4, "headline": "כבר נוקד בעבר"},
+    ]
+    cached_result = {**_result(-3), "processing_time_seconds": 0.0}
+    cache = _MemoryCache({headline_cache_key("כבר נוקד בעבר"): (cached_result, 99)})
+    calls: list = []
+
+    scored = asyncio.run(process_headlines._score_chunk(rows, _scorer(calls), cache))
+
+    assert calls == [["ירי רקטות לעבר הצפון", "הבורסה ננעלה בעליות"]]
+    assert [(hid, src) for hid, _, src in scored] == [(1, None), (2, 1), (3, None), (4, 99)]
+    assert scored[1][1]["global_sentiment"] == scored[0][1]["global_sentiment"]
+    assert scored[1][1]["processing_time_seconds"] == 0.0
+    assert scored[3][1] is cached_result
+    assert (cache.stats.lookups, cache.stats.hits, cache.stats.duplicates) == (4, 1, 1)
+    assert cache.stats.hit_rate == 0.5
+    assert headline_cache_key("הבורסה ננעלה בעליות") in cache.rows
+
+
+def test_score_chunk_without_cache_and_failed_results_not_cached():
+    rows = [{"id": 1, "headline": "א"}, {"id": 2, "headline": "א"}]
+    calls: list = []
+    scored = asyncio.run(process_headlines._score_chunk(rows, _scorer(calls), None))
+    assert calls == [["א", "א"]]
+    assert [src for _, _, src in scored] == [None, None]
+
+    async def failing(obs_list):
+        return [_result(0, ok=False) for _ in obs_list]
+
+    cache = _MemoryCache()
+    asyncio.run(process_headlines._score_chunk(rows, failing, cache))
+    assert cache.rows == {}
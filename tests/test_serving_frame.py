@@ -0,0 +1,118 @@
+"""Serving frame: tail recompute + append equals a full rebuild; stale states and drift surface."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sentisense.constants import SCORE_COLUMNS
+from sentisense.features import dataset as ds
+from sentisense.features import serving as S
+
+_COLS = list(SCORE_COLUMNS)
+_PARAMS = {"overnight": True, "horizon": 1, "top_n": 3, "model": "m"}
+
+
+@pytest.fixture
+def world():
+    """Calendar inputs over ~5 months + the finance base on a Sun–Thu calendar."""
+    rng = np.random.default_rng(0)
+    cal = pd.date_range("2023-01-01", "2023-05-31", name="date")
+    sources = ["ynet", "haaretz", "walla", "kan", "i24"]
+    rows = [(d, s) for d in cal for s in sources if rng.random() < 0.7]
+    agg = pd.DataFrame(rows, columns=["date", "source"])
+    n = rng.integers(1, 30, len(agg))
+    agg["n"] = n
+    for c in _COLS:
+        agg[f"sum_{c}"] = rng.integers(-10, 11, len(agg)) * n
+        agg[f"n_{c}"] = n
+    agg["sum_abs_sentiment"] = agg["sum_global_sentiment"].abs()
+    agg["sum_sq_sentiment"] = agg["sum_abs_sentiment"] * 10
+    cen = pd.DataFrame(rng.standard_normal((len(cal), 8)), index=cal,
+                       columns=[f"embc_{i:03d}" for i in range(8)])
+    cen["emb_dispersion"], cen["emb_count"] = 1.0, 5
+    der = pd.DataFrame(rng.standard_normal((len(cal), 2)), index=cal,
+                       columns=["embpca_000", "embclus_dist_0"])
+
+    days = cal[cal.dayofweek.isin([6, 0, 1, 2, 3])]
+    price = pd.Series(1800 + rng.standard_normal(len(days)).cumsum() * 10, index=days)
+    base = pd.DataFrame({"TA125_Price": price, "TA125_Volume": rng.uniform(1e6, 2e6, len(days)),
+                         "Market_SP500": 4000 + rng.standard_normal(len(days)).cumsum(),
+                         "VTA35_Price": np.where(np.arange(len(days)) < 10, np.nan, 20.0)},
+                        index=days)
+    base.index.name = "date"
+    return agg, cen, der, base, price
+
+
+def _loader(agg, cen, der, upto):
+    """``load_inputs`` over the rows stored by ``upto`` (later-dated rows not yet landed)."""
+    def load(start):
+        lo = pd.Timestamp(start or dt.date.min)
+        return (agg[(agg["date"] >= lo) & (agg["date"] <= upto)],
+                cen[(cen.index >= lo) & (cen.index <= upto)],
+                der[(der.index >= lo) & (der.index <= upto)])
+    return load
+
+
+def _full(world, n_days, upto, top):
+    agg, cen, der, base, price = world
+    scores, c, d = _loader(agg, cen, der, upto)(None)
+    feat = ds._fused_features(ds._feature_ops("pandas"), scores, c, d, base.iloc[:n_days], price,
+                              top_n=3, overnight=True, top_sources=top)
+    return ds._finalize(feat, S._FAR_FUTURE, 1, keep_unlabeled=True)
+
+
+def test_appended_tail_matches_full_rebuild(world):
+    agg, cen, der, base, price = world
+    top = ds._top_sources(agg.groupby("source")["n"].sum(), 3)
+    # Yesterday's frame: three fewer trading days, and the last two days' news not yet scored.
+    then = _full(world, len(base) - 3, base.index[-4] - pd.Timedelta(days=2), top)
+    assert (then["Target"] == -1).sum() == 1
+    upto = pd.Timestamp("2023-05-31")
+    ref = _full(world, len(base), upto, top)
+    assert S.compare_frames(then, ref)["rows_differ"] >= 1      # late news + a new label
+    got, n_new = S.append_tail(then, base, price, _loader(agg, cen, der, upto),
+                               top_sources=top, params=_PARAMS)
+    assert n_new == 3 and len(ref) > 100
+    pd.testing.assert_frame_equal(got, ref, check_freq=False)
+    assert S.compare_frames(got, ref)["rows_differ"] == 0
+
+
+def test_calendar_change_before_tail_is_stale(world):
+    agg, cen, der, base, price = world
+    top = ds._top_sources(agg.groupby("source")["n"].sum(), 3)
+    then = _full(world, len(base) - 1, pd.Timestamp("2023-05-31"), top)
+    with pytest.raises(S._StaleState, match="calendar"):
+        S.append_tail(then, base.drop(base.index[50]), price, _loader(agg, cen, der, "2023-05-31"),
+                      top_sources=top, params=_PARAMS)
+
+
+def test_compare_frames_reports_drift():
+    idx = pd.date_range("2024-01-01", periods=4)
+    full = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0], "count_x": 1.0, "Target": [1, 0, 1, -1]}, index=idx)
+    appended = full.iloc[:3].drop(columns="count_x").assign(a=[1.0, 2.5, 3.0], count_y=0.0)
+    report = S.compare_frames(appended, full)
+    assert report["rows"] == 3 and report["rows_differ"] == 1 and report["cols_differ"] == ["a"]
+    assert report["cols_only_appended"] == ["count_y"] and report["cols_only_full"] == ["count_x"]
+    assert report["days_missing"] == 1 and report["max_abs_diff"] == pytest.approx(0.5)
+
+
+def test_serving_frame_extends_in_place_until_a_full_rebuild_is_due(tmp_path, monkeypatch):
+    calls = []
+    frame = pd.DataFrame({"a": [1.0], "Target": [-1]}, index=pd.date_range("2024-01-01", periods=1))
+    monkeypatch.setattr(S, "_ROOT", tmp_path)
+    monkeypatch.setattr(S, "_full_frame", lambda engine, params: (calls.append("full"), (frame, ["x"]))[1])
+    monkeypatch.setattr(S, "_incremental",
+                        lambda engine, state, params: (calls.append("inc"), (state["frame"], 0))[1])
+    monkeypatch.setattr(S, "compare_frames", lambda a, b: calls.append("compare") or {
+        "rows": 1, "rows_differ": 0, "max_abs_diff": 0.0, "cols_differ": [],
+        "cols_only_appended": [], "cols_only_full": [], "days_missing": 0})
+
+    S.serving_frame(object(), full_every=7)                     # no state → full
+    S.serving_frame(object(), full_every=7)                     # fresh state → tail only
+    S.serving_frame(object(), full_every=7, full=True)          # forced → tail, full, compare
+    assert calls == ["full", "inc", "inc", "full", "compare"]
+    assert len(list(tmp_path.glob("fused-*.pkl"))) == 1
@@ -0,0 +1,69 @@
+"""Batched k-NN over headline_vectors — query rendering, validation and result grouping (no DB)."""
+
+from __future__ import annotations
+
+import datetime as dt
+from types import SimpleNamespace
+
+import pytest
+
+from sentisense.embed import similarity as S
+
+
+class _FakeConn:
+    def __init__(self, rows, log):
+        self.rows, self.log = rows, log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt, params=None):
+        self.log.append((str(stmt), params))
+        return SimpleNamespace(fetchall=lambda: self.rows)
+
+
+class _FakeEngine:
+    def __init__(self, rows=()):
+        self.rows, self.log = list(rows), []
+
+    def begin(self):
+        return _FakeConn(self.rows, self.log)
+
+
+def _row(query_id, headline_id, distance):
+    return SimpleNamespace(query_id=query_id, headline_id=headline_id, date=dt.date(2024, 1, 2),
+                           source="ynet", headline=f"h{headline_id}", distance=distance)
+
+
+def test_filters_render_only_when_given():
+    bare = str(S._knn_query(start=None, end=None, sources=None))
+    assert ":start" not in bare and ":sources" not in bare and "LATERAL" in bare
+    full = str(S._knn_query(start=dt.date(2024, 1, 1), end=dt.date(2024, 2, 1), sources=["a"]))
+    assert "hv.date >= :start" in full and "hv.date <= :end" in full
+    assert "hv.source = ANY(:sources)" in full
+
+
+def test_similar_many_groups_rows_and_sets_ef_search():
+    engine = _FakeEngine([_row(1, 7, 0.1), _row(1, 8, 0.2), _row(2, 9, 0.3)])
+    out = S.similar_many(engine, [2, 1, 1, 3], k=2, ef_search=80, sources=["ynet"])
+
+    assert list(out) == [2, 1, 3]
+    assert [r["headline_id"] for r in out[1]] == [7, 8] and out[3] == []
+    (set_sql, _), (_, params) = engine.log
+    assert set_sql == "SET LOCAL hnsw.ef_search = 80"
+    assert params["ids"] == [2, 1, 3] and params["k"] == 2 and params["sources"] == ["ynet"]
+
+
+@pytest.mark.parametrize("kwargs", [{"k": 0}, {"k": S.MAX_K + 1}, {"ef_search": 0},
+                                    {"ef_search": 1001}])
+def test_similar_many_rejects_out_of_range_knobs(kwargs):
+    with pytest.raises(ValueError):
+        S.similar_many(_FakeEngine(), [1], **kwargs)
+
+
+def test_no_ids_skips_the_query():
+    engine = _FakeEngine()
+    assert S.similar_many(engine, []) == {} and engine.log == []
@@ -0,0 +1,114 @@
+"""Stored score aggregates: builders over (date, source) sums match the per-headline groupby."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sentisense.constants import SCORE_COLUMNS
+from sentisense.features import dataset as ds
+from sentisense.features import source_scores as S
+
+_COLS = list(SCORE_COLUMNS)
+
+
+@pytest.fixture
+def raw():
+    """Latest-score-per-headline rows, as the pre-017 loader returned them (NULLs included)."""
+    rng = np.random.default_rng(0)
+    n = 600
+    sources = rng.choice(["ynet", "haaretz", "walla", "maariv", "kan", "i24"], n,
+                         p=[.3, .25, .2, .12, .08, .05])
+    frame = pd.DataFrame({
+        "date": pd.to_datetime("2023-01-01") + pd.to_timedelta(rng.integers(0, 20, n), "D"),
+        "source": sources,
+    })
+    for c in _COLS:
+        lo, hi = (-10, 10) if c == "global_sentiment" else (0, 10)
+        vals = rng.integers(lo, hi + 1, n).astype(float)
+        vals[rng.random(n) < 0.1] = np.nan
+        frame[c] = vals
+    # A day whose only headline has no sentiment, and one with a single scored headline.
+    frame.loc[len(frame)] = [pd.Timestamp("2023-02-01"), "kan", *[np.nan] * len(_COLS)]
+    frame.loc[len(frame)] = [pd.Timestamp("2023-02-02"), "kan", *range(1, len(_COLS) + 1)]
+    return frame
+
+
+def _aggregate(raw):
+    """What the migration-017 INSERT … SELECT stores for ``raw``."""
+    g = raw.groupby(["date", "source"])
+    agg = g.size().rename("n").to_frame()
+    for c in _COLS:
+        agg[f"sum_{c}"] = g[c].sum().astype("int64")
+        agg[f"n_{c}"] = g[c].count()
+    agg["sum_abs_sentiment"] = g["global_sentiment"].apply(lambda s: s.abs().sum()).astype("int64")
+    agg["sum_sq_sentiment"] = g["global_sentiment"].apply(lambda s: (s * s).sum()).astype("int64")
+    return agg.reset_index()
+
+
+def test_daily_mean_matches_headline_groupby(raw):
+    ref = raw.groupby("date")[_COLS].mean().add_prefix("mean_")
+    ref["n_headlines"] = raw.groupby("date").size()
+    pd.testing.assert_frame_equal(ds._build_daily_mean(_aggregate(raw)), ref, check_dtype=False)
+
+
+def test_per_source_pivot_matches_headline_groupby(raw):
+    top = raw["source"].value_counts().head(3).index.tolist()
+    raw = raw.assign(source_group=raw["source"].where(raw["source"].isin(top), "_other"))
+    g = raw.groupby(["date", "source_group"])
+    grouped = g[_COLS].sum().assign(count=g.size()).reset_index()
+    ref = pd.concat([grouped.pivot(index="date", columns="source_group", values=c).fillna(0)
+                     .add_prefix(f"{c}_") for c in [*_COLS, "count"]], axis=1)
+    ref.columns.name = None
+    out = ds._build_per_source_wide(_aggregate(raw.drop(columns="source_group")), top_n=3)
+    pd.testing.assert_frame_equal(out, ref[out.columns], check_dtype=False)
+    assert set(out.columns) == set(ref.columns)
+
+
+def test_interactions_match_headline_groupby(raw):
+    g = raw.groupby("date")
+    sent = g["global_sentiment"].mean()
+    ref = pd.DataFrame({
+        "ix_econ_sent": g["relevance_economy"].mean() * sent,
+        "ix_sec_sent": g["relevance_security"].mean() * sent,
+        "ix_pol_sent": g["relevance_politics"].mean() * sent,
+        "ix_total_relevance": g[[c for c in _COLS if c != "global_sentiment"]].mean().sum(axis=1),
+        "ix_sent_intensity": g["global_sentiment"].apply(lambda s: s.abs().mean()),
+        "ix_sent_dispersion": g["global_sentiment"].std(),
+    })
+    out = ds._build_interactions(_aggregate(raw))
+    pd.testing.assert_frame_equal(out, ref, check_names=False, rtol=1e-9, atol=1e-9)
+    assert np.isnan(out.loc["2023-02-01", "ix_sent_intensity"])
+    assert np.isnan(out.loc["2023-02-02", "ix_sent_dispersion"])
+
+
+def test_aggregate_sql_covers_every_score_column():
+    sql = str(S._AGG_DATES_SQL)
+    for c in _COLS:
+        assert f"sum_{c}" in sql and f"COUNT(s.{c})" in sql
+    assert "= ANY(:dates)" in sql and "ANY" not in str(S._AGG_ALL_SQL)
+
+
+def test_refresh_takes_the_lock_before_reading_the_watermark(monkeypatch):
+    from types import SimpleNamespace
+
+    executed = []
+
+    class _Txn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, stmt, params=None):
+            executed.append(str(stmt))
+            head = SimpleNamespace(last_id=-1, n=0) if "COALESCE(MAX(id)" in str(stmt) else None
+            return SimpleNamespace(fetchone=lambda: head, rowcount=0)
+
+    monkeypatch.setattr(S, "ensure_source_scores_table", lambda engine: None)
+    for rebuild in (False, True):                    # first run (no watermark row) and rebuild
+        executed.clear()
+        assert S.refresh_daily_source_scores(SimpleNamespace(begin=_Txn), rebuild=rebuild) == 0
+        assert "pg_advisory_xact_lock" in executed[0]
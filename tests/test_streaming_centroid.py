@@ -80,3 +80,69 @@ def test_empty_corpus_returns_empty_frame(monkeypatch):
         columns=["headline_id", "date", "dim", "embedding"]))
     out = E.daily_embedding_centroid(_FakeEngine(), cutoff="2100-01-01")
     assert out.empty
+
+
+def test_shuffled_pages_and_date_growth_match_groupby():
+    # Rows out of date order within a page, and more dates than the initial capacity.
+    rng = np.random.default_rng(3)
+    dim = 8
+    dates = (np.datetime64("2024-01-01") + rng.integers(0, 40, 500)).astype("datetime64[D]")
+    vecs = rng.standard_normal((500, dim)).astype(np.float32)
+
+    moments = E._DailyMoments(dim, capacity=4)
+    for lo in range(0, 500, 64):
+        moments.add(vecs[lo:lo + 64], dates[lo:lo + 64])
+    out = moments.frame()
+
+    ref = pd.DataFrame(vecs.astype(np.float64), index=pd.DatetimeIndex(dates)).groupby(level=0)
+    np.testing.assert_allclose(out.iloc[:, :dim].to_numpy(), ref.mean().to_numpy(), atol=1e-6)
+    np.testing.assert_allclose(out["emb_dispersion"].to_numpy(),
+                               ref.std(ddof=0).mean(axis=1).to_numpy(), atol=1e-6)
+    assert out.index.is_monotonic_increasing
+    assert out["emb_count"].tolist() == ref.size().tolist()
+
+
+def test_persisted_rows_merge_like_one_pass():
+    # refresh_daily_centroid folds a delta into stored rows via rows()/merge(); the result
+    # must equal accumulating everything in one pass.
+    rng = np.random.default_rng(5)
+    dim = 8
+    dates = np.sort((np.datetime64("2024-03-01") + rng.integers(0, 6, 300)).astype("datetime64[D]"))
+    vecs = rng.standard_normal((300, dim)).astype(np.float32)
+
+    one_pass = E._DailyMoments(dim)
+    one_pass.add(vecs, dates)
+
+    stored, delta = E._DailyMoments(dim), E._DailyMoments(dim)
+    stored.add(vecs[:200], dates[:200])
+    delta.add(vecs[200:], dates[200:])
+    for d, n, s, sq in stored.rows():
+        if d in delta.ordinal:
+            delta.merge(pd.Timestamp(d).date(), n, s, sq)
+    untouched = {d for d in stored.ordinal if d not in delta.ordinal}
+    merged = pd.concat([stored.frame().loc[sorted(pd.DatetimeIndex(list(untouched)))],
+                        delta.frame()]).sort_index()
+
+    np.testing.assert_allclose(merged.to_numpy(), one_pass.frame().to_numpy(), atol=1e-9)
+    assert delta.n_rows + sum(n for d, n, *_ in stored.rows() if d in untouched) == 300
+
+
+def test_refresh_takes_the_model_lock_before_reading_the_watermark(monkeypatch):
+    from types import SimpleNamespace
+
+    from sentisense.embed import centroid as C
+
+    executed = []
+
+    class _Txn(_FakeConn):
+        def execute(self, stmt, params=None):
+            executed.append(str(stmt))
+            return SimpleNamespace(fetchone=lambda: None, scalar=lambda: 0)
+
+    monkeypatch.setattr(C, "ensure_centroid_table", lambda engine: None)
+    monkeypatch.setattr(C, "_stream_moments", lambda *a, **k: (None, -1))
+    engine = SimpleNamespace(begin=_Txn)
+    for rebuild in (False, True):                    # first run (no watermark row) and rebuild
+        executed.clear()
+        assert C.refresh_daily_centroid(engine, rebuild=rebuild, model="m") == 0
+        assert "pg_advisory_xact_lock" in executed[0]
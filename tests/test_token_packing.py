@@ -0,0 +1,172 @@
+"""Token-exact fast-batch packing: local tokenizer counts, LRU, fill ratio, bisection counter."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+
+import pytest
+
+pytest.importorskip("langchain_core")
+pytest.importorskip("regex")
+
+import processing_engine.fast_pipeline as fp  # noqa: E402
+import processing_engine.tokens as tokens  # noqa: E402
+from processing_engine.models import BatchHeadlineScores, HeadlineScoreEntry  # noqa: E402
+from processing_engine.prompts import _clamp_output_tokens  # noqa: E402
+from processing_engine.tokens import TokenCounter  # noqa: E402
+
+
+class _Encoding:
+    def __init__(self, text: str) -> None:
+        self.offsets = [m.span() for m in re.finditer(r"\S+", text)]
+        self.ids = list(range(len(self.offsets)))
+
+
+class _WordTokenizer:
+    """Stand-in for ``tokenizers.Tokenizer``: one token per whitespace word."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def encode_batch(self, texts, add_special_tokens=False):
+        self.calls += 1
+        return [_Encoding(t) for t in texts]
+
+
+def _exact_counter(cache_size: int = 1024) -> TokenCounter:
+    counter = TokenCounter(cache_size=cache_size)
+    counter._tokenizer = _WordTokenizer()
+    return counter
+
+
+def test_estimate_without_tokenizer():
+    counter = TokenCounter()
+    assert not counter.exact
+    assert counter.count("א" * 30) == 20                    # 1.5 chars / token
+
+
+def test_lru_counts_each_text_once_and_evicts():
+    counter = _exact_counter(cache_size=2)
+    assert counter.count_many(["a b", "c", "a b"]) == [2, 1, 2]
+    assert (counter.hits, counter.misses, counter._tokenizer.calls) == (0, 2, 1)
+    assert counter.count("a b") == 2 and counter.hits == 1
+    counter.count("d e f")                                    # evicts "c"
+    assert list(counter._cache) == ["a b", "d e f"]
+    assert counter.count("x y z", cache=False) == 3 and "x y z" not in counter._cache
+
+
+def test_missing_tokenizer_file_falls_back(tmp_path):
+    assert not TokenCounter(str(tmp_path / "nope.json")).exact
+
+
+def test_exact_packing_fills_to_ratio(monkeypatch):
+    counter = _exact_counter()
+    monkeypatch.setattr(tokens, "_counter", counter)
+    monkeypatch.setattr(fp, "_CONTEXT_WINDOW", 4000)
+    monkeypatch.setattr(fp, "BATCH_FILL_RATIO", 0.9)
+    monkeypatch.setattr(fp, "PACKING_STATS", fp.PackingStats())
+
+    system = counter.count(fp._BATCH_SYSTEM_PROMPT)
+    wrapper = counter.count(fp._ENTRY_WRAPPER)
+    budget = fp._input_token_budget()
+    assert budget == 3600 - system
+
+    evidence = " ".join(["מילה"] * 100)
+    obs = [{"headline": "כותרת קצרה"} for _ in range(12)]
+    per_entry = wrapper + 2 + 100
+    assert fp._estimate_input_tokens("כותרת קצרה", evidence) == per_entry
+
+    packed = fp._pack_batches(obs, [evidence] * 12, batch_size=50)
+    fit = budget // (per_entry + fp._PER_HEADLINE_OUTPUT_TOKENS)
+    assert len(packed[0][0]) == fit
+    assert sum(len(b[0]) for b in packed) == 12
+
+    stats = fp.PACKING_STATS
+    assert stats.batches == len(packed) and stats.headlines == 12
+    first_fill = (system + fit * (per_entry + fp._PER_HEADLINE_OUTPUT_TOKENS)) / 4000
+    assert first_fill <= 0.9
+    assert counter.misses <= 4                                # evidence tokenised once
+
+
+def test_estimated_packing_keeps_safety_budget(monkeypatch):
+    monkeypatch.setattr(tokens, "_counter", TokenCounter())
+    assert fp._input_token_budget() == (
+        int(fp._CONTEXT_WINDOW * fp._SAFETY_FACTOR) - fp._SYSTEM_PROMPT_TOKENS
+    )
+
+
+def test_truncate_cuts_at_token_boundaries():
+    counter = _exact_counter()
+    assert counter.truncate("אחת שתיים שלוש ארבע", 2) == "אחת שתיים"
+    assert counter.truncate("אחת שתיים", 5) == "אחת שתיים"
+    assert counter.truncate("אחת", 0) == ""
+    assert TokenCounter().truncate("א" * 30, 4) == "א" * 6          # estimate: 1.5 chars/token
+
+
+def test_clamp_uses_exact_prompt_count(monkeypatch):
+    monkeypatch.setattr(tokens, "_counter", _exact_counter())
+    prompt = " ".join(["מילה"] * 1000)                       # 1000 tokens, ~3000 estimated
+    import processing_engine.prompts as prompts
+
+    monkeypatch.setattr(prompts, "CONTEXT_WINDOW", 5000)
+    assert _clamp_output_tokens(prompt, 10_000) == 5000 - 1000 - 256
+
+
+class _OverflowLLM:
+    """Rejects any batch with more than two headlines as a context overflow."""
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, messages):
+        n = messages[1]["content"].count("## Headline [")
+        if n > 2:
+            raise ValueError("This model's maximum context length is 8192 tokens")
+        return BatchHeadlineScores(results=[
+            HeadlineScoreEntry(
+                headline_index=i, chain_of_thought="", politics_government=0,
+                economy_finance=0, security_military=0, health_medicine=0,
+                science_climate=0, technology=0, global_sentiment=0,
+            )
+            for i in range(n)
+        ])
+
+
+def test_bisections_are_counted(monkeypatch):
+    monkeypatch.setattr(tokens, "_counter", TokenCounter())
+    monkeypatch.setattr(fp, "PACKING_STATS", fp.PackingStats())
+    obs = [{"headline": f"כותרת {i}"} for i in range(8)]
+    results = asyncio.run(fp.score_headlines_batch(obs, llm=_OverflowLLM(), batch_size=8))
+    assert all(r["validation_passed"] for r in results)
+    assert fp.PACKING_STATS.bisections == 3                   # 8 → 4+4 → 2+2+2+2
+    assert fp.PACKING_STATS.truncations == 0
+    assert "3 overflow bisections" in fp.PACKING_STATS.summary()
+
+
+class _OversizedLLM(_OverflowLLM):
+    """Rejects every prompt over ``limit`` words; records what it scored."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.scored: list[str] = []
+
+    async def ainvoke(self, messages):
+        if len(messages[1]["content"].split()) > self.limit:
+            raise ValueError("This model's maximum context length is 8192 tokens")
+        self.scored.append(messages[1]["content"])
+        return await super().ainvoke(messages)
+
+
+def test_oversized_headline_is_truncated_by_exact_tokens(monkeypatch):
+    monkeypatch.setattr(tokens, "_counter", _exact_counter())
+    monkeypatch.setattr(fp, "PACKING_STATS", fp.PackingStats())
+    monkeypatch.setattr(fp, "_input_token_budget", lambda evidence_format="full": 400)
+    headline = " ".join(f"מילה{i}" for i in range(1000))
+    llm = _OversizedLLM(limit=450)
+
+    [result] = asyncio.run(fp.score_headlines_batch([{"headline": headline}], llm=llm, batch_size=2))
+
+    assert result["validation_passed"] and fp.PACKING_STATS.truncations == 1
+    kept = llm.scored[0].split("## Headline [0]\n", 1)[1].split("\n", 1)[0].split()
+    assert kept == [f"מילה{i}" for i in range(200)]                        # budget // 2 tokens
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import datetime as dt
 import importlib.util
+import struct
 from pathlib import Path
+from types import SimpleNamespace
 
 import numpy as np
 import pytest
@@ -27,3 +30,46 @@ def test_vec_literal_dim_mismatch_raises():
     v = np.zeros(3, dtype=np.float32)
     with pytest.raises(ValueError, match="!= dim"):
         _vec_literal(v.tobytes(), dim=4)
+
+
+def _read_field(buf, pos):
+    (n,) = struct.unpack_from("!i", buf, pos)
+    pos += 4
+    if n < 0:
+        return None, pos
+    return buf[pos:pos + n], pos + n
+
+
+def test_copy_payload_is_pgcopy_binary_with_pgvector_values():
+    vecs = np.random.default_rng(0).standard_normal((2, 3)).astype(np.float32)
+    rows = [SimpleNamespace(headline_id=7, date=dt.date(2000, 1, 3), source="ynet",
+                            headline="כותרת", embedding=vecs[0].tobytes()),
+            SimpleNamespace(headline_id=9, date=None, source=None, headline="x",
+                            embedding=vecs[1].tobytes())]
+    buf = deploy_vectordb._copy_payload(rows, "org/m", 3)
+
+    assert buf.startswith(b"PGCOPY\n\xff\r\n\x00") and buf.endswith(struct.pack("!h", -1))
+    pos = 19
+    for row, vec in zip(rows, vecs):
+        assert struct.unpack_from("!h", buf, pos) == (6,)
+        pos += 2
+        fields = []
+        for _ in range(6):
+            value, pos = _read_field(buf, pos)
+            fields.append(value)
+        hid, model, date, source, headline, emb = fields
+        assert struct.unpack("!q", hid) == (row.headline_id,) and model == b"org/m"
+        assert (date is None) == (row.date is None)
+        if date is not None:
+            assert struct.unpack("!i", date) == (2,)                 # days since 2000-01-01
+        assert headline.decode("utf-8") == row.headline and (source is None) == (row.source is None)
+        assert struct.unpack_from("!hh", emb) == (3, 0)
+        assert np.array_equal(np.frombuffer(emb[4:], dtype=">f4"), vec)
+    assert pos == len(buf) - 2
+
+
+def test_copy_payload_dim_mismatch_raises():
+    row = SimpleNamespace(headline_id=1, date=None, source=None, headline="x",
+                          embedding=np.zeros(3, dtype=np.float32).tobytes())
+    with pytest.raises(ValueError, match="!= dim"):
+        deploy_vectordb._copy_payload([row], "m", 4)
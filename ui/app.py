@@ -13,6 +13,7 @@ Run (server-side, inside /tf, port 3000 exposed to host):
 from __future__ import annotations
 
 import asyncio
+import datetime as dt
 import hashlib
 import hmac
 import json
@@ -606,6 +607,30 @@ def headlines(date: str, page: int = Query(0, ge=0), page_size: int = Query(50,
         category=category, category_min=category_min)
 
 
+@app.get("/api/headlines/{headline_id}/similar")
+def headlines_similar(headline_id: int, k: int = Query(10, ge=1, le=50),
+                      start: str | None = None, end: str | None = None,
+                      source: list[str] | None = Query(None),
+                      ef_search: int | None = Query(None, ge=1, le=1000)) -> dict:
+    """Nearest headlines ("stories like this one") by e5 cosine distance via pgvector HNSW.
+
+    ``start``/``end`` (YYYY-MM-DD) and repeated ``source`` params restrict the neighbours;
+    ``ef_search`` trades latency for recall (raise it when a narrow filter returns < k).
+    """
+    try:
+        bounds = [dt.date.fromisoformat(d) if d else None for d in (start, end)]
+    except ValueError:
+        return JSONResponse({"error": "start/end must be YYYY-MM-DD"}, status_code=400)
+    try:
+        from sentisense.embed.similarity import similar
+        rows = similar(get_engine(), headline_id, k=k, start=bounds[0], end=bounds[1],
+                       sources=source, ef_search=ef_search)
+    except Exception as exc:  # noqa: BLE001 — headline_vectors / pgvector may be absent
+        logger.warning("/api/headlines/{}/similar failed: {}", headline_id, str(exc)[:300])
+        return {"headline_id": headline_id, "similar": [], "error": str(exc)[:200]}
+    return {"headline_id": headline_id, "similar": rows}
+
+
 @app.get("/api/dates")
 def dates(page: int = Query(0, ge=0),
           page_size: int | None = Query(None, ge=1, le=10000)) -> dict:
@@ -105,10 +105,12 @@ function daysTrace(pts) {
 /**
  * Single-day traces: the day's headline vectors (green), the day centroid
  * (accent diamond), and the KMeans cluster centers — on the chosen axes.
+ * The payload's own ``clusters`` (projected in the basis the day was drawn
+ * with) win over ``centers``, the embpca-space fallback.
  *
  * @param {object} day The /api/centroids/day payload.
  * @param {number[]} axes The [x,y,z] component indices.
- * @param {Array} centers Projected cluster centers.
+ * @param {Array} centers Projected cluster centers (fallback).
  * @param {string} textColor Label colour for the active theme.
  * @returns {Array} Plotly traces.
  */
@@ -129,12 +131,14 @@ function headlineTraces(day, axes, centers = [], textColor) {
     traces.push({
       type: 'scatter3d', mode: 'markers', name: 'Day centroid',
       x: [day.centroid[ax]], y: [day.centroid[ay]], z: [day.centroid[az]],
-      text: [`Centroid of ${day.date} — the embpca features the model sees`],
+      text: [day.basis?.kind === 'headline'
+        ? `Centroid of ${day.date} — in the headline-level basis v${day.basis.version}`
+        : `Centroid of ${day.date} — the embpca features the model sees`],
       hovertemplate: '%{text}<extra></extra>',
       marker: { size: 10, color: ACCENT, symbol: 'diamond', opacity: 1 },
     });
   }
-  const kc = centersTrace(centers, axes, textColor);
+  const kc = centersTrace(day.clusters || centers, axes, textColor);
   if (kc) traces.push(kc);
   return traces;
 }
@@ -293,8 +297,9 @@ export default function Centroids3D({ open, onClose }) {
         ) : (
           <div className="ss-drawer__body">
             <p className="ss-muted" style={{ margin: '4px 2px 8px' }}>
-              Every headline of the chosen day (green), projected into the same 16-dim PCA space
-              as the model&apos;s <code>embpca</code> features. The blue diamond is the day
+              Every headline of the chosen day (green), projected into a 16-dim PCA space —
+              the headline-level basis when one is stored, else the same space as the
+              model&apos;s <code>embpca</code> features. The blue diamond is the day
               centroid; the open diamonds are the KMeans cluster centers.
               {(() => {
                 const c = points.find((p) => p.date === dayDate)?.cluster;
@@ -1,4 +1,5 @@
 import React, { useEffect, useState } from 'react';
+import { getJson } from '../lib/api.js';
 import { sentimentBadge } from '../lib/format.js';
 
 const CATEGORIES = [
@@ -50,6 +51,49 @@ function Fact({ label, children, className = '' }) {
   );
 }
 
+/**
+ * "Stories like this one" — nearest headlines by embedding distance, fetched from
+ * /api/headlines/{id}/similar the first time the card's toggle is opened.
+ */
+function SimilarStories({ id }) {
+  const [open, setOpen] = useState(false);
+  const [rows, setRows] = useState(null);
+  const [error, setError] = useState(null);
+
+  useEffect(() => {
+    if (!open || rows !== null) return;
+    getJson(`/api/headlines/${id}/similar?k=8`)
+      .then((res) => {
+        setRows(res?.similar || []);
+        setError(res?.error || null);
+      })
+      .catch((err) => setError(err.message));
+  }, [open, rows, id]);
+
+  return (
+    <div className="ss-similar">
+      <button type="button" className="ss-btn ss-btn--ghost" onClick={() => setOpen((o) => !o)}>
+        {open ? 'Hide similar stories' : 'Similar stories'}
+      </button>
+      {open ? (
+        <ul className="ss-similar-list">
+          {error ? <li className="ss-muted">Unavailable: {error}</li> : null}
+          {!error && rows === null ? <li className="ss-muted">Loading…</li> : null}
+          {!error && rows?.length === 0 ? <li className="ss-muted">No similar stories.</li> : null}
+          {(rows || []).map((r) => (
+            <li key={r.headline_id}>
+              <span dir="rtl">{r.headline}</span>
+              <small className="ss-muted">
+                {r.date} · {r.source} · {(1 - r.distance).toFixed(2)}
+              </small>
+            </li>
+          ))}
+        </ul>
+      ) : null}
+    </div>
+  );
+}
+
 /**
  * Structured headline cards showing the full title and all category scores,
  * with optional progressive rendering for long dashboard feeds.
@@ -99,6 +143,7 @@ export default function HeadlineList({
                   )}
                 </Fact>
               </div>
+              <SimilarStories id={h.id} />
             </li>
           );
         })}
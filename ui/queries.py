@@ -11,6 +11,7 @@ from __future__ import annotations
 import math
 import os
 
+from loguru import logger
 from sqlalchemy import text
 
 from sentisense.db import get_engine
@@ -437,20 +438,15 @@ def active_model_metrics(engine=None) -> dict | None:
             "n": (None if row["oos_n"] is None else int(row["oos_n"]))}
 
 
-def _cluster_centers(engine) -> list[dict]:
-    """KMeans cluster centers projected into the embpca space → ``[{id, v: [n_pca]}]``.
+def _project_centers(b: dict) -> list[dict]:
+    """KMeans cluster centers of basis row ``b`` projected into its PCA space → ``[{id, v}]``.
 
     Centers are stored in SCALED 768-d space (the KMeans fit space), so the projection skips
     the scaler: ``(center - pca_mean) @ components.T`` — identical to how the day centroids got
     their ``embpca_*`` coordinates. Empty list when the basis lacks centers (pre-upgrade row).
     """
-    import json as _json
-
     import numpy as np
 
-    with engine.connect() as conn:
-        b = conn.execute(_BASIS).mappings().first()
-    b = dict(b) if b else {}
     if not b.get("kmeans_centers") or not b.get("n_clusters"):
         return []
     nf, k = int(b["n_features"]), int(b["n_clusters"])
@@ -461,6 +457,12 @@ def _cluster_centers(engine) -> list[dict]:
     return [{"id": i, "v": [round(float(x), 4) for x in proj[i]]} for i in range(k)]
 
 
+def _cluster_centers(engine) -> list[dict]:
+    """The centroid basis's KMeans centers in the embpca space (see ``_project_centers``)."""
+    b = _latest_basis(engine, ("centroid",))
+    return _project_centers(b) if b else []
+
+
 def centroid_points(engine=None) -> dict:
     """Per-day 3D news centroids + actual up/down + headline count + KMeans cluster.
 
@@ -489,7 +491,37 @@ def centroid_points(engine=None) -> dict:
     return {"points": points, "clusters": clusters}
 
 
-_BASIS = text("SELECT * FROM embedding_pca_basis ORDER BY created_at DESC LIMIT 1")
+_BASIS = text(
+    """
+    SELECT * FROM embedding_pca_basis WHERE kind = :kind
+    ORDER BY created_at DESC, version DESC LIMIT 1
+    """
+)
+# Pre-migration-014 databases hold one unversioned row per model — the centroid basis.
+_BASIS_LEGACY = text("SELECT * FROM embedding_pca_basis ORDER BY created_at DESC LIMIT 1")
+
+
+def _latest_basis(engine, kinds: tuple[str, ...]) -> dict | None:
+    """Newest ``embedding_pca_basis`` row of the first kind in ``kinds`` that has one.
+
+    ``kind`` is ``centroid`` (the embpca basis fit on daily centroids) or ``headline`` (the
+    out-of-core per-headline fit, ``sentisense.embed.basis``). None when nothing matches.
+    """
+    try:
+        with engine.connect() as conn:
+            for kind in kinds:
+                row = conn.execute(_BASIS, {"kind": kind}).mappings().first()
+                if row is not None:
+                    return dict(row)
+        return None
+    except Exception:  # noqa: BLE001 — no kind/version columns before migration 014
+        if "centroid" not in kinds:
+            return None
+        with engine.connect() as conn:
+            row = conn.execute(_BASIS_LEGACY).mappings().first()
+        return dict(row) if row else None
+
+
 _DAY_EMBED = text(
     """
     SELECT he.headline_id, he.dim, he.embedding, rh.source, rh.headline,
@@ -508,31 +540,87 @@ _DAY_EMBED = text(
     LIMIT :cap
     """
 )
+# Same rows, with the precomputed coordinates (migration 015) — the embedding only ships for
+# headlines not yet projected through this basis version.
+_DAY_PCA = text(
+    """
+    SELECT he.headline_id, hp.coords,
+           CASE WHEN hp.coords IS NULL THEN he.embedding END AS embedding,
+           rh.source, rh.headline, nv.global_sentiment AS sentiment
+    FROM headline_embeddings he
+    JOIN raw_headlines rh ON rh.id = he.headline_id
+    LEFT JOIN headline_pca hp
+        ON hp.embed_model = he.embed_model AND hp.kind = :kind AND hp.version = :version
+       AND hp.headline_id = he.headline_id
+    LEFT JOIN LATERAL (
+        SELECT v.global_sentiment
+        FROM nlp_vectors v
+        WHERE v.headline_id = rh.id AND v.validation_passed
+        ORDER BY (v.model_name = :model) DESC, v.id DESC
+        LIMIT 1
+    ) nv ON TRUE
+    WHERE rh.date = :d AND he.embed_model = :em
+    ORDER BY he.headline_id
+    LIMIT :cap
+    """
+)
 _DAY_POINT_CAP = 2000
 
 
+_UNDEFINED_TABLE = "42P01"   # SQLSTATE of "relation … does not exist"
+
+
+def _missing_table(exc: Exception) -> bool:
+    orig = getattr(exc, "orig", None)
+    return (getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)) == _UNDEFINED_TABLE
+
+
+def _day_rows(engine, b: dict, params: dict) -> list:
+    """The day's headlines, with ``coords`` from ``headline_pca`` where projected.
+
+    Falls back to the raw-embedding query when the table (migration 015) or the basis
+    versioning (014) is absent — every row is then projected on the fly. Any other failure
+    of the precomputed query falls back too, with a warning.
+    """
+    if b.get("version") is not None:
+        try:
+            with engine.connect() as conn:
+                return conn.execute(_DAY_PCA, {**params, "kind": b["kind"],
+                                               "version": b["version"]}).mappings().all()
+        except Exception as exc:  # noqa: BLE001 — the day view degrades to on-the-fly projection
+            if not _missing_table(exc):
+                logger.warning("headline_pca day query failed ({}) — projecting every headline "
+                               "on the fly.", str(exc)[:200])
+    with engine.connect() as conn:
+        return conn.execute(_DAY_EMBED, params).mappings().all()
+
+
 def day_centroid_points(engine=None, *, day) -> dict:
-    """Project one day's headline embeddings into the dataset's 16-d ``embpca`` space.
+    """Project one day's headline embeddings into a persisted 16-d PCA space.
 
-    Uses the persisted leak-safe basis (``embedding_pca_basis``: scaler→PCA fit on the train
-    window by ``build_embedding_derived``). Each headline's 768-d vector and the day centroid
-    (mean of the raw vectors) go through the SAME transform, so the centroid matches the
-    ``embpca_*`` features the models actually consume.
+    Prefers the ``headline`` basis (fit out-of-core on individual headlines by
+    ``sentisense.embed.basis``, so it spreads a single day's cloud the way it actually
+    varies) and falls back to the leak-safe ``centroid`` basis (scaler→PCA fit on the train
+    window by ``build_embedding_derived``). Coordinates come precomputed from ``headline_pca``
+    (``sentisense.embed.projection``); headlines not projected yet are projected here from
+    their 768-d vector. The day centroid (mean of the raw vectors) goes through the SAME
+    transform; under the centroid basis it therefore matches the ``embpca_*`` features the
+    models actually consume.
 
     Returns:
-        ``{date, n_pca, points: [{id, source, headline, sentiment, v: [n_pca floats]}],
-           centroid: [n_pca floats]}`` — or ``{error}`` when the basis/embeddings are absent.
+        ``{date, n_pca, basis: {kind, version}, points: [{id, source, headline, sentiment,
+           v: [n_pca floats]}], centroid: [n_pca floats], clusters: [{id, v}]}`` — or
+        ``{error}`` when the basis/embeddings are absent.
     """
     import numpy as np
 
     engine = engine or get_engine()
-    with engine.connect() as conn:
-        b = conn.execute(_BASIS).mappings().first()
-        if b is None:
-            return {"date": str(day), "points": [], "centroid": None,
-                    "error": "no PCA basis — rerun scripts/build_embedding_derived.py"}
-        rows = conn.execute(_DAY_EMBED, {"d": day, "em": b["embed_model"],
-                                         "model": resolved_model(engine), "cap": _DAY_POINT_CAP}).mappings().all()
+    b = _latest_basis(engine, ("headline", "centroid"))
+    if b is None:
+        return {"date": str(day), "points": [], "centroid": None,
+                "error": "no PCA basis — rerun scripts/build_embedding_derived.py"}
+    rows = _day_rows(engine, b, {"d": day, "em": b["embed_model"],
+                                 "model": resolved_model(engine), "cap": _DAY_POINT_CAP})
     if not rows:
         return {"date": str(day), "points": [], "centroid": None,
                 "error": "no embeddings stored for that date"}
@@ -544,19 +632,28 @@ def day_centroid_points(engine=None, *, day) -> dict:
     pmean = np.frombuffer(b["pca_mean"], dtype=np.float32)
     comps = np.frombuffer(b["pca_components"], dtype=np.float32).reshape(np_pca, nf)
 
-    vecs = np.vstack([np.frombuffer(r["embedding"], dtype=np.float32) for r in rows])
-
     def _project(x: np.ndarray) -> np.ndarray:
         return ((x - mean) / scale - pmean) @ comps.T
 
-    proj = _project(vecs)
-    centroid = _project(vecs.mean(axis=0, keepdims=True))[0]
+    proj = np.empty((len(rows), np_pca), dtype=np.float32)
+    stored = [i for i, r in enumerate(rows) if r.get("coords") is not None]
+    fresh = [i for i, r in enumerate(rows) if r.get("coords") is None]
+    if stored:
+        proj[stored] = np.frombuffer(b"".join(rows[i]["coords"] for i in stored),
+                                     dtype=np.float32).reshape(-1, np_pca)
+    if fresh:
+        proj[fresh] = _project(np.vstack([np.frombuffer(rows[i]["embedding"], dtype=np.float32)
+                                          for i in fresh]))
+    # The projection is affine, so the centroid's coordinates are the mean of the headlines'.
+    centroid = proj.mean(axis=0)
     points = [{"id": int(r["headline_id"]), "source": r["source"], "headline": r["headline"],
                "sentiment": (None if r["sentiment"] is None else int(r["sentiment"])),
                "v": [round(float(x), 4) for x in proj[i]]}
               for i, r in enumerate(rows)]
-    return {"date": str(day), "n_pca": np_pca, "points": points,
-            "centroid": [round(float(x), 4) for x in centroid]}
+    return {"date": str(day), "n_pca": np_pca,
+            "basis": {"kind": b.get("kind", "centroid"), "version": b.get("version", 1)},
+            "points": points, "centroid": [round(float(x), 4) for x in centroid],
+            "clusters": _project_centers(b)}
 
 
 _PERSONA_SOURCES = text(